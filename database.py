@@ -1,7 +1,12 @@
 import os
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, JSON, Text, Boolean, ForeignKey
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event, Column, Integer, Float, String, DateTime, JSON, Text, Boolean, ForeignKey
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.pool import StaticPool
 from datetime import datetime
 
 Base = declarative_base()
@@ -217,21 +222,215 @@ class NetworkNode(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     node_metadata = Column(JSON, nullable=True)
 
-def get_engine():
-    database_url = os.getenv('DATABASE_URL')
-    if not database_url:
+# ============================================================================
+# Engine / session registry
+# ============================================================================
+#
+# One engine (and connection pool) per database URL for the whole process.
+# get_engine() and get_session() used to build a fresh engine on every call,
+# opening a new pool - and new Postgres connections - per request.
+
+DEFAULT_POOL_OPTIONS = {
+    'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+    'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+    'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 3600)),
+}
+
+_registry_lock = threading.RLock()
+_engines: Dict[str, Engine] = {}
+_session_factories: Dict[str, sessionmaker] = {}
+_pool_counters: Dict[str, '_PoolCounters'] = {}
+_pool_options: Dict[str, Any] = dict(DEFAULT_POOL_OPTIONS)
+_default_url: Optional[str] = None
+
+
+class _PoolCounters:
+    """Pool event counts for one engine (events fire from many threads)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {'connections_created': 0, 'checkouts': 0, 'checkins': 0,
+                        'checked_out': 0, 'peak_checked_out': 0}
+
+    def connected(self):
+        with self._lock:
+            self._counts['connections_created'] += 1
+
+    def checked_out(self):
+        with self._lock:
+            counts = self._counts
+            counts['checkouts'] += 1
+            counts['checked_out'] += 1
+            counts['peak_checked_out'] = max(counts['peak_checked_out'], counts['checked_out'])
+
+    def checked_in(self):
+        with self._lock:
+            self._counts['checkins'] += 1
+            self._counts['checked_out'] -= 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+def _resolve_url(database_url: Optional[str]) -> str:
+    url = database_url or _default_url or os.getenv('DATABASE_URL')
+    if not url:
         raise ValueError("DATABASE_URL environment variable not set")
-    
-    return create_engine(
-        database_url,
-        echo=False,
-        pool_pre_ping=True,
-        pool_recycle=3600,
-        connect_args={
-            'connect_timeout': 10,
-            'options': '-c statement_timeout=30000'
-        }
-    )
+    return url
+
+
+def _create_engine(database_url: str) -> Engine:
+    """Build an engine with pool settings appropriate for the backend"""
+    if database_url.startswith('sqlite'):
+        options = {'connect_args': {'check_same_thread': False}}
+        if database_url in ('sqlite://', 'sqlite:///:memory:'):
+            # Every session must see the same in-memory database
+            options['poolclass'] = StaticPool
+        else:
+            options.update(_pool_options)
+        engine = create_engine(database_url, echo=False, **options)
+
+        @event.listens_for(engine, "connect")
+        def _enable_foreign_keys(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    else:
+        engine = create_engine(
+            database_url,
+            echo=False,
+            pool_pre_ping=True,
+            connect_args={
+                'connect_timeout': 10,
+                'options': '-c statement_timeout=30000'
+            },
+            **_pool_options
+        )
+
+    counters = _PoolCounters()
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        counters.connected()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, connection_record, connection_proxy):
+        counters.checked_out()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, connection_record):
+        counters.checked_in()
+
+    _pool_counters[database_url] = counters
+    return engine
+
+
+def get_engine(database_url: Optional[str] = None) -> Engine:
+    """
+    Get the shared engine for a database URL.
+    
+    Args:
+        database_url: Database URL (default: configured URL or $DATABASE_URL)
+    
+    Returns:
+        Process-wide engine; created on first use
+    """
+    url = _resolve_url(database_url)
+    engine = _engines.get(url)
+    if engine is None:
+        with _registry_lock:
+            engine = _engines.get(url)
+            if engine is None:
+                engine = _create_engine(url)
+                _engines[url] = engine
+                _session_factories[url] = sessionmaker(bind=engine)
+    return engine
+
+
+def configure_database(database_url: Optional[str] = None, **pool_options) -> Optional[Engine]:
+    """
+    Set the default database and pool settings.
+    
+    Existing engines are disposed so the new settings take effect.
+    
+    Args:
+        database_url: Default URL used instead of $DATABASE_URL (None: use env)
+        **pool_options: pool_size, max_overflow, pool_timeout, pool_recycle
+    
+    Returns:
+        Engine for the configured URL, or None if no URL is available
+    """
+    global _default_url
+    unknown = set(pool_options) - set(DEFAULT_POOL_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown pool options: {sorted(unknown)}")
+
+    with _registry_lock:
+        dispose_engines()
+        _default_url = database_url
+        _pool_options.update(pool_options)
+
+    try:
+        return get_engine()
+    except ValueError:
+        return None
+
+
+def use_test_database(database_url: str = 'sqlite://') -> Engine:
+    """
+    Point the registry at a local SQLite database with all tables created.
+    
+    Lets code that calls get_engine()/get_session() run without Postgres.
+    """
+    if not database_url.startswith('sqlite'):
+        raise ValueError("Test database must be a SQLite URL")
+    engine = configure_database(database_url)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def dispose_engines():
+    """Close every pooled connection and clear the registry"""
+    with _registry_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
+        _pool_counters.clear()
+
+
+def get_pool_metrics(database_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get connection pool utilization for a database.
+    
+    Returns:
+        Dict with pool size/overflow settings, connections checked out now
+        and at peak, and cumulative connect/checkout/checkin counts
+    """
+    url = _resolve_url(database_url)
+    engine = _engines.get(url)
+    if engine is None:
+        return {'initialized': False}
+
+    pool = engine.pool
+    counters = _pool_counters[url].snapshot() if url in _pool_counters else {}
+    metrics = {
+        'initialized': True,
+        'pool_class': type(pool).__name__,
+        'pool_size': pool.size() if hasattr(pool, 'size') else None,
+        'max_overflow': getattr(pool, '_max_overflow', None),
+        'overflow': pool.overflow() if hasattr(pool, 'overflow') else None,
+        'idle': pool.checkedin() if hasattr(pool, 'checkedin') else None,
+        'status': pool.status(),
+    }
+    metrics.update(counters)
+
+    capacity = (metrics['pool_size'] or 0) + max(metrics['max_overflow'] or 0, 0)
+    metrics['utilization'] = counters.get('checked_out', 0) / capacity if capacity else None
+    return metrics
+
 
 def init_db():
     try:
@@ -243,11 +442,39 @@ def init_db():
         print("App will continue without database persistence")
         return None
 
+def open_session(database_url: Optional[str] = None):
+    """
+    Open a session on the shared engine for a database URL.
+    
+    Unlike get_session(), errors propagate. The caller closes the session.
+    """
+    get_engine(database_url)
+    return _session_factories[_resolve_url(database_url)]()
+
 def get_session():
     try:
-        engine = get_engine()
-        Session = sessionmaker(bind=engine)
-        return Session()
+        return open_session()
     except Exception as e:
         print(f"Warning: Could not create database session: {e}")
         return None
+
+@contextmanager
+def session_scope(database_url: Optional[str] = None):
+    """
+    Transactional session from the shared pool.
+    
+    Commits when the block exits normally, rolls back on error and always
+    returns the connection to the pool:
+    
+        with session_scope() as db:
+            db.add(user)
+    """
+    session = open_session(database_url)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -451,29 +451,19 @@ class ReserveLiquidityAllocator:
             reserve_nxt = reserve_account.balance / self.token_system.UNITS_PER_NXT
             return (False, f"Insufficient reserve balance: {reserve_nxt:.6f} NXT < {reserve_amount_nxt:.6f} NXT", {})
         
-        # Execute transfers to each pool via atomic transfer
-        for pool_name, allocation_nxt in allocations.items():
-            # Ensure pool account exists
-            pool_account = self.token_system.get_account(pool_name)
-            if pool_account is None:
-                self.token_system.create_account(pool_name, initial_balance=0)
-            
-            # Convert NXT to units
-            allocation_units = int(allocation_nxt * self.token_system.UNITS_PER_NXT)
-            
-            # Atomic transfer from reserve to pool
-            success, tx, transfer_msg = self.token_system.transfer_atomic(
-                from_address="TRANSITION_RESERVE",
-                to_address=pool_name,
-                amount=allocation_units,
-                fee=0,
-                reason=f"Reserve liquidity allocation to {pool_name}"
-            )
-            
-            if not success:
-                # Rollback all previous allocations would be complex
-                # For now, log error (in production, use 2-phase commit)
-                print(f"⚠️ Pool allocation warning: {pool_name} - {transfer_msg}")
+        # Execute all pool transfers as one atomic batch (all-or-nothing)
+        transfers = [
+            ("TRANSITION_RESERVE", pool_name, int(allocation_nxt * self.token_system.UNITS_PER_NXT))
+            for pool_name, allocation_nxt in allocations.items()
+        ]
+        success, batch, transfer_msg = self.token_system.transfer_batch(
+            transfers,
+            fee=0,
+            reason="Reserve liquidity allocation"
+        )
+        
+        if not success:
+            return (False, f"Pool allocation failed: {transfer_msg}", {})
         
         # Record allocation
         allocation_record = {
@@ -0,0 +1,505 @@
+"""
+Compact GhostDAG Storage - Array-backed block store for long-running nodes
+
+GhostDAGEngine keeps one DAGBlock dataclass per block plus an nx.DiGraph
+mirror, which costs a few kilobytes per block. CompactGhostDAGEngine keeps
+the same consensus state in flat columns instead:
+
+1. Integer block indices (insertion order == topological order)
+2. CSR parent and merge set adjacency in NumPy arrays; child adjacency is
+   derived from the parent CSR on demand
+3. blue_score / is_blue / topological_order / blue work as columnar arrays
+4. Block payloads in a side store (in memory or SQLite on disk)
+
+DAGBlock objects are materialized on demand, so get_dag_structure,
+get_ordered_chain, get_tips and the `blocks` mapping keep working.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+import time
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ghostdag_core import GhostDAGEngine, DAGBlock, GhostdagData
+
+
+class GrowableArray:
+    """Append-only NumPy column with amortized O(1) appends."""
+
+    def __init__(self, dtype, width: Optional[int] = None, capacity: int = 1024):
+        shape = (capacity,) if width is None else (capacity, width)
+        self._data = np.zeros(shape, dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed > len(self._data):
+            capacity = max(needed, 2 * len(self._data))
+            grown = np.zeros((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+    def append(self, value):
+        self._reserve(1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._data.dtype)
+        self._reserve(len(values))
+        self._data[self._size:self._size + len(values)] = values
+        self._size += len(values)
+
+    def __getitem__(self, index):
+        return self._data[:self._size][index]
+
+    def __setitem__(self, index, value):
+        self._data[:self._size][index] = value
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view of the filled part of the column."""
+        view = self._data[:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+
+class MemoryPayloadStore:
+    """Keeps block payloads in a Python list indexed by block index."""
+
+    def __init__(self):
+        self._payloads: List[Dict] = []
+
+    def append(self, index: int, data: Dict):
+        self._payloads.append(data)
+
+    def get(self, index: int) -> Dict:
+        return self._payloads[index]
+
+
+class SQLitePayloadStore:
+    """
+    Keeps block payloads on disk in SQLite so they cost no resident memory.
+
+    Payloads are pickled; inserts are committed in batches.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1000):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS block_payloads (idx INTEGER PRIMARY KEY, data BLOB)"
+        )
+        self.batch_size = batch_size
+        self._pending: List[Tuple[int, bytes]] = []
+
+    def append(self, index: int, data: Dict):
+        self._pending.append((index, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO block_payloads (idx, data) VALUES (?, ?)",
+                self._pending
+            )
+            self.conn.commit()
+            self._pending = []
+
+    def get(self, index: int) -> Dict:
+        self.flush()
+        row = self.conn.execute(
+            "SELECT data FROM block_payloads WHERE idx = ?", (index,)
+        ).fetchone()
+        return pickle.loads(row[0]) if row else {}
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+class CompactBlockStore:
+    """
+    Columnar storage for GhostDAG blocks keyed by dense integer indices.
+    """
+
+    def __init__(self, payload_store=None):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.creators: List[str] = []
+        self._creator_index: Dict[str, int] = {}
+
+        self.timestamp = GrowableArray(np.float64)
+        self.creator = GrowableArray(np.int32)
+        self.hash = GrowableArray(np.uint8, width=32)
+        self.blue_score = GrowableArray(np.int32)
+        self.is_blue = GrowableArray(np.bool_)
+        self.topological_order = GrowableArray(np.int32)
+        self.selected_parent = GrowableArray(np.int32)
+        self.blue_work = GrowableArray(np.int32)
+        self.red_work = GrowableArray(np.int32)
+
+        # CSR adjacency: entries of block i live in indices[offsets[i]:offsets[i+1]]
+        self.parent_offsets = GrowableArray(np.int64)
+        self.parent_offsets.append(0)
+        self.parent_indices = GrowableArray(np.int32)
+        self.mergeset_offsets = GrowableArray(np.int64)
+        self.mergeset_offsets.append(0)
+        self.mergeset_indices = GrowableArray(np.int32)
+
+        self.payloads = payload_store if payload_store is not None else MemoryPayloadStore()
+        self._children_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _intern_creator(self, creator: str) -> int:
+        code = self._creator_index.get(creator)
+        if code is None:
+            code = len(self.creators)
+            self.creators.append(creator)
+            self._creator_index[creator] = code
+        return code
+
+    def append(self, block_id: str, timestamp: float, creator: str, digest: bytes,
+               parents: List[int], mergeset: List[int], selected_parent: int,
+               blue_score: int, is_blue: bool, blue_work: int, red_work: int,
+               data: Dict) -> int:
+        """Append a classified block and return its index."""
+        idx = len(self.ids)
+        self.ids.append(block_id)
+        self.index[block_id] = idx
+
+        self.timestamp.append(timestamp)
+        self.creator.append(self._intern_creator(creator))
+        self.hash.append(np.frombuffer(digest, dtype=np.uint8))
+        self.blue_score.append(blue_score)
+        self.is_blue.append(is_blue)
+        self.topological_order.append(idx)
+        self.selected_parent.append(selected_parent)
+        self.blue_work.append(blue_work)
+        self.red_work.append(red_work)
+
+        self.parent_indices.extend(parents)
+        self.parent_offsets.append(len(self.parent_indices))
+        self.mergeset_indices.extend(mergeset)
+        self.mergeset_offsets.append(len(self.mergeset_indices))
+
+        self.payloads.append(idx, data)
+        self._children_cache = None
+        return idx
+
+    def parents(self, idx: int) -> List[int]:
+        start, end = self.parent_offsets[idx], self.parent_offsets[idx + 1]
+        return self.parent_indices[start:end].tolist()
+
+    def mergeset(self, idx: int) -> List[int]:
+        start, end = self.mergeset_offsets[idx], self.mergeset_offsets[idx + 1]
+        return self.mergeset_indices[start:end].tolist()
+
+    def children_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Child adjacency in CSR form, derived from the parent CSR.
+
+        Returns:
+            (offsets, indices) where children of i are indices[offsets[i]:offsets[i+1]]
+        """
+        if self._children_cache is None:
+            n = len(self.ids)
+            parent_of_edge = self.parent_indices.values
+            child_of_edge = np.repeat(
+                np.arange(n, dtype=np.int32), np.diff(self.parent_offsets.values)
+            )
+            order = np.argsort(parent_of_edge, kind="stable")
+            counts = np.bincount(parent_of_edge, minlength=n)
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            self._children_cache = (offsets, child_of_edge[order])
+        return self._children_cache
+
+    def children(self, idx: int) -> List[int]:
+        offsets, indices = self.children_csr()
+        return indices[offsets[idx]:offsets[idx + 1]].tolist()
+
+    def materialize(self, idx: int) -> DAGBlock:
+        """Build a DAGBlock snapshot of the stored block (not write-through)."""
+        return DAGBlock(
+            block_id=self.ids[idx],
+            timestamp=float(self.timestamp[idx]),
+            parent_blocks=[self.ids[p] for p in self.parents(idx)],
+            data=self.payloads.get(idx),
+            creator=self.creators[self.creator[idx]],
+            hash=self.hash[idx].tobytes().hex(),
+            blue_score=int(self.blue_score[idx]),
+            is_blue=bool(self.is_blue[idx]),
+            topological_order=int(self.topological_order[idx])
+        )
+
+    def ghostdag_data(self, idx: int) -> GhostdagData:
+        """Build GhostdagData for the stored block."""
+        mergeset = self.mergeset(idx)
+        is_blue = self.is_blue.values
+        selected_parent = int(self.selected_parent[idx])
+        return GhostdagData(
+            selected_parent=self.ids[selected_parent] if selected_parent >= 0 else None,
+            mergeset_blues=[self.ids[m] for m in mergeset if is_blue[m]],
+            mergeset_reds=[self.ids[m] for m in mergeset if not is_blue[m]],
+            blue_work=int(self.blue_work[idx]),
+            red_work=int(self.red_work[idx])
+        )
+
+    def memory_usage(self) -> Dict:
+        """Approximate bytes held by the columnar arrays."""
+        columns = [
+            self.timestamp, self.creator, self.hash, self.blue_score, self.is_blue,
+            self.topological_order, self.selected_parent, self.blue_work, self.red_work,
+            self.parent_offsets, self.parent_indices, self.mergeset_offsets,
+            self.mergeset_indices
+        ]
+        return {
+            "blocks": len(self.ids),
+            "column_bytes": sum(column.nbytes for column in columns)
+        }
+
+
+class _StoreView(Mapping):
+    """Read-only mapping from block id to a value materialized from the store."""
+
+    def __init__(self, store: CompactBlockStore, factory):
+        self._store = store
+        self._factory = factory
+
+    def __getitem__(self, block_id: str):
+        return self._factory(self._store.index[block_id])
+
+    def __contains__(self, block_id) -> bool:
+        return block_id in self._store.index
+
+    def __iter__(self):
+        return iter(self._store.ids)
+
+    def __len__(self) -> int:
+        return len(self._store.ids)
+
+
+class CompactGhostDAGEngine(GhostDAGEngine):
+    """
+    GhostDAG engine backed by CompactBlockStore instead of per-block
+    dataclasses and an nx.DiGraph.
+
+    Classification, ordering and metrics match GhostDAGEngine. Blocks
+    returned from `blocks`, `get_tips`, `get_ordered_chain` and `add_block`
+    are snapshots; parent_blocks lists only parents known to the DAG.
+    """
+
+    def __init__(self, k: int = 3, payload_store=None):
+        """
+        Initialize compact GhostDAG engine.
+
+        Args:
+            k: Security parameter (see GhostDAGEngine)
+            payload_store: Side store for block payloads. Defaults to
+                           MemoryPayloadStore; use SQLitePayloadStore to keep
+                           payloads off-heap.
+        """
+        self._payload_store = payload_store
+        super().__init__(k=k)
+
+    def _init_storage(self):
+        """Set up columnar storage in place of DAGBlock dict + nx.DiGraph."""
+        self.store = CompactBlockStore(self._payload_store)
+        self.blocks = _StoreView(self.store, self.store.materialize)
+        self.ghostdag_data = _StoreView(self.store, self.store.ghostdag_data)
+
+    def _create_genesis(self):
+        """Create the genesis block."""
+        self._append_block(self.genesis_id, {"type": "genesis"}, "system", [])
+
+    def add_block(self, block_id: str, data: Dict, creator: str,
+                  parent_blocks: Optional[List[str]] = None) -> DAGBlock:
+        """
+        Add a new block to the DAG.
+
+        Args:
+            block_id: Unique identifier
+            data: Block data payload
+            creator: Block creator/validator
+            parent_blocks: Parent block IDs. If None, uses current tips.
+
+        Returns:
+            Snapshot of the created block
+        """
+        if block_id in self.store.index:
+            raise ValueError(f"Block {block_id} already exists in DAG")
+
+        if parent_blocks is None:
+            parent_blocks = list(self.tips)
+
+        idx = self._append_block(block_id, data, creator, parent_blocks)
+
+        for parent_id in parent_blocks:
+            self.tips.discard(parent_id)
+
+        self.total_blocks += 1
+        if self.store.is_blue[idx]:
+            self.blue_blocks += 1
+        else:
+            self.red_blocks += 1
+
+        return self.store.materialize(idx)
+
+    def _append_block(self, block_id: str, data: Dict, creator: str,
+                      parent_blocks: List[str]) -> int:
+        """Classify a block against the stored DAG and append it to the columns."""
+        store = self.store
+        timestamp = time.time()
+        content = f"{block_id}{timestamp}{parent_blocks}{data}{creator}"
+        digest = hashlib.sha256(content.encode()).digest()
+
+        parents = list(dict.fromkeys(
+            store.index[pid] for pid in parent_blocks if pid in store.index
+        ))
+        selected_parent = self._select_parent_index(parents)
+        mergeset = self._compute_mergeset_indices(selected_parent, parents)
+
+        if selected_parent >= 0:
+            is_blue_column = store.is_blue.values
+            merged = mergeset[1:]
+            merged_blue = int(np.count_nonzero(is_blue_column[merged])) if merged else 0
+            blue_past = int(store.blue_work[selected_parent]) + merged_blue
+            red_past = int(store.red_work[selected_parent]) + len(merged) - merged_blue
+        else:
+            blue_past = 0
+            red_past = 0
+
+        # Genesis is blue by definition; other blocks follow PHANTOM (see base class)
+        is_blue = block_id == self.genesis_id or (self.red_blocks - red_past) <= self.k
+
+        idx = store.append(
+            block_id=block_id,
+            timestamp=timestamp,
+            creator=creator,
+            digest=digest,
+            parents=parents,
+            mergeset=mergeset,
+            selected_parent=selected_parent,
+            blue_score=blue_past,
+            is_blue=is_blue,
+            blue_work=blue_past + (1 if is_blue else 0),
+            red_work=red_past + (0 if is_blue else 1),
+            data=data
+        )
+        self.reachability.add_node(selected_parent, mergeset)
+        self.tips.add(block_id)
+        return idx
+
+    def _select_parent_index(self, parents: List[int]) -> int:
+        """Pick the parent with the highest blue work (ties broken by id)."""
+        if not parents:
+            return -1
+        ids = self.store.ids
+        blue_work = self.store.blue_work
+        return max(parents, key=lambda p: (int(blue_work[p]), ids[p]))
+
+    def _compute_mergeset_indices(self, selected_parent: int, parents: List[int]) -> List[int]:
+        """Merge set over block indices (see GhostDAGEngine._compute_mergeset)."""
+        if selected_parent < 0:
+            return []
+
+        mergeset = [selected_parent]
+        visited = {selected_parent}
+        stack = [p for p in parents if p != selected_parent]
+
+        while stack:
+            current = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            if self.reachability.is_dag_ancestor_node(current, selected_parent):
+                continue
+            mergeset.append(current)
+            stack.extend(p for p in self.store.parents(current) if p not in visited)
+
+        ids = self.store.ids
+        blue_work = self.store.blue_work
+        rest = sorted(mergeset[1:], key=lambda m: (int(blue_work[m]), ids[m]))
+        return [selected_parent] + rest
+
+    def is_ancestor(self, ancestor_id: str, block_id: str) -> bool:
+        """Check whether ancestor_id is in the past of block_id."""
+        index = self.store.index
+        return self.reachability.is_dag_ancestor_node(index[ancestor_id], index[block_id])
+
+    def get_children(self, block_id: str) -> List[str]:
+        """Get ids of blocks that reference block_id as a parent."""
+        return [self.store.ids[c] for c in self.store.children(self.store.index[block_id])]
+
+    def get_ordered_chain(self) -> List[DAGBlock]:
+        """
+        Get the canonical chain of blue blocks in topological order.
+        This is the consensus ordering.
+        """
+        order = self.store.topological_order.values
+        blue = np.flatnonzero(self.store.is_blue.values)
+        blue = blue[np.argsort(order[blue], kind="stable")]
+        return [self.store.materialize(int(idx)) for idx in blue]
+
+    def _average_parents_per_block(self) -> float:
+        """Mean number of parents referenced by non-genesis blocks."""
+        return float(np.mean(np.diff(self.store.parent_offsets.values)[1:]))
+
+    def get_dag_structure(self) -> Dict:
+        """Get DAG structure for visualization."""
+        store = self.store
+        ids = store.ids
+        blue_score = store.blue_score.values.tolist()
+        is_blue = store.is_blue.values.tolist()
+        order = store.topological_order.values.tolist()
+        creator = store.creator.values.tolist()
+        timestamp = store.timestamp.values.tolist()
+
+        nodes = [
+            {
+                "id": ids[i],
+                "label": ids[i],
+                "blue_score": blue_score[i],
+                "is_blue": is_blue[i],
+                "topological_order": order[i],
+                "creator": store.creators[creator[i]],
+                "timestamp": timestamp[i]
+            }
+            for i in range(len(ids))
+        ]
+
+        child_of_edge = np.repeat(
+            np.arange(len(ids)), np.diff(store.parent_offsets.values)
+        ).tolist()
+        parent_of_edge = store.parent_indices.values.tolist()
+        edges = [
+            {"from": ids[parent], "to": ids[child]}
+            for parent, child in zip(parent_of_edge, child_of_edge)
+        ]
+
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "metrics": {
+                "total_blocks": self.total_blocks,
+                "blue_blocks": self.blue_blocks,
+                "red_blocks": self.red_blocks,
+                "tips": len(self.tips)
+            }
+        }
@@ -14,6 +14,8 @@ from collections import deque
 import networkx as nx
 import numpy as np
 
+from ghostdag_reachability import ReachabilityIndex
+
 @dataclass
 class DAGBlock:
     """Block in the GhostDAG structure."""
@@ -39,6 +41,22 @@ class DAGBlock:
         return hashlib.sha256(content.encode()).hexdigest()
 
 
+@dataclass
+class GhostdagData:
+    """
+    Per-block GHOSTDAG bookkeeping relative to the block's selected parent.
+    
+    blue_work/red_work count the blue/red blocks in the block's past
+    including the block itself, so a child can derive its own counts from
+    the selected parent's data plus its merge set.
+    """
+    selected_parent: Optional[str]
+    mergeset_blues: List[str] = field(default_factory=list)
+    mergeset_reds: List[str] = field(default_factory=list)
+    blue_work: int = 0
+    red_work: int = 0
+
+
 class GhostDAGEngine:
     """
     GhostDAG consensus engine implementing PHANTOM protocol.
@@ -59,10 +77,11 @@ class GhostDAGEngine:
                by honest nodes. Higher k = more parallelism but slower consensus.
         """
         self.k = k
-        self.dag = nx.DiGraph()  # Directed Acyclic Graph
-        self.blocks: Dict[str, DAGBlock] = {}
+        self._init_storage()
         self.genesis_id = "genesis"
         self.tips: Set[str] = set()  # Current DAG tips (blocks with no children)
+        self.reachability = ReachabilityIndex()
+        self._next_topological_order = 0
         
         # Performance metrics
         self.total_blocks = 0
@@ -73,6 +92,12 @@ class GhostDAGEngine:
         # Initialize genesis block
         self._create_genesis()
     
+    def _init_storage(self):
+        """Set up per-block storage (overridden by CompactGhostDAGEngine)."""
+        self.dag = nx.DiGraph()  # Directed Acyclic Graph
+        self.blocks: Dict[str, DAGBlock] = {}
+        self.ghostdag_data: Dict[str, GhostdagData] = {}
+    
     def _create_genesis(self):
         """Create the genesis block."""
         genesis = DAGBlock(
@@ -88,6 +113,12 @@ class GhostDAGEngine:
         self.blocks[self.genesis_id] = genesis
         self.dag.add_node(self.genesis_id)
         self.tips.add(self.genesis_id)
+        self.ghostdag_data[self.genesis_id] = GhostdagData(
+            selected_parent=None,
+            blue_work=1
+        )
+        self.reachability.add_block(self.genesis_id)
+        self._next_topological_order = 1
     
     def add_block(self, block_id: str, data: Dict, creator: str, 
                   parent_blocks: Optional[List[str]] = None) -> DAGBlock:
@@ -103,6 +134,9 @@ class GhostDAGEngine:
         Returns:
             Created DAGBlock
         """
+        if block_id in self.blocks:
+            raise ValueError(f"Block {block_id} already exists in DAG")
+        
         if parent_blocks is None:
             # Reference all current tips for maximum parallelism
             parent_blocks = list(self.tips)
@@ -116,14 +150,16 @@ class GhostDAGEngine:
             creator=creator
         )
         
+        # Only parents already known to the DAG contribute edges
+        known_parents = [pid for pid in parent_blocks if pid in self.blocks]
+        
         # Add to DAG
         self.blocks[block_id] = block
         self.dag.add_node(block_id)
         
         # Add edges from parents
-        for parent_id in parent_blocks:
-            if parent_id in self.blocks:
-                self.dag.add_edge(parent_id, block_id)
+        for parent_id in known_parents:
+            self.dag.add_edge(parent_id, block_id)
         
         # Update tips
         self.tips.add(block_id)
@@ -132,10 +168,10 @@ class GhostDAGEngine:
                 self.tips.discard(parent_id)
         
         # Run PHANTOM protocol to classify block
-        self._classify_block(block)
+        self._classify_block(block, known_parents)
         
-        # Update topological order
-        self._update_topological_order()
+        # Append to topological order (parents are always inserted first)
+        self._update_topological_order(block)
         
         self.total_blocks += 1
         if block.is_blue:
@@ -145,56 +181,110 @@ class GhostDAGEngine:
         
         return block
     
-    def _classify_block(self, block: DAGBlock):
+    def _classify_block(self, block: DAGBlock, parents: Optional[List[str]] = None):
         """
         Classify block as blue (honest) or red (attack) using PHANTOM protocol.
         
         A block is blue if it has at most k red blocks in its anticone.
         Anticone = blocks that are neither ancestors nor descendants.
+        
+        A freshly added block has no descendants, so its anticone is every
+        other block outside its past. Past colour counts are derived from the
+        selected parent plus the merge set, so no full-DAG traversal is needed:
+        
+            past(B) = past(sp) + {sp} + mergeset(B)
         """
         block_id = block.block_id
+        if parents is None:
+            parents = [pid for pid in block.parent_blocks if pid in self.blocks]
         
-        # Get all ancestors
-        ancestors = set(nx.ancestors(self.dag, block_id))
+        selected_parent = self._select_parent(parents)
+        mergeset = self._compute_mergeset(selected_parent, parents)
         
-        # Get all descendants (should be empty for new block, but general case)
-        descendants = set(nx.descendants(self.dag, block_id))
+        mergeset_blues = [bid for bid in mergeset if self.blocks[bid].is_blue]
+        mergeset_reds = [bid for bid in mergeset if not self.blocks[bid].is_blue]
         
-        # Anticone = all other blocks that are neither ancestors nor descendants
-        all_blocks = set(self.blocks.keys())
-        anticone = all_blocks - ancestors - descendants - {block_id}
+        if selected_parent is not None:
+            # Selected parent's work already counts the selected parent itself
+            parent_data = self.ghostdag_data[selected_parent]
+            merged = mergeset[1:]
+            blue_past = parent_data.blue_work + sum(1 for bid in merged if self.blocks[bid].is_blue)
+            red_past = parent_data.red_work + sum(1 for bid in merged if not self.blocks[bid].is_blue)
+        else:
+            blue_past = 0
+            red_past = 0
         
-        # Count red blocks in anticone
-        red_in_anticone = sum(
-            1 for bid in anticone 
-            if bid in self.blocks and not self.blocks[bid].is_blue
-        )
+        # Red blocks outside the past of B form the red part of its anticone
+        red_in_anticone = self.red_blocks - red_past
         
         # Classify: blue if red_in_anticone <= k
         block.is_blue = (red_in_anticone <= self.k)
         
         # Calculate blue score (number of blue ancestors)
-        block.blue_score = sum(
-            1 for bid in ancestors 
-            if bid in self.blocks and self.blocks[bid].is_blue
+        block.blue_score = blue_past
+        
+        self.ghostdag_data[block_id] = GhostdagData(
+            selected_parent=selected_parent,
+            mergeset_blues=mergeset_blues,
+            mergeset_reds=mergeset_reds,
+            blue_work=blue_past + (1 if block.is_blue else 0),
+            red_work=red_past + (0 if block.is_blue else 1)
         )
+        self.reachability.add_block(block_id, selected_parent, mergeset)
+    
+    def _select_parent(self, parents: List[str]) -> Optional[str]:
+        """Pick the parent with the highest blue work (ties broken by id)."""
+        if not parents:
+            return None
+        return max(parents, key=lambda pid: (self.ghostdag_data[pid].blue_work, pid))
     
-    def _update_topological_order(self):
+    def _compute_mergeset(self, selected_parent: Optional[str],
+                          parents: List[str]) -> List[str]:
+        """
+        Compute the merge set of a new block: its past minus the past of the
+        selected parent. The selected parent itself is the first entry.
+        
+        The walk starts at the non-selected parents and stops at any block
+        already in the past of the selected parent, so its cost is bounded by
+        the merge set size rather than the DAG size.
         """
-        Update topological ordering of all blocks.
+        if selected_parent is None:
+            return []
+        
+        mergeset = [selected_parent]
+        visited = {selected_parent}
+        queue = deque(pid for pid in parents if pid != selected_parent)
+        
+        while queue:
+            current = queue.popleft()
+            if current in visited:
+                continue
+            visited.add(current)
+            if self.is_ancestor(current, selected_parent):
+                continue
+            mergeset.append(current)
+            for parent_id in self.dag.predecessors(current):
+                if parent_id not in visited:
+                    queue.append(parent_id)
+        
+        # Deterministic order: selected parent first, rest by blue work
+        rest = sorted(mergeset[1:], key=lambda bid: (self.ghostdag_data[bid].blue_work, bid))
+        return [selected_parent] + rest
+    
+    def is_ancestor(self, ancestor_id: str, block_id: str) -> bool:
+        """Check whether ancestor_id is in the past of block_id."""
+        return self.reachability.is_dag_ancestor(ancestor_id, block_id)
+    
+    def _update_topological_order(self, block: DAGBlock):
+        """
+        Append block to the topological ordering.
         This determines the consensus ordering of blocks.
+        
+        Blocks are only added once all their parents exist, so insertion
+        order is a valid topological order and never needs recomputing.
         """
-        try:
-            # Get topological sort
-            ordered_blocks = list(nx.topological_sort(self.dag))
-            
-            # Assign topological order
-            for i, block_id in enumerate(ordered_blocks):
-                if block_id in self.blocks:
-                    self.blocks[block_id].topological_order = i
-        except nx.NetworkXError:
-            # Cycle detected - shouldn't happen in DAG
-            pass
+        block.topological_order = self._next_topological_order
+        self._next_topological_order += 1
     
     def get_ordered_chain(self) -> List[DAGBlock]:
         """
@@ -225,6 +315,7 @@ class GhostDAGEngine:
         """
         start_time = time.time()
         creators = [f"creator_{i}" for i in range(num_creators)]
+        first_index = self.total_blocks
         
         # Simulate parallel creation
         for i in range(num_blocks):
@@ -236,7 +327,7 @@ class GhostDAGEngine:
             parent_blocks = np.random.choice(available_tips, num_parents, replace=False).tolist()
             
             self.add_block(
-                block_id=f"block_{i}",
+                block_id=f"block_{first_index + i}",
                 data={
                     "transactions": f"tx_batch_{i}",
                     "value": np.random.randint(1, 1000)
@@ -259,9 +350,13 @@ class GhostDAGEngine:
             "consensus_chain_length": len(ordered_chain),
             "processing_time": end_time - start_time,
             "blocks_per_second": num_blocks / (end_time - start_time) if end_time > start_time else 0,
-            "average_parents_per_block": np.mean([len(b.parent_blocks) for b in self.blocks.values() if b.block_id != self.genesis_id])
+            "average_parents_per_block": self._average_parents_per_block()
         }
     
+    def _average_parents_per_block(self) -> float:
+        """Mean number of parents referenced by non-genesis blocks."""
+        return np.mean([len(b.parent_blocks) for b in self.blocks.values() if b.block_id != self.genesis_id])
+    
     def detect_attack(self, threshold: float = 0.2) -> Dict:
         """
         Detect potential attacks by analyzing red block ratio.
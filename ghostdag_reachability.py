@@ -0,0 +1,178 @@
+"""
+GhostDAG Reachability Index - Ancestry queries without graph traversal
+
+Answers "is A in the past of B" for the GhostDAG block DAG as blocks arrive.
+
+Structure:
+1. Selected-parent tree - every block hangs off its selected parent, so the
+   DAG's backbone is a tree. Tree ancestry is answered with skew-binary jump
+   pointers (one parent + one jump pointer per block) in O(log n).
+2. Future covering sets - for every block A, the blocks whose merge set
+   contains A. If A is in the past of B but not a tree ancestor of B, some
+   member of A's covering set is a tree ancestor-or-self of B.
+
+The covering set members of a block form an antichain in the selected-parent
+tree and are bounded by how many merge sets a block can appear in (roughly k
+for honest DAGs), so a DAG ancestry query costs O(|FCS| * log n).
+"""
+
+from array import array
+from typing import Dict, Hashable, Iterable, List
+
+
+class ReachabilityIndex:
+    """
+    Incrementally maintained reachability index over a block DAG.
+
+    Blocks must be added after their selected parent and merge set members,
+    which GhostDAGEngine guarantees by construction.
+
+    Internally every block is a dense integer node (insertion order) stored
+    in flat typed arrays. Callers that already number their blocks densely
+    (e.g. CompactGhostDAGEngine) can use the *_node methods directly and skip
+    the id mapping.
+    """
+
+    def __init__(self):
+        self._index: Dict[Hashable, int] = {}
+        self._parent = array('q')
+        self._jump = array('q')
+        self._depth = array('q')
+        # Future covering sets as per-node singly linked lists in flat arrays
+        self._fcs_head = array('q')
+        self._fcs_next = array('q')
+        self._fcs_node = array('q')
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __contains__(self, block_id: Hashable) -> bool:
+        return block_id in self._index
+
+    def add_block(self, block_id: Hashable, selected_parent: Hashable = None,
+                  mergeset: Iterable[Hashable] = ()) -> int:
+        """
+        Register a block in the index.
+
+        Args:
+            block_id: New block identifier
+            selected_parent: Tree parent (None for genesis/root blocks)
+            mergeset: Blocks in past(block) but not in past(selected_parent);
+                      the selected parent itself may be included
+
+        Returns:
+            Internal node index of the block
+        """
+        if block_id in self._index:
+            raise ValueError(f"Block {block_id} already indexed")
+
+        parent = -1 if selected_parent is None else self._index[selected_parent]
+        node = self.add_node(parent, [self._index[bid] for bid in mergeset])
+        self._index[block_id] = node
+        return node
+
+    def add_node(self, parent: int = -1, mergeset: Iterable[int] = ()) -> int:
+        """
+        Register the next dense node.
+
+        Args:
+            parent: Selected parent node (-1 for roots)
+            mergeset: Merge set nodes (the selected parent is skipped)
+
+        Returns:
+            New node index
+        """
+        node = len(self._parent)
+
+        if parent < 0:
+            parent = node
+            jump = node
+            depth = 0
+        else:
+            depth = self._depth[parent] + 1
+            # Skew-binary jump pointers (Myers, 1983): equal-length jumps merge
+            parent_jump = self._jump[parent]
+            if (self._depth[parent] - self._depth[parent_jump] ==
+                    self._depth[parent_jump] - self._depth[self._jump[parent_jump]]):
+                jump = self._jump[parent_jump]
+            else:
+                jump = parent
+
+        self._parent.append(parent)
+        self._jump.append(jump)
+        self._depth.append(depth)
+        self._fcs_head.append(-1)
+
+        for merged in mergeset:
+            if merged != parent:
+                self._fcs_node.append(node)
+                self._fcs_next.append(self._fcs_head[merged])
+                self._fcs_head[merged] = len(self._fcs_node) - 1
+
+        return node
+
+    def _tree_ancestor_at_depth(self, node: int, depth: int) -> int:
+        """Walk up the selected-parent tree to the given depth in O(log n)."""
+        while self._depth[node] > depth:
+            jump = self._jump[node]
+            if self._depth[jump] >= depth:
+                node = jump
+            else:
+                node = self._parent[node]
+        return node
+
+    def _is_tree_ancestor_or_self(self, ancestor: int, node: int) -> bool:
+        ancestor_depth = self._depth[ancestor]
+        if ancestor_depth > self._depth[node]:
+            return False
+        return self._tree_ancestor_at_depth(node, ancestor_depth) == ancestor
+
+    def _iter_future_covering(self, node: int):
+        entry = self._fcs_head[node]
+        while entry >= 0:
+            yield self._fcs_node[entry]
+            entry = self._fcs_next[entry]
+
+    def is_chain_ancestor_node(self, ancestor: int, node: int) -> bool:
+        """Check if ancestor is a strict selected-parent tree ancestor of node."""
+        return ancestor != node and self._is_tree_ancestor_or_self(ancestor, node)
+
+    def is_dag_ancestor_node(self, ancestor: int, node: int) -> bool:
+        """Check if ancestor is in the past of node."""
+        if ancestor == node:
+            return False
+        if self._is_tree_ancestor_or_self(ancestor, node):
+            return True
+        # Covering set members form a tree antichain; at most one can lie on
+        # the selected chain of node
+        node_depth = self._depth[node]
+        for covering in self._iter_future_covering(ancestor):
+            if self._depth[covering] <= node_depth and \
+                    self._is_tree_ancestor_or_self(covering, node):
+                return True
+        return False
+
+    def is_chain_ancestor(self, ancestor_id: Hashable, block_id: Hashable) -> bool:
+        """Check if ancestor_id is a strict ancestor of block_id in the selected-parent tree."""
+        return self.is_chain_ancestor_node(self._index[ancestor_id], self._index[block_id])
+
+    def is_dag_ancestor(self, ancestor_id: Hashable, block_id: Hashable) -> bool:
+        """Check if ancestor_id is in the past of block_id."""
+        return self.is_dag_ancestor_node(self._index[ancestor_id], self._index[block_id])
+
+    def get_future_covering_set(self, block_id: Hashable) -> List[int]:
+        """Get covering set of a block as internal node indices (for diagnostics)."""
+        return sorted(self._iter_future_covering(self._index[block_id]))
+
+    def get_stats(self) -> Dict:
+        """Get index size statistics."""
+        num_nodes = len(self._parent)
+        sizes = [0] * num_nodes
+        for node in range(num_nodes):
+            sizes[node] = sum(1 for _ in self._iter_future_covering(node))
+        return {
+            "indexed_blocks": num_nodes,
+            "max_chain_depth": max(self._depth) if num_nodes else 0,
+            "max_covering_set": max(sizes) if sizes else 0,
+            "average_covering_set": (len(self._fcs_node) / num_nodes) if num_nodes else 0.0
+        }
@@ -355,15 +355,12 @@ def mobile_get_transactions():
     if not account:
         return jsonify({"transactions": [], "count": 0})
     
-    # Get transaction history (if available)
-    # Note: Account object may not have transaction_history attribute
-    transactions = []
-    if hasattr(account, 'transaction_history'):
-        transactions = account.transaction_history[-50:]  # Last 50 transactions
+    # Last 50 transactions from the per-address ledger index
+    transactions = token_system.get_account_transactions(client.account_id, limit=50)
     
     return jsonify({
         "account_id": client.account_id,
-        "transactions": [tx.to_dict() for tx in transactions] if transactions else [],
+        "transactions": [tx.to_dict() for tx in transactions],
         "count": len(transactions)
     })
 
@@ -1,9 +1,71 @@
+import json
+import multiprocessing
+import os
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
 from nexus_engine import NexusEngine
+from nexus_engine_numba import build_param_matrix, run_batch_summary, BATCH_SUMMARY_FIELDS
 from signal_generators import SignalGenerator
 
+
+def _generate_signals(signal_configs: Dict, num_steps: int, delta_t: float) -> Dict[str, np.ndarray]:
+    """Generate all input signals for one (num_steps, delta_t) combination"""
+    signals = {
+        name: SignalGenerator.generate_from_config(signal_configs[name], num_steps, delta_t)
+        for name in ['H', 'M', 'D', 'E', 'C_cons', 'C_disp']
+    }
+    signals['E'] = np.clip(signals['E'], 0.0, 1.0)
+    return signals
+
+
+def run_batched_simulations(
+    signal_configs: Dict,
+    param_sets: List[Dict],
+    seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Run many simulations through the batched Numba kernel.
+    
+    Runs are grouped by (num_steps, delta_t) so signals are generated once
+    per group; each group is simulated in a single parallel kernel call and
+    reduced to summary statistics without building per-run DataFrames.
+    
+    Args:
+        signal_configs: Signal configuration dicts keyed by signal name
+        param_sets: One parameter dict per run (must contain num_steps, delta_t)
+        seed: If set, the global RNG is reseeded before each group's signals
+              are generated, making results independent of how runs are batched
+        
+    Returns:
+        Dict mapping each BATCH_SUMMARY_FIELDS name to a (len(param_sets),) array
+    """
+    summary = {name: np.full(len(param_sets), np.nan) for name in BATCH_SUMMARY_FIELDS}
+    
+    groups: Dict[Tuple[int, float], List[int]] = {}
+    for idx, params in enumerate(param_sets):
+        key = (int(params['num_steps']), float(params['delta_t']))
+        groups.setdefault(key, []).append(idx)
+    
+    for (num_steps, delta_t), indices in groups.items():
+        if seed is not None:
+            np.random.seed(seed)
+        signals = _generate_signals(signal_configs, num_steps, delta_t)
+        param_matrix = build_param_matrix([param_sets[idx] for idx in indices])
+        group_summary = run_batch_summary(signals, delta_t, param_matrix)
+        for name, values in group_summary.items():
+            summary[name][indices] = values
+    
+    return summary
+
+
+def _init_stability_worker():
+    """Keep each pool worker's Numba kernel single-threaded; the pool provides the parallelism"""
+    import numba
+    numba.set_num_threads(1)
+
+
 class MonteCarloAnalysis:
     def __init__(self, base_params: Dict, signal_configs: Dict):
         self.base_params = base_params.copy()
@@ -28,16 +90,8 @@ class MonteCarloAnalysis:
         """
         np.random.seed(seed)
         
-        results = {
-            'final_N': [],
-            'avg_issuance': [],
-            'avg_burn': [],
-            'conservation_error': [],
-            'max_N': [],
-            'min_N': [],
-            'final_S': [],
-            'params_used': []
-        }
+        run_param_sets = []
+        params_used = []
         
         for run_idx in range(num_runs):
             run_params = self.base_params.copy()
@@ -52,23 +106,21 @@ class MonteCarloAnalysis:
                     run_params[param_name] = sampled_value
                     param_sample[param_name] = sampled_value
             
-            try:
-                df = self._run_single_simulation(run_params)
-                
-                results['final_N'].append(float(df['N'].iloc[-1]))
-                results['avg_issuance'].append(float(df['I'].mean()))
-                results['avg_burn'].append(float(df['B'].mean()))
-                results['conservation_error'].append(
-                    float(abs(df['cumulative_I'].iloc[-1] - df['cumulative_B'].iloc[-1]))
-                )
-                results['max_N'].append(float(df['N'].max()))
-                results['min_N'].append(float(df['N'].min()))
-                results['final_S'].append(float(df['S'].iloc[-1]))
-                results['params_used'].append(param_sample)
-                
-            except Exception as e:
-                print(f"Run {run_idx} failed: {str(e)}")
-                continue
+            run_param_sets.append(run_params)
+            params_used.append(param_sample)
+        
+        summary = run_batched_simulations(self.signal_configs, run_param_sets)
+        
+        results = {
+            'final_N': summary['final_N'].tolist(),
+            'avg_issuance': summary['avg_issuance'].tolist(),
+            'avg_burn': summary['avg_burn'].tolist(),
+            'conservation_error': summary['conservation_error'].tolist(),
+            'max_N': summary['max_N'].tolist(),
+            'min_N': summary['min_N'].tolist(),
+            'final_S': summary['final_S'].tolist(),
+            'params_used': params_used
+        }
         
         statistics = {
             'final_N': {
@@ -292,36 +344,22 @@ class SensitivityAnalysis:
                 max_val = base_value * (1 + variation_range)
                 param_values = np.linspace(min_val, max_val, num_points)
             
-            param_results = {
-                'values': [],
-                'final_N': [],
-                'avg_issuance': [],
-                'avg_burn': [],
-                'conservation_error': [],
-                'stability_metric': []
-            }
-            
+            param_sets = []
             for param_val in param_values:
                 test_params = self.base_params.copy()
                 test_params[param_name] = param_val
-                
-                try:
-                    df = self._run_single_simulation(test_params)
-                    
-                    param_results['values'].append(float(param_val))
-                    param_results['final_N'].append(float(df['N'].iloc[-1]))
-                    param_results['avg_issuance'].append(float(df['I'].mean()))
-                    param_results['avg_burn'].append(float(df['B'].mean()))
-                    param_results['conservation_error'].append(
-                        float(abs(df['cumulative_I'].iloc[-1] - df['cumulative_B'].iloc[-1]))
-                    )
-                    
-                    stability = np.std(df['N']) / (np.mean(df['N']) + 1e-10)
-                    param_results['stability_metric'].append(float(stability))
-                    
-                except Exception as e:
-                    print(f"Sensitivity analysis failed for {param_name}={param_val}: {e}")
-                    continue
+                param_sets.append(test_params)
+            
+            summary = run_batched_simulations(self.signal_configs, param_sets)
+            
+            param_results = {
+                'values': [float(v) for v in param_values],
+                'final_N': summary['final_N'].tolist(),
+                'avg_issuance': summary['avg_issuance'].tolist(),
+                'avg_burn': summary['avg_burn'].tolist(),
+                'conservation_error': summary['conservation_error'].tolist(),
+                'stability_metric': (summary['std_N'] / (summary['mean_N'] + 1e-10)).tolist()
+            }
             
             results[param_name] = param_results
         
@@ -471,73 +509,172 @@ class StabilityMapper:
         param2_name: str,
         param1_range: tuple,
         param2_range: tuple,
-        resolution: int = 20
+        resolution: int = 20,
+        executor: str = 'batch',
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        seed: Optional[int] = 42,
+        on_progress: Optional[Callable[[Dict], None]] = None
     ) -> Dict:
         """
         Map stability across 2D parameter space
         
+        The grid is split into shards of cells. Each shard runs through the
+        batched Numba kernel, either in this process ('batch') or fanned out
+        over a process pool ('process'). Finished shards are merged as they
+        arrive, reported through on_progress and, if checkpoint_path is set,
+        saved so an interrupted sweep resumes with only the missing cells.
+        
         Args:
             param1_name: Name of first parameter to vary
             param2_name: Name of second parameter to vary
             param1_range: (min, max) for first parameter
             param2_range: (min, max) for second parameter
             resolution: Grid resolution (NxN grid)
+            executor: 'batch' (in-process) or 'process' (process pool)
+            max_workers: Process pool size (default: CPU count)
+            shard_size: Cells per shard (default: ~4 shards per worker)
+            checkpoint_path: .npz file to resume from and save progress to
+            seed: Global RNG seed applied before generating signals, so
+                  unseeded random signals give the same result in every cell
+                  regardless of sharding
+            on_progress: Called with the partial result after each shard
             
         Returns:
             Dict containing parameter grids and stability metrics
         """
+        if executor not in ('batch', 'process'):
+            raise ValueError(f"Unknown executor '{executor}', expected 'batch' or 'process'")
+        
         param1_values = np.linspace(param1_range[0], param1_range[1], resolution)
         param2_values = np.linspace(param2_range[0], param2_range[1], resolution)
         
-        stability_grid = np.zeros((resolution, resolution))
-        cv_grid = np.zeros((resolution, resolution))
-        final_N_grid = np.zeros((resolution, resolution))
-        conservation_grid = np.zeros((resolution, resolution))
+        # Cells are laid out with param1 as the outer loop; grids are indexed [j, i]
+        num_cells = resolution * resolution
+        sweep = {
+            'param1_name': param1_name,
+            'param2_name': param2_name,
+            'param1_values': param1_values,
+            'param2_values': param2_values,
+            'stability': np.zeros(num_cells),
+            'cv': np.full(num_cells, np.nan),
+            'final_N': np.full(num_cells, np.nan),
+            'conservation': np.full(num_cells, np.nan),
+            'done': np.zeros(num_cells, dtype=bool)
+        }
+        
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self._load_stability_checkpoint(checkpoint_path, sweep, seed)
         
-        total_sims = resolution * resolution
-        completed = 0
+        pending = np.flatnonzero(~sweep['done'])
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = max(1, -(-len(pending) // (max_workers * 4)))
+        shards = [pending[k:k + shard_size] for k in range(0, len(pending), shard_size)]
         
-        for i, p1_val in enumerate(param1_values):
-            for j, p2_val in enumerate(param2_values):
+        def shard_params(cells: np.ndarray) -> List[Dict]:
+            param_sets = []
+            for cell in cells:
                 test_params = self.base_params.copy()
-                test_params[param1_name] = float(p1_val)
-                test_params[param2_name] = float(p2_val)
-                
-                try:
-                    df = self._run_single_simulation(test_params)
-                    metrics = self._calculate_stability_metrics(df)
-                    
-                    stability_grid[j, i] = metrics['is_stable']
-                    cv_grid[j, i] = metrics['coefficient_of_variation']
-                    final_N_grid[j, i] = metrics['final_N']
-                    conservation_grid[j, i] = metrics['conservation_error']
-                    
-                except Exception as e:
-                    stability_grid[j, i] = 0.0
-                    cv_grid[j, i] = np.nan
-                    final_N_grid[j, i] = np.nan
-                    conservation_grid[j, i] = np.nan
-                
-                completed += 1
-                
-                if completed % 20 == 0:
-                    print(f"Stability mapping progress: {completed}/{total_sims} ({100*completed/total_sims:.1f}%)")
+                test_params[param1_name] = float(param1_values[cell // resolution])
+                test_params[param2_name] = float(param2_values[cell % resolution])
+                param_sets.append(test_params)
+            return param_sets
+        
+        def merge(cells: np.ndarray, summary: Dict[str, np.ndarray]):
+            sweep['stability'][cells] = summary['is_stable']
+            sweep['cv'][cells] = summary['std_N'] / (summary['mean_N'] + 1e-10)
+            sweep['final_N'][cells] = summary['final_N']
+            sweep['conservation'][cells] = summary['conservation_error']
+            sweep['done'][cells] = True
+            
+            if checkpoint_path:
+                self._save_stability_checkpoint(checkpoint_path, sweep, seed)
+            if on_progress is not None:
+                on_progress(self._stability_result(sweep, resolution))
+        
+        if executor == 'batch' or not shards:
+            for cells in shards:
+                merge(cells, run_batched_simulations(self.signal_configs, shard_params(cells), seed))
+        else:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+            else:
+                context = None
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                     initializer=_init_stability_worker) as pool:
+                futures = {
+                    pool.submit(run_batched_simulations, self.signal_configs,
+                                shard_params(cells), seed): cells
+                    for cells in shards
+                }
+                for future in as_completed(futures):
+                    merge(futures[future], future.result())
+        
+        return self._stability_result(sweep, resolution)
+    
+    def _stability_result(self, sweep: Dict, resolution: int) -> Dict:
+        """Build the (possibly partial) result dict from flat per-cell arrays"""
+        def to_grid(values: np.ndarray) -> np.ndarray:
+            return values.reshape(resolution, resolution).T.copy()
+        
+        stability_grid = to_grid(sweep['stability'])
         
         return {
-            'param1_name': param1_name,
-            'param2_name': param2_name,
-            'param1_values': param1_values,
-            'param2_values': param2_values,
+            'param1_name': sweep['param1_name'],
+            'param2_name': sweep['param2_name'],
+            'param1_values': sweep['param1_values'],
+            'param2_values': sweep['param2_values'],
             'stability_grid': stability_grid,
-            'cv_grid': cv_grid,
-            'final_N_grid': final_N_grid,
-            'conservation_grid': conservation_grid,
+            'cv_grid': to_grid(sweep['cv']),
+            'final_N_grid': to_grid(sweep['final_N']),
+            'conservation_grid': to_grid(sweep['conservation']),
+            'completed_grid': to_grid(sweep['done']),
+            'completed_cells': int(sweep['done'].sum()),
+            'total_cells': resolution * resolution,
             'stable_fraction': np.mean(stability_grid),
             'stable_param_combinations': self._identify_stable_regions(
-                param1_values, param2_values, stability_grid
+                sweep['param1_values'], sweep['param2_values'], stability_grid
             )
         }
     
+    def _checkpoint_signature(self, sweep: Dict, seed: Optional[int]) -> str:
+        """Describe the sweep so a checkpoint is only reused for the same grid"""
+        return json.dumps({
+            'param1_name': sweep['param1_name'],
+            'param2_name': sweep['param2_name'],
+            'param1_values': sweep['param1_values'].tolist(),
+            'param2_values': sweep['param2_values'].tolist(),
+            'base_params': self.base_params,
+            'signal_configs': self.signal_configs,
+            'seed': seed
+        }, sort_keys=True, default=str)
+    
+    def _save_stability_checkpoint(self, path: str, sweep: Dict, seed: Optional[int]):
+        """Atomically write completed cells to a checkpoint file"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                signature=np.array(self._checkpoint_signature(sweep, seed)),
+                stability=sweep['stability'],
+                cv=sweep['cv'],
+                final_N=sweep['final_N'],
+                conservation=sweep['conservation'],
+                done=sweep['done']
+            )
+        os.replace(tmp_path, path)
+    
+    def _load_stability_checkpoint(self, path: str, sweep: Dict, seed: Optional[int]):
+        """Restore completed cells from a checkpoint written for the same sweep"""
+        with np.load(path) as checkpoint:
+            if str(checkpoint['signature']) != self._checkpoint_signature(sweep, seed):
+                raise ValueError(f"Checkpoint {path} was written for a different stability sweep")
+            for key in ['stability', 'cv', 'final_N', 'conservation', 'done']:
+                sweep[key][:] = checkpoint[key]
+    
     def _identify_stable_regions(
         self,
         param1_values: np.ndarray,
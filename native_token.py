@@ -22,8 +22,14 @@ NexusToken (NXT): The native currency powering the entire ecosystem
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+from bisect import bisect_right
+from collections import Counter, deque
 from enum import Enum
+import json
+import os
+import sqlite3
+import threading
 import time
 import hashlib
 
@@ -71,6 +77,367 @@ class TokenTransaction:
         """Compute transaction hash"""
         tx_data = f"{self.tx_id}{self.tx_type.value}{self.from_address}{self.to_address}{self.amount}{self.fee}{self.timestamp}"
         return hashlib.sha256(tx_data.encode()).hexdigest()
+    
+    def to_dict(self) -> dict:
+        """Serialize for APIs and the on-disk ledger"""
+        return {
+            "tx_id": self.tx_id,
+            "tx_type": self.tx_type.value,
+            "from_address": self.from_address,
+            "to_address": self.to_address,
+            "amount": self.amount,
+            "fee": self.fee,
+            "timestamp": self.timestamp,
+            "data": self.data,
+            "signature": self.signature
+        }
+    
+    @classmethod
+    def from_dict(cls, payload: dict) -> "TokenTransaction":
+        """Rebuild a transaction serialized with to_dict()"""
+        return cls(**{**payload, "tx_type": TransactionType(payload["tx_type"])})
+
+
+@dataclass
+class TransferBatch:
+    """
+    Columnar record of transfers applied together by transfer_batch.
+    
+    One record replaces a TokenTransaction per transfer; individual
+    transactions are materialized on demand. Transfer i has tx_id
+    TX{start_seq + i:08d}.
+    """
+    batch_id: str
+    start_seq: int
+    from_addresses: List[str]
+    to_addresses: List[str]
+    amounts: List[int]
+    fees: List[int]
+    timestamp: float = field(default_factory=time.time)
+    reason: str = ""
+    _groups: Dict[str, Dict[str, List[int]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __len__(self) -> int:
+        return len(self.amounts)
+    
+    def rows_by(self, column: str) -> Dict[str, List[int]]:
+        """
+        Row numbers grouped by 'from_addresses' or 'to_addresses' (cached).
+        
+        Lets balances and the address index be updated once per distinct
+        address instead of once per transfer.
+        """
+        groups = self._groups.get(column)
+        if groups is None:
+            groups = {}
+            for row, address in enumerate(getattr(self, column)):
+                groups.setdefault(address, []).append(row)
+            self._groups[column] = groups
+        return groups
+    
+    @property
+    def tx_ids(self) -> List[str]:
+        return [f"TX{seq:08d}" for seq in range(self.start_seq, self.start_seq + len(self))]
+    
+    @property
+    def total_amount(self) -> int:
+        return sum(self.amounts)
+    
+    @property
+    def total_fees(self) -> int:
+        return sum(self.fees)
+    
+    def transaction(self, row: int) -> TokenTransaction:
+        """Materialize one transfer of the batch"""
+        data = {"batch_id": self.batch_id}
+        if self.reason:
+            data["reason"] = self.reason
+        return TokenTransaction(
+            tx_id=f"TX{self.start_seq + row:08d}",
+            tx_type=TransactionType.TRANSFER,
+            from_address=self.from_addresses[row],
+            to_address=self.to_addresses[row],
+            amount=self.amounts[row],
+            fee=self.fees[row],
+            timestamp=self.timestamp,
+            data=data
+        )
+    
+    def to_dict(self) -> dict:
+        return {
+            "batch_id": self.batch_id,
+            "start_seq": self.start_seq,
+            "from_addresses": self.from_addresses,
+            "to_addresses": self.to_addresses,
+            "amounts": self.amounts,
+            "fees": self.fees,
+            "timestamp": self.timestamp,
+            "reason": self.reason
+        }
+
+
+class TransactionLedger:
+    """
+    Append-only transaction history with a per-address index.
+    
+    The newest `memory_limit` transactions stay resident; older ones spill
+    to SQLite (a private temporary file by default), so a long-running node
+    holds steady memory however long its history grows. Entries are either
+    single TokenTransactions or columnar TransferBatch records, and every
+    transaction gets a sequence number equal to its TX id.
+    
+    Transactions are appended in timestamp order, so each address's index
+    is already sorted and `for_address` costs O(limit): resident matches
+    come from the in-memory index, older ones from an (address, seq) index
+    range scan on disk.
+    """
+    
+    def __init__(self, memory_limit: int = 100_000, path: str = "", batch_size: int = 1000):
+        """
+        Args:
+            memory_limit: Transactions kept resident before spilling to disk
+            path: SQLite file for spilled history ("" = temporary file,
+                  ":memory:" = no disk)
+            batch_size: Spilled entries written per insert batch
+        """
+        self.memory_limit = memory_limit
+        self.batch_size = batch_size
+        
+        # Resident entries and their start seqs, oldest first; entries before
+        # _head have been spilled and are trimmed lazily
+        self._starts: List[int] = []
+        self._entries: List = []
+        self._head = 0
+        self._resident_count = 0
+        # address -> deque of resident seqs, oldest first
+        self._address_index: Dict[str, deque] = {}
+        self._next_seq = 0
+        self._pending: List[Tuple] = []
+        self._lock = threading.RLock()
+        
+        # Incrementally maintained counters (see NativeTokenSystem.get_token_stats)
+        self.total_volume = 0
+        self.total_fees = 0
+        
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS token_transactions (seq INTEGER PRIMARY KEY, payload TEXT)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS token_tx_addresses (address TEXT, seq INTEGER, entry INTEGER, "
+            "offsets TEXT, PRIMARY KEY (address, seq)) WITHOUT ROWID"
+        )
+    
+    def __len__(self) -> int:
+        return self._next_seq
+    
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next transaction will get"""
+        return self._next_seq
+    
+    @property
+    def resident_count(self) -> int:
+        """Transactions currently held in memory"""
+        return self._resident_count
+    
+    def _index(self, address: str, seq: int):
+        seqs = self._address_index.get(address)
+        if seqs is None:
+            seqs = self._address_index[address] = deque()
+        seqs.append(seq)
+    
+    def append(self, tx: TokenTransaction):
+        """Record a transaction (must not be older than the last one appended)"""
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._starts.append(seq)
+            self._entries.append(tx)
+            self._resident_count += 1
+            self._index(tx.from_address, seq)
+            if tx.to_address != tx.from_address:
+                self._index(tx.to_address, seq)
+            
+            self.total_volume += tx.amount
+            self.total_fees += tx.fee
+            self._enforce_limit()
+    
+    def append_batch(self, batch: TransferBatch):
+        """Record a TransferBatch whose start_seq is next_seq"""
+        with self._lock:
+            start = self._next_seq
+            if batch.start_seq != start:
+                raise ValueError(f"Batch starts at seq {batch.start_seq}, expected {start}")
+            count = len(batch)
+            self._next_seq += count
+            self._starts.append(start)
+            self._entries.append(batch)
+            self._resident_count += count
+            
+            for address, rows in self._address_rows(batch).items():
+                seqs = self._address_index.get(address)
+                if seqs is None:
+                    seqs = self._address_index[address] = deque()
+                seqs.extend(start + row for row in rows)
+            
+            self.total_volume += batch.total_amount
+            self.total_fees += batch.total_fees
+            self._enforce_limit()
+    
+    def _enforce_limit(self):
+        while self._resident_count > self.memory_limit and self._head < len(self._starts):
+            self._spill()
+        if self._head > 1024 and 2 * self._head > len(self._starts):
+            del self._starts[:self._head]
+            del self._entries[:self._head]
+            self._head = 0
+    
+    @staticmethod
+    def _address_rows(entry) -> Dict[str, List[int]]:
+        """Ascending row offsets within an entry for every address it touches"""
+        if not isinstance(entry, TransferBatch):
+            if entry.from_address == entry.to_address:
+                return {entry.from_address: [0]}
+            return {entry.from_address: [0], entry.to_address: [0]}
+        
+        by_sender = entry.rows_by("from_addresses")
+        by_receiver = entry.rows_by("to_addresses")
+        if len(by_sender) == 1 and next(iter(by_sender)) not in by_receiver:
+            return {**by_receiver, **by_sender}
+        
+        merged = dict(by_receiver)
+        for address, rows in by_sender.items():
+            received = merged.get(address)
+            # Sender and receiver in one batch (or self-transfer): merge in order
+            merged[address] = rows if received is None else sorted(set(rows).union(received))
+        return merged
+    
+    def _spill(self):
+        """Move the oldest resident entry to disk"""
+        start = self._starts[self._head]
+        entry = self._entries[self._head]
+        self._entries[self._head] = None
+        self._head += 1
+        if isinstance(entry, TransferBatch):
+            payload = {"batch": entry.to_dict()}
+            self._resident_count -= len(entry)
+        else:
+            payload = entry.to_dict()
+            self._resident_count -= 1
+        
+        # One disk row per address per entry, holding its row offsets
+        addresses = []
+        for address, rows in self._address_rows(entry).items():
+            seqs = self._address_index[address]
+            if len(seqs) == len(rows):
+                del self._address_index[address]
+            else:
+                for _ in rows:
+                    seqs.popleft()
+            addresses.append((address, start + rows[-1], start, json.dumps(rows)))
+        
+        self._pending.append((start, json.dumps(payload, default=str), addresses))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Write spilled entries still buffered in memory"""
+        with self._lock:
+            if not self._pending:
+                return
+            self.conn.executemany(
+                "INSERT INTO token_transactions (seq, payload) VALUES (?, ?)",
+                [(seq, payload) for seq, payload, _ in self._pending]
+            )
+            self.conn.executemany(
+                "INSERT INTO token_tx_addresses (address, seq, entry, offsets) VALUES (?, ?, ?, ?)",
+                [row for _, _, addresses in self._pending for row in addresses]
+            )
+            self.conn.commit()
+            self._pending = []
+    
+    def _oldest_resident(self) -> int:
+        return self._starts[self._head] if self._head < len(self._starts) else self._next_seq
+    
+    def _lookup(self, seq: int):
+        """Resident entry containing seq"""
+        return self._entries[bisect_right(self._starts, seq, self._head) - 1]
+    
+    @staticmethod
+    def _materialize(entry, seq: int) -> TokenTransaction:
+        if isinstance(entry, TransferBatch):
+            return entry.transaction(seq - entry.start_seq)
+        return entry
+    
+    @staticmethod
+    def _decode(payload: str):
+        data = json.loads(payload)
+        if "batch" in data:
+            return TransferBatch(**data["batch"])
+        return TokenTransaction.from_dict(data)
+    
+    def for_address(self, address: str, limit: int = 100) -> List[TokenTransaction]:
+        """Newest-first transactions sent or received by an address"""
+        with self._lock:
+            seqs = self._address_index.get(address, ())
+            oldest_resident = self._oldest_resident()
+            result = []
+            for seq in reversed(seqs):
+                if len(result) >= limit:
+                    return result
+                result.append(self._materialize(self._lookup(seq), seq))
+            
+            remaining = limit - len(result)
+            if remaining <= 0 or oldest_resident == 0:
+                return result
+            
+            self.flush()
+            cursor = self.conn.execute(
+                "SELECT a.entry, a.offsets, t.payload FROM token_tx_addresses a "
+                "JOIN token_transactions t ON t.seq = a.entry "
+                "WHERE a.address = ? ORDER BY a.seq DESC",
+                (address,)
+            )
+            for start, offsets, payload in cursor:
+                entry = self._decode(payload)
+                for offset in reversed(json.loads(offsets)):
+                    result.append(self._materialize(entry, start + offset))
+                    if len(result) >= limit:
+                        cursor.close()
+                        return result
+        return result
+    
+    def recent(self, limit: int = 100) -> List[TokenTransaction]:
+        """Newest-first resident transactions"""
+        with self._lock:
+            newest = self._next_seq - 1
+            oldest = self._oldest_resident()
+            return [
+                self._materialize(self._lookup(seq), seq)
+                for seq in range(newest, max(oldest, newest - limit + 1) - 1, -1)
+            ]
+    
+    def __iter__(self) -> Iterator[TokenTransaction]:
+        """All transactions, oldest first (spilled history is read from disk)"""
+        with self._lock:
+            self.flush()
+            resident = self._entries[self._head:]
+            first_resident = self._oldest_resident()
+            rows = self.conn.execute(
+                "SELECT payload FROM token_transactions WHERE seq < ? ORDER BY seq",
+                (first_resident,)
+            ).fetchall()
+        for entry in [self._decode(payload) for payload, in rows] + resident:
+            if isinstance(entry, TransferBatch):
+                for row in range(len(entry)):
+                    yield entry.transaction(row)
+            else:
+                yield entry
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
 
 
 @dataclass
@@ -133,9 +500,21 @@ class NativeTokenSystem:
     VALIDATOR_INFLATION_RATE = 0.02  # 2% annual (halves every 4 years, Bitcoin-style)
     MAX_ANNUAL_BURN_PCT = 5.0  # Cap burns at 5% of circulating supply per year
     
-    def __init__(self):
+    # Transactions kept in memory before older history spills to disk
+    HISTORY_MEMORY_LIMIT = 100_000
+    
+    def __init__(self, history_memory_limit: Optional[int] = None, history_path: Optional[str] = None):
+        """
+        Args:
+            history_memory_limit: Resident transactions (default HISTORY_MEMORY_LIMIT)
+            history_path: SQLite file for spilled history (default
+                          $NEXUS_TOKEN_HISTORY_PATH or a temporary file)
+        """
         self.accounts: Dict[str, Account] = {}
-        self.transactions: List[TokenTransaction] = []
+        self.transactions = TransactionLedger(
+            memory_limit=history_memory_limit or self.HISTORY_MEMORY_LIMIT,
+            path=history_path if history_path is not None else os.environ.get('NEXUS_TOKEN_HISTORY_PATH', '')
+        )
         self.total_burned: int = 0
         self.total_minted: int = self.TOTAL_SUPPLY  # All tokens minted at genesis
         self.tx_counter: int = 0
@@ -331,6 +710,134 @@ class NativeTokenSystem:
                 f"Transfer failed and rolled back: {str(e)}"
             )
     
+    def transfer_batch(
+        self,
+        transfers: List[Tuple[str, str, int]],
+        fee: Optional[int] = None,
+        reason: str = ""
+    ) -> Tuple[bool, Optional[TransferBatch], str]:
+        """
+        Apply many transfers atomically - for payout bursts.
+        
+        All balances are validated before anything changes, the whole batch
+        commits or rolls back from one snapshot, each distinct sender is
+        rate-limited once per batch (not once per transfer), and the result
+        is recorded as a single columnar TransferBatch.
+        
+        Balances are checked against each sender's total debit at the start
+        of the batch; credits received within the same batch do not fund
+        later transfers.
+        
+        Args:
+            transfers: (from_address, to_address, amount) tuples, amounts in units
+            fee: Per-transfer fee (defaults to BASE_TRANSFER_FEE)
+            reason: Optional reason recorded with every transfer
+        
+        Returns:
+            (success: bool, batch: Optional[TransferBatch], message: str)
+        
+        Example:
+            success, batch, msg = token_system.transfer_batch(
+                [("VALIDATOR_POOL", addr, reward) for addr in validators], fee=0
+            )
+        """
+        if not transfers:
+            return (False, None, "Empty transfer batch")
+        
+        if fee is None:
+            fee = self.BASE_TRANSFER_FEE
+        
+        from_addresses, to_addresses, amounts = (list(column) for column in zip(*transfers))
+        if min(amounts) < 0 or fee < 0:
+            return (False, None, "Transfer amounts and fees must be non-negative")
+        
+        # Step 1: Aggregate debits per sender
+        counts = Counter(from_addresses)
+        debits: Dict[str, int] = {}
+        for sender, amount in zip(from_addresses, amounts):
+            debits[sender] = debits.get(sender, 0) + amount + fee
+        
+        # 🔒 SECURITY: Rate limiting once per distinct sender (BEFORE any operations)
+        rate_limiter = get_rate_limiter()
+        for sender in debits:
+            allowed, rate_reason = rate_limiter.check_rate_limit(sender, "transfer")
+            if not allowed:
+                return (False, None, f"🔒 Rate limit for {sender}: {rate_reason}")
+        
+        # Step 2: Validate every sender (BEFORE any mutations)
+        senders = {}
+        for sender, total_deduct in debits.items():
+            account = self.accounts.get(sender)
+            if account is None:
+                return (False, None, f"Sender account '{sender}' not found")
+            if not account.has_sufficient_balance(total_deduct):
+                return (
+                    False,
+                    None,
+                    f"Insufficient balance for {sender}: need {total_deduct} units, have {account.balance} units"
+                )
+            senders[sender] = account
+        
+        # Step 3: One snapshot for the whole batch
+        validator_pool = self.get_account("VALIDATOR_POOL")
+        sender_snapshot = {address: (a.balance, a.nonce) for address, a in senders.items()}
+        receiver_snapshot = {
+            address: self.accounts[address].balance
+            for address in set(to_addresses) if address in self.accounts
+        }
+        validator_balance_before = validator_pool.balance if validator_pool else 0
+        created = []
+        
+        try:
+            # Step 4: Apply the batch
+            for sender, account in senders.items():
+                account.balance -= debits[sender]
+                account.nonce += counts[sender]
+            
+            batch = TransferBatch(
+                batch_id=f"BATCH{self.tx_counter:08d}",
+                start_seq=self.tx_counter,
+                from_addresses=from_addresses,
+                to_addresses=to_addresses,
+                amounts=amounts,
+                fees=[fee] * len(amounts),
+                reason=reason
+            )
+            
+            for receiver, rows in batch.rows_by("to_addresses").items():
+                account = self.accounts.get(receiver)
+                if account is None:
+                    account = self.create_account(receiver)
+                    created.append(receiver)
+                account.balance += sum(amounts[row] for row in rows)
+            
+            if fee > 0 and validator_pool:
+                validator_pool.balance += fee * len(amounts)
+            
+            # Step 5: Record one columnar entry
+            self.transactions.append_batch(batch)
+            self.tx_counter += len(batch)
+            
+            return (True, batch, f"Batch successful: {len(batch)} transfers, {batch.total_amount} units")
+            
+        except Exception as e:
+            # Step 6: ROLLBACK on any error
+            for address, (balance, nonce) in sender_snapshot.items():
+                self.accounts[address].balance = balance
+                self.accounts[address].nonce = nonce
+            for address, balance in receiver_snapshot.items():
+                self.accounts[address].balance = balance
+            for address in created:
+                self.accounts.pop(address, None)
+            if validator_pool:
+                validator_pool.balance = validator_balance_before
+            
+            return (
+                False,
+                None,
+                f"Batch failed and rolled back: {str(e)}"
+            )
+    
     def burn(self, from_address: str, amount: int, reason: str = "") -> Optional[TokenTransaction]:
         """Burn tokens (deflationary mechanism)"""
         from_account = self.get_account(from_address)
@@ -618,17 +1125,15 @@ class NativeTokenSystem:
             "burn_rate_percent": self.get_burn_rate(),
             "total_accounts": len(self.accounts),
             "total_transactions": len(self.transactions),
+            "transaction_volume": self.transactions.total_volume,
+            "total_fees": self.transactions.total_fees,
             "validator_reserve": validator_pool.balance if validator_pool else 0,
             "ecosystem_reserve": ecosystem_fund.balance if ecosystem_fund else 0,
         }
     
     def get_account_transactions(self, address: str, limit: int = 100) -> List[TokenTransaction]:
-        """Get transactions for an account"""
-        account_txs = [
-            tx for tx in self.transactions
-            if tx.from_address == address or tx.to_address == address
-        ]
-        return sorted(account_txs, key=lambda x: x.timestamp, reverse=True)[:limit]
+        """Get transactions for an account, newest first"""
+        return self.transactions.for_address(address, limit)
     
     def units_to_nxt(self, units: int) -> float:
         """Convert units to NXT"""
@@ -8,8 +8,40 @@ while maintaining exact numerical equivalence with the original engine.
 
 import numpy as np
 import pandas as pd
-from numba import jit
-from typing import Dict
+from numba import jit, prange
+from typing import Dict, List, Optional
+from simulation_cache import SimulationResultCache, RESULT_ARRAYS
+
+
+# Column order of the parameter matrix consumed by simulate_nexus_batch_numba
+BATCH_PARAM_NAMES = (
+    'N_initial',
+    'alpha', 'beta', 'kappa', 'eta',
+    'w_H', 'w_M', 'w_D', 'w_E',
+    'gamma_C', 'gamma_D', 'gamma_E',
+    'K_p', 'K_i', 'K_d',
+    'N_target', 'F_floor',
+    'lambda_E', 'lambda_N', 'lambda_H', 'lambda_M',
+    'N_0', 'H_0', 'M_0'
+)
+
+BATCH_PARAM_DEFAULTS = {
+    'N_initial': 1000.0,
+    'alpha': 1.0, 'beta': 1.0, 'kappa': 0.01, 'eta': 0.1,
+    'w_H': 0.4, 'w_M': 0.3, 'w_D': 0.2, 'w_E': 0.1,
+    'gamma_C': 0.5, 'gamma_D': 0.3, 'gamma_E': 0.2,
+    'K_p': 0.1, 'K_i': 0.01, 'K_d': 0.05,
+    'N_target': 1000.0, 'F_floor': 10.0,
+    'lambda_E': 0.3, 'lambda_N': 0.3, 'lambda_H': 0.2, 'lambda_M': 0.2,
+    'N_0': 1000.0, 'H_0': 100.0, 'M_0': 100.0
+}
+
+# Column order of the per-run summary returned by simulate_nexus_batch_numba
+BATCH_SUMMARY_FIELDS = (
+    'final_N', 'mean_N', 'std_N', 'max_N', 'min_N', 'final_S',
+    'avg_issuance', 'avg_burn', 'conservation_error',
+    'convergence_rate', 'is_stable'
+)
 
 
 @jit(nopython=True, cache=True)
@@ -108,6 +140,117 @@ def simulate_nexus_numba(
     return N, S, I, B, Phi, e, dN_dt, e_integral, e_prev
 
 
+@jit(nopython=True, parallel=True, cache=True)
+def simulate_nexus_batch_numba(
+    signals_H: np.ndarray,
+    signals_M: np.ndarray,
+    signals_D: np.ndarray,
+    signals_E: np.ndarray,
+    signals_C_cons: np.ndarray,
+    signals_C_disp: np.ndarray,
+    delta_t: float,
+    param_matrix: np.ndarray
+):
+    """
+    Run one trajectory per parameter row in parallel and reduce each to
+    summary statistics (see BATCH_SUMMARY_FIELDS).
+    
+    Every run starts with a fresh PID controller and shares the same input
+    signals. Trajectories are discarded after reduction, so memory stays
+    O(num_steps) per worker thread regardless of the number of samples.
+    """
+    num_runs = param_matrix.shape[0]
+    num_steps = len(signals_H)
+    summary = np.empty((num_runs, len(BATCH_SUMMARY_FIELDS)))
+    
+    for run in prange(num_runs):
+        p = param_matrix[run]
+        N, S, I, B, Phi, e, dN_dt, e_integral, e_prev = simulate_nexus_numba(
+            signals_H, signals_M, signals_D, signals_E, signals_C_cons, signals_C_disp,
+            p[0], delta_t,
+            p[1], p[2], p[3], p[4],
+            p[5], p[6], p[7], p[8],
+            p[9], p[10], p[11],
+            p[12], p[13], p[14],
+            p[15], p[16],
+            p[17], p[18], p[19], p[20],
+            p[21], p[22], p[23],
+            0.0, 0.0
+        )
+        
+        mean_N = np.mean(N)
+        std_N = np.std(N)
+        max_N = np.max(N)
+        min_N = np.min(N)
+        cv = std_N / (mean_N + 1e-10)
+        
+        if num_steps < 100:
+            convergence_rate = 0.0
+        else:
+            second_half = N[num_steps // 2:]
+            convergence_rate = np.std(second_half) / (np.mean(second_half) + 1e-10)
+        
+        is_stable = 1.0
+        if not np.all(np.isfinite(N)) or min_N < 0 or cv > 1.0:
+            is_stable = 0.0
+        
+        summary[run, 0] = N[-1]
+        summary[run, 1] = mean_N
+        summary[run, 2] = std_N
+        summary[run, 3] = max_N
+        summary[run, 4] = min_N
+        summary[run, 5] = S[-1]
+        summary[run, 6] = np.mean(I)
+        summary[run, 7] = np.mean(B)
+        summary[run, 8] = abs(np.sum(I) * delta_t - np.sum(B) * delta_t)
+        summary[run, 9] = convergence_rate
+        summary[run, 10] = is_stable
+    
+    return summary
+
+
+def build_param_matrix(param_sets: List[Dict]) -> np.ndarray:
+    """
+    Pack parameter dictionaries into an (n_samples x n_params) matrix.
+    
+    Missing parameters fall back to the NexusEngine defaults.
+    """
+    matrix = np.empty((len(param_sets), len(BATCH_PARAM_NAMES)))
+    for row, params in enumerate(param_sets):
+        for col, name in enumerate(BATCH_PARAM_NAMES):
+            matrix[row, col] = float(params.get(name, BATCH_PARAM_DEFAULTS[name]))
+    return matrix
+
+
+def run_batch_summary(
+    signals: Dict[str, np.ndarray],
+    delta_t: float,
+    param_matrix: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Run a batch of simulations sharing one set of input signals.
+    
+    Args:
+        signals: Dict with 'H', 'M', 'D', 'E', 'C_cons', 'C_disp' arrays
+        delta_t: Time step size
+        param_matrix: (n_samples x n_params) matrix in BATCH_PARAM_NAMES order
+        
+    Returns:
+        Dict mapping each BATCH_SUMMARY_FIELDS name to an (n_samples,) array
+    """
+    summary = simulate_nexus_batch_numba(
+        np.ascontiguousarray(signals['H'], dtype=np.float64),
+        np.ascontiguousarray(signals['M'], dtype=np.float64),
+        np.ascontiguousarray(signals['D'], dtype=np.float64),
+        np.ascontiguousarray(signals['E'], dtype=np.float64),
+        np.ascontiguousarray(signals['C_cons'], dtype=np.float64),
+        np.ascontiguousarray(signals['C_disp'], dtype=np.float64),
+        float(delta_t),
+        np.ascontiguousarray(param_matrix, dtype=np.float64)
+    )
+    return {name: summary[:, col] for col, name in enumerate(BATCH_SUMMARY_FIELDS)}
+
+
 class NexusEngineNumba:
     """
     High-performance NexusEngine using Numba JIT compilation.
@@ -116,7 +259,15 @@ class NexusEngineNumba:
     exact numerical equivalence with the original NexusEngine.
     """
     
-    def __init__(self, params: Dict):
+    def __init__(self, params: Dict, cache: Optional[SimulationResultCache] = None):
+        """
+        Args:
+            params: Engine parameters (missing keys use defaults)
+            cache: Optional persistent result cache; identical runs are
+                   served from disk instead of being re-simulated
+        """
+        self.cache = cache
+        
         self.alpha = params.get('alpha', 1.0)
         self.beta = params.get('beta', 1.0)
         self.kappa = params.get('kappa', 0.01)
@@ -186,19 +337,34 @@ class NexusEngineNumba:
         if reset_controller:
             self.reset_controller()
         
-        # Call JIT-compiled simulation core
-        N, S, I, B, Phi, e, dN_dt, e_integral_final, e_prev_final = simulate_nexus_numba(
-            signals_H, signals_M, signals_D, signals_E, signals_C_cons, signals_C_disp,
-            N_initial, delta_t,
-            self.alpha, self.beta, self.kappa, self.eta,
-            self.w_H, self.w_M, self.w_D, self.w_E,
-            self.gamma_C, self.gamma_D, self.gamma_E,
-            self.K_p, self.K_i, self.K_d,
-            self.N_target, self.F_floor,
-            self.lambda_E, self.lambda_N, self.lambda_H, self.lambda_M,
-            self.N_0, self.H_0, self.M_0,
-            self.e_integral, self.e_prev
-        )
+        signals = (signals_H, signals_M, signals_D, signals_E, signals_C_cons, signals_C_disp)
+        engine_params = tuple(getattr(self, name) for name in BATCH_PARAM_NAMES[1:])
+        
+        cache_key = None
+        cached = None
+        if self.cache is not None:
+            cache_key = SimulationResultCache.make_key(
+                engine_params, signals, N_initial, delta_t, self.e_integral, self.e_prev
+            )
+            cached = self.cache.get(cache_key)
+        
+        if cached is not None:
+            arrays, final_state = cached
+            N, S, I, B, Phi, e, dN_dt = (arrays[name] for name in RESULT_ARRAYS)
+            e_integral_final = final_state['e_integral']
+            e_prev_final = final_state['e_prev']
+        else:
+            # Call JIT-compiled simulation core
+            N, S, I, B, Phi, e, dN_dt, e_integral_final, e_prev_final = simulate_nexus_numba(
+                *signals, N_initial, delta_t, *engine_params, self.e_integral, self.e_prev
+            )
+            
+            if self.cache is not None:
+                self.cache.put(
+                    cache_key,
+                    dict(zip(RESULT_ARRAYS, (N, S, I, B, Phi, e, dN_dt))),
+                    {'e_integral': e_integral_final, 'e_prev': e_prev_final}
+                )
         
         # Update PID state for next run
         self.e_integral = e_integral_final
@@ -13,11 +13,13 @@ Uses NexusOS's existing blockchain infrastructure:
 import os
 import json
 import time
+import base64
 import hashlib
+import heapq
 import secrets
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 # NexusOS core components
@@ -38,7 +40,7 @@ from cryptography.hazmat.backends import default_backend
 
 # Database
 import sqlalchemy as sa
-from sqlalchemy import create_engine, Column, String, Float, Integer, BigInteger, DateTime, Text, Boolean
+from sqlalchemy import create_engine, Column, String, Float, Integer, BigInteger, DateTime, Text, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import OperationalError, DBAPIError
@@ -120,6 +122,13 @@ class WalletTransaction(Base):
     spectral_proof = Column(Text, nullable=False)
     interference_hash = Column(String(128), nullable=False)
     energy_cost = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        # Keyset pagination: (address, timestamp, id) ranges per side of a transfer
+        Index('ix_wallet_tx_from_time', 'from_address', 'timestamp', 'id'),
+        Index('ix_wallet_tx_to_time', 'to_address', 'timestamp', 'id'),
+        Index('ix_wallet_tx_time', 'timestamp', 'id'),
+    )
 
 class WalletMessage(Base):
     """WNSP messages sent from wallet"""
@@ -135,6 +144,12 @@ class WalletMessage(Base):
     cost_nxt = Column(Float, nullable=False)
     timestamp = Column(DateTime, default=datetime.utcnow)
     dag_parents = Column(Text)  # JSON list of parent message IDs
+    
+    __table_args__ = (
+        Index('ix_wallet_msg_from_time', 'from_address', 'timestamp', 'id'),
+        Index('ix_wallet_msg_to_time', 'to_address', 'timestamp', 'id'),
+        Index('ix_wallet_msg_time', 'timestamp', 'id'),
+    )
 
 class TokenAccount(Base):
     """Persistent token account storage"""
@@ -161,6 +176,11 @@ class TransactionIO(Base):
     is_spent = Column(Boolean, default=False)
     spent_in_tx = Column(String(64), nullable=True)  # TX that spent this output
     timestamp = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_tx_io_tx', 'tx_id'),
+        Index('ix_tx_io_address', 'address'),
+    )
 
 class DagEdge(Base):
     """DAG structure for transactions - tracks parent-child relationships like blockchain"""
@@ -174,6 +194,11 @@ class DagEdge(Base):
     # DAG metrics
     depth = Column(Integer, nullable=False)  # Distance from genesis
     timestamp = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_dag_edge_child_depth', 'child_id', 'depth'),
+        Index('ix_dag_edge_parent', 'parent_id'),
+    )
 
 class VerificationRecord(Base):
     """Wavelength validation proof - shows how each transaction was verified"""
@@ -213,6 +238,25 @@ class EnergyReservation(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     finalized_at = Column(DateTime, nullable=True)
 
+class LedgerAuditCheckpoint(Base):
+    """Progress marker for incremental ledger audits (highest audited row ids)"""
+    __tablename__ = 'nexus_ledger_audit_checkpoints'
+    
+    id = Column(Integer, primary_key=True)
+    last_tx_row_id = Column(Integer, nullable=False, default=0)
+    last_edge_row_id = Column(Integer, nullable=False, default=0)
+    status = Column(String(20), nullable=False)
+    audited_at = Column(DateTime, default=datetime.utcnow)
+
+class LedgerAuditFlow(Base):
+    """Per-address confirmed transaction flows up to the latest audit checkpoint"""
+    __tablename__ = 'nexus_ledger_audit_flows'
+    
+    address = Column(String(64), primary_key=True)
+    incoming_nxt = Column(Float, nullable=False, default=0.0)
+    outgoing_nxt = Column(Float, nullable=False, default=0.0)  # Amount + fee
+    tx_count = Column(Integer, nullable=False, default=0)
+
 class DeviceWalletMapping(Base):
     """Maps simple device credentials to blockchain addresses"""
     __tablename__ = 'nexus_device_wallet_mapping'
@@ -227,6 +271,45 @@ class DeviceWalletMapping(Base):
     last_seen = Column(DateTime, default=datetime.utcnow)
 
 
+def ensure_indexes(engine) -> List[str]:
+    """
+    Create any model indexes missing from existing tables.
+    
+    create_all() only adds indexes when it creates a table, so databases
+    created before an index was declared need this migration step.
+    
+    Returns:
+        Names of the indexes that were created
+    """
+    inspector = sa.inspect(engine)
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {idx['name'] for idx in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=engine, checkfirst=True)
+                created.append(index.name)
+    return created
+
+
+def encode_page_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque continuation token"""
+    payload = json.dumps({'t': timestamp.isoformat(), 'i': row_id}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_page_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a continuation token produced by encode_page_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload['t']), int(payload['i'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
 # ============================================================================
 # NexusOS Native Wallet
 # ============================================================================
@@ -264,6 +347,7 @@ class NexusNativeWallet:
                 max_overflow=10       # Max overflow connections
             )
             Base.metadata.create_all(self.engine)
+            ensure_indexes(self.engine)
             
             # Store SessionMaker instead of single session
             self.SessionMaker = sessionmaker(bind=self.engine)
@@ -680,7 +764,8 @@ class NexusNativeWallet:
             # 2. DAG Edge: Link to parent transactions
             parent_txs = self.db.query(WalletTransaction).filter(
                 (WalletTransaction.from_address == from_address) | 
-                (WalletTransaction.to_address == from_address)
+                (WalletTransaction.to_address == from_address),
+                WalletTransaction.tx_id != tx_id  # Autoflush makes this tx visible already
             ).order_by(WalletTransaction.timestamp.desc()).limit(2).all()
             
             depth = 0
@@ -930,19 +1015,18 @@ class NexusNativeWallet:
         received: bool = True
     ) -> List[Dict[str, Any]]:
         """Get message history for address"""
-        query = self.db.query(WalletMessage)
-        
-        if sent and received:
-            query = query.filter(
-                (WalletMessage.from_address == address) |
-                (WalletMessage.to_address == address)
-            )
-        elif sent:
-            query = query.filter(WalletMessage.from_address == address)
-        elif received:
-            query = query.filter(WalletMessage.to_address == address)
-        
-        messages = query.order_by(WalletMessage.timestamp.desc()).limit(limit).all()
+        filters = []
+        if sent:
+            filters.append(WalletMessage.from_address == address)
+        if received:
+            filters.append(WalletMessage.to_address == address)
+        
+        if filters:
+            messages, _ = self._keyset_page(WalletMessage, filters, limit)
+        else:
+            messages = self.db.query(WalletMessage).order_by(
+                WalletMessage.timestamp.desc()
+            ).limit(limit).all()
         
         return [
             {
@@ -962,6 +1046,62 @@ class NexusNativeWallet:
     # Transaction History
     # ========================================================================
     
+    def _keyset_page(
+        self,
+        model,
+        filters: List,
+        page_size: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List, Optional[str]]:
+        """
+        Fetch one page of rows newest-first using keyset pagination.
+        
+        Each filter is queried separately so every branch of an OR (e.g.
+        sender side / receiver side) is a single (address, timestamp, id)
+        index range scan bounded by page_size; branches are merged in
+        Python. Cost is O(page_size) regardless of history length.
+        
+        Args:
+            model: WalletTransaction or WalletMessage
+            filters: Filter expressions OR-ed together ([] for all rows)
+            page_size: Maximum rows to return
+            cursor: Continuation token from a previous page
+        
+        Returns:
+            (rows, next_cursor) - next_cursor is None on the last page
+        """
+        position = decode_page_cursor(cursor) if cursor else None
+        
+        branches = []
+        for condition in (filters or [None]):
+            query = self.db.query(model)
+            if condition is not None:
+                query = query.filter(condition)
+            if position:
+                ts, row_id = position
+                query = query.filter(
+                    (model.timestamp < ts) | ((model.timestamp == ts) & (model.id < row_id))
+                )
+            branches.append(query.order_by(
+                model.timestamp.desc(), model.id.desc()
+            ).limit(page_size + 1).all())
+        
+        rows = []
+        seen = set()
+        for row in heapq.merge(*branches, key=lambda r: (r.timestamp, r.id), reverse=True):
+            # A self-transfer matches both branches
+            if row.id in seen:
+                continue
+            seen.add(row.id)
+            rows.append(row)
+            if len(rows) > page_size:
+                break
+        
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            return rows, encode_page_cursor(rows[-1].timestamp, rows[-1].id)
+        return rows, None
+    
     @retry_on_connection_error(max_retries=2)
     def get_transaction_history(
         self,
@@ -969,24 +1109,43 @@ class NexusNativeWallet:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get NXT transaction history"""
-        transactions = self.db.query(WalletTransaction).filter(
-            (WalletTransaction.from_address == address) |
-            (WalletTransaction.to_address == address)
-        ).order_by(WalletTransaction.timestamp.desc()).limit(limit).all()
+        return self.get_transaction_history_page(address, page_size=limit)['transactions']
+    
+    @retry_on_connection_error(max_retries=2)
+    def get_transaction_history_page(
+        self,
+        address: str,
+        page_size: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of NXT transaction history, newest first.
         
-        return [
-            {
-                'tx_id': tx.tx_id,
-                'from_address': tx.from_address,
-                'to_address': tx.to_address,
-                'amount_nxt': tx.amount_nxt,
-                'fee_nxt': tx.fee_nxt,
-                'status': tx.status,
-                'timestamp': tx.timestamp.isoformat(),
-                'quantum_verified': True
-            }
-            for tx in transactions
-        ]
+        Pass the returned next_cursor to fetch the following page.
+        """
+        transactions, next_cursor = self._keyset_page(
+            WalletTransaction,
+            [WalletTransaction.from_address == address, WalletTransaction.to_address == address],
+            page_size,
+            cursor
+        )
+        
+        return {
+            'transactions': [
+                {
+                    'tx_id': tx.tx_id,
+                    'from_address': tx.from_address,
+                    'to_address': tx.to_address,
+                    'amount_nxt': tx.amount_nxt,
+                    'fee_nxt': tx.fee_nxt,
+                    'status': tx.status,
+                    'timestamp': tx.timestamp.isoformat(),
+                    'quantum_verified': True
+                }
+                for tx in transactions
+            ],
+            'next_cursor': next_cursor
+        }
     
     @retry_on_connection_error(max_retries=2)
     def get_message_history(
@@ -995,23 +1154,36 @@ class NexusNativeWallet:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get message history for wallet"""
-        messages = self.db.query(WalletMessage).filter_by(
-            from_address=address
-        ).order_by(WalletMessage.timestamp.desc()).limit(limit).all()
+        return self.get_message_history_page(address, page_size=limit)['messages']
+    
+    @retry_on_connection_error(max_retries=2)
+    def get_message_history_page(
+        self,
+        address: str,
+        page_size: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get one page of sent messages, newest first"""
+        messages, next_cursor = self._keyset_page(
+            WalletMessage, [WalletMessage.from_address == address], page_size, cursor
+        )
         
-        return [
-            {
-                'message_id': msg.message_id,
-                'to_address': msg.to_address,
-                'content': msg.content,
-                'cost_nxt': msg.cost_nxt,
-                'wavelength': msg.wavelength,
-                'spectral_region': msg.spectral_region,
-                'timestamp': msg.timestamp.isoformat(),
-                'status': 'sent'
-            }
-            for msg in messages
-        ]
+        return {
+            'messages': [
+                {
+                    'message_id': msg.message_id,
+                    'to_address': msg.to_address,
+                    'content': msg.content,
+                    'cost_nxt': msg.cost_nxt,
+                    'wavelength': msg.wavelength,
+                    'spectral_region': msg.spectral_region,
+                    'timestamp': msg.timestamp.isoformat(),
+                    'status': 'sent'
+                }
+                for msg in messages
+            ],
+            'next_cursor': next_cursor
+        }
     
     # ========================================================================
     # Utility Methods
@@ -1054,25 +1226,35 @@ class NexusNativeWallet:
         Get ALL transactions from blockchain (for explorer/analytics)
         READ-ONLY bulk query - much more efficient than per-wallet queries
         """
-        transactions = self.db.query(WalletTransaction).order_by(
-            WalletTransaction.timestamp.desc()
-        ).limit(limit).all()
+        return self.get_all_transactions_page(page_size=limit)['transactions']
+    
+    @retry_on_connection_error(max_retries=2)
+    def get_all_transactions_page(
+        self,
+        page_size: int = 1000,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get one page of all transactions, newest first (for explorer paging)"""
+        transactions, next_cursor = self._keyset_page(WalletTransaction, [], page_size, cursor)
         
-        return [
-            {
-                'tx_id': tx.tx_id,
-                'from_address': tx.from_address,
-                'to_address': tx.to_address,
-                'amount_nxt': tx.amount_nxt,
-                'fee_nxt': tx.fee_nxt,
-                'status': tx.status,
-                'timestamp': tx.timestamp.isoformat(),
-                'energy_cost': tx.energy_cost,
-                'interference_hash': tx.interference_hash,
-                'quantum_verified': True
-            }
-            for tx in transactions
-        ]
+        return {
+            'transactions': [
+                {
+                    'tx_id': tx.tx_id,
+                    'from_address': tx.from_address,
+                    'to_address': tx.to_address,
+                    'amount_nxt': tx.amount_nxt,
+                    'fee_nxt': tx.fee_nxt,
+                    'status': tx.status,
+                    'timestamp': tx.timestamp.isoformat(),
+                    'energy_cost': tx.energy_cost,
+                    'interference_hash': tx.interference_hash,
+                    'quantum_verified': True
+                }
+                for tx in transactions
+            ],
+            'next_cursor': next_cursor
+        }
     
     @retry_on_connection_error(max_retries=2)
     def get_all_messages(self, limit: int = 1000) -> List[Dict[str, Any]]:
@@ -1283,8 +1465,21 @@ class NexusNativeWallet:
     # Genesis-to-Tip Audit: Verify Ledger Integrity
     # ========================================================================
     
+    # Rows per batch for streamed audit queries and IN (...) lookups
+    AUDIT_BATCH_SIZE = 5000
+    
+    # Serial ids are handed out before commit, so a row with a lower id can
+    # still commit after a higher one was read. Rows younger than this are
+    # audited but left above the checkpoint watermark; assumes no ledger
+    # transaction stays open longer than this.
+    AUDIT_SETTLE_SECONDS = 300
+    
     @retry_on_connection_error(max_retries=2)
-    def audit_ledger_integrity(self) -> Dict[str, Any]:
+    def audit_ledger_integrity(
+        self,
+        incremental: bool = False,
+        record_checkpoint: bool = True
+    ) -> Dict[str, Any]:
         """
         Perform Bitcoin-style audit of the entire ledger from genesis to tip.
         
@@ -1295,27 +1490,73 @@ class NexusNativeWallet:
         4. IO records match transaction amounts
         5. No double-spends detected
         
+        Balances are reconciled from one grouped SQL aggregate of per-address
+        flows, and DAG edges are read in batches into an iterative Kahn cycle
+        check, so the audit issues a constant number of queries regardless of
+        the number of accounts.
+        
+        A checkpoint is only recorded when the audit passes, so a failing
+        range is re-audited until it is fixed. Its watermark is the newest
+        row older than AUDIT_SETTLE_SECONDS: rows above it are audited now
+        and again by the next incremental run, which catches rows whose
+        lower id committed late.
+        
+        Args:
+            incremental: Only audit rows added since the last passing
+                         checkpoint (falls back to a full audit if none exists)
+            record_checkpoint: Store a checkpoint (on pass) so later
+                               incremental audits can resume from this one
+        
         Returns:
             Audit report with status and findings
         """
         audit_report = {
             'timestamp': datetime.utcnow().isoformat(),
             'status': 'pass',
+            'mode': 'full',
             'errors': [],
             'warnings': [],
             'statistics': {}
         }
         
         try:
+            # Fix the audited range up front so rows committed mid-audit are
+            # left for the next run
+            max_tx_row = self.db.query(sa.func.max(WalletTransaction.id)).scalar() or 0
+            max_edge_row = self.db.query(sa.func.max(DagEdge.id)).scalar() or 0
+            settled_before = datetime.utcnow() - timedelta(seconds=self.AUDIT_SETTLE_SECONDS)
+            
+            checkpoint = None
+            if incremental:
+                checkpoint = self.db.query(LedgerAuditCheckpoint).filter_by(status='pass').order_by(
+                    LedgerAuditCheckpoint.id.desc()
+                ).first()
+            
+            if checkpoint:
+                audit_report['mode'] = 'incremental'
+                tx_range = (checkpoint.last_tx_row_id, max_tx_row)
+                edge_range = (checkpoint.last_edge_row_id, max_edge_row)
+            else:
+                tx_range = (0, max_tx_row)
+                edge_range = (0, max_edge_row)
+            settled_tx_row = self._settled_row(WalletTransaction, tx_range, settled_before)
+            settled_edge_row = self._settled_row(DagEdge, edge_range, settled_before)
+            audit_report['audited_range'] = {
+                'tx_rows': list(tx_range),
+                'edge_rows': list(edge_range)
+            }
+            
             # 1. Verify DAG structure
-            dag_check = self._verify_dag_structure()
+            dag_check = self._verify_dag_structure(edge_range)
             audit_report['dag_structure'] = dag_check
             if not dag_check['is_valid']:
                 audit_report['status'] = 'fail'
                 audit_report['errors'].extend(dag_check['errors'])
             
             # 2. Verify transaction balances
-            balance_check = self._verify_transaction_balances()
+            balance_check = self._verify_transaction_balances(
+                tx_range, use_checkpoint=checkpoint is not None, settled_row=settled_tx_row
+            )
             audit_report['balance_integrity'] = balance_check
             if not balance_check['is_valid']:
                 audit_report['status'] = 'fail'
@@ -1328,7 +1569,7 @@ class NexusNativeWallet:
                 audit_report['warnings'].append(f"{verification_check['missing_count']} transactions without verification records")
             
             # 4. Verify IO records match transactions
-            io_check = self._verify_io_consistency()
+            io_check = self._verify_io_consistency(tx_range)
             audit_report['io_consistency'] = io_check
             if not io_check['is_valid']:
                 audit_report['status'] = 'fail'
@@ -1344,55 +1585,124 @@ class NexusNativeWallet:
                 'genesis_blocks': self.db.query(DagEdge).filter_by(parent_id='GENESIS').count()
             }
             
+            if record_checkpoint and audit_report['status'] == 'pass' and 'flows' in balance_check:
+                self._save_audit_checkpoint(
+                    balance_check.pop('flows'), settled_tx_row, settled_edge_row,
+                    audit_report['status'], replace_flows=checkpoint is None
+                )
+            balance_check.pop('flows', None)
+            
             return audit_report
             
         except Exception as e:
+            self.db.rollback()
             audit_report['status'] = 'error'
             audit_report['errors'].append(f"Audit failed: {str(e)}")
             return audit_report
     
-    def _verify_dag_structure(self) -> Dict[str, Any]:
-        """Verify DAG is acyclic and properly formed"""
+    def _settled_row(self, model, row_range: Tuple[int, int], settled_before: datetime) -> int:
+        """Newest row id in row_range whose timestamp is before settled_before"""
+        low, high = row_range
+        # Walks the primary key down from the tip, so only unsettled rows are scanned
+        settled = self.db.query(model.id).filter(
+            model.id > low,
+            model.id <= high,
+            sa.or_(model.timestamp.is_(None), model.timestamp <= settled_before)
+        ).order_by(model.id.desc()).limit(1).scalar()
+        return settled if settled is not None else low
+    
+    def _save_audit_checkpoint(
+        self,
+        flows: Dict[str, List[float]],
+        last_tx_row: int,
+        last_edge_row: int,
+        status: str,
+        replace_flows: bool
+    ):
+        """Persist cumulative per-address flows and the settled row id watermarks"""
+        if replace_flows:
+            self.db.query(LedgerAuditFlow).delete()
+            self.db.bulk_insert_mappings(LedgerAuditFlow, [
+                {'address': address, 'incoming_nxt': incoming, 'outgoing_nxt': outgoing, 'tx_count': count}
+                for address, (incoming, outgoing, count) in flows.items()
+            ])
+        else:
+            self._upsert_audit_flows(flows)
+        
+        self.db.add(LedgerAuditCheckpoint(
+            last_tx_row_id=last_tx_row,
+            last_edge_row_id=last_edge_row,
+            status=status
+        ))
+        self.db.commit()
+    
+    def _upsert_audit_flows(self, flows: Dict[str, List[float]]):
+        existing = set()
+        for batch in self._batched(list(flows)):
+            existing.update(row[0] for row in self.db.query(LedgerAuditFlow.address).filter(
+                LedgerAuditFlow.address.in_(batch)
+            ))
+        
+        updates = [
+            {'address': address, 'incoming_nxt': incoming, 'outgoing_nxt': outgoing, 'tx_count': count}
+            for address, (incoming, outgoing, count) in flows.items()
+        ]
+        self.db.bulk_update_mappings(LedgerAuditFlow, [u for u in updates if u['address'] in existing])
+        self.db.bulk_insert_mappings(LedgerAuditFlow, [u for u in updates if u['address'] not in existing])
+    
+    def _batched(self, items: List) -> List[List]:
+        size = self.AUDIT_BATCH_SIZE
+        return [items[i:i + size] for i in range(0, len(items), size)]
+    
+    def _verify_dag_structure(self, edge_range: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """
+        Verify DAG is acyclic and properly formed
+        
+        (child, parent) id pairs are read in batches and checked with an
+        iterative Kahn topological sort. Only the reads are batched: the
+        checked edges are held in memory, so a full audit is O(total edges).
+        For an incremental range only the new edges plus older edges that can
+        reach a new child are loaded: any cycle created since the checkpoint
+        must pass through a new edge.
+        """
         try:
-            all_edges = self.db.query(DagEdge).all()
+            low, high = edge_range if edge_range else (0, None)
             
-            # Build adjacency list
-            graph = {}
-            for edge in all_edges:
-                if edge.child_id not in graph:
-                    graph[edge.child_id] = []
-                graph[edge.child_id].append(edge.parent_id)
+            edge_query = self.db.query(DagEdge.child_id, DagEdge.parent_id).filter(DagEdge.id > low)
+            if high is not None:
+                edge_query = edge_query.filter(DagEdge.id <= high)
+            edges = [(child, parent) for child, parent in
+                     edge_query.yield_per(self.AUDIT_BATCH_SIZE)]
+            audited_edges = len(edges)
+            children = {child for child, _ in edges}
             
-            # Check for cycles using DFS
-            def has_cycle(node, visited, rec_stack):
-                visited.add(node)
-                rec_stack.add(node)
-                
-                for neighbor in graph.get(node, []):
-                    if neighbor not in visited:
-                        if has_cycle(neighbor, visited, rec_stack):
-                            return True
-                    elif neighbor in rec_stack:
-                        return True
-                
-                rec_stack.remove(node)
-                return False
+            if low > 0 and edges:
+                # Older nodes that reach a new child through parent links
+                reached = set(children)
+                frontier = list(children)
+                while frontier:
+                    next_frontier = []
+                    for batch in self._batched(frontier):
+                        for child, parent in self.db.query(DagEdge.child_id, DagEdge.parent_id).filter(
+                            DagEdge.id <= low,
+                            DagEdge.parent_id.in_(batch)
+                        ).yield_per(self.AUDIT_BATCH_SIZE):
+                            edges.append((child, parent))
+                            if child not in reached:
+                                reached.add(child)
+                                next_frontier.append(child)
+                    frontier = next_frontier
             
-            visited = set()
-            rec_stack = set()
-            
-            for node in graph:
-                if node not in visited:
-                    if has_cycle(node, visited, rec_stack):
-                        return {
-                            'is_valid': False,
-                            'errors': ['Cycle detected in DAG structure']
-                        }
+            if self._has_cycle(edges):
+                return {
+                    'is_valid': False,
+                    'errors': ['Cycle detected in DAG structure']
+                }
             
             return {
                 'is_valid': True,
-                'total_nodes': len(graph),
-                'total_edges': len(all_edges)
+                'total_nodes': len(children),
+                'total_edges': audited_edges
             }
         except Exception as e:
             return {
@@ -1400,50 +1710,102 @@ class NexusNativeWallet:
                 'errors': [f'DAG verification failed: {str(e)}']
             }
     
-    def _verify_transaction_balances(self) -> Dict[str, Any]:
-        """Verify all account balances match transaction history"""
+    @staticmethod
+    def _has_cycle(edges: List[Tuple[str, str]]) -> bool:
+        """Iterative Kahn's algorithm over (child, parent) edges (duplicates allowed)"""
+        index: Dict[str, int] = {}
+        adjacency: List[List[int]] = []
+        in_degree: List[int] = []
+        
+        def node(node_id: str) -> int:
+            idx = index.get(node_id)
+            if idx is None:
+                idx = index[node_id] = len(adjacency)
+                adjacency.append([])
+                in_degree.append(0)
+            return idx
+        
+        for child, parent in edges:
+            c, p = node(child), node(parent)
+            adjacency[c].append(p)
+            in_degree[p] += 1
+        
+        ready = [n for n, degree in enumerate(in_degree) if degree == 0]
+        processed = 0
+        while ready:
+            n = ready.pop()
+            processed += 1
+            for p in adjacency[n]:
+                in_degree[p] -= 1
+                if in_degree[p] == 0:
+                    ready.append(p)
+        
+        return processed < len(adjacency)
+    
+    def _verify_transaction_balances(
+        self,
+        tx_range: Optional[Tuple[int, int]] = None,
+        use_checkpoint: bool = False,
+        settled_row: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify all account balances match transaction history
+        
+        Per-address confirmed flows are computed with a grouped aggregate.
+        For incremental audits the aggregate only covers new rows and is
+        added to the flows stored at the checkpoint; only accounts touched by
+        new transactions are re-checked.
+        
+        With settled_row, the returned 'flows' (for the checkpoint) only
+        cover rows up to it; rows above it are still checked.
+        """
         try:
-            all_accounts = self.db.query(TokenAccount).all()
-            errors = []
+            low, high = tx_range if tx_range else (0, None)
+            settled = settled_row if settled_row is not None else high
             
-            # Handle empty database gracefully
-            if not all_accounts:
-                return {
-                    'is_valid': True,
-                    'accounts_checked': 0,
-                    'errors': []
-                }
+            flows = self._confirmed_flows(low, settled)
+            recent = self._confirmed_flows(settled, high) if settled != high else {}
             
-            for account in all_accounts:
-                # Skip system accounts
-                if account.address in ['VALIDATOR_POOL', 'GENESIS']:
-                    continue
-                
-                # Calculate balance from transactions
-                incoming = self.db.query(WalletTransaction).filter_by(
-                    to_address=account.address,
-                    status='confirmed'
-                ).all()
-                
-                outgoing = self.db.query(WalletTransaction).filter_by(
-                    from_address=account.address,
-                    status='confirmed'
-                ).all()
-                
-                # Handle accounts with no transactions (valid state)
-                if not incoming and not outgoing:
+            if use_checkpoint:
+                for batch in self._batched(list(flows.keys() | recent.keys())):
+                    for stored in self.db.query(LedgerAuditFlow).filter(
+                        LedgerAuditFlow.address.in_(batch)
+                    ):
+                        flow = flows.setdefault(stored.address, [0.0, 0.0, 0])
+                        flow[0] += stored.incoming_nxt
+                        flow[1] += stored.outgoing_nxt
+                        flow[2] += stored.tx_count
+            
+            totals = {address: list(flow) for address, flow in flows.items()}
+            for address, (total_in, total_out, count) in recent.items():
+                flow = totals.setdefault(address, [0.0, 0.0, 0])
+                flow[0] += total_in
+                flow[1] += total_out
+                flow[2] += count
+            
+            balances: Dict[str, int] = {}
+            for batch in self._batched(list(totals)):
+                balances.update(self.db.query(TokenAccount.address, TokenAccount.balance).filter(
+                    TokenAccount.address.in_(batch)
+                ))
+            
+            errors = []
+            for address, (total_in, total_out, _) in totals.items():
+                # Skip system accounts and transaction parties without accounts
+                if address in ['VALIDATOR_POOL', 'GENESIS'] or address not in balances:
                     continue
                 
-                calculated_balance = sum(tx.amount_nxt * UNITS_PER_NXT for tx in incoming) - sum((tx.amount_nxt + tx.fee_nxt) * UNITS_PER_NXT for tx in outgoing)
+                calculated_balance = total_in * UNITS_PER_NXT - total_out * UNITS_PER_NXT
                 
                 # Allow small rounding differences
-                if abs(calculated_balance - account.balance) > 1:
-                    errors.append(f"Balance mismatch for {account.address[:16]}...: expected {calculated_balance}, got {account.balance}")
+                if abs(calculated_balance - balances[address]) > 1:
+                    errors.append(f"Balance mismatch for {address[:16]}...: expected {calculated_balance}, got {balances[address]}")
             
             return {
                 'is_valid': len(errors) == 0,
-                'accounts_checked': len(all_accounts),
-                'errors': errors
+                'accounts_checked': len(balances) if use_checkpoint else self.db.query(TokenAccount).count(),
+                'errors': errors,
+                'flows': flows
             }
         except Exception as e:
             return {
@@ -1451,6 +1813,34 @@ class NexusNativeWallet:
                 'errors': [f'Balance verification failed: {str(e)}']
             }
     
+    def _confirmed_flows(self, low: int, high: Optional[int]) -> Dict[str, List[float]]:
+        """Per-address [incoming, outgoing, tx count] over confirmed rows in (low, high]"""
+        def confirmed_rows(query):
+            query = query.filter(WalletTransaction.status == 'confirmed', WalletTransaction.id > low)
+            return query.filter(WalletTransaction.id <= high) if high is not None else query
+        
+        incoming = confirmed_rows(self.db.query(
+            WalletTransaction.to_address.label('address'),
+            WalletTransaction.amount_nxt.label('incoming'),
+            sa.literal(0.0).label('outgoing')
+        ))
+        outgoing = confirmed_rows(self.db.query(
+            WalletTransaction.from_address.label('address'),
+            sa.literal(0.0).label('incoming'),
+            (WalletTransaction.amount_nxt + WalletTransaction.fee_nxt).label('outgoing')
+        ))
+        movements = incoming.union_all(outgoing).subquery()
+        
+        flows: Dict[str, List[float]] = {}
+        for address, total_in, total_out, count in self.db.query(
+            movements.c.address,
+            sa.func.sum(movements.c.incoming),
+            sa.func.sum(movements.c.outgoing),
+            sa.func.count()
+        ).group_by(movements.c.address).yield_per(self.AUDIT_BATCH_SIZE):
+            flows[address] = [total_in or 0.0, total_out or 0.0, count]
+        return flows
+    
     def _verify_all_transactions_validated(self) -> Dict[str, Any]:
         """Check all transactions have verification records"""
         try:
@@ -1472,33 +1862,41 @@ class NexusNativeWallet:
                 'error': str(e)
             }
     
-    def _verify_io_consistency(self) -> Dict[str, Any]:
-        """Verify IO records match transaction amounts"""
+    def _verify_io_consistency(self, tx_range: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """Verify IO records match transaction amounts (one grouped join)"""
         try:
-            all_txs = self.db.query(WalletTransaction).all()
+            low, high = tx_range if tx_range else (0, None)
             errors = []
             
-            for tx in all_txs:
-                io_records = self.db.query(TransactionIO).filter_by(tx_id=tx.tx_id).all()
-                
-                if not io_records:
-                    continue  # Older transactions before IO tracking
-                
-                inputs = [io for io in io_records if io.io_type == 'input']
-                outputs = [io for io in io_records if io.io_type == 'output']
-                
-                total_in = sum(io.amount_nxt for io in inputs)
-                total_out = sum(io.amount_nxt for io in outputs)
-                
+            input_total = sa.func.sum(sa.case(
+                (TransactionIO.io_type == 'input', TransactionIO.amount_nxt), else_=0.0
+            ))
+            # Transactions without IO records predate IO tracking and are skipped by the join
+            query = self.db.query(
+                WalletTransaction.tx_id,
+                WalletTransaction.amount_nxt + WalletTransaction.fee_nxt,
+                input_total
+            ).join(
+                TransactionIO, TransactionIO.tx_id == WalletTransaction.tx_id
+            ).filter(WalletTransaction.id > low)
+            if high is not None:
+                query = query.filter(WalletTransaction.id <= high)
+            
+            for tx_id, expected_in, total_in in query.group_by(
+                WalletTransaction.id, WalletTransaction.tx_id,
+                WalletTransaction.amount_nxt, WalletTransaction.fee_nxt
+            ).yield_per(self.AUDIT_BATCH_SIZE):
                 # Input should equal output + fee
-                expected_in = tx.amount_nxt + tx.fee_nxt
-                
-                if abs(total_in - expected_in) > 0.000001:  # Allow floating point error
-                    errors.append(f"IO mismatch for {tx.tx_id[:16]}...: input {total_in} != expected {expected_in}")
+                if abs((total_in or 0.0) - expected_in) > 0.000001:  # Allow floating point error
+                    errors.append(f"IO mismatch for {tx_id[:16]}...: input {total_in} != expected {expected_in}")
+            
+            checked = self.db.query(WalletTransaction).filter(WalletTransaction.id > low)
+            if high is not None:
+                checked = checked.filter(WalletTransaction.id <= high)
             
             return {
                 'is_valid': len(errors) == 0,
-                'transactions_checked': len(all_txs),
+                'transactions_checked': checked.count(),
                 'errors': errors
             }
         except Exception as e:
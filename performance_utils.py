@@ -3,9 +3,12 @@ Performance utilities for NexusOS
 Provides caching, batch processing, and profiling helpers
 """
 
+import sys
 import time
 import functools
-from typing import Callable, Any, Dict
+import threading
+from collections import OrderedDict
+from typing import Callable, Any, Dict, Optional, Tuple
 import streamlit as st
 
 
@@ -77,81 +80,197 @@ def timing_decorator(name: str = None, verbose: bool = False):
     return decorator
 
 
+def _estimate_size(value: Any) -> int:
+    """Approximate in-memory size of a cached value in bytes"""
+    if hasattr(value, 'memory_usage'):
+        # pandas DataFrame / Series
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
 class CachingLayer:
     """
     LRU-based caching layer for expensive computations
+    
+    Entries live in an OrderedDict kept in recency order, so get/set/evict
+    are O(1). TTL expiry is lazy on get and swept periodically from a second
+    OrderedDict kept in write order, which only touches expired entries.
+    All operations are thread-safe.
     """
     
-    def __init__(self, max_size: int = 128, ttl: int = 300):
+    def __init__(self, max_size: int = 128, ttl: int = 300,
+                 max_bytes: Optional[int] = None, cleanup_interval: Optional[float] = None):
         """
         Args:
             max_size: Maximum number of cached entries (LRU eviction)
             ttl: Time to live in seconds
+            max_bytes: Optional bound on the estimated total size of cached values
+            cleanup_interval: Seconds between expiry sweeps (default: ttl)
         """
         self.max_size = max_size
         self.ttl = ttl
-        self.cache = {}
-        self.access_order = []
+        self.max_bytes = max_bytes
+        self.cleanup_interval = ttl if cleanup_interval is None else cleanup_interval
+        
+        self.cache: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._write_order: "OrderedDict[str, float]" = OrderedDict()
+        self._total_bytes = 0
+        self._last_cleanup = time.time()
+        self._lock = threading.RLock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
     
     def get(self, key: str) -> Any:
         """Get cached value if valid"""
-        if key not in self.cache:
-            return None
-        
-        value, timestamp = self.cache[key]
-        
-        # Check TTL
-        if time.time() - timestamp > self.ttl:
-            del self.cache[key]
-            self.access_order.remove(key)
-            return None
-        
-        # Update LRU order
-        self.access_order.remove(key)
-        self.access_order.append(key)
-        
-        return value
+        with self._lock:
+            now = time.time()
+            self._maybe_cleanup(now)
+            
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, timestamp, _ = entry
+            
+            # Check TTL
+            if now - timestamp > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            # Update LRU order
+            self.cache.move_to_end(key)
+            self.hits += 1
+            
+            return value
     
     def set(self, key: str, value: Any):
         """Set cached value with LRU eviction"""
-        # Evict oldest if at capacity
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            oldest_key = self.access_order.pop(0)
-            del self.cache[oldest_key]
-        
-        # Update or add entry
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+        size = _estimate_size(value) if self.max_bytes is not None else 0
         
-        self.cache[key] = (value, time.time())
+        with self._lock:
+            now = time.time()
+            self._maybe_cleanup(now)
+            
+            if key in self.cache:
+                self._remove(key)
+            
+            self.cache[key] = (value, now, size)
+            self._write_order[key] = now
+            self._total_bytes += size
+            
+            # Evict least recently used entries while over capacity
+            while len(self.cache) > self.max_size or (
+                    self.max_bytes is not None and self._total_bytes > self.max_bytes
+                    and len(self.cache) > 1):
+                oldest_key = next(iter(self.cache))
+                self._remove(oldest_key)
+                self.evictions += 1
+    
+    def _remove(self, key: str):
+        _, _, size = self.cache.pop(key)
+        del self._write_order[key]
+        self._total_bytes -= size
+    
+    def _maybe_cleanup(self, now: float):
+        if now - self._last_cleanup >= self.cleanup_interval:
+            self.cleanup_expired(now)
+    
+    def cleanup_expired(self, now: Optional[float] = None) -> int:
+        """Remove all expired entries; returns the number removed"""
+        with self._lock:
+            now = time.time() if now is None else now
+            self._last_cleanup = now
+            removed = 0
+            while self._write_order:
+                key, timestamp = next(iter(self._write_order.items()))
+                if now - timestamp <= self.ttl:
+                    break
+                self._remove(key)
+                removed += 1
+            self.expirations += removed
+            return removed
     
     def clear(self):
         """Clear all cached entries"""
-        self.cache = {}
-        self.access_order = []
+        with self._lock:
+            self.cache = OrderedDict()
+            self._write_order = OrderedDict()
+            self._total_bytes = 0
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return {
-            'size': len(self.cache),
-            'max_size': self.max_size,
-            'ttl': self.ttl,
-            'keys': list(self.cache.keys())
-        }
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'keys': list(self.cache.keys())
+            }
 
 
-def performance_cache(ttl: int = 300):
+# Process-wide caches used by performance_cache(shared=True), one per function
+_shared_caches: Dict[str, CachingLayer] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_cache(name: str, max_size: int = 128, ttl: int = 300,
+                     max_bytes: Optional[int] = None) -> CachingLayer:
+    """Get (or create) a named process-wide cache shared by all sessions"""
+    with _shared_caches_lock:
+        if name not in _shared_caches:
+            _shared_caches[name] = CachingLayer(max_size=max_size, ttl=ttl, max_bytes=max_bytes)
+        return _shared_caches[name]
+
+
+def performance_cache(ttl: int = 300, shared: bool = False, max_size: int = 128,
+                      max_bytes: Optional[int] = None):
     """
     Decorator for caching expensive computations with TTL (time-to-live)
-    Uses Streamlit session state for persistence across reruns
+    Uses Streamlit session state for persistence across reruns, or a
+    process-wide CachingLayer shared across all sessions when shared=True
     
     Args:
         ttl: Time to live in seconds (default: 300s = 5min)
+        shared: Use a process-wide cache instead of per-session state
+        max_size: Entry bound for the shared cache
+        max_bytes: Optional size bound for the shared cache
     """
     def decorator(func: Callable) -> Callable:
         cache_key = f"perf_cache_{func.__name__}"
         
+        if shared:
+            cache = get_shared_cache(f"{func.__module__}.{func.__qualname__}",
+                                     max_size=max_size, ttl=ttl, max_bytes=max_bytes)
+            
+            @functools.wraps(func)
+            def shared_wrapper(*args, **kwargs):
+                args_key = str(args) + str(sorted(kwargs.items()))
+                result = cache.get(args_key)
+                if result is None:
+                    result = func(*args, **kwargs)
+                    cache.set(args_key, result)
+                return result
+            
+            shared_wrapper.cache = cache
+            return shared_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Create cache entry key from function args
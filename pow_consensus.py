@@ -7,15 +7,222 @@ Implements mining mechanism with:
 - Block rewards in NXT tokens
 - Nonce finding algorithm
 - Integration with existing consensus mechanisms (PoS, BFT, DPoS, GHOSTDAG)
+
+Block hashes cover a fixed 128-byte binary header (block fields plus the
+transactions' Merkle root) followed by an 8-byte nonce. The header fills
+exactly two SHA-256 blocks, so the nonce search hashes it once and copies
+that midstate for every attempt. The nonce range can be split across a
+process pool.
 """
 
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+import multiprocessing
+import os
+import struct
+import threading
 import time
 import hashlib
 from native_token import token_system, TokenTransaction
 
 
+HEADER_PREFIX_SIZE = 128  # Two SHA-256 blocks
+MAX_NONCE_ATTEMPTS = 1000000
+NONCE_CHUNK_SIZE = 1 << 16  # Nonces per work unit handed to a mining process
+CANCEL_CHECK_INTERVAL = 4096
+VALIDATION_CHUNK_SIZE = 256  # Blocks per work unit handed to a validation process
+
+_HEADER = struct.Struct(">QdI32s32s32s")
+_NONCE = struct.Struct(">Q")
+
+
+def compute_merkle_root(transactions: Sequence[TokenTransaction]) -> bytes:
+    """Merkle root of the transaction hashes (odd levels duplicate the last node)"""
+    level = [bytes.fromhex(tx.compute_hash()) for tx in transactions]
+    if not level:
+        return bytes(32)
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest()
+                 for i in range(0, len(level), 2)]
+    return level[0]
+
+
+def difficulty_target(difficulty: int) -> Optional[bytes]:
+    """
+    Upper bound for a valid digest: `difficulty` leading zero hex digits.
+    
+    Returns:
+        32-byte big-endian bound (compare digest < bound), or None if every
+        hash is valid
+    """
+    if difficulty <= 0:
+        return None
+    return (1 << max(256 - 4 * difficulty, 0)).to_bytes(32, "big")
+
+
+def scan_nonces(header_prefix: bytes, target: Optional[bytes], start: int, stop: int,
+                cancel=None) -> Tuple[int, int]:
+    """
+    Search nonces in [start, stop) for a digest below target.
+    
+    Returns:
+        (nonce or -1, number of hashes computed)
+    """
+    if target is None:
+        return (start, 1) if start < stop else (-1, 0)
+    
+    copy = hashlib.sha256(header_prefix).copy
+    pack = _NONCE.pack
+    for chunk_start in range(start, stop, CANCEL_CHECK_INTERVAL):
+        if cancel is not None and cancel.is_set():
+            return -1, chunk_start - start
+        for nonce in range(chunk_start, min(chunk_start + CANCEL_CHECK_INTERVAL, stop)):
+            h = copy()
+            h.update(pack(nonce))
+            if h.digest() < target:
+                return nonce, nonce - start + 1
+    return -1, stop - start
+
+
+def verify_blocks(blocks: Sequence["MiningBlock"], previous_hash: str) -> int:
+    """
+    Fully re-verify consecutive blocks: link to the previous block, recomputed
+    hash equal to the stored one, and recomputed hash below the target.
+    
+    Returns:
+        Number of leading blocks that verified (len(blocks) if all did)
+    """
+    for verified, block in enumerate(blocks):
+        if block.previous_hash != previous_hash:
+            return verified
+        digest = block.compute_hash()
+        target = difficulty_target(block.difficulty)
+        if digest != block.hash or (target is not None and bytes.fromhex(digest) >= target):
+            return verified
+        previous_hash = digest
+    return len(blocks)
+
+
+def _mp_context():
+    # Start workers from a clean server: forking after Numba's TBB layer
+    # has started threads can deadlock the children
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context()
+
+
+_worker_cancel = None
+
+
+def _init_mining_worker(cancel):
+    global _worker_cancel
+    _worker_cancel = cancel
+
+
+def _scan_nonces_in_worker(header_prefix: bytes, target: Optional[bytes], start: int, stop: int):
+    return scan_nonces(header_prefix, target, start, stop, _worker_cancel)
+
+
+class NonceSearcher:
+    """
+    Splits a nonce range across worker processes.
+    
+    The range is cut into NONCE_CHUNK_SIZE work units handed out in order.
+    Once a valid nonce is found, work units above it are cancelled and
+    running ones stop at their next cancellation check; units below it are
+    allowed to finish, so the result is always the lowest valid nonce, the
+    same one a single-process search returns.
+    """
+    
+    def __init__(self, workers: int = 1):
+        """
+        Args:
+            workers: Mining processes (1 searches in the calling process,
+                0 uses every CPU)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._cancel = None
+        self._lock = threading.Lock()
+    
+    def _start_pool(self):
+        context = _mp_context()
+        self._cancel = context.Event()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                         initializer=_init_mining_worker,
+                                         initargs=(self._cancel,))
+    
+    def search(self, header_prefix: bytes, target: Optional[bytes], start: int,
+               max_attempts: int) -> Tuple[Optional[int], int]:
+        """
+        Find the lowest nonce in [start, start + max_attempts) below target.
+        
+        Returns:
+            (nonce or None, total hashes computed across all workers)
+        """
+        stop = start + max_attempts
+        if self.workers <= 1 or max_attempts <= NONCE_CHUNK_SIZE:
+            nonce, hashes = scan_nonces(header_prefix, target, start, stop)
+            return (nonce if nonce >= 0 else None), hashes
+        
+        with self._lock:
+            if self._pool is None:
+                self._start_pool()
+            self._cancel.clear()
+            
+            chunks = iter(range(start, stop, NONCE_CHUNK_SIZE))
+            pending = {}
+            found = None
+            hashes = 0
+            
+            def submit_next():
+                chunk_start = next(chunks, None)
+                if chunk_start is not None:
+                    future = self._pool.submit(_scan_nonces_in_worker, header_prefix, target,
+                                               chunk_start, min(chunk_start + NONCE_CHUNK_SIZE, stop))
+                    pending[future] = chunk_start
+            
+            for _ in range(2 * self.workers):
+                submit_next()
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    if future.cancelled():
+                        continue
+                    nonce, count = future.result()
+                    hashes += count
+                    if nonce >= 0 and (found is None or nonce < found):
+                        found = nonce
+                
+                if found is None:
+                    while len(pending) < 2 * self.workers:
+                        before = len(pending)
+                        submit_next()
+                        if len(pending) == before:
+                            break
+                    continue
+                
+                for future, chunk_start in list(pending.items()):
+                    if chunk_start > found and future.cancel():
+                        del pending[future]
+                if all(chunk_start > found for chunk_start in pending.values()):
+                    self._cancel.set()
+            
+            return found, hashes
+    
+    def close(self):
+        """Shut down the worker processes"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
 @dataclass
 class MiningBlock:
     """Block structure for POW mining"""
@@ -29,34 +236,49 @@ class MiningBlock:
     hash: str = ""
     reward: int = 0  # Block reward in units
     
+    def header_prefix(self) -> bytes:
+        """Fixed part of the block header (everything except the nonce)"""
+        header = _HEADER.pack(
+            self.block_number,
+            self.timestamp,
+            self.difficulty,
+            hashlib.sha256(self.previous_hash.encode()).digest(),
+            hashlib.sha256(self.miner_address.encode()).digest(),
+            compute_merkle_root(self.transactions)
+        )
+        return header.ljust(HEADER_PREFIX_SIZE, b"\0")
+    
     def compute_hash(self) -> str:
         """Compute block hash"""
-        block_data = f"{self.block_number}{self.timestamp}{self.previous_hash}{self.nonce}{self.miner_address}{self.difficulty}"
-        for tx in self.transactions:
-            block_data += tx.compute_hash()
-        return hashlib.sha256(block_data.encode()).hexdigest()
+        return hashlib.sha256(self.header_prefix() + _NONCE.pack(self.nonce)).hexdigest()
     
-    def mine(self) -> int:
+    def mine(self, workers: int = 1, max_attempts: Optional[int] = None,
+             searcher: Optional[NonceSearcher] = None) -> int:
         """
         Mine the block by finding valid nonce
-        Returns number of attempts
-        """
-        attempts = 0
-        target_prefix = "0" * self.difficulty
         
-        while True:
-            self.hash = self.compute_hash()
-            attempts += 1
-            
-            if self.hash.startswith(target_prefix):
-                return attempts
-            
-            self.nonce += 1
-            
-            # Safety limit
-            if attempts > 1000000:
-                break
+        Args:
+            workers: Mining processes, ignored when a searcher is given
+            max_attempts: Nonces to try, starting from the current nonce
+                (default: MAX_NONCE_ATTEMPTS)
+            searcher: Reusable NonceSearcher (keeps its process pool alive)
         
+        Returns number of attempts (hashes computed across all workers)
+        """
+        if max_attempts is None:
+            max_attempts = MAX_NONCE_ATTEMPTS
+        owned = searcher is None
+        if owned:
+            searcher = NonceSearcher(workers)
+        try:
+            nonce, attempts = searcher.search(
+                self.header_prefix(), difficulty_target(self.difficulty), self.nonce, max_attempts)
+        finally:
+            if owned:
+                searcher.close()
+        
+        self.nonce = nonce if nonce is not None else self.nonce + max_attempts
+        self.hash = self.compute_hash()
         return attempts
     
     def is_valid(self) -> bool:
@@ -74,6 +296,8 @@ class MiningStats:
     average_block_time: float = 0.0
     current_difficulty: int = 4
     last_difficulty_adjustment: float = field(default_factory=time.time)
+    total_mining_time: float = 0.0  # Wall-clock seconds spent searching nonces
+    last_hashrate: float = 0.0
 
 
 class POWConsensus:
@@ -93,11 +317,28 @@ class POWConsensus:
     INITIAL_BLOCK_REWARD = 5000  # 50 NXT per block (in units)
     REWARD_HALVING_INTERVAL = 100000  # Halve rewards every 100k blocks
     
-    def __init__(self):
+    def __init__(self, mining_workers: Optional[int] = None):
+        """
+        Args:
+            mining_workers: Default mining processes per block (default:
+                $NEXUS_MINING_WORKERS or 1; 0 uses every CPU)
+        """
         self.blockchain: List[MiningBlock] = []
         self.pending_transactions: List[TokenTransaction] = []
         self.stats = MiningStats()
         self.mining_active = False
+        if mining_workers is None:
+            mining_workers = int(os.environ.get('NEXUS_MINING_WORKERS', 1))
+        self.mining_workers = mining_workers
+        self._searcher: Optional[NonceSearcher] = None
+        self._validation_pool: Optional[ProcessPoolExecutor] = None
+        self._validation_workers = 0
+        
+        # Checkpoints: (height, hash of block height - 1). blockchain[:height]
+        # is known valid / already folded into the rolling aggregates.
+        self._validated_tip: Tuple[int, str] = (0, "")
+        self._aggregated_tip: Tuple[int, str] = (0, "")
+        self._total_supply_mined = 0
         
         # Create genesis block
         self._create_genesis_block()
@@ -164,13 +405,40 @@ class POWConsensus:
         """Add transaction to pending pool"""
         self.pending_transactions.append(transaction)
     
-    def mine_block(self, miner_address: str, max_transactions: int = 10) -> Optional[MiningBlock]:
+    def _get_searcher(self, workers: int) -> NonceSearcher:
+        """Nonce searcher for this worker count, reusing its process pool across blocks"""
+        workers = workers or os.cpu_count() or 1
+        if self._searcher is None or self._searcher.workers != workers:
+            if self._searcher is not None:
+                self._searcher.close()
+            self._searcher = NonceSearcher(workers)
+        return self._searcher
+    
+    def close(self):
+        """Shut down mining and validation worker processes"""
+        if self._searcher is not None:
+            self._searcher.close()
+            self._searcher = None
+        if self._validation_pool is not None:
+            self._validation_pool.shutdown(wait=True, cancel_futures=True)
+            self._validation_pool = None
+    
+    def _checkpoint_height(self, tip: Tuple[int, str]) -> int:
+        """Height of a checkpoint if the chain still extends it, else 0"""
+        height, tip_hash = tip
+        if 0 < height <= len(self.blockchain) and self.blockchain[height - 1].hash == tip_hash:
+            return height
+        return 0
+    
+    def mine_block(self, miner_address: str, max_transactions: int = 10,
+                   workers: Optional[int] = None) -> Optional[MiningBlock]:
         """
         Mine a new block
         
         Args:
             miner_address: Address to receive mining rewards
             max_transactions: Maximum transactions to include
+            workers: Mining processes for this block (default: mining_workers)
         
         Returns:
             Mined block or None if failed
@@ -197,9 +465,11 @@ class POWConsensus:
         )
         
         # Mine the block
-        start_time = time.time()
-        attempts = new_block.mine()
-        mine_time = time.time() - start_time
+        searcher = self._get_searcher(self.mining_workers if workers is None else workers)
+        start_time = time.perf_counter()
+        attempts = new_block.mine(searcher=searcher)
+        mine_time = time.perf_counter() - start_time
+        self.stats.last_hashrate = attempts / mine_time if mine_time > 0 else 0.0
         
         # Validate
         if not new_block.is_valid():
@@ -207,6 +477,7 @@ class POWConsensus:
         
         # Add to blockchain
         self.blockchain.append(new_block)
+        self._update_aggregates()
         
         # Remove included transactions
         self.pending_transactions = self.pending_transactions[max_transactions:]
@@ -221,6 +492,7 @@ class POWConsensus:
         # Update stats
         self.stats.total_blocks_mined += 1
         self.stats.total_hash_attempts += attempts
+        self.stats.total_mining_time += mine_time
         self.stats.total_rewards_distributed += block_reward
         
         # Update average block time
@@ -237,25 +509,78 @@ class POWConsensus:
         
         return new_block
     
-    def validate_chain(self) -> bool:
-        """Validate entire blockchain"""
-        for i in range(1, len(self.blockchain)):
-            current_block = self.blockchain[i]
-            previous_block = self.blockchain[i - 1]
-            
-            # Check hash validity
-            if not current_block.is_valid():
-                return False
-            
-            # Check previous hash link
-            if current_block.previous_hash != previous_block.hash:
-                return False
+    def validate_chain(self, full: bool = False, workers: Optional[int] = None) -> bool:
+        """
+        Validate the blockchain, recomputing every block hash
+        
+        Blocks below the last validated tip are trusted, so repeated calls
+        only verify blocks appended since. The checkpoint is discarded if
+        the chain no longer extends it (e.g. after a reorg).
+        
+        Args:
+            full: Ignore the checkpoint and re-verify from genesis
+            workers: Validation processes (default: mining_workers; 0 uses
+                every CPU). Only used for more than VALIDATION_CHUNK_SIZE blocks.
+        
+        Returns:
+            True if every block verifies
+        """
+        chain = self.blockchain
+        start = 0 if full else self._checkpoint_height(self._validated_tip)
+        # Genesis is fixed, not mined
+        start = max(start, 1)
+        if start > len(chain):
+            return True
+        
+        blocks = chain[start:]
+        workers = self.mining_workers if workers is None else workers
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(blocks) > VALIDATION_CHUNK_SIZE:
+            verified = self._verify_parallel(blocks, chain[start - 1].hash, workers)
+        else:
+            verified = verify_blocks(blocks, chain[start - 1].hash)
         
-        return True
+        height = start + verified
+        self._validated_tip = (height, chain[height - 1].hash)
+        return verified == len(blocks)
+    
+    def _verify_parallel(self, blocks: List[MiningBlock], previous_hash: str, workers: int) -> int:
+        """verify_blocks over chunks in a process pool"""
+        if self._validation_pool is None or self._validation_workers != workers:
+            if self._validation_pool is not None:
+                self._validation_pool.shutdown(wait=True)
+            self._validation_pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context())
+            self._validation_workers = workers
+        
+        starts = range(0, len(blocks), VALIDATION_CHUNK_SIZE)
+        futures = [
+            self._validation_pool.submit(
+                verify_blocks, blocks[i:i + VALIDATION_CHUNK_SIZE],
+                blocks[i - 1].hash if i else previous_hash)
+            for i in starts
+        ]
+        verified = 0
+        for i, future in zip(starts, futures):
+            count = future.result()
+            verified += count
+            if count < len(blocks[i:i + VALIDATION_CHUNK_SIZE]):
+                for rest in futures:
+                    rest.cancel()
+                break
+        return verified
+    
+    def _update_aggregates(self):
+        """Fold blocks appended since the last call into the rolling totals"""
+        height = self._checkpoint_height(self._aggregated_tip)
+        if height == 0:
+            self._total_supply_mined = 0
+        for block in self.blockchain[height:]:
+            self._total_supply_mined += block.reward
+        self._aggregated_tip = (len(self.blockchain), self.blockchain[-1].hash)
     
     def get_mining_stats(self) -> dict:
         """Get mining statistics"""
-        total_supply_mined = sum(block.reward for block in self.blockchain)
+        self._update_aggregates()
         
         return {
             "total_blocks": len(self.blockchain),
@@ -266,7 +591,10 @@ class POWConsensus:
             "average_block_time": self.stats.average_block_time,
             "target_block_time": self.TARGET_BLOCK_TIME,
             "pending_transactions": len(self.pending_transactions),
-            "total_supply_mined": total_supply_mined,
+            "total_supply_mined": self._total_supply_mined,
+            "hashrate": self.get_hashrate(),
+            "last_hashrate": self.stats.last_hashrate,
+            "mining_workers": self.mining_workers,
             "chain_valid": self.validate_chain(),
         }
     
@@ -275,16 +603,10 @@ class POWConsensus:
         return list(reversed(self.blockchain[-limit:]))
     
     def get_hashrate(self) -> float:
-        """Estimate network hashrate (hashes per second)"""
-        if self.stats.average_block_time == 0:
+        """Measured hashrate (hashes per second, summed over all mining processes)"""
+        if self.stats.total_mining_time <= 0:
             return 0.0
-        
-        # Average attempts per block / average time per block
-        if self.stats.total_blocks_mined == 0:
-            return 0.0
-        
-        avg_attempts = self.stats.total_hash_attempts / self.stats.total_blocks_mined
-        return avg_attempts / self.stats.average_block_time if self.stats.average_block_time > 0 else 0.0
+        return self.stats.total_hash_attempts / self.stats.total_mining_time
 
 
 # Global POW consensus instance
@@ -10,6 +10,7 @@ Protects against:
 - Governance attacks (vote buying, proposal spam)
 """
 
+import math
 import time
 import hashlib
 from typing import Dict, List, Optional, Tuple, Any
@@ -51,16 +52,61 @@ class SecurityAlert:
     mitigation_action: Optional[str] = None
 
 
+class _RateLimitShard:
+    """One lock stripe of RateLimiter state"""
+    
+    __slots__ = ("lock", "state", "violations", "violation_timestamps", "ops_since_sweep")
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        # "address:operation" -> GCRA theoretical arrival time (token_bucket)
+        #                        or deque of request timestamps (sliding_window)
+        self.state: Dict[str, Any] = {}
+        self.violations: Dict[str, int] = {}
+        self.violation_timestamps: Dict[str, float] = {}
+        self.ops_since_sweep = 0
+
+
 class RateLimiter:
     """
     Per-address rate limiting to prevent transaction flooding and spam
     
-    Implements sliding window rate limiting with exponential backoff
+    State is hash-sharded across independently locked stripes so checks for
+    different addresses do not serialize on one lock. Two algorithms:
+    
+    - "token_bucket" (default): GCRA, one float per address/operation.
+      Allows a burst of max_requests, refilling at max_requests per window.
+    - "sliding_window": exact request count over the trailing window
+      (keeps up to max_requests timestamps per key).
+    
+    Keys whose bucket has refilled (or whose window has emptied) carry no
+    state and are evicted during periodic per-shard sweeps; violation
+    counts are evicted after idle_ttl seconds without a violation.
+    Violations trigger exponential backoff in the reported retry time.
     """
     
-    def __init__(self):
-        # address -> deque of timestamps
-        self.request_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+    ALGORITHMS = ("token_bucket", "sliding_window")
+    
+    def __init__(
+        self,
+        algorithm: str = "token_bucket",
+        num_shards: int = 64,
+        idle_ttl: float = 3600.0,
+        sweep_every: int = 1024
+    ):
+        """
+        Args:
+            algorithm: "token_bucket" (GCRA) or "sliding_window"
+            num_shards: Number of lock stripes
+            idle_ttl: Seconds after the last violation before it is forgotten
+            sweep_every: Checks per shard between idle-key sweeps
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        
+        self.algorithm = algorithm
+        self.idle_ttl = idle_ttl
+        self.sweep_every = sweep_every
         
         # Rate limits (requests per time window)
         self.limits = {
@@ -71,11 +117,10 @@ class RateLimiter:
             "vote": (10, 300),  # 10 votes per 5 minutes
         }
         
-        # Violation tracking for exponential backoff
-        self.violations: Dict[str, int] = defaultdict(int)
-        self.violation_timestamps: Dict[str, float] = {}
-        
-        self.lock = threading.Lock()
+        self._shards = [_RateLimitShard() for _ in range(num_shards)]
+    
+    def _shard(self, address: str) -> _RateLimitShard:
+        return self._shards[hash(address) % len(self._shards)]
     
     def check_rate_limit(
         self,
@@ -88,64 +133,147 @@ class RateLimiter:
         Returns:
             (allowed: bool, reason: Optional[str])
         """
-        with self.lock:
-            if operation not in self.limits:
-                return True, None
-            
-            max_requests, window_seconds = self.limits[operation]
-            
-            # Get request history for this address
-            history = self.request_history[f"{address}:{operation}"]
-            
-            # Remove old requests outside window
+        limit = self.limits.get(operation)
+        if limit is None:
+            return True, None
+        
+        max_requests, window_seconds = limit
+        key = f"{address}:{operation}"
+        shard = self._shard(address)
+        
+        with shard.lock:
             current_time = time.time()
-            cutoff_time = current_time - window_seconds
             
-            while history and history[0] < cutoff_time:
-                history.popleft()
+            if self.algorithm == "token_bucket":
+                allowed, used = self._check_gcra(shard, key, current_time, max_requests, window_seconds)
+            else:
+                allowed, used = self._check_window(shard, key, current_time, max_requests, window_seconds)
             
-            # Check if limit exceeded
-            if len(history) >= max_requests:
+            if not allowed:
                 # Record violation
-                self.violations[address] += 1
-                self.violation_timestamps[address] = current_time
+                violations = shard.violations.get(address, 0) + 1
+                shard.violations[address] = violations
+                shard.violation_timestamps[address] = current_time
                 
                 # Calculate backoff time (exponential)
-                backoff_multiplier = min(2 ** self.violations[address], 64)
+                backoff_multiplier = min(2 ** violations, 64)
                 retry_after = window_seconds * backoff_multiplier
-                
-                return False, f"Rate limit exceeded. {len(history)}/{max_requests} requests in {window_seconds}s. Retry after {retry_after:.0f}s"
-            
-            # Add current request
-            history.append(current_time)
             
-            return True, None
+            shard.ops_since_sweep += 1
+            if shard.ops_since_sweep >= self.sweep_every:
+                self._sweep(shard, current_time)
+        
+        if not allowed:
+            return False, f"Rate limit exceeded. {used}/{max_requests} requests in {window_seconds}s. Retry after {retry_after:.0f}s"
+        return True, None
+    
+    async def check_rate_limit_async(
+        self,
+        address: str,
+        operation: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Awaitable check_rate_limit for asyncio handlers.
+        
+        The check holds one stripe lock for a few microseconds and never
+        sleeps, so it is safe to run directly on the event loop.
+        """
+        return self.check_rate_limit(address, operation)
+    
+    @staticmethod
+    def _check_gcra(shard, key, now, max_requests, window_seconds) -> Tuple[bool, int]:
+        """Generic cell rate algorithm: O(1) state per key"""
+        interval = window_seconds / max_requests
+        tat = max(shard.state.get(key, now), now)
+        used = math.ceil((tat - now) / interval - 1e-9)
+        if used >= max_requests:
+            return False, used
+        shard.state[key] = tat + interval
+        return True, used
+    
+    @staticmethod
+    def _check_window(shard, key, now, max_requests, window_seconds) -> Tuple[bool, int]:
+        """Sliding window over the last window_seconds"""
+        history = shard.state.get(key)
+        if history is None:
+            history = shard.state[key] = deque()
+        
+        # Remove old requests outside window
+        cutoff_time = now - window_seconds
+        while history and history[0] < cutoff_time:
+            history.popleft()
+        
+        if len(history) >= max_requests:
+            return False, len(history)
+        history.append(now)
+        return True, len(history) - 1
+    
+    def _sweep(self, shard: _RateLimitShard, now: float):
+        """Drop keys that no longer constrain anything (caller holds the lock)"""
+        shard.ops_since_sweep = 0
+        max_window = max((window for _, window in self.limits.values()), default=0)
+        
+        if self.algorithm == "token_bucket":
+            idle = [key for key, tat in shard.state.items() if tat <= now]
+        else:
+            cutoff = now - max_window
+            idle = [key for key, history in shard.state.items() if not history or history[-1] < cutoff]
+        for key in idle:
+            del shard.state[key]
+        
+        stale = [a for a, t in shard.violation_timestamps.items() if now - t > self.idle_ttl]
+        for address in stale:
+            del shard.violation_timestamps[address]
+            shard.violations.pop(address, None)
+    
+    def evict_idle(self) -> int:
+        """
+        Sweep every shard now.
+        
+        Returns:
+            Number of tracked keys remaining
+        """
+        now = time.time()
+        remaining = 0
+        for shard in self._shards:
+            with shard.lock:
+                self._sweep(shard, now)
+                remaining += len(shard.state)
+        return remaining
+    
+    def tracked_keys(self) -> int:
+        """Number of address/operation keys currently holding state"""
+        return sum(len(shard.state) for shard in self._shards)
     
     def reset_violations(self, address: str):
         """Reset violation count for address (e.g., after successful behavior)"""
-        with self.lock:
-            if address in self.violations:
-                del self.violations[address]
-            if address in self.violation_timestamps:
-                del self.violation_timestamps[address]
+        shard = self._shard(address)
+        with shard.lock:
+            shard.violations.pop(address, None)
+            shard.violation_timestamps.pop(address, None)
     
     def get_stats(self, address: str) -> Dict[str, Any]:
         """Get rate limiting stats for address"""
-        with self.lock:
+        shard = self._shard(address)
+        with shard.lock:
             stats = {
-                "violations": self.violations.get(address, 0),
-                "last_violation": self.violation_timestamps.get(address),
+                "violations": shard.violations.get(address, 0),
+                "last_violation": shard.violation_timestamps.get(address),
                 "current_requests": {}
             }
             
             current_time = time.time()
             
             for operation, (max_req, window) in self.limits.items():
-                key = f"{address}:{operation}"
-                if key in self.request_history:
+                state = shard.state.get(f"{address}:{operation}")
+                if state is None:
+                    continue
+                if self.algorithm == "token_bucket":
+                    used = max(0, math.ceil((state - current_time) / (window / max_req) - 1e-9))
+                else:
                     cutoff = current_time - window
-                    recent = [t for t in self.request_history[key] if t > cutoff]
-                    stats["current_requests"][operation] = f"{len(recent)}/{max_req}"
+                    used = sum(1 for t in state if t > cutoff)
+                stats["current_requests"][operation] = f"{used}/{max_req}"
             
             return stats
 
@@ -542,11 +670,15 @@ _rate_limiter = None
 _mev_protection = None
 _oracle_system = None
 
+_rate_limiter_lock = threading.Lock()
+
 def get_rate_limiter() -> RateLimiter:
     """Get singleton rate limiter"""
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = RateLimiter()
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
     return _rate_limiter
 
 def get_mev_protection() -> DEXMEVProtection:
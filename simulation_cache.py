@@ -0,0 +1,233 @@
+"""
+Persistent result cache for NexusEngineNumba simulations
+
+Simulation outputs are stored on disk under a content hash of everything that
+determines them: engine parameters, PID controller state, initial state, time
+step and the raw bytes of every input signal. Identical runs are therefore
+served from disk across sessions, users and process restarts.
+
+Layout:
+    <directory>/<key[:2]>/<key>.npy    stacked output arrays (memory-mapped on read)
+    <directory>/<key[:2]>/<key>.json   final PID controller state
+
+Entries are evicted least-recently-used once the cache exceeds max_bytes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Output arrays of simulate_nexus_numba, in order
+RESULT_ARRAYS = ('N', 'S', 'I', 'B', 'Phi', 'e', 'dN_dt')
+
+CACHE_FORMAT_VERSION = 1
+
+
+class SimulationResultCache:
+    """
+    Content-addressed, LRU-bounded on-disk cache of simulation results.
+
+    Safe to share between threads and between processes pointing at the same
+    directory: entries are written atomically and a missing file is treated as
+    a cache miss.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 1 << 30):
+        """
+        Args:
+            directory: Cache directory (default: $NEXUS_SIMULATION_CACHE_DIR or a temp dir)
+            max_bytes: Total size bound for cached result files (LRU eviction)
+        """
+        self.directory = directory or os.environ.get(
+            'NEXUS_SIMULATION_CACHE_DIR',
+            os.path.join(tempfile.gettempdir(), 'nexus_simulation_cache')
+        )
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU index from files on disk, oldest first"""
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.npy'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, name[:-4], self._entry_size(name[:-4], stat.st_size)))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key[:2], key)
+        return base + '.npy', base + '.json'
+
+    def _entry_size(self, key: str, array_bytes: int) -> int:
+        try:
+            return array_bytes + os.path.getsize(self._paths(key)[1])
+        except FileNotFoundError:
+            return array_bytes
+
+    @staticmethod
+    def make_key(
+        params: Sequence[float],
+        signals: Sequence[np.ndarray],
+        N_initial: float,
+        delta_t: float,
+        e_integral: float,
+        e_prev: float
+    ) -> str:
+        """
+        Stable hash of a simulation's inputs.
+
+        Args:
+            params: Engine parameters in a fixed order
+            signals: Input signal arrays in a fixed order
+            N_initial: Initial Nexus state
+            delta_t: Time step size
+            e_integral, e_prev: PID controller state at the start of the run
+        """
+        digest = hashlib.sha256()
+        scalars = [float(p) for p in params] + [
+            float(N_initial), float(delta_t), float(e_integral), float(e_prev)
+        ]
+        digest.update(f"v{CACHE_FORMAT_VERSION}".encode())
+        digest.update(np.asarray(scalars, dtype=np.float64).tobytes())
+        for signal in signals:
+            array = np.ascontiguousarray(signal, dtype=np.float64)
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, float]]]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (arrays, final_state) or None on a miss. Arrays are read-only
+            memory-mapped views keyed by RESULT_ARRAYS names.
+        """
+        array_path, state_path = self._paths(key)
+        try:
+            with open(state_path) as f:
+                final_state = json.load(f)
+            stacked = np.load(array_path, mmap_mode='r')
+            os.utime(array_path)
+        except (FileNotFoundError, ValueError):
+            with self._lock:
+                self.misses += 1
+                self._forget(key)
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                # Written by another process sharing the directory
+                size = self._entry_size(key, os.path.getsize(array_path))
+                self._entries[key] = size
+                self._total_bytes += size
+
+        return dict(zip(RESULT_ARRAYS, stacked)), final_state
+
+    def put(self, key: str, arrays: Dict[str, np.ndarray], final_state: Dict[str, float]):
+        """Store a result atomically and evict least-recently-used entries"""
+        array_path, state_path = self._paths(key)
+        os.makedirs(os.path.dirname(array_path), exist_ok=True)
+
+        stacked = np.vstack([np.asarray(arrays[name], dtype=np.float64) for name in RESULT_ARRAYS])
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+        # State file first: a readable .npy implies a complete entry
+        with open(state_path + suffix, 'w') as f:
+            json.dump({k: float(v) for k, v in final_state.items()}, f)
+        os.replace(state_path + suffix, state_path)
+
+        with open(array_path + suffix, 'wb') as f:
+            np.save(f, stacked)
+        os.replace(array_path + suffix, array_path)
+
+        size = self._entry_size(key, os.path.getsize(array_path))
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _forget(self, key: str):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for key in list(self._entries):
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'directory': self.directory
+            }
+
+
+_default_cache: Optional[SimulationResultCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_simulation_cache() -> SimulationResultCache:
+    """Get the process-wide simulation cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SimulationResultCache()
+        return _default_cache
@@ -21,10 +21,13 @@ import hashlib
 import numpy as np
 from typing import Dict, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from datetime import datetime
+from itertools import combinations
+from operator import itemgetter
 import networkx as nx
-from scipy.stats import pearsonr
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
 from sklearn.cluster import DBSCAN
 from enum import Enum
 
@@ -80,6 +83,69 @@ class ClusterDetectionResult:
     timestamp: float = field(default_factory=time.time)
 
 
+class DisjointSet:
+    """Union-find over hashable items with path halving and union by size"""
+    
+    def __init__(self):
+        self.parent: Dict[Any, Any] = {}
+        self.size: Dict[Any, int] = {}
+    
+    def find(self, item: Any) -> Any:
+        parent = self.parent
+        if item not in parent:
+            parent[item] = item
+            self.size[item] = 1
+            return item
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a: Any, b: Any) -> Any:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size.pop(root_b)
+        return root_a
+
+
+class GroupIndex:
+    """
+    Validators grouped by a key (funding source, ISP, subnet), maintained
+    one validator at a time for incremental detection.
+    """
+    
+    def __init__(self):
+        self.key_of: Dict[str, Any] = {}
+        self.groups: Dict[Any, Dict[str, None]] = defaultdict(dict)
+    
+    def assign(self, validator_id: str, key: Any) -> bool:
+        """Move a validator to `key` (None removes it); True if anything changed"""
+        if self.key_of.get(validator_id) == key:
+            return False
+        self.discard(validator_id)
+        if key is not None:
+            self.key_of[validator_id] = key
+            self.groups[key][validator_id] = None
+        return True
+    
+    def discard(self, validator_id: str) -> bool:
+        key = self.key_of.pop(validator_id, None)
+        if key is None:
+            return False
+        group = self.groups[key]
+        del group[validator_id]
+        if not group:
+            del self.groups[key]
+        return True
+    
+    def clusters(self, min_size: int) -> List[List[str]]:
+        return [list(group) for group in self.groups.values() if len(group) >= min_size]
+
+
 class TemporalClusterDetector:
     """Detects validators registered in suspicious time windows"""
     
@@ -89,6 +155,10 @@ class TemporalClusterDetector:
             window_seconds: Time window to consider suspicious (default 1 hour)
         """
         self.window_seconds = window_seconds
+        
+        # Incremental state (see update)
+        self._times: Dict[str, float] = {}
+        self._clusters: Optional[Dict[str, List[str]]] = None
     
     def detect(self, profiles: List[ValidatorProfile]) -> Dict[str, List[str]]:
         """
@@ -99,24 +169,44 @@ class TemporalClusterDetector:
         """
         if len(profiles) < 2:
             return {}
-        
+        return self._scan([(p.validator_id, p.registration_time) for p in profiles])
+    
+    def update(self, changed: List[ValidatorProfile], removed: Set[str]) -> Dict[str, List[str]]:
+        """
+        Incremental detect: apply changed and removed validators to the
+        stored registration times and rescan only if any time moved.
+        """
+        times = self._times
+        dirty = self._clusters is None
+        for validator_id in removed:
+            dirty |= times.pop(validator_id, None) is not None
+        for profile in changed:
+            if times.get(profile.validator_id) != profile.registration_time:
+                times[profile.validator_id] = profile.registration_time
+                dirty = True
+        if dirty:
+            self._clusters = self._scan(list(times.items())) if len(times) >= 2 else {}
+        return self._clusters
+    
+    def _scan(self, registrations: List[Tuple[str, float]]) -> Dict[str, List[str]]:
+        """Greedy windows over (validator_id, registration_time) pairs"""
         # Sort by registration time
-        sorted_profiles = sorted(profiles, key=lambda p: p.registration_time)
+        sorted_profiles = sorted(registrations, key=itemgetter(1))
         
         clusters = {}
         cluster_id = 0
         
         i = 0
         while i < len(sorted_profiles):
-            current_cluster = [sorted_profiles[i].validator_id]
-            base_time = sorted_profiles[i].registration_time
+            current_cluster = [sorted_profiles[i][0]]
+            base_time = sorted_profiles[i][1]
             
             # Find all validators within time window
             j = i + 1
             while j < len(sorted_profiles):
-                time_diff = sorted_profiles[j].registration_time - base_time
+                time_diff = sorted_profiles[j][1] - base_time
                 if time_diff <= self.window_seconds:
-                    current_cluster.append(sorted_profiles[j].validator_id)
+                    current_cluster.append(sorted_profiles[j][0])
                     j += 1
                 else:
                     break
@@ -137,15 +227,126 @@ class TemporalClusterDetector:
         return min(1.0, density / 10.0)  # Normalize to 0-1
 
 
+# Vote encoding: APPROVE=1, REJECT=-1, ABSTAIN/not voted=0
+VOTE_VALUES = {"APPROVE": 1.0, "REJECT": -1.0}
+
+
 class BehavioralClusterDetector:
-    """Detects validators with correlated voting patterns"""
+    """
+    Detects validators with correlated voting patterns
+    
+    Votes form a sparse validator x proposal matrix. Pearson correlations
+    are evaluated in row blocks as (X_b X^T - P m_b m^T) / (n_b n^T), where
+    m and n are each row's mean and centred norm, so the V x V matrix is
+    never held at once. Pairs at or above the threshold become graph edges
+    and clusters are the connected components with at least 3 validators.
+    
+    Above lsh_min_validators, candidate pairs come from random-hyperplane
+    LSH on the centred rows (sign agreement tracks the angle, i.e. the
+    correlation) and only candidates are scored exactly.
+    """
     
-    def __init__(self, correlation_threshold: float = 0.8):
+    # Correlation entries evaluated per block
+    BLOCK_ELEMENTS = 1 << 22
+    # Vote matrices up to this many entries are densified (float32) for BLAS
+    DENSE_ELEMENTS = 1 << 26
+    # LSH buckets up to this size are expanded into explicit pairs
+    SMALL_BUCKET = 64
+    
+    def __init__(
+        self,
+        correlation_threshold: float = 0.8,
+        method: str = "auto",
+        lsh_min_validators: int = 20000,
+        lsh_bands: int = 64,
+        lsh_rows: int = 14,
+        seed: int = 0
+    ):
         """
         Args:
             correlation_threshold: Minimum correlation to consider suspicious
+            method: "exact" (blocked all-pairs), "lsh" (candidate prefilter)
+                or "auto" (lsh from lsh_min_validators validators)
+            lsh_min_validators: Validator count at which "auto" switches to LSH
+            lsh_bands: LSH bands (more bands: higher recall, more candidates)
+            lsh_rows: Hyperplanes per band (more rows: fewer false candidates)
+            seed: Seed for the LSH hyperplanes
         """
+        if method not in ("auto", "exact", "lsh"):
+            raise ValueError(f"Unknown method: {method}")
         self.correlation_threshold = correlation_threshold
+        self.method = method
+        self.lsh_min_validators = lsh_min_validators
+        self.lsh_bands = lsh_bands
+        self.lsh_rows = lsh_rows
+        self.seed = seed
+        self._reset_state()
+    
+    def _reset_state(self):
+        """Incremental state (see update)"""
+        self._row_of: Dict[str, int] = {}
+        self._row_ids: List[Optional[str]] = []
+        self._row_digest: List[int] = []
+        # Every proposal a row voted on (abstentions included) and the vote values
+        self._row_cols: List[np.ndarray] = []
+        self._row_values: List[np.ndarray] = []
+        self._column_of: Dict[str, int] = {}
+        self._column_refs = np.zeros(0, dtype=np.int64)
+        self._scored_columns: Optional[np.ndarray] = None
+        self._edges = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        self._clusters: Optional[Dict[str, List[str]]] = None
+    
+    def build_vote_matrix(
+        self,
+        profiles: List[ValidatorProfile]
+    ) -> Tuple[List[str], List[str], sparse.csr_matrix]:
+        """
+        Sparse vote matrix over validators that cast at least one non-abstain vote.
+        
+        Returns:
+            (validator_ids, proposal_ids, matrix) with matrix[i, j] the vote of
+            validator i on proposal j
+        """
+        # Columns numbered on first sight, re-sorted by proposal id below
+        column: Dict[str, int] = {}
+        
+        cols: List[int] = []
+        values: List[float] = []
+        lengths = []
+        for profile in profiles:
+            vote_map = self._latest_votes(profile)
+            for proposal_id, choice in vote_map.items():
+                cols.append(column.setdefault(proposal_id, len(column)))
+                values.append(VOTE_VALUES.get(choice, 0.0))
+            lengths.append(len(vote_map))
+        
+        proposal_ids = sorted(column)
+        sorted_column = np.empty(len(column), dtype=np.int64)
+        sorted_column[list(column.values())] = np.arange(len(column))
+        
+        owner = np.repeat(np.arange(len(profiles)), lengths)
+        values = np.array(values)
+        voted = values != 0
+        owner, cols, values = owner[voted], sorted_column[np.array(cols, dtype=np.int64)][voted], values[voted]
+        
+        # Only validators with at least one non-abstain vote get a row
+        has_votes = np.bincount(owner, minlength=len(profiles)) > 0
+        row_of = np.cumsum(has_votes) - 1
+        validator_ids = [profiles[i].validator_id for i in np.flatnonzero(has_votes)]
+        
+        matrix = sparse.csr_matrix(
+            (values, (row_of[owner], cols)),
+            shape=(len(validator_ids), len(proposal_ids))
+        )
+        return validator_ids, proposal_ids, matrix
+    
+    @staticmethod
+    def _latest_votes(profile: ValidatorProfile) -> Dict[str, str]:
+        """proposal_id -> choice; the last vote on a proposal wins"""
+        vote_map = {}
+        for vote in profile.votes_cast:
+            vote_map[vote['proposal_id']] = vote['choice']
+        return vote_map
     
     def detect(self, profiles: List[ValidatorProfile]) -> Dict[str, List[str]]:
         """
@@ -157,66 +358,364 @@ class BehavioralClusterDetector:
         if len(profiles) < 2:
             return {}
         
-        # Build voting matrix
-        proposal_ids = set()
-        for profile in profiles:
-            for vote in profile.votes_cast:
-                proposal_ids.add(vote['proposal_id'])
+        validator_ids, proposal_ids, matrix = self.build_vote_matrix(profiles)
         
-        if not proposal_ids:
+        # Need at least 3 proposals for meaningful correlation
+        if len(proposal_ids) < 3 or len(validator_ids) < 3:
             return {}
         
-        proposal_list = sorted(list(proposal_ids))
-        
-        # Create vote vectors for each validator
-        vote_vectors = {}
-        for profile in profiles:
-            vector = []
-            vote_map = {v['proposal_id']: v['choice'] for v in profile.votes_cast}
-            
-            for prop_id in proposal_list:
-                if prop_id in vote_map:
-                    # Encode: APPROVE=1, REJECT=-1, ABSTAIN=0
-                    choice = vote_map[prop_id]
-                    value = 1 if choice == "APPROVE" else (-1 if choice == "REJECT" else 0)
-                    vector.append(value)
-                else:
-                    vector.append(0)  # Didn't vote
-            
-            if any(v != 0 for v in vector):
-                vote_vectors[profile.validator_id] = np.array(vector)
+        rows_i, rows_j = self.correlated_pairs(matrix)
+        return self._components(rows_i, rows_j, validator_ids)
+    
+    @staticmethod
+    def _components(
+        rows_i: np.ndarray,
+        rows_j: np.ndarray,
+        validator_ids: List[Optional[str]]
+    ) -> Dict[str, List[str]]:
+        """Connected components of the correlation graph with >= 3 members"""
+        num_validators = len(validator_ids)
+        adjacency = sparse.coo_matrix(
+            (np.ones(len(rows_i), dtype=np.int8), (rows_i, rows_j)),
+            shape=(num_validators, num_validators)
+        )
+        _, labels = connected_components(adjacency, directed=False)
         
-        # Calculate pairwise correlations
+        # Numbered by their first validator
+        sizes = np.bincount(labels)
         clusters = {}
-        cluster_id = 0
-        processed = set()
+        members = defaultdict(list)
+        for index in np.flatnonzero(sizes[labels] >= 3):
+            members[labels[index]].append(validator_ids[index])
+        for cluster_id, component in enumerate(members.values()):
+            clusters[f"behavioral_{cluster_id}"] = component
+        
+        return clusters
+    
+    def update(self, changed: List[ValidatorProfile], removed: Set[str]) -> Dict[str, List[str]]:
+        """
+        Incremental detect over the validators seen so far.
         
-        for val_id1, vec1 in vote_vectors.items():
-            if val_id1 in processed:
+        Only validators whose votes changed are re-correlated (against every
+        row); edges between untouched validators are kept from the previous
+        run. A change in the set of proposals alters every row's mean and
+        norm, so it triggers a full rescore of the stored rows instead.
+        """
+        dirty: List[int] = []
+        
+        for validator_id in removed:
+            row = self._row_of.pop(validator_id, None)
+            if row is not None:
+                self._set_row(row, np.empty(0, dtype=np.int64), np.empty(0), 0)
+                self._row_ids[row] = None
+                dirty.append(row)
+        
+        for profile in changed:
+            vote_map = self._latest_votes(profile)
+            digest = hash(tuple(vote_map.items()))
+            row = self._row_of.get(profile.validator_id)
+            if row is None:
+                row = len(self._row_ids)
+                self._row_of[profile.validator_id] = row
+                self._row_ids.append(profile.validator_id)
+                self._row_digest.append(0)
+                self._row_cols.append(np.empty(0, dtype=np.int64))
+                self._row_values.append(np.empty(0))
+            elif self._row_digest[row] == digest:
                 continue
+            column = self._column_of
+            cols = np.array([column.setdefault(p, len(column)) for p in vote_map], dtype=np.int64)
+            values = np.array([VOTE_VALUES.get(choice, 0.0) for choice in vote_map.values()], dtype=np.float64)
+            self._set_row(row, cols, values, digest)
+            dirty.append(row)
+        
+        if not dirty and self._clusters is not None:
+            return self._clusters
+        
+        # Drop removed rows once they make up half the table
+        if len(self._row_of) * 2 < len(self._row_ids):
+            self._compact_rows()
+            dirty = []
+        
+        columns = np.flatnonzero(self._column_refs > 0)
+        rows_i, rows_j = self._rescore(np.unique(np.array(dirty, dtype=np.int64)), columns)
+        self._edges = (rows_i, rows_j)
+        self._clusters = self._components(rows_i, rows_j, self._row_ids)
+        return self._clusters
+    
+    def _set_row(self, row: int, cols: np.ndarray, values: np.ndarray, digest: int):
+        if len(self._column_refs) < len(self._column_of):
+            self._column_refs = np.concatenate(
+                (self._column_refs, np.zeros(len(self._column_of) - len(self._column_refs), dtype=np.int64))
+            )
+        np.subtract.at(self._column_refs, self._row_cols[row], 1)
+        np.add.at(self._column_refs, cols, 1)
+        self._row_cols[row] = cols
+        self._row_values[row] = values
+        self._row_digest[row] = digest
+    
+    def _compact_rows(self):
+        """Renumber live rows densely; edges are rescored by the caller"""
+        live = [row for row, validator_id in enumerate(self._row_ids) if validator_id is not None]
+        self._row_ids = [self._row_ids[row] for row in live]
+        self._row_digest = [self._row_digest[row] for row in live]
+        self._row_cols = [self._row_cols[row] for row in live]
+        self._row_values = [self._row_values[row] for row in live]
+        self._row_of = {validator_id: row for row, validator_id in enumerate(self._row_ids)}
+        self._scored_columns = None
+    
+    def _rescore(self, dirty: np.ndarray, columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Edges after an update: dirty rows against all rows, or a full rescore"""
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        num_rows = len(self._row_ids)
+        if len(columns) < 3 or num_rows < 3:
+            self._scored_columns = None
+            return empty
+        
+        # Stored column numbers -> dense positions among live proposals
+        position = np.full(len(self._column_of), -1, dtype=np.int64)
+        position[columns] = np.arange(len(columns))
+        lengths = np.fromiter(map(len, self._row_cols), dtype=np.int64, count=num_rows)
+        cols = position[np.concatenate(self._row_cols)]
+        values = np.concatenate(self._row_values)
+        owner = np.repeat(np.arange(num_rows), lengths)
+        voted = values != 0
+        matrix = sparse.csr_matrix(
+            (values[voted], (owner[voted], cols[voted])), shape=(num_rows, len(columns))
+        )
+        
+        mean, norm = self._row_moments(matrix)
+        full = self._scored_columns is None or not np.array_equal(columns, self._scored_columns)
+        self._scored_columns = columns
+        if full:
+            return self.correlated_pairs(matrix)
+        
+        # Keep edges between clean rows, re-correlate dirty rows with everything
+        rows_i, rows_j = self._edges
+        is_dirty = np.zeros(num_rows, dtype=bool)
+        is_dirty[dirty] = True
+        keep = ~(is_dirty[rows_i] | is_dirty[rows_j])
+        new_i, new_j = self._pairs_with(self._rows_for_products(matrix), dirty, mean, norm)
+        return np.concatenate((rows_i[keep], new_i)), np.concatenate((rows_j[keep], new_j))
+    
+    def correlated_pairs(self, matrix: sparse.csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row pairs (i < j) whose Pearson correlation reaches the threshold.
+        
+        Rows with zero variance never correlate (Pearson is undefined).
+        """
+        num_validators = matrix.shape[0]
+        mean, norm = self._row_moments(matrix)
+        
+        use_lsh = self.method == "lsh" or (
+            self.method == "auto" and num_validators >= self.lsh_min_validators
+        )
+        vectors = self._rows_for_products(matrix)
+        if use_lsh:
+            return self._lsh_pairs(matrix, vectors, mean, norm)
+        return self._pairs_among(vectors, np.arange(num_validators), mean, norm)
+    
+    @staticmethod
+    def _row_moments(matrix: sparse.csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-row mean and centred L2 norm"""
+        num_proposals = matrix.shape[1]
+        mean = np.asarray(matrix.sum(axis=1)).ravel() / num_proposals
+        squares = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+        norm = np.sqrt(np.maximum(squares - num_proposals * mean * mean, 0.0))
+        return mean, norm
+    
+    def _rows_for_products(self, matrix: sparse.csr_matrix):
+        """
+        Rows to multiply: dense float32 when small enough (votes are small
+        integers, so products are exact), otherwise the sparse matrix
+        """
+        if matrix.shape[0] * matrix.shape[1] <= self.DENSE_ELEMENTS:
+            return matrix.toarray().astype(np.float32)
+        return matrix
+    
+    def _score_pairs(
+        self,
+        vectors,
+        pairs_i: np.ndarray,
+        pairs_j: np.ndarray,
+        mean: np.ndarray,
+        norm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact (float64) correlation of the given row pairs; keep those at the threshold"""
+        num_proposals = vectors.shape[1]
+        if sparse.issparse(vectors):
+            row_size = max(1, vectors.nnz // max(vectors.shape[0], 1))
+        else:
+            row_size = num_proposals
+        chunk = max(1, self.BLOCK_ELEMENTS // row_size)
+        
+        kept_i, kept_j = [], []
+        for start in range(0, len(pairs_i), chunk):
+            a = pairs_i[start:start + chunk]
+            b = pairs_j[start:start + chunk]
+            if sparse.issparse(vectors):
+                gram = np.asarray(vectors[a].multiply(vectors[b]).sum(axis=1)).ravel()
+            else:
+                gram = np.einsum('ij,ij->i', vectors[a], vectors[b], dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = (gram - num_proposals * mean[a] * mean[b]) / (norm[a] * norm[b])
+            keep = corr >= self.correlation_threshold
+            kept_i.append(a[keep])
+            kept_j.append(b[keep])
+        
+        if not kept_i:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(kept_i), np.concatenate(kept_j)
+    
+    def _pairs_among(
+        self,
+        vectors,
+        rows: np.ndarray,
+        mean: np.ndarray,
+        norm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """All pairs within `rows` at or above the threshold, in row blocks"""
+        rows = rows[norm[rows] > 0]
+        num_proposals = vectors.shape[1]
+        block = max(1, self.BLOCK_ELEMENTS // max(len(rows), 1))
+        
+        sub = self._standardized(vectors, rows, mean, norm)
+        
+        found_i, found_j = [], []
+        for start in range(0, len(rows), block):
+            stop = min(start + block, len(rows))
+            # Block rows against themselves and every later row
+            if sparse.issparse(sub):
+                gram = np.asarray(sub[start:] @ sub[start:stop].T.toarray(), dtype=np.float64)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = (gram - num_proposals * np.multiply.outer(mean[rows[start:]], mean[rows[start:stop]])) \
+                        / np.multiply.outer(norm[rows[start:]], norm[rows[start:stop]])
+                screen = self.correlation_threshold
+            else:
+                corr = sub[start:] @ sub[start:stop].T
+                screen = self.correlation_threshold - 1e-4
+            later, current = np.nonzero(corr >= screen)
+            keep = later > current
+            found_i.append(rows[start + current[keep]])
+            found_j.append(rows[start + later[keep]])
+        
+        if not found_i:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        pairs_i, pairs_j = np.concatenate(found_i), np.concatenate(found_j)
+        if sparse.issparse(vectors):
+            return pairs_i, pairs_j
+        return self._score_pairs(vectors, pairs_i, pairs_j, mean, norm)
+    
+    @staticmethod
+    def _standardized(vectors, rows: np.ndarray, mean: np.ndarray, norm: np.ndarray):
+        """
+        Sparse rows as-is; dense rows centred and scaled to unit norm, so one
+        float32 matmul screens a block and only the few pairs near or above
+        the threshold are scored exactly
+        """
+        if sparse.issparse(vectors):
+            return vectors[rows]
+        return (vectors[rows] - mean[rows, None].astype(np.float32)) / norm[rows, None].astype(np.float32)
+    
+    def _pairs_with(
+        self,
+        vectors,
+        rows: np.ndarray,
+        mean: np.ndarray,
+        norm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pairs (i < j) at or above the threshold with at least one row in `rows`"""
+        num_validators, num_proposals = vectors.shape
+        valid = np.flatnonzero(norm > 0)
+        rows = rows[norm[rows] > 0]
+        block = max(1, self.BLOCK_ELEMENTS // max(len(valid), 1))
+        everyone = self._standardized(vectors, valid, mean, norm)
+        
+        codes = []
+        for start in range(0, len(rows), block):
+            current = rows[start:start + block]
+            if sparse.issparse(vectors):
+                gram = np.asarray(everyone @ vectors[current].T.toarray(), dtype=np.float64)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = (gram - num_proposals * np.multiply.outer(mean[valid], mean[current])) \
+                        / np.multiply.outer(norm[valid], norm[current])
+                screen = self.correlation_threshold
+            else:
+                corr = everyone @ self._standardized(vectors, current, mean, norm).T
+                screen = self.correlation_threshold - 1e-4
+            other, index = np.nonzero(corr >= screen)
+            first, second = valid[other], current[index]
+            keep = first != second
+            codes.append(np.minimum(first, second)[keep] * num_validators + np.maximum(first, second)[keep])
+        
+        if not codes:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        # Pairs with both rows in `rows` were found twice
+        codes = np.unique(np.concatenate(codes))
+        pairs_i, pairs_j = np.divmod(codes, num_validators)
+        if sparse.issparse(vectors):
+            return pairs_i, pairs_j
+        return self._score_pairs(vectors, pairs_i, pairs_j, mean, norm)
+    
+    def _lsh_pairs(
+        self,
+        matrix: sparse.csr_matrix,
+        vectors,
+        mean: np.ndarray,
+        norm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate pairs from hyperplane LSH, then exact correlation on candidates"""
+        num_validators, num_proposals = matrix.shape
+        valid = np.flatnonzero(norm > 0)
+        rng = np.random.default_rng(self.seed)
+        planes = rng.standard_normal((num_proposals, self.lsh_bands * self.lsh_rows))
+        
+        # Project the centred rows: (x - m) . r = x . r - m * sum(r)
+        projection = matrix[valid] @ planes - np.outer(mean[valid], planes.sum(axis=0))
+        bits = (projection > 0).reshape(len(valid), self.lsh_bands, self.lsh_rows)
+        keys = bits.astype(np.int64) @ (1 << np.arange(self.lsh_rows, dtype=np.int64))
+        
+        found_i, found_j = [], []
+        candidates = []
+        for band in range(self.lsh_bands):
+            band_keys = keys[:, band]
+            order = np.argsort(band_keys, kind='stable')
+            sorted_keys = band_keys[order]
             
-            cluster = [val_id1]
-            processed.add(val_id1)
+            boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+            starts = np.concatenate(([0], boundaries))
+            sizes = np.diff(np.concatenate((starts, [len(order)])))
             
-            for val_id2, vec2 in vote_vectors.items():
-                if val_id2 in processed or val_id1 == val_id2:
-                    continue
-                
-                # Calculate Pearson correlation
-                if len(vec1) >= 3:  # Need at least 3 votes for meaningful correlation
-                    try:
-                        corr, _ = pearsonr(vec1, vec2)
-                        if corr >= self.correlation_threshold:
-                            cluster.append(val_id2)
-                            processed.add(val_id2)
-                    except:
-                        pass
+            # Large buckets: blocked all-pairs within the bucket
+            large = sizes > self.SMALL_BUCKET
+            for start, size in zip(starts[large], sizes[large]):
+                bucket = np.sort(valid[order[start:start + size]])
+                pairs_i, pairs_j = self._pairs_among(vectors, bucket, mean, norm)
+                found_i.append(pairs_i)
+                found_j.append(pairs_j)
             
-            if len(cluster) >= 3:
-                clusters[f"behavioral_{cluster_id}"] = cluster
-                cluster_id += 1
+            # Small buckets: enumerate pairs by offset within the sorted keys
+            small = np.repeat(~large, sizes)
+            for offset in range(1, min(self.SMALL_BUCKET, len(order))):
+                same = (sorted_keys[:-offset] == sorted_keys[offset:]) & small[offset:]
+                if not same.any():
+                    break
+                first = valid[order[:-offset][same]]
+                second = valid[order[offset:][same]]
+                candidates.append(np.minimum(first, second) * num_validators + np.maximum(first, second))
         
-        return clusters
+        if candidates:
+            # Sort + adjacent compare: far cheaper than np.unique's hash path on int64 codes
+            codes = np.sort(np.concatenate(candidates))
+            codes = codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+            pairs_i, pairs_j = np.divmod(codes, num_validators)
+            pairs_i, pairs_j = self._score_pairs(vectors, pairs_i, pairs_j, mean, norm)
+            found_i.append(pairs_i)
+            found_j.append(pairs_j)
+        
+        if not found_i:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(found_i), np.concatenate(found_j)
     
     def calculate_score(self, correlation: float, cluster_size: int) -> float:
         """Calculate suspicion score for behavioral cluster"""
@@ -230,6 +729,8 @@ class EconomicClusterDetector:
     
     def __init__(self):
         self.funding_graph = nx.DiGraph()
+        # Incremental state (see update)
+        self._by_source = GroupIndex()
     
     def detect(self, profiles: List[ValidatorProfile]) -> Dict[str, List[str]]:
         """
@@ -257,6 +758,17 @@ class EconomicClusterDetector:
         
         return clusters
     
+    def update(self, changed: List[ValidatorProfile], removed: Set[str]) -> Dict[str, List[str]]:
+        """Incremental detect: move changed validators between funding groups"""
+        for validator_id in removed:
+            self._by_source.discard(validator_id)
+        for profile in changed:
+            self._by_source.assign(profile.validator_id, profile.funding_source or None)
+        return {
+            f"economic_{cluster_id}": validators
+            for cluster_id, validators in enumerate(self._by_source.clusters(3))
+        }
+    
     def calculate_score(self, cluster_size: int, time_span: float) -> float:
         """Calculate suspicion score for economic cluster"""
         # Many validators funded quickly from same source = suspicious
@@ -274,6 +786,9 @@ class NetworkTopologyDetector:
             similarity_threshold: Minimum similarity to cluster
         """
         self.similarity_threshold = similarity_threshold
+        # Incremental state (see update)
+        self._by_isp = GroupIndex()
+        self._by_subnet = GroupIndex()
     
     def detect(self, profiles: List[ValidatorProfile]) -> Dict[str, List[str]]:
         """
@@ -316,6 +831,23 @@ class NetworkTopologyDetector:
         
         return clusters
     
+    def update(self, changed: List[ValidatorProfile], removed: Set[str]) -> Dict[str, List[str]]:
+        """Incremental detect: move changed validators between ISP and subnet groups"""
+        for validator_id in removed:
+            self._by_isp.discard(validator_id)
+            self._by_subnet.discard(validator_id)
+        for profile in changed:
+            self._by_isp.assign(profile.validator_id, profile.isp_hash or None)
+            self._by_subnet.assign(profile.validator_id, profile.ip_hash[:8] if profile.ip_hash else None)
+        
+        clusters = {}
+        isp_clusters = self._by_isp.clusters(5)
+        for cluster_id, validators in enumerate(isp_clusters):
+            clusters[f"network_isp_{cluster_id}"] = validators
+        for cluster_id, validators in enumerate(self._by_subnet.clusters(3), len(isp_clusters)):
+            clusters[f"network_ip_{cluster_id}"] = validators
+        return clusters
+    
     def calculate_score(self, cluster_size: int, network_type: str) -> float:
         """Calculate suspicion score for network cluster"""
         if network_type == "ip":
@@ -349,11 +881,12 @@ class SpectralClusterDetector:
         clusters = {}
         cluster_id = 0
         
+        profile_map = {p.validator_id: p for p in profiles}
+        
         # For each behavioral cluster, check spectral coverage
         for behavior_cluster_id, validator_ids in behavioral_clusters.items():
             # Get spectral regions represented
             regions = set()
-            profile_map = {p.validator_id: p for p in profiles}
             
             for val_id in validator_ids:
                 if val_id in profile_map:
@@ -383,6 +916,10 @@ class DeviceFingerprintDetector:
             timing_tolerance_ms: Tolerance for timing similarity
         """
         self.timing_tolerance_ms = timing_tolerance_ms
+        
+        # Incremental state (see update)
+        self._features: Dict[str, Tuple[float, float]] = {}
+        self._clusters: Optional[Dict[str, List[str]]] = None
     
     def detect(self, profiles: List[ValidatorProfile]) -> Dict[str, List[str]]:
         """
@@ -400,13 +937,42 @@ class DeviceFingerprintDetector:
         validator_indices = []
         
         for profile in profiles:
-            if len(profile.block_timing_signature) >= 3:
-                # Use mean and std of timing as features
-                mean_timing = np.mean(profile.block_timing_signature)
-                std_timing = np.std(profile.block_timing_signature)
-                timing_profiles.append([mean_timing, std_timing])
+            features = self._timing_features(profile)
+            if features is not None:
+                timing_profiles.append(features)
                 validator_indices.append(profile.validator_id)
         
+        return self._cluster(validator_indices, timing_profiles)
+    
+    def update(self, changed: List[ValidatorProfile], removed: Set[str]) -> Dict[str, List[str]]:
+        """
+        Incremental detect: refresh timing features of changed validators and
+        re-run DBSCAN only if any feature moved.
+        """
+        features = self._features
+        dirty = self._clusters is None
+        for validator_id in removed:
+            dirty |= features.pop(validator_id, None) is not None
+        for profile in changed:
+            current = self._timing_features(profile)
+            if features.get(profile.validator_id) != current:
+                dirty = True
+                if current is None:
+                    del features[profile.validator_id]
+                else:
+                    features[profile.validator_id] = current
+        if dirty:
+            self._clusters = self._cluster(list(features), list(features.values()))
+        return self._clusters
+    
+    @staticmethod
+    def _timing_features(profile: ValidatorProfile) -> Optional[Tuple[float, float]]:
+        """Mean and std of block timing, or None with fewer than 3 samples"""
+        if len(profile.block_timing_signature) < 3:
+            return None
+        return (float(np.mean(profile.block_timing_signature)), float(np.std(profile.block_timing_signature)))
+    
+    def _cluster(self, validator_ids: List[str], timing_profiles: List[Tuple[float, float]]) -> Dict[str, List[str]]:
         if len(timing_profiles) < 2:
             return {}
         
@@ -414,22 +980,17 @@ class DeviceFingerprintDetector:
         X = np.array(timing_profiles)
         clustering = DBSCAN(eps=self.timing_tolerance_ms, min_samples=3).fit(X)
         
-        # Extract clusters
-        clusters = {}
-        for label in set(clustering.labels_):
-            if label == -1:  # Noise points
-                continue
-            
-            cluster_validators = [
-                validator_indices[i] 
-                for i, lbl in enumerate(clustering.labels_) 
-                if lbl == label
-            ]
-            
-            if len(cluster_validators) >= 3:
-                clusters[f"device_{label}"] = cluster_validators
+        # Extract clusters, skipping noise points (-1)
+        members = defaultdict(list)
+        for validator_id, label in zip(validator_ids, clustering.labels_.tolist()):
+            if label != -1:
+                members[label].append(validator_id)
         
-        return clusters
+        return {
+            f"device_{label}": members[label]
+            for label in sorted(members)
+            if len(members[label]) >= 3
+        }
     
     def calculate_score(self, cluster_size: int, timing_variance: float) -> float:
         """Calculate suspicion score for device cluster"""
@@ -455,6 +1016,9 @@ class SybilDetectionConfig:
     network_weight: float = 0.15
     spectral_weight: float = 0.20
     device_weight: float = 0.05
+    
+    # Detection results kept for get_detection_stats (older ones only count)
+    history_limit: int = 10000
 
 
 class SybilDetectionEngine:
@@ -483,34 +1047,47 @@ class SybilDetectionEngine:
             self.config.device_timing_tolerance_ms
         )
         
-        # Detection history
-        self.detection_history: List[ClusterDetectionResult] = []
+        # Detection history (bounded) and running totals over every detection
+        self.detection_history: deque = deque(maxlen=self.config.history_limit)
+        self._total_detections = 0
+        self._total_cluster_size = 0
+        self._severity_counts: Dict[str, int] = defaultdict(int)
+        self._flagged_validators: Set[str] = set()
+        
+        # Incremental state: per-validator fingerprint from the last run
+        self._fingerprints: Dict[str, int] = {}
     
     def analyze_validators(
         self, 
-        profiles: List[ValidatorProfile]
+        profiles: List[ValidatorProfile],
+        incremental: bool = False
     ) -> List[ClusterDetectionResult]:
         """
         Run complete Sybil detection analysis on validator profiles.
         
+        Args:
+            profiles: Current profile of every validator
+            incremental: Re-evaluate only validators whose profile changed
+                since the last incremental run (detector state is kept between
+                runs; the first run evaluates everyone)
+        
         Returns:
             List of detected clusters with severity and evidence
         """
         if len(profiles) < 2:
             return []
         
-        # Run all detectors
-        temporal_clusters = self.temporal_detector.detect(profiles)
-        behavioral_clusters = self.behavioral_detector.detect(profiles)
-        economic_clusters = self.economic_detector.detect(profiles)
-        network_clusters = self.network_detector.detect(profiles)
+        if incremental:
+            temporal_clusters, behavioral_clusters, economic_clusters, network_clusters, \
+                device_clusters = self._update_detectors(profiles)
+        else:
+            temporal_clusters = self.temporal_detector.detect(profiles)
+            behavioral_clusters = self.behavioral_detector.detect(profiles)
+            economic_clusters = self.economic_detector.detect(profiles)
+            network_clusters = self.network_detector.detect(profiles)
+            device_clusters = self.device_detector.detect(profiles)
         spectral_clusters = self.spectral_detector.detect(profiles, behavioral_clusters)
-        device_clusters = self.device_detector.detect(profiles)
         
-        # Aggregate all detections
-        all_clusters = {}
-        
-        # Merge clusters by validator overlap
         cluster_sources = {
             'temporal': (temporal_clusters, self.config.temporal_weight),
             'behavioral': (behavioral_clusters, self.config.behavioral_weight),
@@ -520,70 +1097,112 @@ class SybilDetectionEngine:
             'device': (device_clusters, self.config.device_weight)
         }
         
-        # Build unified cluster index
-        validator_to_clusters = defaultdict(set)
-        for source_name, (clusters, _) in cluster_sources.items():
-            for cluster_id, validators in clusters.items():
-                for val_id in validators:
-                    validator_to_clusters[val_id].add((source_name, cluster_id))
+        # Every detected cluster, numbered in source order
+        detections = [
+            (source_name, weight, validators)
+            for source_name, (clusters, weight) in cluster_sources.items()
+            for validators in clusters.values()
+        ]
+        memberships = defaultdict(list)
+        for index, (_, _, validators) in enumerate(detections):
+            for val_id in dict.fromkeys(validators):
+                memberships[val_id].append(index)
         
-        # Group validators that appear together in multiple detection vectors
-        processed = set()
+        profile_map = {p.validator_id: p for p in profiles}
         results = []
-        
-        for val_id, source_clusters in validator_to_clusters.items():
-            if val_id in processed:
-                continue
-            
-            # Find all validators that share detection vectors with this one
-            cluster_validators = {val_id}
-            processed.add(val_id)
-            
-            for other_val, other_sources in validator_to_clusters.items():
-                if other_val in processed:
-                    continue
-                
-                # Check overlap in detection sources
-                overlap = source_clusters & other_sources
-                if len(overlap) >= 2:  # Detected by at least 2 same vectors
-                    cluster_validators.add(other_val)
-                    processed.add(other_val)
-            
-            if len(cluster_validators) >= 3:
+        for group in self.fuse_clusters(memberships):
+            if len(group) >= 3:
                 # Calculate composite score and severity
+                overlap = Counter(index for val_id in group for index in memberships[val_id])
                 result = self._create_detection_result(
-                    list(cluster_validators),
-                    profiles,
-                    cluster_sources
+                    group,
+                    profile_map,
+                    [(detections[index][0], detections[index][1], size)
+                     for index, size in sorted(overlap.items()) if size >= 3]
                 )
                 results.append(result)
-                self.detection_history.append(result)
+                self._record(result)
         
         return sorted(results, key=lambda r: r.confidence_score, reverse=True)
     
+    @staticmethod
+    def fuse_clusters(memberships: Dict[str, List[int]]) -> List[List[str]]:
+        """
+        Group validators that appear together in at least 2 detected clusters.
+        
+        Grouping is transitive: every pair of clusters a validator belongs to
+        is a key, and validators sharing a key are unioned, so the cost is
+        linear in the number of (validator, cluster) detections.
+        
+        Args:
+            memberships: validator_id -> indices of the clusters it appears in
+        
+        Returns:
+            Groups of validator_ids, ordered by first appearance
+        """
+        groups = DisjointSet()
+        first_with = {}
+        for val_id, clusters in memberships.items():
+            groups.find(val_id)
+            for key in combinations(clusters, 2):
+                groups.union(first_with.setdefault(key, val_id), val_id)
+        
+        members = defaultdict(list)
+        for val_id in memberships:
+            members[groups.find(val_id)].append(val_id)
+        return list(members.values())
+    
+    def _update_detectors(self, profiles: List[ValidatorProfile]) -> Tuple[Dict[str, List[str]], ...]:
+        """Feed validators changed since the last incremental run to each detector"""
+        fingerprints = {
+            p.validator_id: hash((
+                p.spectral_region, p.registration_time, p.funding_source, p.ip_hash, p.isp_hash,
+                tuple((v['proposal_id'], v['choice']) for v in p.votes_cast), tuple(p.block_timing_signature)
+            ))
+            for p in profiles
+        }
+        previous = self._fingerprints
+        changed = [p for p in profiles if previous.get(p.validator_id) != fingerprints[p.validator_id]]
+        removed = previous.keys() - fingerprints.keys()
+        self._fingerprints = fingerprints
+        
+        return (
+            self.temporal_detector.update(changed, removed),
+            self.behavioral_detector.update(changed, removed),
+            self.economic_detector.update(changed, removed),
+            self.network_detector.update(changed, removed),
+            self.device_detector.update(changed, removed)
+        )
+    
+    def _record(self, result: ClusterDetectionResult):
+        self.detection_history.append(result)
+        self._total_detections += 1
+        self._total_cluster_size += len(result.validators)
+        self._severity_counts[result.severity.name] += 1
+        self._flagged_validators.update(result.validators)
+    
     def _create_detection_result(
         self,
         validator_ids: List[str],
-        profiles: List[ValidatorProfile],
-        cluster_sources: Dict
+        profile_map: Dict[str, ValidatorProfile],
+        overlaps: List[Tuple[str, float, int]]
     ) -> ClusterDetectionResult:
-        """Create detection result with evidence and scoring"""
-        
-        profile_map = {p.validator_id: p for p in profiles}
+        """
+        Create detection result with evidence and scoring.
         
+        Args:
+            overlaps: (source_name, weight, validators shared) for every
+                detected cluster sharing at least 3 validators with this one
+        """
         # Calculate scores from each detection vector
         detection_vectors = {}
         evidence = []
         total_score = 0.0
         
-        for source_name, (clusters, weight) in cluster_sources.items():
-            # Check if this cluster was detected by this vector
-            for cluster_id, cluster_vals in clusters.items():
-                overlap = set(validator_ids) & set(cluster_vals)
-                if len(overlap) >= 3:
-                    detection_vectors[source_name] = weight
-                    total_score += weight
-                    evidence.append(f"Detected by {source_name} vector ({len(overlap)} validators)")
+        for source_name, weight, overlap in overlaps:
+            detection_vectors[source_name] = weight
+            total_score += weight
+            evidence.append(f"Detected by {source_name} vector ({overlap} validators)")
         
         # Additional evidence
         regions = set(profile_map[v].spectral_region for v in validator_ids if v in profile_map)
@@ -624,7 +1243,7 @@ class SybilDetectionEngine:
     
     def get_detection_stats(self) -> Dict[str, Any]:
         """Get statistics on detection history"""
-        if not self.detection_history:
+        if not self._total_detections:
             return {
                 "total_detections": 0,
                 "severity_breakdown": {},
@@ -632,20 +1251,11 @@ class SybilDetectionEngine:
                 "total_flagged_validators": 0
             }
         
-        severity_counts = defaultdict(int)
-        total_validators = set()
-        
-        for result in self.detection_history:
-            severity_counts[result.severity.name] += 1
-            total_validators.update(result.validators)
-        
-        avg_size = np.mean([len(r.validators) for r in self.detection_history])
-        
         return {
-            "total_detections": len(self.detection_history),
-            "severity_breakdown": dict(severity_counts),
-            "average_cluster_size": avg_size,
-            "total_flagged_validators": len(total_validators),
+            "total_detections": self._total_detections,
+            "severity_breakdown": dict(self._severity_counts),
+            "average_cluster_size": self._total_cluster_size / self._total_detections,
+            "total_flagged_validators": len(self._flagged_validators),
             "recent_detections": [
                 {
                     "cluster_id": r.cluster_id,
@@ -654,6 +1264,6 @@ class SybilDetectionEngine:
                     "confidence": r.confidence_score,
                     "timestamp": r.timestamp
                 }
-                for r in self.detection_history[-10:]
+                for r in list(self.detection_history)[-10:]
             ]
         }
@@ -159,8 +159,8 @@ class IntegratedSybilMonitor:
         if len(profiles) < 2:
             return []
         
-        # Run detection
-        detections = self.detection_engine.analyze_validators(profiles)
+        # Run detection, re-evaluating only validators changed since the last scan
+        detections = self.detection_engine.analyze_validators(profiles, incremental=True)
         
         # Update stats
         self.total_scans += 1
@@ -13,8 +13,7 @@ from typing import Dict, Any, Optional
 import os
 import json
 from datetime import datetime
-from database import get_engine, User, Role
-from sqlalchemy.orm import sessionmaker
+from database import session_scope, User, Role
 
 
 # ============================================================================
@@ -36,11 +35,7 @@ class AdminTaskHandlers:
         """
         from auth import create_user
         
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
-        
-        try:
+        with session_scope() as db:
             user = create_user(
                 db,
                 params['email'],
@@ -53,8 +48,6 @@ class AdminTaskHandlers:
                 'user_id': user.id if user else None,
                 'email': params['email']
             }
-        finally:
-            db.close()
     
     @staticmethod
     def update_user_roles(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,11 +58,7 @@ class AdminTaskHandlers:
             user_id: User ID
             roles: List of role names
         """
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
-        
-        try:
+        with session_scope() as db:
             user = db.query(User).filter(User.id == params['user_id']).first()
             
             if not user:
@@ -87,8 +76,6 @@ class AdminTaskHandlers:
             db.commit()
             
             return {'success': True, 'user_id': user.id}
-        finally:
-            db.close()
     
     @staticmethod
     def log_system_event(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -123,11 +110,7 @@ class AdminTaskHandlers:
         """
         from database import SimulationRun
         
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
-        
-        try:
+        with session_scope() as db:
             sim_run = db.query(SimulationRun).filter(
                 SimulationRun.id == params['simulation_id']
             ).first()
@@ -147,8 +130,6 @@ class AdminTaskHandlers:
                 'output_path': output_path,
                 'format': format_type
             }
-        finally:
-            db.close()
 
 
 # ============================================================================
@@ -21,7 +21,13 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 from collections import defaultdict, deque
+from concurrent.futures import (
+    Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+)
+import heapq
 import json
+import multiprocessing
+import time
 
 
 class TaskStatus(Enum):
@@ -256,6 +262,28 @@ class TaskOrchestrationDAG:
         
         return self.task_results
     
+    def execute_parallel(self, max_workers: int = 4, executor: str = 'thread',
+                         default_timeout: Optional[float] = None) -> Dict[str, TaskResult]:
+        """
+        Execute all tasks concurrently, starting each task as soon as its
+        dependencies complete (no level barriers)
+        
+        Args:
+            max_workers: Maximum number of tasks running at once
+            executor: 'thread' for I/O-bound handlers (webhooks, API calls),
+                      'process' for CPU-bound handlers (handlers must be picklable)
+            default_timeout: Timeout in seconds for tasks without Task.timeout
+            
+        Returns:
+            Dictionary mapping task IDs to execution results
+        """
+        return ParallelTaskExecutor(
+            self,
+            max_workers=max_workers,
+            executor=executor,
+            default_timeout=default_timeout
+        ).run()
+    
     def get_execution_plan(self) -> Dict[str, Any]:
         """
         Get detailed execution plan with statistics
@@ -289,6 +317,236 @@ class TaskOrchestrationDAG:
         self.task_results.clear()
 
 
+def _invoke_handler(handler: Callable, parameters: Dict[str, Any]) -> Any:
+    """Run a task handler in a pool worker (module-level so it can be pickled)"""
+    return handler(parameters)
+
+
+@dataclass
+class _RunningAttempt:
+    """Bookkeeping for one in-flight task attempt"""
+    task_id: str
+    started: float
+    deadline: Optional[float]
+    pool: Executor
+
+
+class ParallelTaskExecutor:
+    """
+    Dependency-driven parallel executor for TaskOrchestrationDAG
+    
+    Ready tasks are started in TaskPriority order (highest first) whenever a
+    worker is free, and a task becomes ready the moment its last dependency
+    completes. Failed tasks cancel their dependents, like execute_all.
+    
+    Timeouts are enforced from the scheduler: an attempt that exceeds its
+    timeout is failed (and retried while retries remain). Python cannot kill
+    a running thread, so the pool holding a timed-out attempt is retired and
+    replaced to keep full capacity; retired process pools have their worker
+    processes terminated once the run ends.
+    """
+    
+    def __init__(self, dag: TaskOrchestrationDAG, max_workers: int = 4,
+                 executor: str = 'thread', default_timeout: Optional[float] = None):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor type: {executor}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
+        self.dag = dag
+        self.max_workers = max_workers
+        self.executor_type = executor
+        self.default_timeout = default_timeout
+        
+        self._pool: Optional[Executor] = None
+        self._retired_pools: List[Executor] = []
+        self._ready: List = []
+        self._running: Dict[Future, _RunningAttempt] = {}
+        self._attempts: Dict[str, int] = defaultdict(int)
+        self._first_start: Dict[str, float] = {}
+        self._remaining: Dict[str, int] = {}
+        self._order: Dict[str, int] = {}
+        self._settled: Set[str] = set()
+    
+    def _new_pool(self) -> Executor:
+        if self.executor_type == 'process':
+            # Forking a process that has started native thread pools (e.g. Numba's
+            # TBB layer) can leave children deadlocked; start workers from a clean server
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+            else:
+                context = None
+            return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='nexus-task')
+    
+    def _push_ready(self, task_id: str):
+        task = self.dag.tasks[task_id]
+        heapq.heappush(self._ready, (-task.priority.value, self._order[task_id], task_id))
+    
+    def _submit(self, task_id: str):
+        task = self.dag.tasks[task_id]
+        key = f"{task.task_type}.{task.operation}"
+        handler = self.dag.task_handlers.get(key)
+        
+        if not handler:
+            self._finish(task_id, TaskResult(
+                status=TaskStatus.FAILED,
+                error=f"No handler registered for {key}"
+            ))
+            return
+        
+        now = time.monotonic()
+        self._first_start.setdefault(task_id, now)
+        timeout = task.timeout if task.timeout is not None else self.default_timeout
+        
+        try:
+            future = self._pool.submit(_invoke_handler, handler, task.parameters)
+        except Exception as e:
+            self._finish(task_id, TaskResult(status=TaskStatus.FAILED, error=str(e)))
+            return
+        
+        self._running[future] = _RunningAttempt(
+            task_id=task_id,
+            started=now,
+            deadline=now + timeout if timeout is not None else None,
+            pool=self._pool
+        )
+    
+    def _attempt_failed(self, task_id: str, error: str, metadata: Optional[Dict[str, Any]] = None):
+        task = self.dag.tasks[task_id]
+        self._attempts[task_id] += 1
+        
+        if self._attempts[task_id] <= task.max_retries:
+            self._push_ready(task_id)
+            return
+        
+        self._finish(task_id, TaskResult(
+            status=TaskStatus.FAILED,
+            error=error,
+            execution_time=time.monotonic() - self._first_start[task_id],
+            retry_count=self._attempts[task_id] - 1,
+            metadata=metadata or {}
+        ))
+    
+    def _finish(self, task_id: str, result: TaskResult):
+        """Record a final result and release or cancel dependents"""
+        results = self.dag.task_results
+        results[task_id] = result
+        self._settled.add(task_id)
+        
+        pending = deque([task_id])
+        while pending:
+            finished_id = pending.popleft()
+            succeeded = results[finished_id].status == TaskStatus.COMPLETED
+            
+            for dependent_id in self.dag.reverse_dependencies[finished_id]:
+                if dependent_id in self._settled or dependent_id not in self.dag.tasks:
+                    continue
+                if not succeeded:
+                    results[dependent_id] = TaskResult(
+                        status=TaskStatus.CANCELLED,
+                        error=f"Dependency {finished_id} failed"
+                    )
+                    self._settled.add(dependent_id)
+                    pending.append(dependent_id)
+                    continue
+                self._remaining[dependent_id] -= 1
+                if self._remaining[dependent_id] == 0:
+                    self._push_ready(dependent_id)
+    
+    def _collect(self, future: Future):
+        attempt = self._running.pop(future)
+        task_id = attempt.task_id
+        
+        try:
+            output = future.result()
+        except Exception as e:
+            self._attempt_failed(task_id, str(e))
+            return
+        
+        self._finish(task_id, TaskResult(
+            status=TaskStatus.COMPLETED,
+            output=output,
+            execution_time=time.monotonic() - self._first_start[task_id],
+            retry_count=self._attempts[task_id]
+        ))
+    
+    def _expire(self, now: float):
+        expired = [
+            future for future, attempt in self._running.items()
+            if attempt.deadline is not None and now >= attempt.deadline
+        ]
+        for future in expired:
+            attempt = self._running.pop(future)
+            future.cancel()
+            
+            # The worker is still busy with the abandoned attempt; swap in a
+            # fresh pool so remaining tasks keep full parallelism
+            if attempt.pool is self._pool:
+                self._retired_pools.append(self._pool)
+                self._pool.shutdown(wait=False)
+                self._pool = self._new_pool()
+            
+            timeout = attempt.deadline - attempt.started
+            self._attempt_failed(
+                attempt.task_id,
+                f"Task timed out after {timeout:.2f}s",
+                metadata={'timed_out': True}
+            )
+    
+    def _shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        for pool in self._retired_pools:
+            if isinstance(pool, ProcessPoolExecutor):
+                for process in list(getattr(pool, '_processes', {}).values()):
+                    process.terminate()
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def run(self) -> Dict[str, TaskResult]:
+        """
+        Execute all tasks in the DAG
+        
+        Returns:
+            Dictionary mapping task IDs to execution results
+        """
+        levels = self.dag.topological_sort()
+        
+        self._order = {
+            task_id: index
+            for index, task_id in enumerate(tid for level in levels for tid in level)
+        }
+        self._remaining = {
+            task_id: len(self.dag.dependencies[task_id]) for task_id in self.dag.tasks
+        }
+        for task_id, remaining in self._remaining.items():
+            if remaining == 0:
+                self._push_ready(task_id)
+        
+        self._pool = self._new_pool()
+        try:
+            while self._ready or self._running:
+                while self._ready and len(self._running) < self.max_workers:
+                    _, _, task_id = heapq.heappop(self._ready)
+                    self._submit(task_id)
+                
+                if not self._running:
+                    continue
+                
+                deadlines = [a.deadline for a in self._running.values() if a.deadline is not None]
+                wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                
+                done, _ = wait(list(self._running), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._collect(future)
+                
+                self._expire(time.monotonic())
+        finally:
+            self._shutdown()
+        
+        return self.dag.task_results
+
+
 class TaskBuilder:
     """
     Fluent builder for creating tasks
@@ -0,0 +1,84 @@
+"""
+Benchmark script for POWConsensus chain validation
+
+Builds chains of 1k and 10k blocks and times:
+- the original get_mining_stats refresh (re-sum every reward, prefix-only
+  check of stored hashes from genesis)
+- a full re-verification that recomputes every block hash
+- the checkpointed refresh after one new block is appended
+"""
+
+import os
+import time
+from native_token import TokenTransaction, TransactionType
+from pow_consensus import MiningBlock, POWConsensus
+
+
+def build_chain(num_blocks: int) -> POWConsensus:
+    consensus = POWConsensus(mining_workers=1)
+    for number in range(1, num_blocks + 1):
+        transactions = [
+            TokenTransaction(f"TX{number:06d}{i}", TransactionType.TRANSFER, "NXS_A", "NXS_B", 100 + i,
+                             timestamp=1_700_000_000.0 + number)
+            for i in range(5)
+        ]
+        block = MiningBlock(number, 1_700_000_000.0 + number * 10, transactions,
+                            consensus.blockchain[-1].hash, "NXS_MINER", difficulty=1, reward=5000)
+        block.mine()
+        consensus.blockchain.append(block)
+    return consensus
+
+
+def legacy_refresh(consensus: POWConsensus) -> bool:
+    """Original stats refresh: reward sum plus prefix/link check from genesis"""
+    sum(block.reward for block in consensus.blockchain)
+    for i in range(1, len(consensus.blockchain)):
+        if not consensus.blockchain[i].is_valid():
+            return False
+        if consensus.blockchain[i].previous_hash != consensus.blockchain[i - 1].hash:
+            return False
+    return True
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    assert fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run_benchmarks():
+    """Run chain validation benchmarks at 1k and 10k blocks"""
+    workers = os.cpu_count() or 1
+    print("=" * 80)
+    print(f"POW Chain Validation Benchmark ({workers} CPUs)")
+    print("=" * 80)
+    print()
+
+    print(f"{'Blocks':<10} {'Legacy (ms)':<14} {'Full serial (ms)':<18} {'Full parallel (ms)':<20} {'Refresh (ms)':<14}")
+    print("-" * 80)
+
+    for num_blocks in [1_000, 10_000]:
+        consensus = build_chain(num_blocks)
+        legacy_time = timed(legacy_refresh, consensus)
+        serial_time = timed(consensus.validate_chain, full=True, workers=1)
+        parallel = "n/a"
+        if workers > 1:
+            consensus.validate_chain(full=True, workers=workers)  # Start the pool outside the timing
+            parallel = f"{timed(consensus.validate_chain, full=True, workers=workers) * 1e3:.1f}"
+
+        consensus.DIFFICULTY_ADJUSTMENT_INTERVAL = 10 ** 9
+        consensus.stats.current_difficulty = 1
+        consensus.mine_block("NXS_MINER")
+        refresh_time = timed(lambda: consensus.get_mining_stats()["chain_valid"])
+        consensus.close()
+
+        print(f"{num_blocks:<10} {legacy_time * 1e3:<14.1f} {serial_time * 1e3:<18.1f} {parallel:<20} "
+              f"{refresh_time * 1e3:<14.3f}")
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
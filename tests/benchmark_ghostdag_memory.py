@@ -0,0 +1,82 @@
+"""
+Benchmark script comparing memory per block of GhostDAGEngine and
+CompactGhostDAGEngine
+
+Usage:
+    python tests/benchmark_ghostdag_memory.py [num_blocks ...]
+
+Defaults to 10k and 100k blocks; pass 1000000 for the 1M-block check.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from ghostdag_core import GhostDAGEngine
+from ghostdag_compact import CompactGhostDAGEngine, SQLitePayloadStore
+
+
+def build(engine: GhostDAGEngine, num_blocks: int, window: int = 10, seed: int = 42):
+    """Add blocks with 1-3 parents drawn from recent blocks"""
+    rng = np.random.default_rng(seed)
+    recent = [engine.genesis_id]
+    parent_counts = rng.integers(1, 4, num_blocks)
+    for i in range(num_blocks):
+        num_parents = min(len(recent), int(parent_counts[i]))
+        parents = [recent[j] for j in rng.choice(len(recent), num_parents, replace=False)]
+        block_id = f"block_{i}"
+        engine.add_block(block_id, {"transactions": f"tx_batch_{i}", "value": i},
+                         f"creator_{i % 5}", parent_blocks=parents)
+        recent.append(block_id)
+        if len(recent) > window:
+            recent.pop(0)
+
+
+def measure(factory, num_blocks: int):
+    """Return (bytes per block, seconds) for building num_blocks blocks"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    engine = factory()
+    build(engine, num_blocks)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del engine
+    return current / num_blocks, elapsed
+
+
+def run_benchmarks(sizes):
+    """Run memory benchmarks"""
+    print("=" * 80)
+    print("GhostDAG Memory Benchmark")
+    print("=" * 80)
+    print()
+    print(f"{'Blocks':<10} {'Engine':<26} {'Bytes/block':<14} {'Build (s)':<10} {'Reduction':<10}")
+    print("-" * 80)
+
+    for num_blocks in sizes:
+        baseline, baseline_time = measure(lambda: GhostDAGEngine(k=3), num_blocks)
+        print(f"{num_blocks:<10} {'GhostDAGEngine':<26} {baseline:<14.0f} {baseline_time:<10.2f}")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            payload_path = os.path.join(tmpdir, "payloads.db")
+            variants = [
+                ("Compact (memory payloads)", lambda: CompactGhostDAGEngine(k=3)),
+                ("Compact (SQLite payloads)", lambda: CompactGhostDAGEngine(
+                    k=3, payload_store=SQLitePayloadStore(payload_path))),
+            ]
+            for name, factory in variants:
+                per_block, build_time = measure(factory, num_blocks)
+                print(f"{'':<10} {name:<26} {per_block:<14.0f} {build_time:<10.2f} "
+                      f"{baseline / per_block:<.1f}x")
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    run_benchmarks(sizes)
@@ -0,0 +1,98 @@
+"""
+Benchmark script for nearest-replica chunk sourcing
+
+Compares three ways of picking the holder a chunk is fetched from:
+the original arbitrary holder, a fresh BFS from the requester per chunk,
+and NearestReplicaIndex labels. Reports average hops of the chosen source
+and the time to answer every (chunk, requester) lookup.
+"""
+
+import random
+import time
+from collections import deque
+from wnsp_mesh_routing import MeshRoutingTable, NearestReplicaIndex
+
+
+HOLDERS_PER_CHUNK = 6
+REQUESTERS_PER_CHUNK = 40
+
+
+def make_mesh(num_nodes: int, seed: int = 0) -> MeshRoutingTable:
+    """Ring of nodes with short-range links plus a few long-range ones"""
+    rng = random.Random(seed)
+    table = MeshRoutingTable()
+    for i in range(num_nodes):
+        table.add_node(f"n{i}")
+    for i in range(num_nodes):
+        for step in (1, 2):
+            table.add_link(f"n{i}", f"n{(i + step) % num_nodes}")
+        if rng.random() < 0.05:
+            table.add_link(f"n{i}", f"n{rng.randrange(num_nodes)}")
+    return table
+
+
+def bfs_nearest(table: MeshRoutingTable, start: str, holders: set) -> str:
+    """Nearest holder by BFS outward from the requester"""
+    seen, queue = {start}, deque([start])
+    while queue:
+        current = queue.popleft()
+        if current in holders:
+            return current
+        for neighbor in table.adjacency[current]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return None
+
+
+def run_benchmarks():
+    """Run replica selection benchmarks at 1k, 5k and 20k nodes"""
+    print("=" * 80)
+    print("Nearest-Replica Chunk Sourcing Benchmark")
+    print("=" * 80)
+    print()
+
+    print(f"{'Nodes':<8} {'Chunks':<8} {'Arbitrary hops':<16} {'Nearest hops':<14} "
+          f"{'BFS/query (s)':<15} {'Index (s)':<11} {'Speedup':<8}")
+    print("-" * 80)
+
+    for num_nodes, num_chunks in [(1_000, 200), (5_000, 200), (20_000, 100)]:
+        rng = random.Random(1)
+        table = make_mesh(num_nodes)
+        nodes = list(table.adjacency)
+        chunks = {f"chunk{c}": rng.sample(nodes, HOLDERS_PER_CHUNK) for c in range(num_chunks)}
+        queries = [(key, rng.choice(nodes)) for key in chunks for _ in range(REQUESTERS_PER_CHUNK)]
+
+        # Original behaviour: first holder, wherever it is
+        arbitrary_hops = sum(table.distance(chunks[key][0], node) for key, node in queries)
+
+        start = time.perf_counter()
+        bfs_choice = [bfs_nearest(table, node, set(chunks[key])) for key, node in queries]
+        bfs_time = time.perf_counter() - start
+
+        index = NearestReplicaIndex(table)
+        start = time.perf_counter()
+        for key, holders in chunks.items():
+            for holder in holders:
+                index.add_holder(key, holder)
+        index_choice = [index.nearest(key, node) for key, node in queries]
+        index_time = time.perf_counter() - start
+
+        nearest_hops = sum(index.distance(key, node) for key, node in queries)
+        assert nearest_hops == sum(table.distance(h, node) for h, (_, node) in zip(bfs_choice, queries))
+        assert all(c is not None for c in index_choice)
+
+        print(f"{num_nodes:<8} {num_chunks:<8} {arbitrary_hops / len(queries):<16.1f} "
+              f"{nearest_hops / len(queries):<14.1f} {bfs_time:<15.2f} {index_time:<11.2f} "
+              f"{bfs_time / index_time:<7.1f}x")
+
+    print()
+    print(f"{HOLDERS_PER_CHUNK} holders and {REQUESTERS_PER_CHUNK} requesters per chunk; "
+          "index time includes building the labels.")
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
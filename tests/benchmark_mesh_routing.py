@@ -0,0 +1,102 @@
+"""
+Benchmark script for unified mesh stack route lookups
+
+Compares the original compute_wavelength_route (scan every node to
+resolve both addresses, then a list-based BFS that copies the path at
+each enqueue) against the indexed routing table on a stable random mesh.
+Lookups come from 50 sending nodes to random destinations, so the cached
+shortest-path trees are reused after the first lookup from each sender.
+"""
+
+import random
+import time
+import numpy as np
+from wnsp_unified_mesh_stack import (
+    WNSPUnifiedMeshStack, MeshNode, NodeType, TransportProtocol, WavelengthAddress
+)
+
+
+def build_mesh(num_nodes: int, links_per_node: int = 3, seed: int = 0) -> WNSPUnifiedMeshStack:
+    rng = random.Random(seed)
+    stack = WNSPUnifiedMeshStack()
+    mesh = stack.layer1_mesh_isp
+    signature = np.full(8, 0.125)
+    for i in range(num_nodes):
+        node_id = f"node_{i:06d}"
+        mesh.add_node(MeshNode(node_id, NodeType.EDGE, WavelengthAddress(signature, f"{i:064x}", node_id),
+                               [TransportProtocol.WIFI], set(), 500, 24.0))
+    for i in range(1, num_nodes):
+        # Spanning chain to a random earlier node keeps the mesh connected
+        mesh.create_link(f"node_{i:06d}", f"node_{rng.randrange(i):06d}", TransportProtocol.WIFI,
+                         rng.uniform(-90, -40), rng.uniform(5, 100), rng.uniform(500, 10000))
+    for _ in range(num_nodes * (links_per_node - 1)):
+        a, b = rng.sample(range(num_nodes), 2)
+        mesh.create_link(f"node_{a:06d}", f"node_{b:06d}", TransportProtocol.BLE,
+                         rng.uniform(-90, -40), rng.uniform(5, 100), rng.uniform(500, 10000))
+    return stack
+
+
+def legacy_route(mesh, source_addr, dest_addr):
+    """Original compute_wavelength_route"""
+    source_node = dest_node = None
+    for node in mesh.nodes.values():
+        if node.wavelength_addr.quantum_hash == source_addr.quantum_hash:
+            source_node = node.node_id
+        if node.wavelength_addr.quantum_hash == dest_addr.quantum_hash:
+            dest_node = node.node_id
+    if not source_node or not dest_node:
+        return []
+    visited = set()
+    queue = [(source_node, [source_node])]
+    while queue:
+        current, path = queue.pop(0)
+        if current == dest_node:
+            return path
+        if current in visited:
+            continue
+        visited.add(current)
+        for neighbor in mesh.topology_graph.get(current, []):
+            if neighbor not in visited:
+                queue.append((neighbor, path + [neighbor]))
+    return []
+
+
+def run_benchmarks():
+    """Run route lookup benchmarks at 1k, 5k and 20k nodes"""
+    print("=" * 80)
+    print("Unified Mesh Stack Route Lookup Benchmark")
+    print("=" * 80)
+    print()
+
+    print(f"{'Nodes':<10} {'Legacy (routes/s)':<20} {'Indexed (routes/s)':<20} {'Speedup':<10} {'Trees built':<12}")
+    print("-" * 80)
+
+    for num_nodes in [1_000, 5_000, 20_000]:
+        stack = build_mesh(num_nodes)
+        mesh = stack.layer1_mesh_isp
+        rng = random.Random(1)
+        addresses = [node.wavelength_addr for node in mesh.nodes.values()]
+        senders = rng.sample(addresses, 50)
+        lookups = [(rng.choice(senders), rng.choice(addresses)) for _ in range(2_000)]
+
+        sample = lookups[:max(20, 20_000_000 // num_nodes ** 2)]
+        start = time.perf_counter()
+        for source, dest in sample:
+            legacy_route(mesh, source, dest)
+        legacy_rate = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for source, dest in lookups:
+            stack.layer2_routing.compute_wavelength_route(source, dest)
+        indexed_rate = len(lookups) / (time.perf_counter() - start)
+
+        print(f"{num_nodes:<10} {legacy_rate:<20,.0f} {indexed_rate:<20,.0f} "
+              f"{indexed_rate / legacy_rate:<10.0f}x {mesh.routing.stats['tree_builds']:<12}")
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
@@ -0,0 +1,86 @@
+"""
+Benchmark script for POWConsensus nonce search
+
+Compares the original per-attempt header rebuild (string header plus every
+transaction's compute_hash() on each nonce) against the midstate search,
+in-process and split across a process pool. Every variant mines the same
+block and must land on the same nonce.
+"""
+
+import hashlib
+import os
+import time
+from native_token import TokenTransaction, TransactionType
+from pow_consensus import MiningBlock, NonceSearcher
+
+
+def make_block(difficulty: int, num_transactions: int = 10) -> MiningBlock:
+    transactions = [
+        TokenTransaction(f"TX{i:08d}", TransactionType.TRANSFER, f"NXS{i}", f"NXS{i + 1}", 100 + i,
+                         timestamp=1_700_000_000.0 + i)
+        for i in range(num_transactions)
+    ]
+    return MiningBlock(1, 1_700_000_000.0, transactions, "ab" * 32, "NXS_MINER", difficulty=difficulty)
+
+
+def legacy_mine(block: MiningBlock, attempts: int) -> float:
+    """Original loop: rebuild the header and re-hash every transaction per nonce"""
+    target_prefix = "0" * block.difficulty
+    start = time.perf_counter()
+    for nonce in range(attempts):
+        block_data = f"{block.block_number}{block.timestamp}{block.previous_hash}{nonce}{block.miner_address}{block.difficulty}"
+        for tx in block.transactions:
+            block_data += tx.compute_hash()
+        if hashlib.sha256(block_data.encode()).hexdigest().startswith(target_prefix):
+            pass
+    return attempts / (time.perf_counter() - start)
+
+
+def timed_mine(block: MiningBlock, searcher: NonceSearcher):
+    start = time.perf_counter()
+    attempts = block.mine(searcher=searcher)
+    elapsed = time.perf_counter() - start
+    return block.nonce, attempts, elapsed
+
+
+def run_benchmarks():
+    """Run nonce search benchmarks at difficulty 4 and 5"""
+    workers = os.cpu_count() or 1
+    print("=" * 80)
+    print(f"POW Nonce Search Benchmark ({workers} CPUs)")
+    print("=" * 80)
+    print()
+
+    legacy_rate = legacy_mine(make_block(5), 20_000)
+    print(f"Legacy header rebuild: {legacy_rate:,.0f} H/s")
+    print()
+
+    print(f"{'Difficulty':<12} {'Searcher':<16} {'Nonce':<10} {'Hashes':<10} {'Time (ms)':<12} {'H/s':<14} {'vs legacy':<10}")
+    print("-" * 80)
+
+    searchers = [("1 process", NonceSearcher(1))]
+    if workers > 1:
+        searchers.append((f"{workers} processes", NonceSearcher(workers)))
+    for _, searcher in searchers[1:]:
+        searcher.search(bytes(128), None, 0, 1 << 20)  # Start the pool outside the timing
+
+    for difficulty in [4, 5]:
+        nonces = set()
+        for name, searcher in searchers:
+            nonce, attempts, elapsed = timed_mine(make_block(difficulty), searcher)
+            nonces.add(nonce)
+            rate = attempts / elapsed
+            print(f"{difficulty:<12} {name:<16} {nonce:<10} {attempts:<10} {elapsed * 1e3:<12.1f} "
+                  f"{rate:<14,.0f} {rate / legacy_rate:<10.1f}x")
+        assert len(nonces) == 1
+
+    for _, searcher in searchers:
+        searcher.close()
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
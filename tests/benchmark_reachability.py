@@ -0,0 +1,98 @@
+"""
+Benchmark script comparing GhostDAG reachability index queries to nx.ancestors
+
+Builds GhostDAG block DAGs of increasing size and times random
+"is A in the past of B" queries answered by the reachability index versus
+a full networkx ancestor traversal.
+"""
+
+import time
+import numpy as np
+import networkx as nx
+from ghostdag_core import GhostDAGEngine
+
+
+def build_dag(num_blocks: int, window: int = 10, seed: int = 42) -> GhostDAGEngine:
+    """Build a wide GhostDAG with 1-3 parents per block drawn from recent blocks"""
+    rng = np.random.default_rng(seed)
+    engine = GhostDAGEngine(k=3)
+    recent = [engine.genesis_id]
+    for i in range(num_blocks):
+        num_parents = min(len(recent), int(rng.integers(1, 4)))
+        parents = [recent[j] for j in rng.choice(len(recent), num_parents, replace=False)]
+        block_id = f"block_{i}"
+        engine.add_block(block_id, {"value": i}, f"creator_{i % 5}", parent_blocks=parents)
+        recent.append(block_id)
+        if len(recent) > window:
+            recent.pop(0)
+    return engine
+
+
+def sample_queries(engine: GhostDAGEngine, num_queries: int, seed: int = 7):
+    """Sample (candidate ancestor, block) pairs biased towards nearby blocks"""
+    rng = np.random.default_rng(seed)
+    block_ids = list(engine.blocks)
+    queries = []
+    for _ in range(num_queries):
+        b = int(rng.integers(1, len(block_ids)))
+        a = max(0, b - int(rng.integers(1, 200)))
+        queries.append((block_ids[a], block_ids[b]))
+    return queries
+
+
+def benchmark_index(engine: GhostDAGEngine, queries) -> float:
+    """Average seconds per query using the reachability index"""
+    start = time.perf_counter()
+    for ancestor_id, block_id in queries:
+        engine.is_ancestor(ancestor_id, block_id)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def benchmark_networkx(engine: GhostDAGEngine, queries) -> float:
+    """Average seconds per query using nx.ancestors"""
+    start = time.perf_counter()
+    for ancestor_id, block_id in queries:
+        ancestor_id in nx.ancestors(engine.dag, block_id)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def run_benchmarks():
+    """Run reachability benchmarks at 1k, 10k and 100k blocks"""
+    print("=" * 80)
+    print("GhostDAG Reachability Benchmark")
+    print("=" * 80)
+    print()
+
+    test_sizes = [1_000, 10_000, 100_000]
+
+    print(f"{'Blocks':<10} {'Build (s)':<12} {'Index (us)':<14} {'nx (us)':<14} {'Speedup':<10}")
+    print("-" * 80)
+
+    for num_blocks in test_sizes:
+        start = time.perf_counter()
+        engine = build_dag(num_blocks)
+        build_time = time.perf_counter() - start
+
+        queries = sample_queries(engine, 2000)
+        index_time = benchmark_index(engine, queries)
+
+        # nx.ancestors is O(past) per query; sample fewer at large sizes
+        nx_queries = queries[:max(20, 2000 * 1000 // num_blocks)]
+        nx_time = benchmark_networkx(engine, nx_queries)
+
+        speedup = nx_time / index_time if index_time > 0 else 0
+        print(f"{num_blocks:<10} {build_time:<12.2f} {index_time * 1e6:<14.2f} "
+              f"{nx_time * 1e6:<14.2f} {speedup:<10.1f}x")
+
+        stats = engine.reachability.get_stats()
+        print(f"{'':<10} chain depth {stats['max_chain_depth']}, "
+              f"max covering set {stats['max_covering_set']}, "
+              f"avg covering set {stats['average_covering_set']:.2f}")
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
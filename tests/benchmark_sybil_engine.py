@@ -0,0 +1,91 @@
+"""
+Benchmark script for SybilDetectionEngine monitoring runs
+
+Each network is analyzed once to seed the incremental state, then 1% of
+the validators change their votes. The table compares re-analyzing the
+whole network from scratch with an incremental run, and an incremental
+run when nothing changed.
+"""
+
+import copy
+import time
+import numpy as np
+from sybil_detection import SybilDetectionEngine, ValidatorProfile
+
+
+NUM_PROPOSALS = 200
+REGIONS = ["RED", "ORANGE", "YELLOW", "GREEN", "BLUE", "VIOLET"]
+
+
+def make_profiles(num_validators: int, seed: int = 0):
+    """Honest validators plus 20 Sybil groups of 5"""
+    rng = np.random.default_rng(seed)
+    choices = np.array(["APPROVE", "REJECT", "ABSTAIN"])
+    votes = rng.integers(0, 3, (num_validators, NUM_PROPOSALS))
+    votes[:100] = rng.integers(0, 3, (20, NUM_PROPOSALS))[np.arange(100) % 20]
+    proposal_ids = [f"PROP_{j:04d}" for j in range(NUM_PROPOSALS)]
+
+    profiles = []
+    for v in range(num_validators):
+        sybil = v < 100
+        profiles.append(ValidatorProfile(
+            f"VAL_{v:06d}", f"NXS{v}", REGIONS[v % 6], 1.0,
+            registration_time=float(v if sybil else rng.uniform(0, 1e8)),
+            votes_cast=[{'proposal_id': p, 'choice': choices[c], 'timestamp': 0}
+                        for p, c in zip(proposal_ids, votes[v])],
+            funding_source=f"SRC{v % 20}" if sybil else f"SRC_{v}",
+            ip_hash=f"{v % 20:08x}{v}" if sybil else f"{rng.integers(0, 1 << 32):08x}",
+            block_timing_signature=list(rng.uniform(0, 5000, 4))
+        ))
+    return profiles
+
+
+def change_votes(profiles, fraction: float, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    profiles = list(profiles)
+    for i in rng.choice(len(profiles), int(len(profiles) * fraction), replace=False):
+        profile = copy.copy(profiles[i])
+        profile.votes_cast = [dict(vote, choice='APPROVE') if k % 7 == 0 else vote
+                              for k, vote in enumerate(profile.votes_cast)]
+        profiles[i] = profile
+    return profiles
+
+
+def timed(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run_benchmarks():
+    """Run monitoring benchmarks at 2k, 10k and 20k validators"""
+    print("=" * 80)
+    print("SybilDetectionEngine Incremental Monitoring Benchmark")
+    print("=" * 80)
+    print()
+
+    print(f"{'Validators':<12} {'Full (s)':<12} {'Incremental (s)':<18} {'Unchanged (s)':<16} {'Speedup':<10}")
+    print("-" * 80)
+
+    for num_validators in [2_000, 10_000, 20_000]:
+        profiles = make_profiles(num_validators)
+        engine = SybilDetectionEngine()
+        engine.analyze_validators(profiles, incremental=True)
+
+        profiles = change_votes(profiles, 0.01)
+        full_time = timed(SybilDetectionEngine().analyze_validators, profiles)
+        incremental_time = timed(engine.analyze_validators, profiles, incremental=True)
+        unchanged_time = timed(engine.analyze_validators, profiles, incremental=True)
+
+        print(f"{num_validators:<12} {full_time:<12.2f} {incremental_time:<18.2f} {unchanged_time:<16.2f} "
+              f"{full_time / incremental_time:<9.1f}x")
+
+    print()
+    print("Incremental: 1% of validators changed votes since the previous run.")
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
@@ -0,0 +1,73 @@
+"""
+Benchmark script for NativeTokenSystem bulk payouts
+
+Compares a payout burst issued as one transfer_atomic call per recipient
+against a single transfer_batch call. Each run times the second of two
+identical bursts, i.e. a recurring payout to recipients that already have
+accounts. The per-call loop runs with the transfer rate limit lifted,
+since at the default 10 transfers per minute it would be throttled after
+the tenth payout.
+"""
+
+import time
+from native_token import NativeTokenSystem
+from security_framework import RateLimiter
+import security_framework
+
+
+def make_system() -> NativeTokenSystem:
+    limiter = RateLimiter()
+    limiter.limits["transfer"] = (10 ** 9, 60)
+    security_framework._rate_limiter = limiter
+    return NativeTokenSystem(history_path=":memory:")
+
+
+def payouts(num_transfers: int, num_recipients: int = 1_000):
+    return [("VALIDATOR_POOL", f"NXS_VALIDATOR_{i % num_recipients:05d}", 1_000 + i % 7)
+            for i in range(num_transfers)]
+
+
+def benchmark_loop(transfers) -> float:
+    system = make_system()
+    for _ in range(2):
+        start = time.perf_counter()
+        for sender, receiver, amount in transfers:
+            system.transfer_atomic(sender, receiver, amount, fee=0, reason="reward")
+        elapsed = time.perf_counter() - start
+    return elapsed
+
+
+def benchmark_batch(transfers) -> float:
+    system = make_system()
+    for _ in range(2):
+        start = time.perf_counter()
+        success, _, message = system.transfer_batch(transfers, fee=0, reason="reward")
+        elapsed = time.perf_counter() - start
+        assert success, message
+    return elapsed
+
+
+def run_benchmarks():
+    """Run payout benchmarks at 1k, 10k and 100k transfers"""
+    print("=" * 80)
+    print("NativeTokenSystem Bulk Payout Benchmark")
+    print("=" * 80)
+    print()
+
+    print(f"{'Transfers':<12} {'Loop (ms)':<12} {'Batch (ms)':<12} {'Speedup':<10}")
+    print("-" * 80)
+
+    for num_transfers in [1_000, 10_000, 100_000]:
+        transfers = payouts(num_transfers)
+        loop_time = benchmark_loop(transfers)
+        batch_time = benchmark_batch(transfers)
+        speedup = loop_time / batch_time if batch_time > 0 else 0
+        print(f"{num_transfers:<12} {loop_time * 1e3:<12.1f} {batch_time * 1e3:<12.1f} {speedup:<10.1f}x")
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
@@ -0,0 +1,68 @@
+"""
+Benchmark script for WavelengthValidator chain validation
+
+Compares validating a message chain link by link with the original
+per-pair evaluation (fresh float64 grid, two complex exponentials and a
+SHA-256 of the float buffers per link) against validate_message_chain_batch.
+"""
+
+import hashlib
+import time
+import numpy as np
+from wavelength_validator import WavelengthValidator, SpectralRegion, ModulationType
+
+
+def make_waves(validator: WavelengthValidator, count: int):
+    regions = list(SpectralRegion)
+    return [
+        validator.create_message_wave(f"message {i}", regions[i % len(regions)], ModulationType.QAM16)
+        for i in range(count)
+    ]
+
+
+def legacy_link(validator: WavelengthValidator, wave1, wave2) -> str:
+    """Original compute_interference"""
+    x = np.linspace(0, 10 * max(wave1.wavelength, wave2.wavelength), validator.grid_resolution)
+    E1 = validator.calculate_wave_function(wave1, x)
+    E2 = validator.calculate_wave_function(wave2, x)
+    E_total = E1 + E2
+    intensity = np.abs(E_total) ** 2
+    phase_distribution = np.angle(E_total)
+    np.abs(np.mean(E1 * np.conj(E2))) / np.sqrt(np.mean(np.abs(E1) ** 2) * np.mean(np.abs(E2) ** 2))
+    float(np.max(intensity)), float(np.min(intensity))
+    return hashlib.sha256(intensity.tobytes() + phase_distribution.tobytes()).hexdigest()
+
+
+def run_benchmarks():
+    """Run chain validation benchmarks at 1k, 10k and 50k messages"""
+    print("=" * 80)
+    print("WavelengthValidator Chain Validation Benchmark")
+    print("=" * 80)
+    print()
+
+    print(f"{'Messages':<12} {'Per-pair (msg/s)':<20} {'Batch (msg/s)':<20} {'Speedup':<10}")
+    print("-" * 80)
+
+    for num_messages in [1_000, 10_000, 50_000]:
+        validator = WavelengthValidator()
+        waves = make_waves(validator, num_messages)
+
+        sample = min(num_messages, 5_000)
+        start = time.perf_counter()
+        for wave1, wave2 in zip(waves[:sample], waves[1:sample]):
+            legacy_link(validator, wave1, wave2)
+        legacy_rate = (sample - 1) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        validator.validate_message_chain_batch(waves)
+        batch_rate = (num_messages - 1) / (time.perf_counter() - start)
+
+        print(f"{num_messages:<12} {legacy_rate:<20,.0f} {batch_rate:<20,.0f} {batch_rate / legacy_rate:<10.1f}x")
+
+    print()
+    print("✅ Benchmarking complete!")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmarks()
@@ -2,9 +2,11 @@
 Unit tests for Database Models
 
 Tests CRUD operations, foreign key constraints, cascading deletes,
-and data integrity for all SQLAlchemy models.
+and data integrity for all SQLAlchemy models, plus the process-wide
+engine/session registry.
 """
 
+import threading
 import pytest
 from datetime import datetime, timedelta
 from sqlalchemy import create_engine
@@ -12,7 +14,9 @@ from sqlalchemy.orm import sessionmaker
 from database import (
     Base, SimulationConfig, SimulationRun, User, Role, UserRole,
     Session, MonitoringSnapshot, AlertRule, AlertEvent,
-    OptimizationRun, OptimizationIteration
+    OptimizationRun, OptimizationIteration,
+    get_engine, get_session, session_scope, configure_database,
+    use_test_database, get_pool_metrics
 )
 
 
@@ -608,5 +612,122 @@ class TestDataIntegrity:
         assert retrieved.signal_config is None
 
 
+@pytest.fixture
+def registry():
+    """Engine registry pointed at an in-memory SQLite database"""
+    engine = use_test_database()
+    yield engine
+    configure_database(None)
+
+
+class TestEngineRegistry:
+    """Tests for shared engine, session scope and pool metrics"""
+    
+    def test_engine_is_shared(self, registry):
+        """Every call returns the same engine and pool"""
+        assert get_engine() is registry
+        assert get_engine() is get_engine()
+        
+        session = get_session()
+        assert session.get_bind() is registry
+        session.close()
+    
+    def test_session_scope_commits(self, registry):
+        """Session scope commits on success"""
+        with session_scope() as db:
+            db.add(Role(name='viewer', description='Read only'))
+        
+        with session_scope() as db:
+            assert db.query(Role).filter_by(name='viewer').count() == 1
+    
+    def test_session_scope_rolls_back(self, registry):
+        """Session scope rolls back and re-raises on error"""
+        with pytest.raises(RuntimeError):
+            with session_scope() as db:
+                db.add(Role(name='admin'))
+                db.flush()
+                raise RuntimeError("boom")
+        
+        with session_scope() as db:
+            assert db.query(Role).count() == 0
+    
+    def test_pool_metrics(self, tmp_path):
+        """Checked-out connections are tracked against the pool size"""
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        configure_database(url, pool_size=2, max_overflow=1)
+        try:
+            held = [get_engine().connect() for _ in range(3)]
+            metrics = get_pool_metrics()
+            assert metrics['pool_size'] == 2
+            assert metrics['max_overflow'] == 1
+            assert metrics['checked_out'] == 3
+            assert metrics['utilization'] == pytest.approx(1.0)
+            
+            for conn in held:
+                conn.close()
+            metrics = get_pool_metrics()
+            assert metrics['checked_out'] == 0
+            assert metrics['peak_checked_out'] == 3
+            assert metrics['connections_created'] == 3
+        finally:
+            configure_database(None, pool_size=5, max_overflow=10)
+    
+    def test_pool_metrics_under_concurrent_checkouts(self, tmp_path):
+        """Pool events from many threads are not lost"""
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        configure_database(url, pool_size=4, max_overflow=4)
+        try:
+            engine = get_engine()
+            barrier = threading.Barrier(8)
+
+            def worker():
+                barrier.wait()
+                for _ in range(200):
+                    engine.connect().close()
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            metrics = get_pool_metrics()
+            assert metrics['checkouts'] == metrics['checkins'] == 1600
+            assert metrics['checked_out'] == 0
+            assert 1 <= metrics['peak_checked_out'] <= 8
+        finally:
+            configure_database(None, pool_size=5, max_overflow=10)
+    
+    def test_unknown_pool_option_rejected(self):
+        """Typos in pool settings fail loudly"""
+        with pytest.raises(ValueError):
+            configure_database('sqlite://', pool_sise=3)
+    
+    def test_missing_url(self, monkeypatch):
+        """No configured URL and no DATABASE_URL"""
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        with pytest.raises(ValueError):
+            get_engine()
+        assert get_session() is None
+    
+    def test_task_handlers_use_registry(self, registry):
+        """Admin task handlers run against the shared engine"""
+        from task_handlers import AdminTaskHandlers
+        
+        with session_scope() as db:
+            db.add(Role(name='viewer'))
+            db.add(Role(name='admin'))
+        
+        created = AdminTaskHandlers.create_user(
+            {'email': 'pool@example.com', 'password': 'secret-pass', 'roles': ['viewer']}
+        )
+        assert created['success']
+        
+        AdminTaskHandlers.update_user_roles({'user_id': created['user_id'], 'roles': ['admin']})
+        with session_scope() as db:
+            user = db.query(User).filter_by(email='pool@example.com').one()
+            assert [ur.role.name for ur in user.user_roles] == ['admin']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,265 @@
+"""
+Tests for the GhostDAG consensus engine
+
+Tests cover:
+1. Incremental PHANTOM classification matches full-DAG recomputation
+2. Merge set and selected parent bookkeeping
+3. Appended topological ordering
+4. Reachability index ancestry queries
+5. Compact array-backed engine parity
+"""
+
+import pytest
+import numpy as np
+import networkx as nx
+from ghostdag_core import GhostDAGEngine
+from ghostdag_reachability import ReachabilityIndex
+from ghostdag_compact import CompactGhostDAGEngine, SQLitePayloadStore
+
+
+def reference_classification(engine: GhostDAGEngine, insertion_order):
+    """Replay blocks with the original whole-DAG PHANTOM classification."""
+    dag = nx.DiGraph()
+    colors = {engine.genesis_id: True}
+    scores = {engine.genesis_id: 0}
+    dag.add_node(engine.genesis_id)
+
+    for block_id in insertion_order:
+        block = engine.blocks[block_id]
+        dag.add_node(block_id)
+        for parent_id in block.parent_blocks:
+            if parent_id in colors:
+                dag.add_edge(parent_id, block_id)
+
+        ancestors = nx.ancestors(dag, block_id)
+        anticone = set(colors) - ancestors
+        red_in_anticone = sum(1 for bid in anticone if not colors[bid])
+        colors[block_id] = red_in_anticone <= engine.k
+        scores[block_id] = sum(1 for bid in ancestors if colors[bid])
+
+    return colors, scores
+
+
+def build_random_dag(engine: GhostDAGEngine, num_blocks: int, seed: int, max_lag: int = 8):
+    """Create blocks whose parents are drawn from a sliding window of recent blocks."""
+    rng = np.random.default_rng(seed)
+    order = []
+    for i in range(num_blocks):
+        window = ([engine.genesis_id] + order)[-max_lag:]
+        num_parents = min(len(window), int(rng.integers(1, 4)))
+        parents = rng.choice(window, num_parents, replace=False).tolist()
+        block_id = f"b{i}"
+        engine.add_block(block_id, {"i": i}, "creator", parent_blocks=parents)
+        order.append(block_id)
+    return order
+
+
+class TestIncrementalClassification:
+    """Incremental classification must match the original algorithm"""
+
+    @pytest.mark.parametrize("k,seed", [(0, 1), (1, 2), (3, 3), (3, 4), (5, 5)])
+    def test_matches_reference(self, k, seed):
+        engine = GhostDAGEngine(k=k)
+        order = build_random_dag(engine, 150, seed)
+        colors, scores = reference_classification(engine, order)
+
+        for block_id in order:
+            block = engine.blocks[block_id]
+            assert block.is_blue == colors[block_id], block_id
+            assert block.blue_score == scores[block_id], block_id
+
+        assert engine.red_blocks == sum(1 for bid in order if not colors[bid])
+        assert engine.blue_blocks + engine.red_blocks == engine.total_blocks
+
+    def test_simulation_matches_reference(self):
+        np.random.seed(7)
+        engine = GhostDAGEngine(k=2)
+        engine.simulate_parallel_block_creation(num_blocks=200, num_creators=4)
+        order = [f"block_{i}" for i in range(200)]
+        colors, scores = reference_classification(engine, order)
+
+        for block_id in order:
+            assert engine.blocks[block_id].is_blue == colors[block_id]
+            assert engine.blocks[block_id].blue_score == scores[block_id]
+
+    def test_unknown_parents_are_ignored(self):
+        engine = GhostDAGEngine(k=3)
+        block = engine.add_block("a", {}, "c", parent_blocks=["genesis", "missing"])
+        assert block.blue_score == 1
+        assert engine.ghostdag_data["a"].selected_parent == "genesis"
+
+    def test_duplicate_block_rejected(self):
+        engine = GhostDAGEngine(k=3)
+        engine.add_block("a", {}, "c")
+        with pytest.raises(ValueError):
+            engine.add_block("a", {}, "c")
+
+    def test_repeated_simulation_extends_dag(self):
+        engine = GhostDAGEngine(k=3)
+        engine.simulate_parallel_block_creation(num_blocks=10, num_creators=2)
+        engine.simulate_parallel_block_creation(num_blocks=10, num_creators=2)
+        assert engine.total_blocks == 20
+        assert len(engine.blocks) == 21
+
+
+class TestMergeSet:
+    """Selected parent and merge set bookkeeping"""
+
+    def test_mergeset_is_past_difference(self):
+        engine = GhostDAGEngine(k=3)
+        order = build_random_dag(engine, 120, seed=11)
+
+        for block_id in order:
+            data = engine.ghostdag_data[block_id]
+            parents = [p for p in engine.blocks[block_id].parent_blocks if p in engine.blocks]
+            expected = set(nx.ancestors(engine.dag, block_id))
+            expected -= set(nx.ancestors(engine.dag, data.selected_parent))
+            assert set(data.mergeset_blues) | set(data.mergeset_reds) == expected
+            assert data.selected_parent in parents
+            assert data.mergeset_blues[0] == data.selected_parent or \
+                data.mergeset_reds[0] == data.selected_parent
+
+    def test_is_ancestor(self):
+        engine = GhostDAGEngine(k=3)
+        order = build_random_dag(engine, 80, seed=13)
+
+        for block_id in order[::7]:
+            ancestors = nx.ancestors(engine.dag, block_id)
+            for other in engine.blocks:
+                assert engine.is_ancestor(other, block_id) == (other in ancestors)
+
+
+class TestTopologicalOrder:
+    """Topological order is appended as blocks arrive"""
+
+    def test_order_respects_edges(self):
+        engine = GhostDAGEngine(k=3)
+        build_random_dag(engine, 100, seed=17)
+
+        for parent, child in engine.dag.edges():
+            assert engine.blocks[parent].topological_order < engine.blocks[child].topological_order
+
+    def test_order_is_stable(self):
+        engine = GhostDAGEngine(k=3)
+        first = engine.add_block("a", {}, "c")
+        order_before = first.topological_order
+        engine.add_block("b", {}, "c")
+        engine.add_block("c", {}, "c", parent_blocks=["a"])
+        assert first.topological_order == order_before
+        assert [b.block_id for b in engine.get_ordered_chain()][:2] == ["genesis", "a"]
+
+
+class TestReachabilityIndex:
+    """Reachability index answers ancestry without graph traversal"""
+
+    def test_chain_ancestry(self):
+        index = ReachabilityIndex()
+        index.add_block(0)
+        for i in range(1, 500):
+            index.add_block(i, i - 1, [i - 1])
+
+        assert index.is_chain_ancestor(0, 499)
+        assert index.is_dag_ancestor(250, 251)
+        assert not index.is_dag_ancestor(251, 250)
+        assert not index.is_dag_ancestor(7, 7)
+
+    def test_merged_side_branch(self):
+        index = ReachabilityIndex()
+        index.add_block("g")
+        index.add_block("a", "g", ["g"])
+        index.add_block("b", "g", ["g"])
+        index.add_block("c", "a", ["a", "b"])
+
+        assert index.is_dag_ancestor("b", "c")
+        assert not index.is_chain_ancestor("b", "c")
+        assert not index.is_dag_ancestor("a", "b")
+        assert index.get_future_covering_set("b") == [3]
+
+    def test_matches_networkx_on_wide_dag(self):
+        engine = GhostDAGEngine(k=3)
+        order = build_random_dag(engine, 300, seed=23, max_lag=20)
+        rng = np.random.default_rng(5)
+        all_blocks = list(engine.blocks)
+
+        for block_id in rng.choice(order, 25, replace=False):
+            ancestors = nx.ancestors(engine.dag, block_id)
+            for other in all_blocks:
+                assert engine.reachability.is_dag_ancestor(other, block_id) == (other in ancestors)
+
+    def test_duplicate_rejected(self):
+        index = ReachabilityIndex()
+        index.add_block("g")
+        with pytest.raises(ValueError):
+            index.add_block("g")
+
+
+class TestCompactEngine:
+    """Array-backed engine matches the dataclass/networkx engine"""
+
+    def build_pair(self, num_blocks=200, seed=29):
+        regular = GhostDAGEngine(k=2)
+        compact = CompactGhostDAGEngine(k=2)
+        order = build_random_dag(regular, num_blocks, seed, max_lag=12)
+        build_random_dag(compact, num_blocks, seed, max_lag=12)
+        return regular, compact, order
+
+    def test_classification_matches(self):
+        regular, compact, order = self.build_pair()
+
+        for block_id in order:
+            expected = regular.blocks[block_id]
+            actual = compact.blocks[block_id]
+            assert actual.blue_score == expected.blue_score
+            assert actual.is_blue == expected.is_blue
+            assert actual.topological_order == expected.topological_order
+            assert compact.ghostdag_data[block_id] == regular.ghostdag_data[block_id]
+
+        assert compact.total_blocks == regular.total_blocks
+        assert compact.tips == regular.tips
+
+    def test_views_match(self):
+        regular, compact, _ = self.build_pair()
+
+        assert [b.block_id for b in compact.get_ordered_chain()] == \
+            [b.block_id for b in regular.get_ordered_chain()]
+        assert {b.block_id for b in compact.get_tips()} == {b.block_id for b in regular.get_tips()}
+
+        expected = regular.get_dag_structure()
+        actual = compact.get_dag_structure()
+        assert {(e["from"], e["to"]) for e in actual["edges"]} == \
+            {(e["from"], e["to"]) for e in expected["edges"]}
+        assert [n["id"] for n in actual["nodes"]] == [n["id"] for n in expected["nodes"]]
+        assert actual["metrics"] == expected["metrics"]
+
+    def test_children_from_parent_csr(self):
+        regular, compact, order = self.build_pair(num_blocks=80)
+
+        for block_id in ["genesis"] + order:
+            assert sorted(compact.get_children(block_id)) == \
+                sorted(regular.dag.successors(block_id))
+
+    def test_block_snapshot_fields(self):
+        compact = CompactGhostDAGEngine(k=3)
+        block = compact.add_block("a", {"value": 1}, "alice", parent_blocks=["genesis"])
+
+        assert block.data == {"value": 1}
+        assert block.creator == "alice"
+        assert block.parent_blocks == ["genesis"]
+        assert len(block.hash) == 64
+        assert compact.blocks["a"].hash == block.hash
+
+    def test_sqlite_payload_store(self):
+        compact = CompactGhostDAGEngine(k=3, payload_store=SQLitePayloadStore())
+        compact.add_block("a", {"value": np.int64(7)}, "alice")
+
+        assert compact.blocks["a"].data == {"value": 7}
+        assert compact.blocks["genesis"].data == {"type": "genesis"}
+
+    def test_simulation_metrics(self):
+        np.random.seed(3)
+        compact = CompactGhostDAGEngine(k=3)
+        metrics = compact.simulate_parallel_block_creation(num_blocks=50, num_creators=3)
+
+        assert metrics["total_blocks"] == 50
+        assert metrics["consensus_chain_length"] == 51
+        assert metrics["average_parents_per_block"] >= 1
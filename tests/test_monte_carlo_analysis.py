@@ -0,0 +1,193 @@
+"""
+Tests for batched Monte Carlo, sensitivity and stability analysis
+
+Validates:
+1. Batched Numba summaries match the per-run NexusEngine reference
+2. Monte Carlo sampling is reproducible and covers every run
+3. Sensitivity and stability maps agree with single-run metrics
+4. Sharded, process-pool and resumable stability sweeps
+"""
+
+import numpy as np
+import pytest
+from monte_carlo_analysis import (
+    MonteCarloAnalysis, SensitivityAnalysis, StabilityMapper, run_batched_simulations
+)
+
+
+def base_params():
+    return {
+        'alpha': 1.0, 'beta': 1.0, 'kappa': 0.01, 'eta': 0.1,
+        'w_H': 0.4, 'w_M': 0.3, 'w_D': 0.2, 'w_E': 0.1,
+        'gamma_C': 0.5, 'gamma_D': 0.3, 'gamma_E': 0.2,
+        'K_p': 0.1, 'K_i': 0.01, 'K_d': 0.05,
+        'N_target': 1000.0, 'F_floor': 10.0,
+        'lambda_E': 0.3, 'lambda_N': 0.3, 'lambda_H': 0.2, 'lambda_M': 0.2,
+        'N_0': 1000.0, 'H_0': 100.0, 'M_0': 100.0,
+        'N_initial': 800.0, 'num_steps': 300, 'delta_t': 0.1
+    }
+
+
+def signal_configs():
+    return {
+        'H': {'type': 'sinusoidal', 'amplitude': 20.0, 'offset': 100.0, 'frequency': 0.05},
+        'M': {'type': 'constant', 'value': 90.0},
+        'D': {'type': 'step', 'initial': 50.0, 'final': 70.0},
+        'E': {'type': 'sinusoidal', 'amplitude': 0.4, 'offset': 0.9, 'frequency': 0.02},
+        'C_cons': {'type': 'pulse', 'baseline': 60.0, 'pulse_height': 20.0},
+        'C_disp': {'type': 'ramp', 'start': 30.0, 'end': 50.0}
+    }
+
+
+def reference_summary(params):
+    """Summary statistics computed from the pure-Python DataFrame path"""
+    mapper = StabilityMapper(params, signal_configs())
+    df = mapper._run_single_simulation(params)
+    metrics = mapper._calculate_stability_metrics(df)
+    return df, metrics
+
+
+class TestBatchedKernel:
+    """Batched kernel against the per-run NexusEngine loop"""
+
+    def test_matches_single_runs(self):
+        rng = np.random.default_rng(1)
+        param_sets = []
+        for _ in range(6):
+            params = base_params()
+            params['alpha'] = float(rng.uniform(0.5, 1.5))
+            params['K_p'] = float(rng.uniform(0.01, 0.3))
+            params['num_steps'] = int(rng.choice([150, 300]))
+            param_sets.append(params)
+
+        summary = run_batched_simulations(signal_configs(), param_sets)
+
+        for idx, params in enumerate(param_sets):
+            df, metrics = reference_summary(params)
+            assert summary['final_N'][idx] == pytest.approx(df['N'].iloc[-1], rel=1e-9)
+            assert summary['max_N'][idx] == pytest.approx(df['N'].max(), rel=1e-9)
+            assert summary['min_N'][idx] == pytest.approx(df['N'].min(), rel=1e-9)
+            assert summary['final_S'][idx] == pytest.approx(df['S'].iloc[-1], rel=1e-9)
+            assert summary['avg_issuance'][idx] == pytest.approx(df['I'].mean(), rel=1e-9)
+            assert summary['avg_burn'][idx] == pytest.approx(df['B'].mean(), rel=1e-9)
+            assert summary['conservation_error'][idx] == pytest.approx(
+                metrics['conservation_error'], rel=1e-6, abs=1e-6)
+            assert summary['std_N'][idx] / (summary['mean_N'][idx] + 1e-10) == pytest.approx(
+                metrics['coefficient_of_variation'], rel=1e-6)
+            assert summary['convergence_rate'][idx] == pytest.approx(
+                metrics['convergence_rate'], rel=1e-6, abs=1e-12)
+            assert summary['is_stable'][idx] == metrics['is_stable']
+
+    def test_short_runs_skip_convergence_rate(self):
+        params = base_params()
+        params['num_steps'] = 50
+        summary = run_batched_simulations(signal_configs(), [params])
+        assert summary['convergence_rate'][0] == 0.0
+
+
+class TestMonteCarlo:
+    """Monte Carlo sampling through the batched backend"""
+
+    def test_statistics_and_reproducibility(self):
+        analysis = MonteCarloAnalysis(base_params(), signal_configs())
+        variations = {'alpha': (1.0, 0.2), 'kappa': (0.01, 0.002), 'num_steps': (300, 50)}
+
+        first = analysis.run_monte_carlo(variations, num_runs=40, seed=3)
+        second = analysis.run_monte_carlo(variations, num_runs=40, seed=3)
+
+        assert first['num_successful_runs'] == 40
+        assert first['raw_results']['final_N'] == second['raw_results']['final_N']
+        assert first['statistics']['final_N']['mean'] == pytest.approx(
+            np.mean(first['raw_results']['final_N']))
+
+        params = base_params()
+        params.update(first['raw_results']['params_used'][7])
+        df, _ = reference_summary(params)
+        assert first['raw_results']['final_N'][7] == pytest.approx(df['N'].iloc[-1], rel=1e-9)
+
+
+class TestSensitivityAndStability:
+    """Sensitivity rankings and stability grids"""
+
+    def test_sensitivity_matches_single_runs(self):
+        analysis = SensitivityAnalysis(base_params(), signal_configs())
+        result = analysis.run_sensitivity_analysis(['alpha', 'num_steps'], num_points=5)
+
+        alpha_results = result['detailed_results']['alpha']
+        assert len(alpha_results['values']) == 5
+
+        params = base_params()
+        params['alpha'] = alpha_results['values'][2]
+        df, metrics = reference_summary(params)
+        assert alpha_results['final_N'][2] == pytest.approx(df['N'].iloc[-1], rel=1e-9)
+        assert alpha_results['stability_metric'][2] == pytest.approx(
+            metrics['coefficient_of_variation'], rel=1e-6)
+        assert {r['parameter'] for r in result['sensitivity_rankings']} == {'alpha', 'num_steps'}
+
+    def test_stability_grid_orientation(self):
+        mapper = StabilityMapper(base_params(), signal_configs())
+        result = mapper.map_stability_region('alpha', 'K_p', (0.5, 1.5), (0.0, 0.3), resolution=4)
+
+        assert result['stability_grid'].shape == (4, 4)
+        i, j = 3, 1
+        params = base_params()
+        params['alpha'] = float(result['param1_values'][i])
+        params['K_p'] = float(result['param2_values'][j])
+        df, metrics = reference_summary(params)
+        assert result['final_N_grid'][j, i] == pytest.approx(metrics['final_N'], rel=1e-9)
+        assert result['stability_grid'][j, i] == metrics['is_stable']
+
+    def test_process_pool_matches_batch(self):
+        mapper = StabilityMapper(base_params(), signal_configs())
+        args = ('alpha', 'K_p', (0.5, 1.5), (0.0, 0.3))
+        expected = mapper.map_stability_region(*args, resolution=5)
+
+        updates = []
+        actual = mapper.map_stability_region(*args, resolution=5, executor='process',
+                                             max_workers=2, shard_size=4,
+                                             on_progress=updates.append)
+
+        np.testing.assert_allclose(actual['final_N_grid'], expected['final_N_grid'])
+        np.testing.assert_array_equal(actual['stability_grid'], expected['stability_grid'])
+        assert len(updates) == 7
+        assert [u['completed_cells'] for u in updates] == sorted(u['completed_cells'] for u in updates)
+        assert updates[-1]['completed_grid'].all()
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        mapper = StabilityMapper(base_params(), signal_configs())
+        args = ('alpha', 'K_p', (0.5, 1.5), (0.0, 0.3))
+        checkpoint = str(tmp_path / 'sweep.npz')
+        expected = mapper.map_stability_region(*args, resolution=4)
+
+        class Interrupted(Exception):
+            pass
+
+        def interrupt(partial):
+            if partial['completed_cells'] >= 8:
+                raise Interrupted()
+
+        with pytest.raises(Interrupted):
+            mapper.map_stability_region(*args, resolution=4, shard_size=4,
+                                        checkpoint_path=checkpoint, on_progress=interrupt)
+
+        updates = []
+        resumed = mapper.map_stability_region(*args, resolution=4, shard_size=4,
+                                              checkpoint_path=checkpoint, on_progress=updates.append)
+
+        assert [u['completed_cells'] for u in updates] == [12, 16]
+        np.testing.assert_allclose(resumed['final_N_grid'], expected['final_N_grid'])
+
+        with pytest.raises(ValueError):
+            mapper.map_stability_region('alpha', 'kappa', (0.5, 1.5), (0.0, 0.3),
+                                        resolution=4, checkpoint_path=checkpoint)
+
+    def test_unseeded_random_signals_are_deterministic(self):
+        configs = signal_configs()
+        configs['C_cons'] = {'type': 'random_walk', 'initial': 60.0, 'volatility': 2.0, 'seed': None}
+        mapper = StabilityMapper(base_params(), configs)
+        args = ('alpha', 'K_p', (0.5, 1.5), (0.0, 0.3))
+
+        whole = mapper.map_stability_region(*args, resolution=3, seed=11)
+        sharded = mapper.map_stability_region(*args, resolution=3, seed=11, shard_size=2)
+
+        np.testing.assert_array_equal(whole['final_N_grid'], sharded['final_N_grid'])
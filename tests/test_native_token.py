@@ -0,0 +1,171 @@
+"""
+Tests for NativeTokenSystem transaction history
+
+Tests cover:
+1. Per-address lookups match a full scan of the history
+2. Resident window stays bounded while older history spills to disk
+3. Incrementally maintained token statistics
+4. Atomic batched transfers
+"""
+
+import pytest
+import numpy as np
+import security_framework
+from native_token import NativeTokenSystem, TransactionLedger, TokenTransaction, TransactionType
+
+
+def reference_account_transactions(token, address, limit):
+    """Original full-scan lookup"""
+    matches = [tx for tx in token.transactions if tx.from_address == address or tx.to_address == address]
+    return [tx.tx_id for tx in sorted(matches, key=lambda x: (x.timestamp, x.tx_id), reverse=True)[:limit]]
+
+
+def populate(token, num_txs=400, seed=0):
+    rng = np.random.default_rng(seed)
+    addresses = [f"NXS{i:02d}" for i in range(12)]
+    for _ in range(num_txs):
+        address = str(rng.choice(addresses))
+        if rng.random() < 0.7:
+            token.mint_reward(address, int(rng.integers(10, 1000)))
+        else:
+            token.burn(address, int(rng.integers(1, 10)))
+    return addresses
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    """Each test starts with empty rate-limit history"""
+    monkeypatch.setattr(security_framework, '_rate_limiter', security_framework.RateLimiter())
+
+
+@pytest.fixture
+def token(tmp_path):
+    system = NativeTokenSystem(history_memory_limit=50, history_path=str(tmp_path / 'history.db'))
+    yield system
+    system.transactions.close()
+
+
+class TestAccountHistory:
+    """Per-address index against a full scan"""
+
+    @pytest.mark.parametrize("limit", [1, 10, 60, 500])
+    def test_matches_full_scan(self, token, limit):
+        addresses = populate(token)
+        for address in addresses + ['VALIDATOR_POOL', 'BURN_ADDRESS', 'UNKNOWN']:
+            actual = [tx.tx_id for tx in token.get_account_transactions(address, limit)]
+            assert actual == reference_account_transactions(token, address, limit)
+
+    def test_resident_window_is_bounded(self, token):
+        populate(token)
+        ledger = token.transactions
+        assert len(ledger) == token.tx_counter > 300
+        assert ledger.resident_count == 50
+        assert sum(len(seqs) for seqs in ledger._address_index.values()) <= 100
+        assert [tx.tx_id for tx in ledger] == [f"TX{i:08d}" for i in range(token.tx_counter)]
+
+    def test_spilled_transactions_round_trip(self, token):
+        token.mint_reward('NXS_A', 123, reason='first')
+        populate(token, num_txs=100)
+
+        oldest = token.get_account_transactions('NXS_A', 1000)[-1]
+        assert oldest.tx_id == 'TX00000000'
+        assert oldest.tx_type is TransactionType.REWARD
+        assert oldest.amount == 123
+        assert oldest.data == {'reason': 'first'}
+
+    def test_self_transfer_listed_once(self):
+        ledger = TransactionLedger(memory_limit=2, path=':memory:')
+        for i in range(5):
+            ledger.append(TokenTransaction(f"TX{i}", TransactionType.TRANSFER, 'A', 'A', 1))
+        assert [tx.tx_id for tx in ledger.for_address('A', 10)] == ['TX4', 'TX3', 'TX2', 'TX1', 'TX0']
+
+
+class TestTokenStats:
+    """Counters maintained as transactions are recorded"""
+
+    def test_stats_match_history(self, token):
+        populate(token)
+        stats = token.get_token_stats()
+        history = list(token.transactions)
+
+        assert stats['total_transactions'] == len(history)
+        assert stats['transaction_volume'] == sum(tx.amount for tx in history)
+        assert stats['total_fees'] == sum(tx.fee for tx in history)
+        assert stats['total_burned'] == sum(
+            tx.amount for tx in history if tx.tx_type is TransactionType.BURN)
+
+
+class TestTransferBatch:
+    """Atomic batched payouts"""
+
+    def test_matches_sequential_transfers(self, token):
+        token.create_account('PAYER', initial_balance=10_000)
+        transfers = [('VALIDATOR_POOL', f"NXS{i % 7}", 100 + i) for i in range(40)]
+        transfers += [('PAYER', 'NXS1', 50), ('PAYER', 'NXS_NEW', 25)]
+        pool_before = token.get_account('VALIDATOR_POOL').balance
+
+        success, batch, message = token.transfer_batch(transfers, fee=3, reason='payout')
+
+        assert success, message
+        assert len(batch) == 42
+        assert token.tx_counter == 42
+        assert token.get_account('NXS_NEW').balance == 25
+        assert token.get_account('NXS1').balance == sum(a for _, r, a in transfers if r == 'NXS1')
+        assert token.get_account('PAYER').balance == 10_000 - 75 - 6
+        assert token.get_account('PAYER').nonce == 2
+        pool_paid = sum(a for s, _, a in transfers if s == 'VALIDATOR_POOL')
+        assert token.get_account('VALIDATOR_POOL').balance == pool_before - pool_paid - 40 * 3 + 42 * 3
+
+        history = token.get_account_transactions('NXS1', 100)
+        assert [tx.tx_id for tx in history] == reference_account_transactions(token, 'NXS1', 100)
+        assert history[0].data == {'batch_id': batch.batch_id, 'reason': 'payout'}
+        assert history[0].fee == 3
+
+    def test_insufficient_balance_changes_nothing(self, token):
+        token.create_account('PAYER', initial_balance=100)
+        before = {a: acct.balance for a, acct in token.accounts.items()}
+
+        success, batch, message = token.transfer_batch(
+            [('PAYER', 'A', 60), ('PAYER', 'B', 60)], fee=0)
+
+        assert not success and batch is None
+        assert 'Insufficient balance' in message
+        assert {a: acct.balance for a, acct in token.accounts.items()} == before
+        assert len(token.transactions) == 0
+
+    def test_rate_limited_once_per_sender(self, token):
+        transfers = [('VALIDATOR_POOL', f"NXS{i}", 10) for i in range(50)]
+        for _ in range(10):
+            assert token.transfer_batch(transfers, fee=0)[0]
+
+        success, _, message = token.transfer_batch(transfers, fee=0)
+        assert not success
+        assert 'Rate limit' in message
+
+    def test_rollback_on_error(self, token, monkeypatch):
+        before = {a: (acct.balance, acct.nonce) for a, acct in token.accounts.items()}
+
+        def fail(batch):
+            raise RuntimeError("disk full")
+        monkeypatch.setattr(token.transactions, 'append_batch', fail)
+
+        success, _, message = token.transfer_batch(
+            [('VALIDATOR_POOL', 'NEW1', 10), ('TREASURY', 'NEW2', 20)], fee=1)
+
+        assert not success
+        assert 'rolled back' in message
+        assert {a: (acct.balance, acct.nonce) for a, acct in token.accounts.items()} == before
+
+    def test_batches_spill_and_interleave_with_single_transactions(self, token):
+        rng = np.random.default_rng(4)
+        token.create_account('NXS0')
+        for _ in range(9):
+            transfers = [('VALIDATOR_POOL', f"NXS{int(r)}", 5) for r in rng.integers(0, 6, 20)]
+            transfers.append(('NXS0', 'NXS0', 0))
+            assert token.transfer_batch(transfers, fee=0)[0]
+            token.mint_reward('NXS3', 1)
+
+        assert token.transactions.resident_count <= 50
+        for address in ['NXS0', 'NXS3', 'NXS5', 'VALIDATOR_POOL']:
+            actual = [tx.tx_id for tx in token.get_account_transactions(address, 80)]
+            assert actual == reference_account_transactions(token, address, 80)
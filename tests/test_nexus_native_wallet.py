@@ -0,0 +1,359 @@
+"""
+Tests for NexusNativeWallet ledger auditing
+
+Tests cover:
+1. Set-based balance reconciliation matches the per-account reference
+2. Iterative DAG cycle detection on deep and cyclic graphs
+3. IO consistency from a single grouped join
+4. Incremental audits resuming from the last passing, settled checkpoint
+5. Keyset-paginated transaction and message history
+"""
+
+import pytest
+import numpy as np
+import sqlalchemy as sa
+from datetime import datetime, timedelta
+from nexus_native_wallet import (
+    NexusNativeWallet, WalletTransaction, WalletMessage, TokenAccount, DagEdge, TransactionIO,
+    VerificationRecord, LedgerAuditCheckpoint, UNITS_PER_NXT, ensure_indexes
+)
+
+
+@pytest.fixture
+def wallet(tmp_path):
+    """Wallet backed by a throwaway SQLite database"""
+    w = NexusNativeWallet(database_url=f"sqlite:///{tmp_path / 'ledger.db'}")
+    yield w
+    w.db.close()
+    w.engine.dispose()
+
+
+def add_transaction(wallet, tx_id, sender, receiver, amount, fee=0.01, parent='GENESIS',
+                    status='confirmed', with_io=True, row_id=None):
+    """Insert ledger rows the way send_nxt does, without the cryptography"""
+    wallet.db.add(WalletTransaction(
+        id=row_id, tx_id=tx_id, from_address=sender, to_address=receiver,
+        amount_nxt=amount, fee_nxt=fee, status=status,
+        wave_signature='{}', spectral_proof='{}', interference_hash='h', energy_cost=0.0
+    ))
+    wallet.db.add(DagEdge(child_id=tx_id, parent_id=parent, edge_type='transaction', depth=1))
+    wallet.db.add(VerificationRecord(tx_id=tx_id, verifier_type='wavelength', is_valid=True, full_proof='{}'))
+    if with_io:
+        wallet.db.add(TransactionIO(tx_id=tx_id, io_type='input', address=sender,
+                                    amount_nxt=amount + fee, sequence=0))
+        wallet.db.add(TransactionIO(tx_id=tx_id, io_type='output', address=receiver,
+                                    amount_nxt=amount, sequence=0))
+
+
+def build_ledger(wallet, num_accounts=20, num_txs=300, seed=0):
+    """Random confirmed/pending transfers with account balances kept consistent"""
+    rng = np.random.default_rng(seed)
+    addresses = [f"NXS{i:03d}{'F' * 37}" for i in range(num_accounts)]
+    balances = {a: 0.0 for a in addresses}
+    previous = 'GENESIS'
+
+    for i in range(num_txs):
+        sender, receiver = rng.choice(addresses, 2, replace=False)
+        amount = float(rng.integers(1, 100))
+        status = 'confirmed' if rng.random() < 0.9 else 'pending'
+        add_transaction(wallet, f"tx{i}", sender, receiver, amount, parent=previous, status=status)
+        if status == 'confirmed':
+            balances[sender] -= amount + 0.01
+            balances[receiver] += amount
+        previous = f"tx{i}"
+
+    for address, balance in balances.items():
+        wallet.db.add(TokenAccount(address=address, balance=int(round(balance * UNITS_PER_NXT))))
+    wallet.db.commit()
+    return addresses
+
+
+def settle(wallet):
+    """Age every ledger row past the audit settle window"""
+    old = datetime.utcnow() - timedelta(seconds=wallet.AUDIT_SETTLE_SECONDS + 60)
+    wallet.db.query(WalletTransaction).update({WalletTransaction.timestamp: old})
+    wallet.db.query(DagEdge).update({DagEdge.timestamp: old})
+    wallet.db.commit()
+
+
+def reference_balance_errors(wallet):
+    """Original per-account N+1 reconciliation"""
+    errors = []
+    for account in wallet.db.query(TokenAccount).all():
+        if account.address in ['VALIDATOR_POOL', 'GENESIS']:
+            continue
+        incoming = wallet.db.query(WalletTransaction).filter_by(to_address=account.address, status='confirmed').all()
+        outgoing = wallet.db.query(WalletTransaction).filter_by(from_address=account.address, status='confirmed').all()
+        if not incoming and not outgoing:
+            continue
+        calculated = sum(tx.amount_nxt * UNITS_PER_NXT for tx in incoming) - \
+            sum((tx.amount_nxt + tx.fee_nxt) * UNITS_PER_NXT for tx in outgoing)
+        if abs(calculated - account.balance) > 1:
+            errors.append(account.address)
+    return errors
+
+
+class TestFullAudit:
+    """Full genesis-to-tip audit"""
+
+    def test_consistent_ledger_passes(self, wallet):
+        build_ledger(wallet)
+        report = wallet.audit_ledger_integrity()
+
+        assert report['status'] == 'pass', report['errors']
+        assert report['mode'] == 'full'
+        assert report['dag_structure']['total_edges'] == 300
+        assert report['io_consistency']['transactions_checked'] == 300
+        assert 'flows' not in report['balance_integrity']
+
+    def test_balance_mismatches_match_reference(self, wallet):
+        addresses = build_ledger(wallet)
+        for address in addresses[:3]:
+            wallet.db.query(TokenAccount).filter_by(address=address).update(
+                {TokenAccount.balance: TokenAccount.balance + 5})
+        wallet.db.commit()
+
+        report = wallet.audit_ledger_integrity()
+        flagged = [e.split(' ')[3][:-4] for e in report['balance_integrity']['errors']]
+
+        assert report['status'] == 'fail'
+        assert sorted(flagged) == sorted(a[:16] for a in reference_balance_errors(wallet))
+        assert len(flagged) == 3
+
+    def test_deep_chain_has_no_recursion_limit(self, wallet):
+        wallet.db.bulk_insert_mappings(DagEdge, [
+            {'child_id': f"n{i}", 'parent_id': f"n{i - 1}" if i else 'GENESIS',
+             'edge_type': 'message', 'depth': i + 1}
+            for i in range(20000)
+        ])
+        wallet.db.commit()
+
+        check = wallet._verify_dag_structure()
+        assert check['is_valid']
+        assert check['total_nodes'] == 20000
+
+    def test_cycle_detected(self, wallet):
+        build_ledger(wallet, num_txs=50)
+        wallet.db.add(DagEdge(child_id='tx10', parent_id='tx40', edge_type='cross', depth=1))
+        wallet.db.commit()
+
+        report = wallet.audit_ledger_integrity()
+        assert 'Cycle detected in DAG structure' in report['errors']
+
+    def test_send_nxt_does_not_link_transaction_to_itself(self, wallet):
+        sender = wallet.create_wallet('pw')['address']
+        receiver = wallet.create_wallet('pw')['address']
+        wallet.db.query(TokenAccount).filter_by(address=sender).update({TokenAccount.balance: 0})
+        wallet.db.add(TokenAccount(address='FAUCET', balance=0))
+        add_transaction(wallet, 'fund', 'FAUCET', sender, 10.0)
+        wallet.db.query(TokenAccount).filter_by(address=sender).update({TokenAccount.balance: 10 * UNITS_PER_NXT})
+        wallet.db.commit()
+
+        tx = wallet.send_nxt(sender, receiver, 1.0, 'pw', idempotency_key='k1')
+
+        parents = [e.parent_id for e in wallet.db.query(DagEdge).filter_by(child_id=tx['tx_id'])]
+        assert parents == ['fund']
+        assert wallet._verify_dag_structure()['is_valid']
+
+    def test_io_mismatch_detected(self, wallet):
+        build_ledger(wallet, num_txs=30)
+        add_transaction(wallet, 'legacy', 'NXS_A', 'NXS_B', 1.0, with_io=False)
+        wallet.db.query(TransactionIO).filter_by(tx_id='tx5', io_type='input').update(
+            {TransactionIO.amount_nxt: 999.0})
+        wallet.db.commit()
+
+        check = wallet._verify_io_consistency()
+        assert not check['is_valid']
+        assert len(check['errors']) == 1
+        assert check['errors'][0].startswith('IO mismatch for tx5')
+        assert check['transactions_checked'] == 31
+
+
+class TestIncrementalAudit:
+    """Audits resuming from the last checkpoint"""
+
+    def test_falls_back_to_full_without_checkpoint(self, wallet):
+        build_ledger(wallet, num_txs=20)
+        report = wallet.audit_ledger_integrity(incremental=True)
+        assert report['mode'] == 'full'
+        assert wallet.db.query(LedgerAuditCheckpoint).count() == 1
+
+    def test_only_new_rows_are_audited(self, wallet):
+        addresses = build_ledger(wallet, num_txs=100)
+        settle(wallet)
+        wallet.audit_ledger_integrity()
+
+        add_transaction(wallet, 'new1', addresses[0], addresses[1], 10.0, parent='tx99')
+        wallet.db.query(TokenAccount).filter_by(address=addresses[0]).update(
+            {TokenAccount.balance: TokenAccount.balance - int(10.01 * UNITS_PER_NXT)})
+        wallet.db.query(TokenAccount).filter_by(address=addresses[1]).update(
+            {TokenAccount.balance: TokenAccount.balance + 10 * UNITS_PER_NXT})
+        wallet.db.commit()
+
+        report = wallet.audit_ledger_integrity(incremental=True)
+        assert report['status'] == 'pass', report['errors']
+        assert report['mode'] == 'incremental'
+        assert report['audited_range']['tx_rows'] == [100, 101]
+        assert report['balance_integrity']['accounts_checked'] == 2
+        assert report['io_consistency']['transactions_checked'] == 1
+        assert report['dag_structure']['total_edges'] == 1
+
+    def test_incremental_balance_uses_stored_flows(self, wallet):
+        addresses = build_ledger(wallet, num_txs=100)
+        settle(wallet)
+        wallet.audit_ledger_integrity()
+
+        # New transfer without updating balances
+        add_transaction(wallet, 'new1', addresses[2], addresses[3], 7.0, parent='tx99')
+        wallet.db.commit()
+
+        report = wallet.audit_ledger_integrity(incremental=True)
+        assert report['status'] == 'fail'
+        assert len(report['balance_integrity']['errors']) == 2
+
+        full = wallet.audit_ledger_integrity()
+        assert sorted(full['balance_integrity']['errors']) == sorted(report['balance_integrity']['errors'])
+
+    def test_incremental_detects_cycle_through_old_edges(self, wallet):
+        wallet.db.bulk_insert_mappings(DagEdge, [
+            {'child_id': 'a', 'parent_id': 'GENESIS', 'edge_type': 'message', 'depth': 1},
+            {'child_id': 'b', 'parent_id': 'a', 'edge_type': 'message', 'depth': 2},
+            {'child_id': 'c', 'parent_id': 'b', 'edge_type': 'message', 'depth': 3},
+            {'child_id': 'd', 'parent_id': 'x', 'edge_type': 'message', 'depth': 1},
+        ])
+        wallet.db.commit()
+        settle(wallet)
+        assert wallet.audit_ledger_integrity()['dag_structure']['is_valid']
+
+        # Still acyclic: d -> x -> c -> b -> a
+        wallet.db.add(DagEdge(child_id='x', parent_id='c', edge_type='cross', depth=4))
+        wallet.db.commit()
+        settle(wallet)
+        assert wallet.audit_ledger_integrity(incremental=True)['dag_structure']['is_valid']
+
+        # Only new edge is a -> d; the rest of the loop is already audited
+        wallet.db.add(DagEdge(child_id='a', parent_id='d', edge_type='cross', depth=2))
+        wallet.db.commit()
+        report = wallet.audit_ledger_integrity(incremental=True)
+        assert report['mode'] == 'incremental'
+        assert report['audited_range']['edge_rows'] == [5, 6]
+        assert not report['dag_structure']['is_valid']
+
+    def test_failed_audit_keeps_last_good_checkpoint(self, wallet):
+        addresses = build_ledger(wallet, num_txs=100)
+        settle(wallet)
+        wallet.audit_ledger_integrity()
+
+        # Transfer recorded without updating balances
+        add_transaction(wallet, 'bad', addresses[2], addresses[3], 7.0, parent='tx99')
+        wallet.db.commit()
+        settle(wallet)
+        for _ in range(2):
+            report = wallet.audit_ledger_integrity(incremental=True)
+            assert report['status'] == 'fail'
+            assert report['audited_range']['tx_rows'] == [100, 101]
+        assert wallet.db.query(LedgerAuditCheckpoint).count() == 1
+
+        wallet.db.query(TokenAccount).filter_by(address=addresses[2]).update(
+            {TokenAccount.balance: TokenAccount.balance - int(7.01 * UNITS_PER_NXT)})
+        wallet.db.query(TokenAccount).filter_by(address=addresses[3]).update(
+            {TokenAccount.balance: TokenAccount.balance + 7 * UNITS_PER_NXT})
+        wallet.db.commit()
+        assert wallet.audit_ledger_integrity(incremental=True)['status'] == 'pass'
+        assert wallet.audit_ledger_integrity(incremental=True)['audited_range']['tx_rows'] == [101, 101]
+
+    def test_late_commit_below_tip_is_audited(self, wallet):
+        addresses = build_ledger(wallet, num_txs=100)
+        settle(wallet)
+        wallet.audit_ledger_integrity()
+
+        # Ids 101 and 103 commit; 102 was handed out but commits later
+        add_transaction(wallet, 'new1', addresses[0], addresses[1], 0.0, fee=0.0, parent='tx99', row_id=101)
+        add_transaction(wallet, 'new3', addresses[0], addresses[1], 0.0, fee=0.0, parent='new1', row_id=103)
+        wallet.db.commit()
+        report = wallet.audit_ledger_integrity(incremental=True)
+        assert report['status'] == 'pass', report['errors']
+        assert report['audited_range']['tx_rows'] == [100, 103]
+
+        add_transaction(wallet, 'late', addresses[0], addresses[1], 1.0, parent='new1', row_id=102)
+        wallet.db.query(TransactionIO).filter_by(tx_id='late', io_type='input').update(
+            {TransactionIO.amount_nxt: 999.0})
+        wallet.db.commit()
+        report = wallet.audit_ledger_integrity(incremental=True)
+        assert report['audited_range']['tx_rows'] == [100, 103]
+        assert any(e.startswith('IO mismatch for late') for e in report['errors'])
+
+
+def add_history(wallet, address, other, count, start=datetime(2025, 1, 1)):
+    """Transfers in both directions, with timestamp ties every third row"""
+    for i in range(count):
+        sender, receiver = (address, other) if i % 2 else (other, address)
+        wallet.db.add(WalletTransaction(
+            tx_id=f"{address}-{other}-{i}", from_address=sender, to_address=receiver,
+            amount_nxt=1.0, fee_nxt=0.01, status='confirmed',
+            wave_signature='{}', spectral_proof='{}', interference_hash='h', energy_cost=0.0,
+            timestamp=start + timedelta(seconds=i // 3)
+        ))
+    wallet.db.commit()
+
+
+class TestHistoryPagination:
+    """Keyset pagination over the (address, timestamp, id) indexes"""
+
+    def test_pages_cover_history_once_in_order(self, wallet):
+        add_history(wallet, 'NXS_ME', 'NXS_PEER', 47)
+        add_history(wallet, 'NXS_X', 'NXS_Y', 10, start=datetime(2025, 6, 1))
+
+        seen, cursor = [], None
+        while True:
+            page = wallet.get_transaction_history_page('NXS_ME', page_size=10, cursor=cursor)
+            seen.extend(tx['tx_id'] for tx in page['transactions'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        expected = [
+            tx.tx_id for tx in wallet.db.query(WalletTransaction).filter(
+                (WalletTransaction.from_address == 'NXS_ME') | (WalletTransaction.to_address == 'NXS_ME')
+            ).order_by(WalletTransaction.timestamp.desc(), WalletTransaction.id.desc())
+        ]
+        assert seen == expected
+        assert len(seen) == 47
+        assert [tx['tx_id'] for tx in wallet.get_transaction_history('NXS_ME', limit=5)] == expected[:5]
+
+    def test_self_transfer_listed_once(self, wallet):
+        add_history(wallet, 'NXS_ME', 'NXS_ME', 6)
+        page = wallet.get_transaction_history_page('NXS_ME', page_size=10)
+        assert len(page['transactions']) == 6
+        assert page['next_cursor'] is None
+
+    def test_all_transactions_and_messages(self, wallet):
+        add_history(wallet, 'NXS_A', 'NXS_B', 25)
+        for i in range(7):
+            wallet.db.add(WalletMessage(message_id=f"m{i}", from_address='NXS_A', to_address='NXS_B',
+                                        content='hi', cost_nxt=0.01, wavelength=500.0,
+                                        spectral_region='green'))
+        wallet.db.commit()
+
+        first = wallet.get_all_transactions_page(page_size=20)
+        second = wallet.get_all_transactions_page(page_size=20, cursor=first['next_cursor'])
+        assert len(first['transactions']) + len(second['transactions']) == 25
+        assert second['next_cursor'] is None
+
+        page = wallet.get_message_history_page('NXS_A', page_size=5)
+        rest = wallet.get_message_history_page('NXS_A', page_size=5, cursor=page['next_cursor'])
+        ids = [m['message_id'] for m in page['messages'] + rest['messages']]
+        assert sorted(ids) == sorted(f"m{i}" for i in range(7))
+
+    def test_invalid_cursor_rejected(self, wallet):
+        with pytest.raises(ValueError):
+            wallet.get_transaction_history_page('NXS_ME', cursor='not-a-cursor')
+
+    def test_ensure_indexes_migrates_existing_tables(self, wallet):
+        wallet.db.close()
+        with wallet.engine.begin() as conn:
+            conn.execute(sa.text('DROP INDEX ix_wallet_tx_from_time'))
+            conn.execute(sa.text('DROP INDEX ix_dag_edge_child_depth'))
+
+        assert sorted(ensure_indexes(wallet.engine)) == ['ix_dag_edge_child_depth', 'ix_wallet_tx_from_time']
+        assert ensure_indexes(wallet.engine) == []
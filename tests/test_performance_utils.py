@@ -0,0 +1,122 @@
+"""
+Tests for performance_utils caching
+
+Validates:
+1. LRU ordering and eviction in CachingLayer
+2. Lazy and swept TTL expiry
+3. Byte-size bounds and statistics
+4. Process-wide shared performance_cache backend
+"""
+
+import threading
+import time
+import numpy as np
+from performance_utils import CachingLayer, performance_cache
+
+
+class TestCachingLayer:
+    """O(1) LRU/TTL cache"""
+
+    def test_lru_eviction_respects_access_order(self):
+        cache = CachingLayer(max_size=3, ttl=60)
+        for key in ['a', 'b', 'c']:
+            cache.set(key, key.upper())
+
+        assert cache.get('a') == 'A'
+        cache.set('d', 'D')
+
+        assert cache.get('b') is None
+        assert list(cache.stats()['keys']) == ['c', 'a', 'd']
+        assert cache.stats()['evictions'] == 1
+
+    def test_overwrite_does_not_evict(self):
+        cache = CachingLayer(max_size=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('a', 3)
+
+        assert cache.get('a') == 3
+        assert cache.get('b') == 2
+        assert cache.stats()['evictions'] == 0
+
+    def test_lazy_ttl_expiry(self):
+        cache = CachingLayer(max_size=10, ttl=0.05, cleanup_interval=3600)
+        cache.set('a', 1)
+        time.sleep(0.1)
+
+        assert cache.get('a') is None
+        stats = cache.stats()
+        assert stats['size'] == 0
+        assert stats['expirations'] == 1
+        assert stats['misses'] == 1
+
+    def test_sweep_only_removes_expired(self):
+        cache = CachingLayer(max_size=10, ttl=10, cleanup_interval=3600)
+        cache.set('old', 1)
+        cache.set('new', 2)
+        now = time.time()
+        cache.cache['old'] = (1, now - 20, 0)
+        cache._write_order['old'] = now - 20
+
+        assert cache.cleanup_expired() == 1
+        assert cache.stats()['keys'] == ['new']
+
+    def test_byte_bound(self):
+        cache = CachingLayer(max_size=100, ttl=60, max_bytes=3 * 8000)
+        for i in range(5):
+            cache.set(f"arr{i}", np.zeros(1000))
+
+        stats = cache.stats()
+        assert stats['size'] == 3
+        assert stats['bytes'] == 3 * 8000
+        assert cache.get('arr0') is None
+        assert cache.get('arr4') is not None
+
+    def test_hit_rate(self):
+        cache = CachingLayer()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('missing')
+        assert cache.stats()['hit_rate'] == 0.5
+
+    def test_concurrent_access(self):
+        cache = CachingLayer(max_size=50, ttl=60)
+
+        def worker(offset):
+            for i in range(2000):
+                key = f"k{(i + offset) % 80}"
+                if cache.get(key) is None:
+                    cache.set(key, i)
+
+        threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.stats()
+        assert stats['size'] == 50
+        assert len(cache._write_order) == 50
+        assert stats['hits'] + stats['misses'] == 8000
+
+
+class TestSharedPerformanceCache:
+    """performance_cache with a process-wide backend"""
+
+    def test_shared_backend(self):
+        calls = []
+
+        @performance_cache(ttl=60, shared=True, max_size=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+
+        square(4)
+        square(5)
+        square(3)
+        assert calls == [3, 4, 5, 3]
+        assert square.cache.stats()['size'] == 2
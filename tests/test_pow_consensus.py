@@ -0,0 +1,221 @@
+"""
+Tests for POW consensus mining
+
+Tests cover:
+1. Merkle root and integer difficulty target
+2. Midstate nonce search matches a full re-hash of every attempt
+3. Process-pool search returns the same nonce as the serial search
+4. POWConsensus.mine_block statistics
+5. Incremental and parallel chain validation, rolling aggregates
+"""
+
+import hashlib
+import pytest
+import pow_consensus
+from native_token import TokenTransaction, TransactionType
+from pow_consensus import (
+    MiningBlock, NonceSearcher, POWConsensus, compute_merkle_root, difficulty_target
+)
+
+
+def make_transactions(count):
+    return [TokenTransaction(f"TX{i}", TransactionType.TRANSFER, 'A', 'B', 10 + i, timestamp=100.0 + i)
+            for i in range(count)]
+
+
+def make_chain(num_blocks, workers=1):
+    consensus = POWConsensus(mining_workers=workers)
+    consensus.stats.current_difficulty = 1
+    consensus.DIFFICULTY_ADJUSTMENT_INTERVAL = 10 ** 9
+    for i in range(num_blocks):
+        consensus.add_transaction(make_transactions(i % 3 + 1)[-1])
+        consensus.mine_block('NXS_MINER')
+    return consensus
+
+
+def make_block(difficulty, num_transactions=3):
+    return MiningBlock(1, 1_700_000_000.0, make_transactions(num_transactions), "ab" * 32,
+                       "NXS_MINER", difficulty=difficulty)
+
+
+class TestHeader:
+    """Merkle root and difficulty target"""
+
+    def test_merkle_root(self):
+        txs = make_transactions(3)
+        leaves = [bytes.fromhex(tx.compute_hash()) for tx in txs]
+        left = hashlib.sha256(leaves[0] + leaves[1]).digest()
+        right = hashlib.sha256(leaves[2] + leaves[2]).digest()
+
+        assert compute_merkle_root(txs) == hashlib.sha256(left + right).digest()
+        assert compute_merkle_root(txs[:1]) == leaves[0]
+        assert compute_merkle_root([]) == bytes(32)
+        assert compute_merkle_root(txs[::-1]) != compute_merkle_root(txs)
+
+    @pytest.mark.parametrize("difficulty", [1, 2, 3, 4])
+    def test_target_matches_hex_prefix(self, difficulty):
+        target = difficulty_target(difficulty)
+        for i in range(20_000):
+            digest = hashlib.sha256(str(i).encode()).digest()
+            assert (digest < target) == digest.hex().startswith("0" * difficulty)
+
+    def test_zero_difficulty_accepts_anything(self):
+        assert difficulty_target(0) is None
+        block = make_block(0)
+        assert block.mine() == 1
+        assert block.nonce == 0 and block.is_valid()
+
+    def test_hash_covers_transactions(self):
+        block = make_block(2)
+        block.mine()
+        block.transactions[1].amount += 1
+        assert block.compute_hash() != block.hash
+
+
+class TestNonceSearch:
+    """Serial and parallel nonce search"""
+
+    def test_finds_lowest_valid_nonce(self):
+        block = make_block(2)
+        attempts = block.mine()
+
+        expected = make_block(2)
+        while not expected.compute_hash().startswith("00"):
+            expected.nonce += 1
+
+        assert block.nonce == expected.nonce
+        assert attempts == expected.nonce + 1
+        assert block.hash == block.compute_hash()
+        assert block.is_valid()
+
+    def test_exhausted_range(self):
+        block = make_block(8)
+        attempts = block.mine(max_attempts=1000)
+        assert attempts == 1000
+        assert block.nonce == 1000
+        assert not block.is_valid()
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        monkeypatch.setattr(pow_consensus, 'NONCE_CHUNK_SIZE', 1024)
+        searcher = NonceSearcher(2)
+        try:
+            for difficulty in (2, 3):
+                serial = make_block(difficulty)
+                serial.mine()
+                parallel = make_block(difficulty)
+                attempts = parallel.mine(searcher=searcher)
+
+                assert parallel.nonce == serial.nonce
+                assert parallel.hash == serial.hash
+                assert attempts >= serial.nonce + 1
+        finally:
+            searcher.close()
+
+    def test_parallel_stops_early(self, monkeypatch):
+        monkeypatch.setattr(pow_consensus, 'NONCE_CHUNK_SIZE', 1024)
+        searcher = NonceSearcher(2)
+        try:
+            block = make_block(2)
+            attempts = block.mine(searcher=searcher, max_attempts=10_000_000)
+            assert block.is_valid()
+            assert attempts < 100_000
+        finally:
+            searcher.close()
+
+
+class TestMineBlock:
+    """POWConsensus integration"""
+
+    def test_mine_block_updates_stats(self):
+        consensus = POWConsensus(mining_workers=1)
+        consensus.stats.current_difficulty = 2
+        consensus.add_transaction(make_transactions(1)[0])
+
+        block = consensus.mine_block('NXS_MINER')
+
+        assert block is not None and block.is_valid()
+        assert block.previous_hash == consensus.blockchain[0].hash
+        assert consensus.pending_transactions == []
+        stats = consensus.get_mining_stats()
+        assert stats['total_hash_attempts'] == block.nonce + 1
+        assert stats['hashrate'] > 0
+        assert stats['chain_valid']
+
+    def test_failed_search_returns_none(self, monkeypatch):
+        monkeypatch.setattr(pow_consensus, 'MAX_NONCE_ATTEMPTS', 10)
+        consensus = POWConsensus()
+        consensus.stats.current_difficulty = 10
+
+        assert consensus.mine_block('NXS_MINER') is None
+        assert len(consensus.blockchain) == 1
+
+
+class TestChainValidation:
+    """Checkpointed, fully re-hashing chain validation"""
+
+    def test_only_new_blocks_are_verified(self, monkeypatch):
+        consensus = make_chain(20)
+        verified = []
+        original = pow_consensus.verify_blocks
+
+        def spy(blocks, previous_hash):
+            verified.append(len(blocks))
+            return original(blocks, previous_hash)
+        monkeypatch.setattr(pow_consensus, 'verify_blocks', spy)
+
+        assert consensus.validate_chain()
+        assert consensus.validate_chain()
+        consensus.mine_block('NXS_MINER')
+        consensus.mine_block('NXS_MINER')
+        assert consensus.validate_chain()
+        assert verified == [20, 0, 2]
+
+    def test_recomputes_hashes(self):
+        consensus = make_chain(10)
+        consensus.blockchain[4].transactions[0].amount += 1
+        assert not consensus.validate_chain()
+        assert consensus._validated_tip[0] == 4
+
+        consensus = make_chain(10)
+        forged = consensus.blockchain[6]
+        forged.hash = "0" * 64
+        consensus.blockchain[7].previous_hash = forged.hash
+        assert not consensus.validate_chain()
+
+    def test_checkpoint_trusts_validated_blocks(self):
+        consensus = make_chain(10)
+        assert consensus.validate_chain()
+        consensus.blockchain[3].transactions[0].amount += 1
+        assert consensus.validate_chain()
+        assert not consensus.validate_chain(full=True)
+
+    def test_reorg_discards_checkpoint_and_aggregates(self):
+        consensus = make_chain(10)
+        assert consensus.validate_chain()
+        assert consensus.get_mining_stats()['total_supply_mined'] == sum(b.reward for b in consensus.blockchain)
+
+        # Same height, different tip
+        del consensus.blockchain[-3:]
+        consensus.INITIAL_BLOCK_REWARD = 7
+        for _ in range(3):
+            consensus.mine_block('NXS_OTHER')
+        assert len(consensus.blockchain) == 11
+        consensus.blockchain[9].miner_address = 'NXS_THIEF'
+        assert not consensus.validate_chain()
+
+        stats = consensus.get_mining_stats()
+        assert stats['total_supply_mined'] == sum(b.reward for b in consensus.blockchain)
+        assert not stats['chain_valid']
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        monkeypatch.setattr(pow_consensus, 'VALIDATION_CHUNK_SIZE', 8)
+        consensus = make_chain(40)
+        try:
+            assert consensus.validate_chain(workers=2)
+            assert consensus._validated_tip[0] == 41
+
+            consensus.blockchain[25].transactions[0].fee += 1
+            assert not consensus.validate_chain(full=True, workers=2)
+            assert consensus._validated_tip[0] == 25
+        finally:
+            consensus.close()
@@ -0,0 +1,137 @@
+"""
+Tests for the security framework rate limiter
+
+Tests cover:
+1. Burst limits and refill for token-bucket and sliding-window modes
+2. Idle-key and stale-violation eviction
+3. Lock-striped state under concurrent callers
+4. Async API
+"""
+
+import asyncio
+import threading
+import pytest
+import security_framework
+from security_framework import RateLimiter
+
+
+class FakeClock:
+    """Controllable replacement for time.time"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(security_framework.time, 'time', fake)
+    return fake
+
+
+@pytest.mark.parametrize("algorithm", RateLimiter.ALGORITHMS)
+class TestLimits:
+    """Behaviour shared by both algorithms"""
+
+    def test_burst_then_reject(self, clock, algorithm):
+        limiter = RateLimiter(algorithm=algorithm)
+        results = [limiter.check_rate_limit('NXS_A', 'transfer')[0] for _ in range(12)]
+        assert results == [True] * 10 + [False] * 2
+
+        allowed, reason = limiter.check_rate_limit('NXS_A', 'transfer')
+        assert not allowed
+        assert reason.startswith('Rate limit exceeded. 10/10 requests in 60s.')
+        assert limiter.get_stats('NXS_A')['violations'] == 3
+        assert limiter.get_stats('NXS_A')['current_requests']['transfer'] == '10/10'
+
+    def test_limits_are_per_address_and_operation(self, clock, algorithm):
+        limiter = RateLimiter(algorithm=algorithm)
+        for _ in range(10):
+            limiter.check_rate_limit('NXS_A', 'transfer')
+        assert not limiter.check_rate_limit('NXS_A', 'transfer')[0]
+        assert limiter.check_rate_limit('NXS_B', 'transfer')[0]
+        assert limiter.check_rate_limit('NXS_A', 'message')[0]
+        assert limiter.check_rate_limit('NXS_A', 'unlisted_operation')[0]
+
+    def test_full_refill_after_window(self, clock, algorithm):
+        limiter = RateLimiter(algorithm=algorithm)
+        for _ in range(10):
+            limiter.check_rate_limit('NXS_A', 'transfer')
+        clock.now += 61
+        assert all(limiter.check_rate_limit('NXS_A', 'transfer')[0] for _ in range(10))
+
+    def test_idle_keys_are_evicted(self, clock, algorithm):
+        limiter = RateLimiter(algorithm=algorithm, idle_ttl=100)
+        for i in range(500):
+            limiter.check_rate_limit(f"NXS{i}", 'transfer')
+        for _ in range(11):
+            limiter.check_rate_limit('NXS_SPAM', 'transfer')
+        assert limiter.tracked_keys() == 501
+
+        clock.now += 3601
+        assert limiter.evict_idle() == 0
+        assert limiter.get_stats('NXS_SPAM')['violations'] == 0
+
+
+class TestTokenBucket:
+    """GCRA-specific refill behaviour"""
+
+    def test_sustained_rate(self, clock):
+        limiter = RateLimiter()
+        for _ in range(10):
+            limiter.check_rate_limit('NXS_A', 'transfer')
+
+        # One request every 60s / 10 after the burst is used up
+        clock.now += 5.9
+        assert not limiter.check_rate_limit('NXS_A', 'transfer')[0]
+        clock.now += 0.2
+        assert limiter.check_rate_limit('NXS_A', 'transfer')[0]
+        assert not limiter.check_rate_limit('NXS_A', 'transfer')[0]
+
+    def test_sweeps_run_automatically(self, clock):
+        limiter = RateLimiter(num_shards=1, sweep_every=100)
+        for i in range(99):
+            limiter.check_rate_limit(f"NXS{i}", 'vote')
+        clock.now += 301
+        limiter.check_rate_limit('NXS_LAST', 'vote')
+        assert limiter.tracked_keys() == 1
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            RateLimiter(algorithm='leaky')
+
+
+class TestConcurrency:
+    """Striped locks under many threads"""
+
+    def test_no_lost_updates(self):
+        limiter = RateLimiter(num_shards=8)
+        allowed = [0] * 32
+        barrier = threading.Barrier(32)
+
+        def worker(index):
+            barrier.wait()
+            for _ in range(200):
+                # Every thread hammers a shared address and its own address
+                for address in ('NXS_SHARED', f"NXS{index}"):
+                    if limiter.check_rate_limit(address, 'vote')[0]:
+                        allowed[index] += 1
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(32)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sum(allowed) == 10 + 32 * 10
+
+    def test_async_api(self):
+        limiter = RateLimiter()
+
+        async def burst():
+            return [(await limiter.check_rate_limit_async('NXS_A', 'dex_swap'))[0] for _ in range(6)]
+
+        assert asyncio.run(burst()) == [True] * 5 + [False]
@@ -0,0 +1,107 @@
+"""
+Tests for the persistent NexusEngineNumba result cache
+
+Validates:
+1. Cached runs return the same DataFrame and PID state as fresh runs
+2. Keys change with parameters, signals and controller state
+3. Entries survive a new cache instance (process restart)
+4. LRU eviction keeps the cache within its size bound
+"""
+
+import numpy as np
+import pandas as pd
+from nexus_engine_numba import NexusEngineNumba
+from simulation_cache import SimulationResultCache
+
+
+def make_signals(num_steps: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return {
+        'signals_H': rng.uniform(50, 150, num_steps),
+        'signals_M': rng.uniform(50, 150, num_steps),
+        'signals_D': rng.uniform(50, 150, num_steps),
+        'signals_E': rng.uniform(0.5, 1.0, num_steps),
+        'signals_C_cons': rng.uniform(10, 50, num_steps),
+        'signals_C_disp': rng.uniform(10, 50, num_steps),
+    }
+
+
+def run(engine, signals, **kwargs):
+    return engine.run_simulation(**signals, N_initial=1000.0, delta_t=0.1, **kwargs)
+
+
+class TestSimulationCache:
+    """On-disk result cache behaviour"""
+
+    def test_cached_run_matches_fresh_run(self, tmp_path):
+        cache = SimulationResultCache(str(tmp_path))
+        signals = make_signals(500)
+
+        fresh = run(NexusEngineNumba({'alpha': 1.2}), signals)
+        first = run(NexusEngineNumba({'alpha': 1.2}, cache=cache), signals)
+        cached_engine = NexusEngineNumba({'alpha': 1.2}, cache=cache)
+        second = run(cached_engine, signals)
+
+        pd.testing.assert_frame_equal(first, fresh)
+        pd.testing.assert_frame_equal(second, fresh)
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+        reference = NexusEngineNumba({'alpha': 1.2})
+        run(reference, signals)
+        assert cached_engine.e_integral == reference.e_integral
+        assert cached_engine.e_prev == reference.e_prev
+
+    def test_segmented_runs_key_on_controller_state(self, tmp_path):
+        cache = SimulationResultCache(str(tmp_path))
+        signals = make_signals(200)
+        engine = NexusEngineNumba({}, cache=cache)
+
+        run(engine, signals)
+        continued = run(engine, signals)
+        reset = run(engine, signals, reset_controller=True)
+
+        assert cache.stats()['misses'] == 2
+        assert cache.stats()['hits'] == 1
+        assert not np.allclose(continued['Phi'].values, reset['Phi'].values)
+
+    def test_key_depends_on_inputs(self):
+        signals = list(make_signals(100).values())
+        params = [1.0, 0.5]
+        base = SimulationResultCache.make_key(params, signals, 1000.0, 0.1, 0.0, 0.0)
+
+        changed_signal = [s.copy() for s in signals]
+        changed_signal[3][10] += 1e-9
+        assert SimulationResultCache.make_key(params, changed_signal, 1000.0, 0.1, 0.0, 0.0) != base
+        assert SimulationResultCache.make_key([1.0, 0.6], signals, 1000.0, 0.1, 0.0, 0.0) != base
+        assert SimulationResultCache.make_key(params, signals, 1000.0, 0.2, 0.0, 0.0) != base
+        assert SimulationResultCache.make_key(params, signals, 1000.0, 0.1, 0.0, 0.0) == base
+
+    def test_persists_across_instances(self, tmp_path):
+        signals = make_signals(300)
+        run(NexusEngineNumba({}, cache=SimulationResultCache(str(tmp_path))), signals)
+
+        reopened = SimulationResultCache(str(tmp_path))
+        assert reopened.stats()['entries'] == 1
+        run(NexusEngineNumba({}, cache=reopened), signals)
+        assert reopened.stats()['hits'] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        probe = SimulationResultCache(str(tmp_path / 'probe'))
+        run(NexusEngineNumba({}, cache=probe), make_signals(1000))
+        entry_bytes = probe.stats()['bytes']
+
+        cache = SimulationResultCache(str(tmp_path / 'lru'), max_bytes=int(entry_bytes * 2.5))
+        signal_sets = [make_signals(1000, seed) for seed in range(3)]
+        run(NexusEngineNumba({}, cache=cache), signal_sets[0])
+        run(NexusEngineNumba({}, cache=cache), signal_sets[1])
+        run(NexusEngineNumba({}, cache=cache), signal_sets[0])
+        run(NexusEngineNumba({}, cache=cache), signal_sets[2])
+
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['evictions'] == 1
+        assert stats['bytes'] <= cache.max_bytes
+
+        run(NexusEngineNumba({}, cache=cache), signal_sets[0])
+        assert cache.stats()['hits'] == 2
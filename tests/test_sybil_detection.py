@@ -0,0 +1,257 @@
+"""
+Tests for behavioral (voting correlation) Sybil detection
+
+Tests cover:
+1. Exact mode matches a pairwise pearsonr reference
+2. LSH prefilter recovers strongly coordinated groups
+3. Vote matrix construction and degenerate inputs
+4. Union-find fusion of detector outputs
+5. Incremental engine runs match full re-analysis
+"""
+
+import copy
+import random
+import warnings
+import pytest
+import numpy as np
+import networkx as nx
+from scipy.stats import pearsonr
+from sybil_detection import (
+    BehavioralClusterDetector, SybilDetectionConfig, SybilDetectionEngine, ValidatorProfile
+)
+
+
+def make_profiles(num_validators, num_proposals, groups=5, group_size=6, flip=0.05, seed=0):
+    """Random voters plus `groups` coordinated groups that copy a shared ballot"""
+    rng = np.random.default_rng(seed)
+    ballots = [rng.choice(["APPROVE", "REJECT", "ABSTAIN"], num_proposals) for _ in range(groups)]
+    profiles = []
+    for v in range(num_validators):
+        if v < groups * group_size:
+            choices = ballots[v % groups].copy()
+            choices[rng.random(num_proposals) < flip] = "REJECT"
+        else:
+            choices = rng.choice(["APPROVE", "REJECT", "ABSTAIN"], num_proposals)
+        votes = [{'proposal_id': f"p{j:04d}", 'choice': str(c), 'timestamp': 0}
+                 for j, c in enumerate(choices) if rng.random() < 0.9]
+        profiles.append(ValidatorProfile(f"v{v}", f"NXS{v}", "BLUE", 1.0, 0.0, votes_cast=votes))
+    return profiles
+
+
+def reference_clusters(profiles, threshold=0.8):
+    """Pairwise pearsonr, clusters as connected components of >= 3"""
+    ids, _, matrix = BehavioralClusterDetector(threshold).build_vote_matrix(profiles)
+    dense = matrix.toarray()
+    graph = nx.Graph()
+    graph.add_nodes_from(range(len(ids)))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i in range(len(ids)):
+            for j in range(i + 1, len(ids)):
+                if pearsonr(dense[i], dense[j])[0] >= threshold:
+                    graph.add_edge(i, j)
+    return sorted(sorted(ids[k] for k in c) for c in nx.connected_components(graph) if len(c) >= 3)
+
+
+def normalized(clusters):
+    return sorted(sorted(members) for members in clusters.values())
+
+
+class TestExact:
+    """Blocked all-pairs correlation"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_pearsonr_reference(self, seed):
+        profiles = make_profiles(150, 40, seed=seed)
+        clusters = BehavioralClusterDetector(method='exact').detect(profiles)
+        assert normalized(clusters) == reference_clusters(profiles)
+        assert list(clusters) == [f"behavioral_{k}" for k in range(len(clusters))]
+
+    def test_sparse_path_matches_dense(self, monkeypatch):
+        profiles = make_profiles(120, 30, seed=3)
+        dense = BehavioralClusterDetector(method='exact').detect(profiles)
+        monkeypatch.setattr(BehavioralClusterDetector, 'DENSE_ELEMENTS', 0)
+        monkeypatch.setattr(BehavioralClusterDetector, 'BLOCK_ELEMENTS', 1000)
+        assert normalized(BehavioralClusterDetector(method='exact').detect(profiles)) == normalized(dense)
+
+
+class TestLSH:
+    """Hyperplane LSH candidate prefilter"""
+
+    def test_recovers_coordinated_groups(self):
+        profiles = make_profiles(3000, 100, flip=0.02, seed=4)
+        clusters = BehavioralClusterDetector(method='lsh').detect(profiles)
+        expected = sorted(sorted(f"v{v}" for v in range(g, 30, 5)) for g in range(5))
+        assert normalized(clusters) == expected
+
+    def test_large_buckets_scored_in_blocks(self, monkeypatch):
+        monkeypatch.setattr(BehavioralClusterDetector, 'SMALL_BUCKET', 2)
+        profiles = make_profiles(150, 40, flip=0.0, seed=5)
+        detector = BehavioralClusterDetector(method='lsh', lsh_bands=8, lsh_rows=2)
+        assert normalized(detector.detect(profiles)) == reference_clusters(profiles)
+
+    def test_auto_switches_on_validator_count(self):
+        profiles = make_profiles(200, 40, seed=6)
+        lsh = BehavioralClusterDetector(method='lsh').detect(profiles)
+        exact = BehavioralClusterDetector(method='exact').detect(profiles)
+        assert BehavioralClusterDetector(lsh_min_validators=100).detect(profiles) == lsh
+        assert BehavioralClusterDetector(lsh_min_validators=1000).detect(profiles) == exact
+
+
+class TestVoteMatrix:
+    """Matrix construction and inputs without meaningful correlation"""
+
+    def test_last_vote_wins_and_abstainers_dropped(self):
+        votes = [{'proposal_id': 'b', 'choice': 'REJECT'}, {'proposal_id': 'a', 'choice': 'APPROVE'},
+                 {'proposal_id': 'b', 'choice': 'APPROVE'}]
+        profiles = [
+            ValidatorProfile('v0', 'a0', 'BLUE', 1.0, 0.0, votes_cast=votes),
+            ValidatorProfile('v1', 'a1', 'BLUE', 1.0, 0.0,
+                             votes_cast=[{'proposal_id': 'c', 'choice': 'ABSTAIN'}]),
+        ]
+        ids, proposals, matrix = BehavioralClusterDetector().build_vote_matrix(profiles)
+        assert ids == ['v0']
+        assert proposals == ['a', 'b', 'c']
+        assert matrix.toarray().tolist() == [[1.0, 1.0, 0.0]]
+
+    def test_too_few_proposals(self):
+        votes = [{'proposal_id': p, 'choice': 'APPROVE'} for p in ('a', 'b')]
+        profiles = [ValidatorProfile(f"v{i}", f"a{i}", 'BLUE', 1.0, 0.0, votes_cast=list(votes))
+                    for i in range(5)]
+        assert BehavioralClusterDetector().detect(profiles) == {}
+
+    def test_constant_voters_never_cluster(self):
+        votes = [{'proposal_id': f"p{j}", 'choice': 'APPROVE'} for j in range(10)]
+        profiles = [ValidatorProfile(f"v{i}", f"a{i}", 'BLUE', 1.0, 0.0, votes_cast=list(votes))
+                    for i in range(5)]
+        for method in ('exact', 'lsh'):
+            assert BehavioralClusterDetector(method=method).detect(profiles) == {}
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            BehavioralClusterDetector(method='spectral')
+
+
+REGIONS = ["RED", "ORANGE", "YELLOW", "GREEN", "BLUE", "VIOLET"]
+
+
+def make_network(num_validators, num_proposals=30, groups=6, group_size=5, seed=0):
+    """Honest validators plus Sybil groups sharing votes, funding, subnet, ISP and timing"""
+    rng = np.random.default_rng(seed)
+    ballots = [rng.choice(["APPROVE", "REJECT", "ABSTAIN"], num_proposals) for _ in range(groups)]
+    profiles = []
+    for v in range(num_validators):
+        if v < groups * group_size:
+            g = v % groups
+            choices, registered = ballots[g], 1e5 * g + v
+            source, ip, isp = f"SRC{g}", f"ip{g:02d}xxxx{v}", f"isp{g}"
+            timing = [100.0 + 50 * g + x for x in (1, 2, 3)]
+        else:
+            choices = rng.choice(["APPROVE", "REJECT", "ABSTAIN"], num_proposals)
+            registered = float(rng.uniform(0, 1e7))
+            source, ip = f"S{rng.integers(0, num_validators)}", f"{rng.integers(0, 1 << 30):08x}"
+            isp, timing = f"isp{rng.integers(10, 60)}", list(rng.uniform(0, 5000, 4))
+        votes = [{'proposal_id': f"p{j:03d}", 'choice': str(c), 'timestamp': 0} for j, c in enumerate(choices)]
+        profiles.append(ValidatorProfile(
+            f"v{v}", f"NXS{v}", REGIONS[v % 6], 1.0, registered, votes_cast=votes,
+            funding_source=source, ip_hash=ip, isp_hash=isp, block_timing_signature=timing
+        ))
+    return profiles
+
+
+def summary(results):
+    return sorted((tuple(sorted(r.validators)), round(r.confidence_score, 9), tuple(r.evidence)) for r in results)
+
+
+class TestFusion:
+    """Merging detector outputs into Sybil groups"""
+
+    def test_groups_share_two_clusters_transitively(self):
+        # a-b share clusters 0 and 1, b-c share 2 and 3; d shares only cluster 0
+        memberships = {'a': [0, 1], 'b': [0, 1, 2, 3], 'c': [2, 3], 'd': [0], 'e': [4, 5]}
+        assert SybilDetectionEngine.fuse_clusters(memberships) == [['a', 'b', 'c'], ['d'], ['e']]
+
+    def test_detects_planted_groups(self):
+        results = SybilDetectionEngine().analyze_validators(make_network(200))
+        assert sorted(sorted(r.validators) for r in results) == sorted(
+            sorted(f"v{v}" for v in range(g, 30, 6)) for g in range(6))
+        assert all(set(r.detection_vectors) >= {'behavioral', 'economic', 'device'} for r in results)
+        assert [r.confidence_score for r in results] == sorted((r.confidence_score for r in results), reverse=True)
+
+
+class TestIncremental:
+    """Incremental analyze_validators against a fresh full run"""
+
+    def test_matches_full_analysis_across_edits(self):
+        rng = random.Random(1)
+        profiles = make_network(300)
+        engine = SybilDetectionEngine()
+        assert summary(engine.analyze_validators(profiles, incremental=True)) == \
+            summary(SybilDetectionEngine().analyze_validators(profiles))
+
+        for step in range(6):
+            profiles = [copy.copy(p) for p in profiles]
+            for _ in range(10):
+                profile, kind = rng.choice(profiles), rng.randrange(5)
+                if kind == 0:
+                    profile.votes_cast = [dict(v, choice=rng.choice(["APPROVE", "REJECT"])) for v in profile.votes_cast]
+                elif kind == 1:
+                    profile.funding_source = "SRC1"
+                elif kind == 2:
+                    profile.registration_time = rng.uniform(0, 1e7)
+                elif kind == 3:
+                    profile.block_timing_signature = [151.0, 152.0, 153.0]
+                else:
+                    profile.ip_hash = "ip03xxxx"
+            if step % 3 == 0:
+                profiles = profiles[:-5]
+            if step == 4:
+                profiles += make_network(320, seed=9)[300:]
+
+            incremental = engine.analyze_validators(profiles, incremental=True)
+            assert summary(incremental) == summary(SybilDetectionEngine().analyze_validators(profiles))
+
+    def test_new_proposal_rescores_everyone(self):
+        profiles = make_network(100)
+        engine = SybilDetectionEngine()
+        engine.analyze_validators(profiles, incremental=True)
+
+        profiles[40] = copy.copy(profiles[40])
+        profiles[40].votes_cast = profiles[40].votes_cast + [{'proposal_id': 'p999', 'choice': 'APPROVE'}]
+        assert summary(engine.analyze_validators(profiles, incremental=True)) == \
+            summary(SybilDetectionEngine().analyze_validators(profiles))
+
+    def test_unchanged_validators_are_not_rescored(self, monkeypatch):
+        profiles = make_network(100)
+        engine = SybilDetectionEngine()
+        engine.analyze_validators(profiles, incremental=True)
+
+        def fail(*args):
+            raise AssertionError("full rescore")
+        monkeypatch.setattr(engine.behavioral_detector, 'correlated_pairs', fail)
+        profiles[50] = copy.copy(profiles[50])
+        profiles[50].votes_cast = [dict(v, choice='APPROVE') for v in profiles[50].votes_cast]
+        profiles[51] = copy.copy(profiles[51])
+        profiles[51].stake_amount = 99.0
+
+        assert summary(engine.analyze_validators(profiles, incremental=True)) == \
+            summary(SybilDetectionEngine().analyze_validators(profiles))
+        assert summary(engine.analyze_validators(profiles, incremental=True)) == \
+            summary(SybilDetectionEngine().analyze_validators(profiles))
+
+
+class TestHistory:
+    """Bounded detection history with running totals"""
+
+    def test_history_is_bounded(self):
+        engine = SybilDetectionEngine(SybilDetectionConfig(history_limit=8))
+        profiles = make_network(100)
+        for _ in range(3):
+            engine.analyze_validators(profiles, incremental=True)
+
+        stats = engine.get_detection_stats()
+        assert len(engine.detection_history) == 8
+        assert stats['total_detections'] == 18
+        assert stats['total_flagged_validators'] == 30
+        assert stats['average_cluster_size'] == 5
+        assert len(stats['recent_detections']) == 8
@@ -8,8 +8,10 @@ Tests cover:
 4. Priority-based execution ordering
 5. Task handlers for different operation types
 6. End-to-end workflow scenarios
+7. Parallel execution with priorities, retries and timeouts
 """
 
+import time
 import pytest
 from task_orchestration import (
     Task, TaskOrchestrationDAG, TaskBuilder, TaskStatus, TaskPriority
@@ -452,3 +454,133 @@ class TestWorkflowScenarios:
         results = dag.execute_all()
         assert len(results) == 3
         assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+
+
+class TestParallelExecution:
+    """Test dependency-driven parallel execution"""
+    
+    def test_independent_tasks_run_concurrently(self):
+        """Test that independent I/O-bound tasks overlap on the thread pool"""
+        dag = TaskOrchestrationDAG()
+        dag.register_task_handler('io', 'wait', lambda params: time.sleep(0.2) or params['n'])
+        
+        for i in range(4):
+            dag.add_task(Task(f'task{i}', 'io', 'wait', {'n': i}))
+        
+        start = time.monotonic()
+        results = dag.execute_parallel(max_workers=4)
+        elapsed = time.monotonic() - start
+        
+        assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+        assert [results[f'task{i}'].output for i in range(4)] == [0, 1, 2, 3]
+        assert elapsed < 0.6
+    
+    def test_dependent_starts_without_level_barrier(self):
+        """Test a task starts as soon as its own dependencies finish"""
+        dag = TaskOrchestrationDAG()
+        finished = {}
+        
+        def record(params):
+            time.sleep(params['delay'])
+            finished[params['name']] = time.monotonic()
+        
+        dag.register_task_handler('io', 'record', record)
+        dag.add_task(Task('fast', 'io', 'record', {'name': 'fast', 'delay': 0.0}))
+        dag.add_task(Task('slow', 'io', 'record', {'name': 'slow', 'delay': 0.4}))
+        dag.add_task(Task('after-fast', 'io', 'record', {'name': 'after-fast', 'delay': 0.0},
+                          dependencies=['fast']))
+        
+        dag.execute_parallel(max_workers=2)
+        
+        assert finished['after-fast'] < finished['slow']
+    
+    def test_priority_order_within_level(self):
+        """Test that ready tasks start in priority order"""
+        dag = TaskOrchestrationDAG()
+        started = []
+        dag.register_task_handler('io', 'record', lambda params: started.append(params['name']))
+        
+        dag.add_task(Task('low', 'io', 'record', {'name': 'low'}, priority=TaskPriority.LOW))
+        dag.add_task(Task('critical', 'io', 'record', {'name': 'critical'},
+                          priority=TaskPriority.CRITICAL))
+        dag.add_task(Task('normal', 'io', 'record', {'name': 'normal'}))
+        
+        dag.execute_parallel(max_workers=1)
+        
+        assert started == ['critical', 'normal', 'low']
+    
+    def test_timeout_is_enforced(self):
+        """Test that a hung task fails on timeout without blocking the run"""
+        dag = TaskOrchestrationDAG()
+        dag.register_task_handler('io', 'hang', lambda params: time.sleep(1.0))
+        dag.register_task_handler('io', 'quick', lambda params: 'ok')
+        
+        dag.add_task(Task('hang', 'io', 'hang', {}, max_retries=0, timeout=0.1))
+        dag.add_task(Task('dependent', 'io', 'quick', {}, dependencies=['hang']))
+        dag.add_task(Task('other', 'io', 'quick', {}))
+        
+        start = time.monotonic()
+        results = dag.execute_parallel(max_workers=1)
+        elapsed = time.monotonic() - start
+        
+        assert results['hang'].status == TaskStatus.FAILED
+        assert results['hang'].metadata['timed_out'] is True
+        assert results['dependent'].status == TaskStatus.CANCELLED
+        assert results['other'].status == TaskStatus.COMPLETED
+        assert elapsed < 0.8
+    
+    def test_retries_then_succeeds(self):
+        """Test that failed attempts are retried up to max_retries"""
+        dag = TaskOrchestrationDAG()
+        calls = []
+        
+        def flaky(params):
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+            return 'done'
+        
+        dag.register_task_handler('io', 'flaky', flaky)
+        dag.add_task(Task('flaky', 'io', 'flaky', {}, max_retries=3))
+        
+        results = dag.execute_parallel()
+        
+        assert results['flaky'].status == TaskStatus.COMPLETED
+        assert results['flaky'].retry_count == 2
+    
+    def test_failure_cancels_transitive_dependents(self):
+        """Test that failure cancels the whole downstream chain"""
+        dag = TaskOrchestrationDAG()
+        dag.register_task_handler('test', 'fail', lambda params: 1 / 0)
+        register_all_handlers(dag)
+        
+        dag.add_task(Task('task1', 'test', 'fail', {}, max_retries=0))
+        dag.add_task(Task('task2', 'admin', 'log_system_event',
+                          {'event_type': 'test', 'message': 'test'}, dependencies=['task1']))
+        dag.add_task(Task('task3', 'admin', 'log_system_event',
+                          {'event_type': 'test', 'message': 'test'}, dependencies=['task2']))
+        
+        results = dag.execute_parallel()
+        
+        assert results['task1'].status == TaskStatus.FAILED
+        assert results['task2'].status == TaskStatus.CANCELLED
+        assert results['task3'].status == TaskStatus.CANCELLED
+    
+    def test_process_pool_executor(self):
+        """Test CPU-bound handlers on the process pool"""
+        dag = TaskOrchestrationDAG()
+        register_all_handlers(dag)
+        
+        for i in range(3):
+            dag.add_task(Task(f'transform{i}', 'data', 'transform_data',
+                              {'input_data': list(range(i + 1)), 'transformation': 'map'}))
+        
+        results = dag.execute_parallel(max_workers=2, executor='process')
+        
+        assert [results[f'transform{i}'].output['output_count'] for i in range(3)] == [1, 2, 3]
+    
+    def test_invalid_executor(self):
+        """Test unknown executor types are rejected"""
+        dag = TaskOrchestrationDAG()
+        with pytest.raises(ValueError):
+            dag.execute_parallel(executor='fiber')
@@ -18,7 +18,7 @@ from transaction_dag import (
     DAGTransactionProcessor,
     VectorizedTransactionProcessor
 )
-from multi_agent_sim import MultiAgentNexusSimulation
+from multi_agent_sim import MultiAgentNexusSimulation, NetworkTopology
 
 
 class TestTransactionNode:
@@ -120,7 +120,38 @@ class TestTransactionDAG:
         levels = dag.topological_sort()
         
         assert len(levels) <= 3
-    
+
+    def test_linear_builder_matches_pairwise_levels(self):
+        """Test last-writer builder gives the same levels as the all-pairs rule"""
+        rng = np.random.default_rng(0)
+        dag = TransactionDAG()
+        for _ in range(300):
+            source, target = rng.choice(40, 2, replace=False)
+            dag.add_transaction(int(source), int(target), lambda s, dt: 0.1)
+
+        dag.build_dependencies()
+        levels = dag.topological_sort()
+
+        expected_level = {}
+        for j, node_j in enumerate(dag.nodes):
+            deps = [i for i in range(j) if dag._has_dependency(dag.nodes[i], node_j)]
+            expected_level[j] = 1 + max((expected_level[i] for i in deps), default=-1)
+
+        actual_level = {tid: depth for depth, level in enumerate(levels) for tid in level}
+        assert actual_level == expected_level
+
+    def test_dependency_edges_are_linear(self):
+        """Test each transaction keeps at most two incoming dependency edges"""
+        dag = TransactionDAG()
+        for i in range(200):
+            dag.add_transaction(0, i + 1, lambda s, dt: 0.1)
+
+        dag.build_dependencies()
+
+        assert all(len(deps) <= 2 for deps in dag.dependencies.values())
+        assert sum(len(deps) for deps in dag.dependencies.values()) == 199
+        assert len(dag.topological_sort()) == 200
+
     def test_execution_plan(self):
         """Test execution plan generation"""
         dag = TransactionDAG()
@@ -257,6 +288,44 @@ class TestVectorizedTransactionProcessor:
         for i in range(3):
             assert abs(dag_result[i] - vec_result[i]) < 0.1
 
+    def test_sparse_matches_dense(self):
+        """Test sparse CSR mode gives the same states as dense mode"""
+        edges = list(NetworkTopology.small_world(200, k=4, p=0.3).edges()) + [(3, 3), (5, 4)]
+
+        dense = VectorizedTransactionProcessor(200, edges, transfer_rate=0.05, mode='dense')
+        sparse = VectorizedTransactionProcessor(200, edges, transfer_rate=0.05, mode='sparse')
+
+        states = np.random.default_rng(1).uniform(0, 100, 200)
+        np.testing.assert_allclose(
+            dense.execute_transfers(states, 0.5),
+            sparse.execute_transfers(states, 0.5)
+        )
+
+    def test_auto_mode_by_density(self):
+        """Test auto mode picks sparse for ring networks and dense for complete graphs"""
+        ring = list(NetworkTopology.ring(5000).edges())
+        complete = list(NetworkTopology.fully_connected(50).edges())
+
+        assert VectorizedTransactionProcessor(5000, ring, 0.01).mode == 'sparse'
+        assert VectorizedTransactionProcessor(50, complete, 0.01).mode == 'dense'
+
+    def test_array_in_array_out(self):
+        """Test arrays are accepted and returned without dict conversion"""
+        processor = VectorizedTransactionProcessor(3, [(0, 1), (1, 2)], 0.1, mode='sparse')
+
+        result = processor.execute_transfers(np.array([10.0, 5.0, 2.0]), 1.0)
+        expected = processor.execute_transfers({0: 10.0, 1: 5.0, 2: 2.0}, 1.0)
+
+        assert isinstance(result, np.ndarray)
+        assert list(result) == [expected[i] for i in range(3)]
+
+    def test_no_edges(self):
+        """Test processor with isolated agents leaves states unchanged"""
+        processor = VectorizedTransactionProcessor(4, [], 0.1)
+
+        states = np.array([1.0, 2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(processor.execute_transfers(states, 1.0), states)
+
 
 class TestMultiAgentIntegration:
     """Test integration with MultiAgentNexusSimulation"""
@@ -0,0 +1,112 @@
+"""
+Tests for WavelengthValidator interference
+
+Tests cover:
+1. Cached float32 path against the float64 wave-function reference
+2. Batch and single-pair patterns are identical
+3. Batched chain validation and tamper detection
+"""
+
+import dataclasses
+import numpy as np
+import pytest
+from wavelength_validator import (
+    WavelengthValidator, SpectralRegion, ModulationType, spatial_basis
+)
+
+
+def make_waves(validator, count):
+    regions = list(SpectralRegion)
+    return [
+        validator.create_message_wave(f"message {i}", regions[i % len(regions)], ModulationType.QPSK)
+        for i in range(count)
+    ]
+
+
+def reference_interference(validator, wave1, wave2):
+    """Original float64 evaluation"""
+    x = np.linspace(0, 10 * max(wave1.wavelength, wave2.wavelength), validator.grid_resolution)
+    E1 = validator.calculate_wave_function(wave1, x)
+    E2 = validator.calculate_wave_function(wave2, x)
+    E_total = E1 + E2
+    coherence = np.abs(np.mean(E1 * np.conj(E2))) / np.sqrt(np.mean(np.abs(E1) ** 2) * np.mean(np.abs(E2) ** 2))
+    return np.abs(E_total) ** 2, np.angle(E_total), coherence
+
+
+class TestInterference:
+    """Cached, vectorized interference patterns"""
+
+    def test_matches_float64_reference(self):
+        validator = WavelengthValidator()
+        waves = make_waves(validator, 40)
+        for wave1, wave2 in zip(waves, waves[1:]):
+            pattern = validator.compute_interference(wave1, wave2)
+            intensity, phase, coherence = reference_interference(validator, wave1, wave2)
+
+            assert pattern.intensity_distribution.dtype == np.float32
+            np.testing.assert_allclose(pattern.intensity_distribution, intensity, atol=1e-5)
+            phase_error = np.angle(np.exp(1j * (pattern.phase_distribution - phase)))
+            assert np.max(np.abs(phase_error)) < 1e-3
+            assert pattern.coherence_factor == pytest.approx(coherence, abs=1e-6)
+            assert pattern.max_intensity == pytest.approx(intensity.max(), abs=1e-5)
+
+    @pytest.mark.parametrize("resolution", [100, 256, 257])
+    def test_batch_matches_single(self, resolution):
+        validator = WavelengthValidator(grid_resolution=resolution)
+        waves = make_waves(validator, 60)
+        batch = validator.compute_interference_batch(waves[:-1], waves[1:])
+        for wave1, wave2, pattern in zip(waves, waves[1:], batch):
+            single = validator.compute_interference(wave1, wave2)
+            assert single.pattern_hash == pattern.pattern_hash
+            np.testing.assert_array_equal(single.intensity_distribution, pattern.intensity_distribution)
+
+    def test_hash_depends_on_every_wave_property(self):
+        validator = WavelengthValidator()
+        wave1, wave2 = make_waves(validator, 2)
+        base = validator.compute_interference(wave1, wave2).pattern_hash
+        for change in ({'amplitude': wave2.amplitude * 0.5}, {'phase': wave2.phase + 0.1},
+                       {'wavelength': wave2.wavelength * 1.01}):
+            altered = dataclasses.replace(wave2, **change)
+            assert validator.compute_interference(wave1, altered).pattern_hash != base
+
+    def test_basis_is_cached_and_read_only(self):
+        first = spatial_basis(500e-9, 700e-9, 256)
+        assert spatial_basis(500e-9, 700e-9, 256)[0] is first[0]
+        with pytest.raises(ValueError):
+            first[0][0] = 1.0
+
+    def test_mismatched_batch(self):
+        validator = WavelengthValidator()
+        waves = make_waves(validator, 3)
+        with pytest.raises(ValueError):
+            validator.compute_interference_batch(waves, waves[1:])
+        assert validator.compute_interference_batch([], []) == []
+
+
+class TestChainValidation:
+    """validate_message_chain_batch"""
+
+    def test_establish_then_verify(self):
+        validator = WavelengthValidator()
+        waves = make_waves(validator, 30)
+
+        established = validator.validate_message_chain_batch(waves)
+        assert len(established) == 29
+        assert all(is_valid for is_valid, _, _ in established)
+        hashes = [pattern.pattern_hash for _, pattern, _ in established]
+
+        waves[10] = dataclasses.replace(waves[10], amplitude=waves[10].amplitude * 0.9)
+        results = validator.validate_message_chain_batch(waves, hashes)
+        invalid = [i for i, (is_valid, _, _) in enumerate(results) if not is_valid]
+        assert invalid == [9, 10]
+        assert results[9][2].startswith("❌ TAMPERING DETECTED")
+
+        assert len(validator.validation_history) == 58
+        single = validator.validate_message_chain(waves[0], waves[1], hashes[0])
+        assert single[0] and single[1].pattern_hash == hashes[0]
+
+    def test_expected_hash_count(self):
+        validator = WavelengthValidator()
+        waves = make_waves(validator, 4)
+        with pytest.raises(ValueError):
+            validator.validate_message_chain_batch(waves, ['abc'])
@@ -0,0 +1,191 @@
+"""
+Tests for media node cache eviction
+
+Tests cover:
+1. Running byte counter and capacity bound under random churn
+2. LRU, LFU and energy-aware victim order against brute-force references
+3. Pinned crisis/refugee content and the refuse-when-full policy
+4. Engine wiring: per-node hit metrics, eviction bookkeeping, replica index
+"""
+
+import random
+import pytest
+from wnsp_media_propagation_production import (
+    EVICTION_POLICIES, MediaChunk, NodeCache, WNSPMediaPropagationProduction
+)
+from wnsp_unified_mesh_stack import create_demo_network
+
+
+KB = 1024
+
+
+def make_chunk(name, size=64 * KB, energy=1.0):
+    return MediaChunk(name, 'file', 0, 1, size, f"hash_{name}", 500.0, energy)
+
+
+def cache_of(num_chunks, policy, chunk_size=64 * KB):
+    return NodeCache('node', num_chunks * chunk_size / 1048576, eviction_policy=policy)
+
+
+class TestAccounting:
+    """Used bytes track the cached chunks exactly"""
+
+    @pytest.mark.parametrize("policy", sorted(EVICTION_POLICIES))
+    def test_random_churn(self, policy):
+        rng = random.Random(policy)
+        cache = NodeCache('node', 2.0, eviction_policy=policy)
+        chunks = [make_chunk(f"c{i}", rng.randrange(1, 300) * KB, rng.random()) for i in range(200)]
+        for _ in range(3000):
+            chunk = rng.choice(chunks)
+            action = rng.randrange(4)
+            if action == 0:
+                cache.remove_chunk(chunk.content_hash)
+            elif action == 1:
+                cache.lookup(chunk.content_hash)
+            else:
+                cache.add_chunk(chunk, pinned=rng.random() < 0.02)
+            used = sum(c.data_size for c in cache.chunks_cached.values())
+            assert cache.used_capacity_mb == used / 1048576
+            assert cache.used_capacity_mb <= cache.cache_capacity_mb
+            assert cache.pinned_capacity_mb == sum(cache.chunks_cached[k].data_size for k in cache.pinned) / 1048576
+        assert cache.hits + cache.misses > 0
+        if policy != 'none':
+            assert cache.evictions > 0
+
+    def test_oversized_chunk_is_refused_without_evicting(self):
+        cache = cache_of(4, 'lru')
+        for i in range(4):
+            cache.add_chunk(make_chunk(f"c{i}"))
+        assert not cache.add_chunk(make_chunk('big', 5 * 64 * KB))
+        assert len(cache.chunks_cached) == 4 and cache.evictions == 0
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            NodeCache('node', 1.0, eviction_policy='fifo')
+
+
+class TestPolicies:
+    """Victim order for each policy"""
+
+    def test_lru(self):
+        cache = cache_of(3, 'lru')
+        for name in 'abc':
+            cache.add_chunk(make_chunk(name))
+        cache.lookup('hash_a')
+        cache.add_chunk(make_chunk('d'))
+        assert set(cache.chunks_cached) == {'hash_a', 'hash_c', 'hash_d'}
+
+    def test_lfu_matches_reference(self):
+        rng = random.Random(3)
+        cache = cache_of(8, 'lfu')
+        uses, last_used, clock = {}, {}, 0
+        for _ in range(2000):
+            clock += 1
+            name = f"c{rng.randrange(20)}"
+            key = f"hash_{name}"
+            if rng.random() < 0.1:
+                cache.remove_chunk(key)
+                uses.pop(key, None)
+                continue
+            if cache.lookup(key) is not None:
+                uses[key] += 1
+                last_used[key] = clock
+                continue
+            expected = None
+            if len(uses) == 8:
+                expected = min(uses, key=lambda k: (uses[k], last_used[k]))
+                del uses[expected]
+            before = set(cache.chunks_cached)
+            assert cache.add_chunk(make_chunk(name))
+            assert before - set(cache.chunks_cached) == ({expected} if expected else set())
+            uses[key], last_used[key] = 1, clock
+
+    def test_energy_aware_keeps_costly_and_popular_chunks(self):
+        cache = cache_of(3, 'energy')
+        cache.add_chunk(make_chunk('uv', energy=3.0))
+        cache.add_chunk(make_chunk('ir', energy=1.0))
+        cache.add_chunk(make_chunk('ir_hot', energy=1.0))
+        for _ in range(5):
+            cache.lookup('hash_ir_hot')
+        cache.add_chunk(make_chunk('new', energy=1.0))
+        assert 'hash_ir' not in cache.chunks_cached
+        assert {'hash_uv', 'hash_ir_hot', 'hash_new'} <= set(cache.chunks_cached)
+
+    def test_energy_aware_ages_out_stale_favourites(self):
+        cache = cache_of(2, 'energy')
+        cache.add_chunk(make_chunk('old_hot'))
+        for _ in range(3):
+            cache.lookup('hash_old_hot')
+        # A stream of one-hit chunks raises the age until the stale favourite goes
+        for i in range(10):
+            cache.add_chunk(make_chunk(f"s{i}"))
+            cache.lookup(f"hash_s{i}")
+        assert 'hash_old_hot' not in cache.chunks_cached
+
+
+class TestPinning:
+    """Pinned chunks are never evicted"""
+
+    def test_pinned_survive_and_fill(self):
+        cache = cache_of(3, 'lru')
+        cache.add_chunk(make_chunk('p1'), pinned=True)
+        cache.add_chunk(make_chunk('a'))
+        cache.add_chunk(make_chunk('a'), pinned=True)  # re-adding pins
+        cache.add_chunk(make_chunk('b'))
+        cache.add_chunk(make_chunk('c'))
+        assert set(cache.chunks_cached) == {'hash_p1', 'hash_a', 'hash_c'}
+
+        cache.add_chunk(make_chunk('p2'), pinned=True)
+        assert not cache.add_chunk(make_chunk('d'))
+        assert cache.remove_chunk('hash_p2') is not None
+        assert cache.add_chunk(make_chunk('d'))
+
+    def test_none_policy_refuses_when_full(self):
+        cache = cache_of(2, 'none')
+        assert cache.add_chunk(make_chunk('a')) and cache.add_chunk(make_chunk('b'))
+        assert not cache.add_chunk(make_chunk('c'))
+        assert cache.evictions == 0
+
+
+class TestEngine:
+    """Eviction inside the propagation engine"""
+
+    def engine_with_small_phone(self, capacity_mb=0.25, policy='lru'):
+        stack = create_demo_network()
+        stack.layer1_mesh_isp.nodes['student_phone_003'].cache_capacity_mb = capacity_mb
+        return WNSPMediaPropagationProduction(stack, eviction_policy=policy)
+
+    def test_hot_content_keeps_being_served(self):
+        engine = self.engine_with_small_phone()
+        hot = engine.add_media_file('hot.mp3', 'mp3', 128 * KB, 'Hot', 'university', source_node_id='dorm_cache')
+        for i in range(6):
+            engine.propagate_file_to_node(hot.file_id, 'student_phone_003')
+            cold = engine.add_media_file(f"cold{i}.mp3", 'mp3', 64 * KB, 'Cold', 'university',
+                                         source_node_id='dorm_cache')
+            assert engine.propagate_file_to_node(cold.file_id, 'student_phone_003')['success']
+
+        status = engine.get_node_cache_status('student_phone_003')
+        assert status['evictions'] == 4  # four slots: hot file plus two cold files
+        assert status['cache_hits'] == 10 and status['cache_misses'] == 8
+        assert status['hit_ratio'] == round(10 / 18, 3)
+        assert status['used_capacity_mb'] <= 0.25
+        assert hot.get_download_progress('student_phone_003') == 100
+
+        cache = engine.node_caches['student_phone_003']
+        for media in engine.media_library.values():
+            for chunk in media.chunks:
+                cached = chunk.content_hash in cache.chunks_cached
+                assert ('student_phone_003' in chunk.nodes_with_chunk) == cached
+                nearest = engine.replica_index.nearest(chunk.content_hash, 'student_phone_003')
+                assert (nearest == 'student_phone_003') == cached
+
+    def test_crisis_content_is_pinned(self):
+        engine = self.engine_with_small_phone(capacity_mb=0.125)
+        alert = engine.add_media_file('alert.pdf', 'pdf', 64 * KB, 'Evacuation', 'crisis', source_node_id='dorm_cache')
+        assert engine.propagate_file_to_node(alert.file_id, 'student_phone_003')['success']
+        other = engine.add_media_file('song.mp3', 'mp3', 128 * KB, 'Song', 'university', source_node_id='dorm_cache')
+        # One free slot: the song's second chunk evicts its first, never the alert
+        assert engine.propagate_file_to_node(other.file_id, 'student_phone_003')['success']
+        assert other.get_download_progress('student_phone_003') == 50
+        assert alert.get_download_progress('student_phone_003') == 100
+        assert engine.get_node_cache_status('student_phone_003')['pinned_capacity_mb'] == 0.06
@@ -0,0 +1,177 @@
+"""
+Tests for WNSP media range streaming
+
+Tests cover:
+1. Range header parsing (open-ended, suffix, multi-range, unsatisfiable)
+2. Memory-mapped file cache (LRU bound, re-open on change)
+3. /media/<id>/stream responses: full, single range, multi-range, 416,
+   If-Range and conditional GET
+"""
+
+import os
+import re
+import pytest
+from wnsp_media_file_manager import (
+    MediaFile, OpenFileCache, parse_byte_ranges, STREAM_SLICE_SIZE
+)
+from wnsp_media_server import app, media_manager
+
+
+CONTENT = bytes(range(256)) * 1024 + b"tail"
+
+
+@pytest.fixture
+def media(tmp_path, monkeypatch):
+    path = tmp_path / 'lecture.mp4'
+    path.write_bytes(CONTENT)
+    media_file = MediaFile(
+        file_id='test_media', filename=path.name, filepath=str(path), file_type='video',
+        mime_type='video/mp4', file_size=len(CONTENT), content_hash='', chunks=[],
+        category='university', title='Lecture', artist='Unknown', description='', duration='Unknown'
+    )
+    monkeypatch.setitem(media_manager.media_library, 'test_media', media_file)
+    yield path
+    media_manager.open_files.discard(str(path))
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+class TestParseByteRanges:
+    """Range header parsing"""
+
+    @pytest.mark.parametrize("header,expected", [
+        ("bytes=0-99", [(0, 99)]),
+        ("bytes=900-", [(900, 999)]),
+        ("bytes=-100", [(900, 999)]),
+        ("bytes=-5000", [(0, 999)]),
+        ("bytes=500-5000", [(500, 999)]),
+        ("bytes=0-0, 10-19,-1", [(0, 0), (10, 19), (999, 999)]),
+        ("bytes=1000-", []),
+        ("bytes=2000-3000, 5-6", [(5, 6)]),
+    ])
+    def test_valid(self, header, expected):
+        assert parse_byte_ranges(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", [
+        None, "", "items=0-1", "bytes=", "bytes=5", "bytes=a-b", "bytes=10-5",
+        "bytes=" + ",".join(["0-1"] * 17),
+    ])
+    def test_ignored(self, header):
+        assert parse_byte_ranges(header, 1000) is None
+
+
+class TestOpenFileCache:
+    """Memory-mapped file LRU"""
+
+    def test_lru_bound_and_reuse(self, tmp_path):
+        cache = OpenFileCache(capacity=2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"f{i}"
+            path.write_bytes(b"x" * (i + 1))
+            paths.append(str(path))
+
+        first = cache.open(paths[0])
+        assert cache.open(paths[0]) is first
+        cache.open(paths[1])
+        cache.open(paths[2])
+        assert len(cache) == 2
+        assert cache.open(paths[0]) is not first
+        # An evicted mapping stays readable for responses still holding it
+        assert b"".join(first.iter_range(0, 0)) == b"x"
+
+    def test_reopens_changed_file(self, tmp_path):
+        cache = OpenFileCache()
+        path = tmp_path / "f"
+        path.write_bytes(b"old")
+        old = cache.open(str(path))
+        path.write_bytes(b"newer")
+        os.utime(path, ns=(old.mtime_ns + 10 ** 9, old.mtime_ns + 10 ** 9))
+
+        new = cache.open(str(path))
+        assert new.size == 5 and new.etag != old.etag
+        assert b"".join(new.iter_range(0, 4)) == b"newer"
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        source = OpenFileCache().open(str(path))
+        assert source.size == 0 and source.mapping is None
+        assert list(source.iter_range(0, -1)) == []
+
+    def test_slices_are_bounded(self, media):
+        source = OpenFileCache().open(str(media))
+        slices = list(source.iter_range(10, len(CONTENT) - 1))
+        assert max(len(s) for s in slices) == STREAM_SLICE_SIZE
+        assert b"".join(slices) == CONTENT[10:]
+
+
+class TestStreamMedia:
+    """HTTP responses"""
+
+    def test_full_file(self, media, client):
+        response = client.get('/media/test_media/stream', buffered=False)
+        assert response.is_streamed
+        assert response.status_code == 200
+        assert response.headers['Content-Length'] == str(len(CONTENT))
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert response.headers['ETag'] and response.headers['Last-Modified']
+        pieces = list(response.iter_encoded())
+        assert max(len(p) for p in pieces) <= STREAM_SLICE_SIZE
+        assert b''.join(pieces) == CONTENT
+
+    def test_single_range(self, media, client):
+        response = client.get('/media/test_media/stream', headers={'Range': 'bytes=100-199'})
+        assert response.status_code == 206
+        assert response.data == CONTENT[100:200]
+        assert response.headers['Content-Range'] == f'bytes 100-199/{len(CONTENT)}'
+        assert response.headers['Content-Length'] == '100'
+
+        response = client.get('/media/test_media/stream', headers={'Range': 'bytes=-4'})
+        assert response.data == b"tail"
+
+    def test_multi_range(self, media, client):
+        response = client.get('/media/test_media/stream', headers={'Range': 'bytes=0-9, 70000-70100'})
+        assert response.status_code == 206
+        boundary = re.search(r'boundary=(\w+)', response.headers['Content-Type']).group(1)
+        assert response.headers['Content-Type'].startswith('multipart/byteranges')
+        assert int(response.headers['Content-Length']) == len(response.data)
+
+        parts = response.data.split(f'--{boundary}'.encode())[1:-1]
+        bodies = [part.split(b'\r\n\r\n', 1) for part in parts]
+        assert b'Content-Range: bytes 0-9/' in bodies[0][0]
+        assert bodies[0][1] == CONTENT[0:10] + b'\r\n'
+        assert bodies[1][1] == CONTENT[70000:70101] + b'\r\n'
+        assert response.data.endswith(f'--{boundary}--\r\n'.encode())
+
+    def test_unsatisfiable(self, media, client):
+        response = client.get('/media/test_media/stream', headers={'Range': f'bytes={len(CONTENT)}-'})
+        assert response.status_code == 416
+        assert response.headers['Content-Range'] == f'bytes */{len(CONTENT)}'
+
+    def test_conditional_get(self, media, client):
+        etag = client.get('/media/test_media/stream').headers['ETag']
+
+        response = client.get('/media/test_media/stream', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        last_modified = client.get('/media/test_media/stream').headers['Last-Modified']
+        response = client.get('/media/test_media/stream', headers={'If-Modified-Since': last_modified})
+        assert response.status_code == 304
+
+    def test_if_range(self, media, client):
+        etag = client.get('/media/test_media/stream').headers['ETag']
+
+        response = client.get('/media/test_media/stream', headers={'Range': 'bytes=0-9', 'If-Range': etag})
+        assert response.status_code == 206
+
+        response = client.get('/media/test_media/stream', headers={'Range': 'bytes=0-9', 'If-Range': '"stale"'})
+        assert response.status_code == 200
+        assert response.data == CONTENT
+
+    def test_unknown_media(self, client):
+        assert client.get('/media/missing/stream').status_code == 404
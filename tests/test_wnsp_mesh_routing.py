@@ -0,0 +1,315 @@
+"""
+Tests for the shared mesh routing table
+
+Tests cover:
+1. Hop-count and link-quality routes match networkx under link and node churn
+2. Cached trees survive topology changes that cannot affect them
+3. Unified mesh stack routing, nearest knowledge cache and media propagation paths
+4. Nearest-replica labels against a BFS reference under holder and topology churn
+"""
+
+import random
+import numpy as np
+import networkx as nx
+import pytest
+from wnsp_mesh_routing import MeshRoutingTable, NearestReplicaIndex
+from wnsp_unified_mesh_stack import (
+    create_demo_network, MeshNode, NodeType, TransportProtocol, WavelengthAddress
+)
+from wnsp_media_propagation_production import WNSPMediaPropagationProduction
+
+
+def random_mesh(num_nodes=60, num_links=120, seed=0):
+    """Routing table and matching networkx graph (weight = 1 / quality)"""
+    rng = random.Random(seed)
+    table, graph = MeshRoutingTable(), nx.Graph()
+    for i in range(num_nodes):
+        table.add_node(f"n{i}", f"hash{i}")
+        graph.add_node(f"n{i}")
+    for _ in range(num_links):
+        add_random_link(table, graph, rng, num_nodes)
+    return table, graph, rng
+
+
+def add_random_link(table, graph, rng, num_nodes):
+    a, b = rng.sample([n for n in graph.nodes], 2)
+    quality = rng.uniform(0.05, 1.0)
+    table.add_link(a, b, quality)
+    weight = 1.0 / quality
+    if not graph.has_edge(a, b) or graph[a][b]['weight'] > weight:
+        graph.add_edge(a, b, weight=weight)
+
+
+def assert_routes_match(table, graph, sources):
+    for source in sources:
+        hops = nx.single_source_shortest_path_length(graph, source)
+        costs = nx.single_source_dijkstra_path_length(graph, source)
+        for target in graph.nodes:
+            path = table.shortest_path(source, target)
+            weighted = table.shortest_path(source, target, weighted=True)
+            if target not in hops:
+                assert path == [] and weighted == []
+                assert table.next_hop(source, target) is None
+                continue
+            assert len(path) - 1 == hops[target]
+            assert path[0] == source and path[-1] == target
+            assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+            assert sum(graph[u][v]['weight'] for u, v in zip(weighted, weighted[1:])) == pytest.approx(costs[target])
+            if target != source:
+                assert table.next_hop(source, target) == path[1]
+
+
+class TestRoutes:
+    """Shortest paths against networkx"""
+
+    def test_static_topology(self):
+        table, graph, _ = random_mesh()
+        assert_routes_match(table, graph, list(graph.nodes)[:20])
+
+    def test_churn(self):
+        table, graph, rng = random_mesh(seed=1)
+        sources = list(graph.nodes)[:15]
+        next_id = 60
+        for step in range(40):
+            assert_routes_match(table, graph, sources)
+            action = rng.randrange(4)
+            if action == 0:
+                add_random_link(table, graph, rng, len(graph))
+            elif action == 1 and graph.number_of_edges():
+                a, b = rng.choice(list(graph.edges))
+                assert table.remove_link(a, b)
+                graph.remove_edge(a, b)
+            elif action == 2:
+                victim = rng.choice([n for n in graph.nodes if n not in sources])
+                assert table.remove_node(victim)
+                graph.remove_node(victim)
+            else:
+                table.add_node(f"n{next_id}", f"hash{next_id}")
+                graph.add_node(f"n{next_id}")
+                next_id += 1
+                add_random_link(table, graph, rng, len(graph))
+        assert table.stats['tree_hits'] > table.stats['tree_builds']
+
+    def test_unknown_and_trivial_routes(self):
+        table = MeshRoutingTable()
+        table.add_node('a', 'ha')
+        assert table.shortest_path('a', 'a') == ['a']
+        assert table.shortest_path('a', 'missing') == []
+        assert table.shortest_path('missing', 'a') == []
+        assert table.resolve('ha') == 'a'
+        assert table.resolve('nope') is None
+
+
+class TestInvalidation:
+    """Trees are only rebuilt when a change can affect them"""
+
+    def line(self, length=6):
+        table = MeshRoutingTable()
+        for i in range(length):
+            table.add_node(f"n{i}")
+        for i in range(length - 1):
+            table.add_link(f"n{i}", f"n{i + 1}")
+        return table
+
+    def test_link_between_equal_depths_keeps_tree(self):
+        table = self.line()
+        table.add_node('side')
+        table.add_link('n2', 'side')
+        table.tree('n0')
+        table.add_link('n3', 'side')  # side: 3 hops, n3: 3 hops
+        assert table.stats['trees_invalidated'] == 0
+
+        table.add_link('n0', 'n5')  # shortcut
+        assert table.stats['trees_invalidated'] == 1
+        assert table.shortest_path('n0', 'n5') == ['n0', 'n5']
+
+    def test_removing_leaf_or_unused_link_keeps_tree(self):
+        table = self.line()
+        table.add_link('n1', 'n3')
+        table.tree('n0')
+        builds = table.stats['tree_builds']
+
+        assert table.remove_link('n2', 'n3')  # not on the tree
+        assert table.remove_node('n5')  # leaf
+        assert table.shortest_path('n0', 'n4') == ['n0', 'n1', 'n3', 'n4']
+        assert table.shortest_path('n0', 'n5') == []
+        assert table.stats['tree_builds'] == builds
+
+        assert table.remove_node('n3')
+        assert table.shortest_path('n0', 'n4') == []
+        assert table.stats['tree_builds'] == builds + 1
+
+    def test_lru_bound(self):
+        table = MeshRoutingTable(max_cached_trees=3)
+        table.add_node('a')
+        table.add_node('b')
+        table.add_link('a', 'b')
+        for source in ['a', 'b']:
+            table.tree(source)
+            table.tree(source, weighted=True)
+        assert len(table._trees) == 3
+
+
+class TestMeshStack:
+    """Routing wired into the unified mesh stack and media propagation"""
+
+    def test_wavelength_route_and_nearest_cache(self):
+        stack = create_demo_network()
+        nodes = stack.layer1_mesh_isp.nodes
+        route = stack.layer2_routing.compute_wavelength_route(
+            nodes['student_phone_001'].wavelength_addr, nodes['campus_gateway'].wavelength_addr)
+        assert route[0] == 'student_phone_001' and route[-1] == 'campus_gateway'
+        assert len(route) == 4
+
+        # LoRa relay->gateway link is poor; quality routing detours via dorm_cache
+        weighted = stack.layer2_routing.compute_wavelength_route(
+            nodes['library_relay'].wavelength_addr, nodes['campus_gateway'].wavelength_addr, weighted=True)
+        assert weighted == ['library_relay', 'dorm_cache', 'campus_gateway']
+
+        knowledge = stack.layer4_knowledge
+        assert knowledge.find_nearest_cache('wiki_physics', 'student_phone_003') == 'dorm_cache'
+        assert knowledge.find_nearest_cache('wiki_physics', 'campus_gateway') == 'campus_gateway'
+        assert knowledge.find_nearest_cache('wiki_history', 'student_phone_003') is None
+        assert knowledge.find_nearest_cache('unknown', 'student_phone_003') is None
+
+    def test_node_churn_reroutes(self):
+        stack = create_demo_network()
+        mesh = stack.layer1_mesh_isp
+        addr = {n: node.wavelength_addr for n, node in mesh.nodes.items()}
+        assert len(stack.layer2_routing.compute_wavelength_route(addr['student_phone_001'], addr['dorm_cache'])) == 4
+
+        assert mesh.remove_node('library_relay')
+        assert 'library_relay' not in mesh.topology_graph['student_phone_002']
+        assert stack.layer2_routing.compute_wavelength_route(addr['student_phone_001'], addr['dorm_cache']) == []
+        assert stack.layer4_knowledge.find_nearest_cache('wiki_physics', 'student_phone_001') is None
+
+        mesh.create_link('student_phone_002', 'campus_gateway', TransportProtocol.WIFI, -50, 10, 5000)
+        assert stack.layer2_routing.compute_wavelength_route(addr['student_phone_001'], addr['dorm_cache']) == \
+            ['student_phone_001', 'student_phone_002', 'campus_gateway', 'dorm_cache']
+        assert stack.layer4_knowledge.find_nearest_cache('wiki_physics', 'student_phone_001') == 'campus_gateway'
+
+        assert mesh.remove_link('campus_gateway', 'student_phone_002') == 1
+        assert stack.layer2_routing.compute_wavelength_route(addr['student_phone_001'], addr['dorm_cache']) == []
+
+    def test_rejoining_node_starts_without_links(self):
+        stack = create_demo_network()
+        mesh = stack.layer1_mesh_isp
+        old = mesh.nodes['dorm_cache']
+        signature = np.full(8, 0.125)
+        mesh.add_node(MeshNode('dorm_cache', NodeType.CACHE, WavelengthAddress(signature, 'fresh', 'dorm_cache'),
+                               [TransportProtocol.WIFI], set(), 50000, 0.0))
+        assert mesh.topology_graph['dorm_cache'] == set()
+        assert 'dorm_cache' not in mesh.topology_graph['library_relay']
+        assert mesh.routing.resolve('fresh') == 'dorm_cache'
+        assert mesh.routing.resolve(old.wavelength_addr.quantum_hash) is None
+
+    def test_media_propagation_path(self):
+        stack = create_demo_network()
+        engine = WNSPMediaPropagationProduction(stack)
+        assert engine._compute_propagation_path('student_phone_001', 'campus_gateway') == \
+            stack.layer1_mesh_isp.routing.shortest_path('student_phone_001', 'campus_gateway')
+        assert len(engine._compute_propagation_path('student_phone_001', 'campus_gateway')) == 4
+        assert engine._compute_propagation_path('student_phone_001', 'nowhere') == []
+
+
+def assert_nearest_match(index, graph, key, holders):
+    lengths = {h: nx.single_source_shortest_path_length(graph, h) for h in holders}
+    for node in graph.nodes:
+        reachable = [lengths[h][node] for h in holders if node in lengths[h]]
+        if not reachable:
+            assert index.nearest(key, node) is None
+            continue
+        nearest = index.nearest(key, node)
+        assert index.distance(key, node) == min(reachable)
+        assert lengths[nearest][node] == min(reachable)
+
+
+class TestReplicaIndex:
+    """Closest holder per content key"""
+
+    def test_incremental_holders_and_churn(self):
+        table, graph, rng = random_mesh(num_links=90, seed=2)
+        index = NearestReplicaIndex(table)
+        holders = []
+        for step in range(60):
+            action = rng.randrange(5)
+            if action < 2 or not holders:
+                node = rng.choice(list(graph.nodes))
+                index.add_holder('chunk', node)
+                if node not in holders:
+                    holders.append(node)
+            elif action == 2:
+                node = rng.choice(holders)
+                index.remove_holder('chunk', node)
+                holders.remove(node)
+            elif action == 3:
+                add_random_link(table, graph, rng, len(graph))
+            elif graph.number_of_edges():
+                a, b = rng.choice(list(graph.edges))
+                table.remove_link(a, b)
+                graph.remove_edge(a, b)
+            assert_nearest_match(index, graph, 'chunk', holders)
+        assert index.stats['incremental_updates'] > 0
+
+    def test_added_holder_updates_labels_in_place(self):
+        table = TestInvalidation().line(8)
+        index = NearestReplicaIndex(table)
+        index.add_holder('k', 'n0')
+        assert index.nearest('k', 'n7') == 'n0'
+        index.add_holder('k', 'n7')
+        assert index.nearest('k', 'n5') == 'n7' and index.nearest('k', 'n3') == 'n0'
+        assert index.stats['label_builds'] == 1
+        assert index.stats['incremental_updates'] == 1
+
+        table.remove_node('n7')
+        assert index.nearest('k', 'n5') == 'n0'
+        assert index.nearest('k', 'n7') is None
+        assert index.stats['label_builds'] == 2
+
+        index.remove_holder('k', 'n0')
+        assert index.nearest('k', 'n1') is None
+
+        # A holder that rejoins the mesh still has its copy
+        table.add_node('n7')
+        table.add_link('n6', 'n7')
+        assert index.nearest('k', 'n1') == 'n7'
+        index.remove_holder('k', 'n7')
+        assert 'k' not in index.holders
+
+    def test_label_lru_bound(self):
+        table = TestInvalidation().line(4)
+        index = NearestReplicaIndex(table, max_labels=2)
+        for key in ['a', 'b', 'c']:
+            index.add_holder(key, 'n0')
+            index.nearest(key, 'n3')
+        assert list(index._labels) == ['b', 'c']
+        assert index.nearest('a', 'n3') == 'n0'
+
+
+class TestMediaReplicas:
+    """Media propagation pulls each chunk from its closest holder"""
+
+    def test_closest_holder_and_striped_sources(self):
+        stack = create_demo_network()
+        engine = WNSPMediaPropagationProduction(stack)
+        media = engine.add_media_file('lecture.mp4', 'mp4', 4_000_000, 'Lecture', 'university',
+                                      source_node_id='student_phone_001')
+        for chunk in media.chunks[::2]:
+            assert engine.node_caches['dorm_cache'].add_chunk(chunk)
+
+        # student_phone_003 -> dorm_cache is 2 hops, -> student_phone_001 is 3
+        assert engine._find_closest_source_node(media.chunks[0], 'student_phone_003') == 'dorm_cache'
+        assert engine._find_closest_source_node(media.chunks[1], 'student_phone_003') == 'student_phone_001'
+
+        result = engine.propagate_file_to_node(media.file_id, 'student_phone_003')
+        assert result['success']
+        assert result['sources'] == {'dorm_cache': len(media.chunks[::2]), 'student_phone_001': len(media.chunks[1::2])}
+
+    def test_removed_chunks_leave_the_index(self):
+        stack = create_demo_network()
+        engine = WNSPMediaPropagationProduction(stack)
+        media = engine.add_media_file('notes.pdf', 'pdf', 300_000, 'Notes', 'university', source_node_id='dorm_cache')
+        chunk = media.chunks[0]
+        assert engine.replica_index.nearest(chunk.content_hash, 'student_phone_001') == 'dorm_cache'
+        assert engine.remove_media_file(media.file_id)
+        assert engine.replica_index.nearest(chunk.content_hash, 'student_phone_001') is None
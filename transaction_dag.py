@@ -19,6 +19,7 @@ Performance Benefits:
 
 from typing import Dict, List, Set, Tuple
 import numpy as np
+from scipy import sparse
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
@@ -88,15 +89,23 @@ class TransactionDAG:
         - T1 writes to an agent that T2 reads from
         
         For bidirectional transfers (A↔B), we need to ensure consistency.
+        
+        Every transfer reads and writes both of its endpoints, so all
+        transactions touching an agent form a chain in transaction order.
+        Tracking the last writer per agent adds only the chain edges (at most
+        two per transaction) in O(n) time; the remaining dependencies are
+        implied transitively and give the same topological levels.
         """
-        for i, node_i in enumerate(self.nodes):
-            for j, node_j in enumerate(self.nodes):
-                if i == j:
-                    continue
-                
-                if self._has_dependency(node_i, node_j):
-                    self.dependencies[j].add(i)
-                    self.reverse_dependencies[i].add(j)
+        last_writer: Dict[int, int] = {}
+        
+        for node in self.nodes:
+            tid = node.transaction_id
+            for agent in (node.source, node.target):
+                previous = last_writer.get(agent)
+                if previous is not None and previous != tid:
+                    self.dependencies[tid].add(previous)
+                    self.reverse_dependencies[previous].add(tid)
+                last_writer[agent] = tid
     
     def _has_dependency(self, t1: TransactionNode, t2: TransactionNode) -> bool:
         """
@@ -259,9 +268,19 @@ class VectorizedTransactionProcessor:
     
     Best for dense networks with many agents where transfers can be
     represented as matrix operations.
+    
+    Execution modes:
+    - 'dense': num_agents × num_agents adjacency matrix and outer state difference
+    - 'sparse': CSR adjacency; net transfers are a Laplacian matvec, O(N + E)
+    - 'auto': dense only for small, dense graphs, sparse otherwise
     """
     
-    def __init__(self, num_agents: int, network_edges: List[Tuple[int, int]], transfer_rate: float):
+    # Auto mode picks dense execution only below both limits
+    DENSE_MAX_AGENTS = 2000
+    DENSE_MIN_DENSITY = 0.1
+    
+    def __init__(self, num_agents: int, network_edges: List[Tuple[int, int]], transfer_rate: float,
+                 mode: str = 'auto'):
         """
         Initialize vectorized processor
         
@@ -269,34 +288,82 @@ class VectorizedTransactionProcessor:
             num_agents: Total number of agents
             network_edges: List of (source, target) tuples
             transfer_rate: Transfer rate coefficient
+            mode: 'dense', 'sparse' or 'auto' (choose by graph density)
         """
+        if mode not in ('auto', 'dense', 'sparse'):
+            raise ValueError(f"Unknown execution mode: {mode}")
+        
         self.num_agents = num_agents
         self.transfer_rate = transfer_rate
         
-        self.adjacency_matrix = np.zeros((num_agents, num_agents))
-        for source, target in network_edges:
-            self.adjacency_matrix[source, target] = 1
-            self.adjacency_matrix[target, source] = 1
+        edges = np.asarray(network_edges, dtype=np.int64).reshape(-1, 2)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        # Undirected, de-duplicated edge list (u < v)
+        edges = np.unique(np.sort(edges, axis=1), axis=0)
+        
+        max_edges = num_agents * (num_agents - 1) / 2
+        self.density = len(edges) / max_edges if max_edges > 0 else 0.0
+        
+        if mode == 'auto':
+            dense = (num_agents <= self.DENSE_MAX_AGENTS and
+                     self.density >= self.DENSE_MIN_DENSITY)
+            mode = 'dense' if dense else 'sparse'
+        self.mode = mode
+        
+        if self.mode == 'dense':
+            self.adjacency_matrix = np.zeros((num_agents, num_agents))
+            self.adjacency_matrix[edges[:, 0], edges[:, 1]] = 1
+            self.adjacency_matrix[edges[:, 1], edges[:, 0]] = 1
+        else:
+            rows = np.concatenate([edges[:, 0], edges[:, 1]])
+            cols = np.concatenate([edges[:, 1], edges[:, 0]])
+            self.adjacency_matrix = sparse.csr_matrix(
+                (np.ones(len(rows)), (rows, cols)), shape=(num_agents, num_agents)
+            )
+            self.degrees = np.asarray(self.adjacency_matrix.sum(axis=1)).ravel()
     
-    def execute_transfers(self, agent_states: Dict[int, float], delta_t: float) -> Dict[int, float]:
+    def execute_transfers_array(self, states: np.ndarray, delta_t: float) -> np.ndarray:
         """
-        Execute transfers using vectorized operations
+        Execute transfers on a state vector indexed by agent ID
         
         Args:
-            agent_states: Current agent states
+            states: Array of agent states, shape (num_agents,)
             delta_t: Time step
             
         Returns:
-            Updated agent states
+            New array of updated agent states
         """
-        states_array = np.array([agent_states[i] for i in range(self.num_agents)])
+        states_array = np.asarray(states, dtype=float)
+        
+        if self.mode == 'dense':
+            state_diff = states_array[:, np.newaxis] - states_array[np.newaxis, :]
+            
+            transfer_matrix = self.adjacency_matrix * state_diff * self.transfer_rate * delta_t
+            
+            net_transfers = np.sum(transfer_matrix, axis=1)
+        else:
+            # sum_j A_ij (s_i - s_j) = deg_i * s_i - (A @ s)_i
+            net_transfers = (self.degrees * states_array - self.adjacency_matrix @ states_array)
+            net_transfers *= self.transfer_rate * delta_t
         
-        state_diff = states_array[:, np.newaxis] - states_array[np.newaxis, :]
+        return np.maximum(0, states_array - net_transfers)
+    
+    def execute_transfers(self, agent_states, delta_t: float):
+        """
+        Execute transfers using vectorized operations
         
-        transfer_matrix = self.adjacency_matrix * state_diff * self.transfer_rate * delta_t
+        Args:
+            agent_states: Current agent states, as {agent_id: N_value} or an array
+            delta_t: Time step
+            
+        Returns:
+            Updated agent states, in the same form as agent_states
+        """
+        if isinstance(agent_states, np.ndarray):
+            return self.execute_transfers_array(agent_states, delta_t)
         
-        net_transfers = np.sum(transfer_matrix, axis=1)
+        states_array = np.array([agent_states[i] for i in range(self.num_agents)])
         
-        new_states_array = np.maximum(0, states_array - net_transfers)
+        new_states_array = self.execute_transfers_array(states_array, delta_t)
         
         return {i: new_states_array[i] for i in range(self.num_agents)}
@@ -4,11 +4,19 @@ Revolutionary cryptographic validation using electromagnetic wave theory instead
 
 Security foundation: Maxwell's equations, wave interference, quantum energy principles
 Economic model: Message costs based on actual quantum energy (E = hf)
+
+Interference is evaluated on a grid spanning ten of the longer wavelength, so
+each wave's spatial factor exp(ikx) depends only on its wavelength and that
+span. These factors are cached and shared by every message pair; a wave's
+amplitude and phase only scale them. Batches of pairs are evaluated as
+(pairs x grid) float32 arrays.
 """
 
 import numpy as np
 import hashlib
-from typing import Dict, List, Tuple, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Sequence
 from dataclasses import dataclass
 from enum import Enum
 import json
@@ -19,6 +27,9 @@ SPEED_OF_LIGHT = 299792458  # m/s
 PLANCK_CONSTANT = 6.62607015e-34  # J·s
 JOULES_PER_NXT = 1e-18  # Conversion factor: 1 NXT = 10^18 Joules (for economic scaling)
 
+BASIS_CACHE_SIZE = 1024  # Cached spatial factors (one per wavelength/grid span/resolution)
+BATCH_CHUNK_SIZE = 4096  # Message pairs evaluated per vectorized block
+
 
 class SpectralRegion(Enum):
     """Electromagnetic spectrum regions for message classification"""
@@ -118,6 +129,37 @@ class InterferencePattern:
         return correlation >= (1.0 - tolerance)
 
 
+_basis_cache: "OrderedDict[Tuple[float, float, int], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+_basis_cache_lock = threading.Lock()
+
+
+def spatial_basis(wavelength: float, span_wavelength: float, resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    cos(kx) and sin(kx) as float32 on linspace(0, 10 * span_wavelength, resolution).
+    
+    Evaluated in float64 (kx reaches a few hundred radians) and cached, LRU-bounded.
+    Returned arrays are read-only and shared.
+    """
+    key = (float(wavelength), float(span_wavelength), int(resolution))
+    with _basis_cache_lock:
+        basis = _basis_cache.get(key)
+        if basis is not None:
+            _basis_cache.move_to_end(key)
+            return basis
+    
+    kx = (2 * np.pi / key[0]) * np.linspace(0, 10 * key[1], key[2])
+    cos_kx = np.cos(kx).astype(np.float32)
+    sin_kx = np.sin(kx).astype(np.float32)
+    cos_kx.flags.writeable = False
+    sin_kx.flags.writeable = False
+    
+    with _basis_cache_lock:
+        _basis_cache[key] = (cos_kx, sin_kx)
+        while len(_basis_cache) > BASIS_CACHE_SIZE:
+            _basis_cache.popitem(last=False)
+    return cos_kx, sin_kx
+
+
 class WavelengthValidator:
     """
     Revolutionary message validator using electromagnetic wave theory.
@@ -227,37 +269,116 @@ class WavelengthValidator:
         Returns:
             Interference pattern (cryptographic fingerprint)
         """
-        # Create spatial grid
-        x = np.linspace(0, 10 * max(wave1.wavelength, wave2.wavelength), self.grid_resolution)
+        return self.compute_interference_batch([wave1], [wave2])[0]
+    
+    def compute_interference_batch(
+        self,
+        waves1: Sequence[WaveProperties],
+        waves2: Sequence[WaveProperties]
+    ) -> List[InterferencePattern]:
+        """
+        Interference patterns of many wave pairs at once.
         
-        # Calculate both wave functions
-        E1 = self.calculate_wave_function(wave1, x)
-        E2 = self.calculate_wave_function(wave2, x)
+        Pair i superposes waves1[i] and waves2[i]; the result for each pair is
+        identical to compute_interference on that pair.
+        
+        Args:
+            waves1: First wave of each pair
+            waves2: Second wave of each pair
+        
+        Returns:
+            One interference pattern per pair
+        """
+        if len(waves1) != len(waves2):
+            raise ValueError("waves1 and waves2 must have the same length")
+        
+        patterns: List[InterferencePattern] = []
+        for start in range(0, len(waves1), BATCH_CHUNK_SIZE):
+            patterns.extend(self._interference_block(
+                waves1[start:start + BATCH_CHUNK_SIZE],
+                waves2[start:start + BATCH_CHUNK_SIZE]
+            ))
+        return patterns
+    
+    def _field_components(
+        self,
+        waves: Sequence[WaveProperties],
+        spans: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Real and imaginary parts (pairs x grid, float32) of each wave's field"""
+        wavelengths = np.array([w.wavelength for w in waves], dtype=np.float64)
+        keys, index = np.unique(np.stack([wavelengths, spans], axis=1), axis=0, return_inverse=True)
+        index = index.reshape(-1)
+        bases = [spatial_basis(w, span, self.grid_resolution) for w, span in keys]
+        cos_kx = np.stack([b[0] for b in bases])[index]
+        sin_kx = np.stack([b[1] for b in bases])[index]
+        
+        # A * exp(i(kx + phi)) = (A cos phi + iA sin phi)(cos kx + i sin kx)
+        amplitude = np.array([w.amplitude for w in waves], dtype=np.float64)
+        phase = np.array([w.phase for w in waves], dtype=np.float64)
+        scale_re = (amplitude * np.cos(phase)).astype(np.float32)[:, None]
+        scale_im = (amplitude * np.sin(phase)).astype(np.float32)[:, None]
+        
+        real = scale_re * cos_kx - scale_im * sin_kx
+        imag = scale_re * sin_kx + scale_im * cos_kx
+        return real, imag
+    
+    def _interference_block(
+        self,
+        waves1: Sequence[WaveProperties],
+        waves2: Sequence[WaveProperties]
+    ) -> List[InterferencePattern]:
+        if not waves1:
+            return []
+        
+        # Shared grid: ten wavelengths of the longer wave of each pair
+        spans = np.maximum(
+            np.array([w.wavelength for w in waves1], dtype=np.float64),
+            np.array([w.wavelength for w in waves2], dtype=np.float64)
+        )
+        re1, im1 = self._field_components(waves1, spans)
+        re2, im2 = self._field_components(waves2, spans)
+        
+        # Rows of [intensity | Re E | Im E]: the bytes fingerprinted per pair
+        fingerprint = np.empty((len(waves1), 3, self.grid_resolution), dtype=np.float32)
+        intensity, re_total, im_total = fingerprint[:, 0], fingerprint[:, 1], fingerprint[:, 2]
         
         # Superposition principle (fundamental to Maxwell's equations)
-        E_total = E1 + E2
+        np.add(re1, re2, out=re_total)
+        np.add(im1, im2, out=im_total)
         
         # Intensity = |E|² (what we'd measure with a detector)
-        intensity = np.abs(E_total) ** 2
-        phase_distribution = np.angle(E_total)
+        np.multiply(re_total, re_total, out=intensity)
+        intensity += im_total * im_total
+        phase_distribution = np.arctan2(im_total, re_total)
         
         # Coherence factor (how well the waves interfere)
-        coherence = np.abs(np.mean(E1 * np.conj(E2))) / (
-            np.sqrt(np.mean(np.abs(E1)**2) * np.mean(np.abs(E2)**2))
-        )
-        
-        # Create unique hash from interference pattern
-        pattern_bytes = intensity.tobytes() + phase_distribution.tobytes()
-        pattern_hash = hashlib.sha256(pattern_bytes).hexdigest()
-        
-        return InterferencePattern(
-            intensity_distribution=intensity,
-            phase_distribution=phase_distribution,
-            coherence_factor=float(coherence),
-            max_intensity=float(np.max(intensity)),
-            min_intensity=float(np.min(intensity)),
-            pattern_hash=pattern_hash
-        )
+        cross_re = np.mean(re1 * re2 + im1 * im2, axis=1, dtype=np.float64)
+        cross_im = np.mean(im1 * re2 - re1 * im2, axis=1, dtype=np.float64)
+        power1 = np.mean(re1 * re1 + im1 * im1, axis=1, dtype=np.float64)
+        power2 = np.mean(re2 * re2 + im2 * im2, axis=1, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coherence = np.hypot(cross_re, cross_im) / np.sqrt(power1 * power2)
+        
+        coherence = coherence.tolist()
+        max_intensity = intensity.max(axis=1).astype(np.float64).tolist()
+        min_intensity = intensity.min(axis=1).astype(np.float64).tolist()
+        
+        # Fingerprint the intensity and the total field. Both come from
+        # elementwise float32 multiply/add only, so the bytes are the same
+        # whichever batch a pair is evaluated in.
+        sha256 = hashlib.sha256
+        return [
+            InterferencePattern(
+                intensity_distribution=intensity[i],
+                phase_distribution=phase_distribution[i],
+                coherence_factor=coherence[i],
+                max_intensity=max_intensity[i],
+                min_intensity=min_intensity[i],
+                pattern_hash=sha256(fingerprint[i]).hexdigest()
+            )
+            for i in range(len(waves1))
+        ]
     
     def validate_message_chain(
         self,
@@ -279,7 +400,54 @@ class WavelengthValidator:
         """
         # Compute actual interference
         interference = self.compute_interference(message1_wave, message2_wave)
+        is_valid, msg = self._record_validation(
+            message1_wave, message2_wave, interference, expected_interference_hash
+        )
+        return is_valid, interference, msg
+    
+    def validate_message_chain_batch(
+        self,
+        message_waves: Sequence[WaveProperties],
+        expected_interference_hashes: Optional[Sequence[Optional[str]]] = None
+    ) -> List[Tuple[bool, InterferencePattern, str]]:
+        """
+        Validate every link of a message chain in one vectorized pass.
         
+        Link i joins message_waves[i] (parent) and message_waves[i + 1]
+        (child); each result matches validate_message_chain on that link.
+        
+        Args:
+            message_waves: Wave properties of the messages, in chain order
+            expected_interference_hashes: Optional expected hash per link
+                (len(message_waves) - 1 entries, None to establish a link)
+        
+        Returns:
+            (is_valid, interference_pattern, validation_message) per link
+        """
+        parents = message_waves[:-1]
+        children = message_waves[1:]
+        if expected_interference_hashes is None:
+            expected_interference_hashes = [None] * len(parents)
+        elif len(expected_interference_hashes) != len(parents):
+            raise ValueError("Need one expected interference hash per chain link")
+        
+        patterns = self.compute_interference_batch(parents, children)
+        results = []
+        for parent, child, interference, expected in zip(
+            parents, children, patterns, expected_interference_hashes
+        ):
+            is_valid, msg = self._record_validation(parent, child, interference, expected)
+            results.append((is_valid, interference, msg))
+        return results
+    
+    def _record_validation(
+        self,
+        message1_wave: WaveProperties,
+        message2_wave: WaveProperties,
+        interference: InterferencePattern,
+        expected_interference_hash: Optional[str]
+    ) -> Tuple[bool, str]:
+        """Check a computed pattern against the expected hash and record it"""
         # If we have expected pattern, validate against it
         if expected_interference_hash:
             if interference.pattern_hash == expected_interference_hash:
@@ -303,7 +471,7 @@ class WavelengthValidator:
             'is_valid': is_valid
         })
         
-        return is_valid, interference, msg
+        return is_valid, msg
     
     def calculate_message_cost(
         self,
@@ -4,16 +4,150 @@ WNSP Media File Manager - Production File Ingestion & Streaming
 GPL v3.0 License
 
 Handles real file I/O, chunking, SHA-256 hashing, and streaming
+
+Range requests are served from memory-mapped files in fixed-size slices, so
+memory per viewer stays at one slice whatever the requested range size.
+Mappings are kept in a small LRU and re-opened when the file changes on disk.
 """
 
 import os
 import hashlib
+import mmap
 import mimetypes
+import threading
+from collections import OrderedDict
+from email.utils import formatdate
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Optional, BinaryIO
+from typing import Iterator, List, Dict, Optional, BinaryIO, Tuple
 import json
 
+STREAM_SLICE_SIZE = 64 * 1024  # Bytes yielded per slice when streaming a range
+OPEN_FILE_CACHE_SIZE = 32  # Memory-mapped media files kept open
+MAX_BYTE_RANGES = 16  # More ranges than this in one request are ignored (full response)
+
+
+@dataclass
+class MediaSource:
+    """An open, memory-mapped media file plus its cache validators"""
+    filepath: str
+    size: int
+    mtime_ns: int
+    mapping: Optional[mmap.mmap]  # None for empty files (cannot be mapped)
+    etag: str  # Unquoted entity tag
+    last_modified: str  # HTTP date
+    
+    def iter_range(self, start: int, end: int, slice_size: int = STREAM_SLICE_SIZE) -> Iterator[bytes]:
+        """Yield bytes start..end (inclusive) in slices of at most slice_size"""
+        mapping = self.mapping
+        position = start
+        stop = end + 1
+        while position < stop:
+            chunk_end = min(position + slice_size, stop)
+            yield mapping[position:chunk_end]
+            position = chunk_end
+
+
+def parse_byte_ranges(range_header: Optional[str], file_size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse an HTTP Range header into inclusive (start, end) byte ranges.
+    
+    Supports "start-end", open-ended "start-" and suffix "-length" specs,
+    comma-separated. Ends past the file are clamped.
+    
+    Returns:
+        List of satisfiable ranges (empty if none is satisfiable, i.e. 416),
+        or None if the header is absent, malformed or has too many ranges
+        (serve the whole file)
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.strip().partition('=')
+    if unit.strip().lower() != 'bytes' or not spec:
+        return None
+    
+    parts = spec.split(',')
+    if len(parts) > MAX_BYTE_RANGES:
+        return None
+    
+    ranges = []
+    for part in parts:
+        first, dash, last = part.strip().partition('-')
+        if not dash:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else max(file_size - 1, start)
+                if start < 0 or end < start:
+                    return None
+            else:
+                length = int(last)
+                if length < 0:
+                    return None
+                if length == 0:
+                    continue
+                start = max(file_size - length, 0)
+                end = file_size - 1
+        except ValueError:
+            return None
+        if start < file_size:
+            ranges.append((start, min(end, file_size - 1)))
+    return ranges
+
+
+class OpenFileCache:
+    """
+    LRU of memory-mapped files keyed by path.
+    
+    Entries are re-opened when the file's size or mtime changes. Media files
+    are write-once (uploads never overwrite an existing path), so a mapping
+    is never truncated under a running response. Evicted mappings are not
+    closed explicitly: responses still streaming from one keep it alive,
+    and it is unmapped once the last of them finishes.
+    """
+    
+    def __init__(self, capacity: int = OPEN_FILE_CACHE_SIZE):
+        self.capacity = capacity
+        self._sources: "OrderedDict[str, MediaSource]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def open(self, filepath: str) -> MediaSource:
+        """Get the mapping for a file (raises OSError if it cannot be opened)"""
+        stat = os.stat(filepath)
+        with self._lock:
+            source = self._sources.get(filepath)
+            if source is not None and source.size == stat.st_size and source.mtime_ns == stat.st_mtime_ns:
+                self._sources.move_to_end(filepath)
+                return source
+        
+        with open(filepath, 'rb') as f:
+            # mmap keeps its own descriptor, so the file can be closed right away
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else None
+        source = MediaSource(
+            filepath=filepath,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            mapping=mapping,
+            etag=f"{stat.st_size:x}-{stat.st_mtime_ns:x}",
+            last_modified=formatdate(stat.st_mtime, usegmt=True)
+        )
+        with self._lock:
+            self._sources[filepath] = source
+            self._sources.move_to_end(filepath)
+            while len(self._sources) > self.capacity:
+                self._sources.popitem(last=False)
+        return source
+    
+    def discard(self, filepath: str):
+        """Forget a file's mapping"""
+        with self._lock:
+            self._sources.pop(filepath, None)
+    
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
 @dataclass
 class MediaChunk:
     """Represents a 64KB chunk of a media file"""
@@ -71,6 +205,7 @@ class WNSPMediaFileManager:
     def __init__(self):
         self.media_library: Dict[str, MediaFile] = {}
         self.chunk_cache: Dict[str, bytes] = {}  # In-memory chunk cache
+        self.open_files = OpenFileCache()
         
         # Ensure media directories exist
         for subdir in ['video', 'audio', 'docs']:
@@ -245,6 +380,23 @@ class WNSPMediaFileManager:
         """Retrieve chunk data from cache"""
         return self.chunk_cache.get(chunk_id)
     
+    def get_media_source(self, file_id: str) -> Optional[MediaSource]:
+        """
+        Get the memory-mapped source for streaming a file
+        
+        Returns:
+            MediaSource or None if the file is unknown or unreadable
+        """
+        media_file = self.media_library.get(file_id)
+        if media_file is None:
+            return None
+        
+        try:
+            return self.open_files.open(media_file.filepath)
+        except OSError as e:
+            print(f"❌ Failed to map file: {e}")
+            return None
+    
     def get_file_bytes(self, file_id: str, start: int = 0, end: Optional[int] = None) -> Optional[bytes]:
         """
         Get file bytes for range requests
@@ -299,6 +451,7 @@ class WNSPMediaFileManager:
     def remove_file(self, file_id: str) -> bool:
         """Remove a file from the media library registry"""
         if file_id in self.media_library:
+            self.open_files.discard(self.media_library[file_id].filepath)
             del self.media_library[file_id]
             # Also clear any cached chunks for this file
             chunks_to_remove = [cid for cid in self.chunk_cache if cid.startswith(file_id)]
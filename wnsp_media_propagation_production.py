@@ -23,16 +23,20 @@ Features:
 2. Content-based deduplication: Identical chunks reused across files
 3. Real propagation tracking: Tracks which nodes have which chunks
 4. Multi-hop energy accounting: Calculates per-hop costs and totals
-5. Node-specific caches: Each node maintains its own chunk inventory
+5. Node-specific caches: Each node maintains its own chunk inventory, evicting
+   by LRU, LFU or energy-aware popularity when full (crisis/refugee content pinned)
 """
 
 import hashlib
+import heapq
 import time
 import random
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Callable, Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 import math
 import numpy as np
+from collections import Counter, OrderedDict
+from wnsp_mesh_routing import MeshRoutingTable, NearestReplicaIndex
 
 @dataclass
 class MediaChunk:
@@ -94,40 +98,276 @@ class MediaFile:
         chunks_on_node = sum(1 for chunk in self.chunks if node_id in chunk.nodes_with_chunk)
         return (chunks_on_node / self.total_chunks * 100) if self.total_chunks > 0 else 0
 
+class LRUEviction:
+    """Evict the least recently used chunk"""
+    
+    def __init__(self):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+    
+    def insert(self, key: str, chunk: MediaChunk):
+        self._order[key] = None
+    
+    def touch(self, key: str):
+        if key in self._order:
+            self._order.move_to_end(key)
+    
+    def remove(self, key: str):
+        self._order.pop(key, None)
+    
+    def pop(self) -> Optional[str]:
+        return self._order.popitem(last=False)[0] if self._order else None
+
+
+class LFUEviction:
+    """Evict the least frequently used chunk (least recent among equals), O(1)"""
+    
+    def __init__(self):
+        self._counts: Dict[str, int] = {}  # key -> uses
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}  # uses -> keys, oldest first
+        self._min_count = 0
+    
+    def insert(self, key: str, chunk: MediaChunk):
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+    
+    def touch(self, key: str):
+        count = self._counts.get(key)
+        if count is None:
+            return
+        self._unlink(key, count)
+        if self._min_count == count and count not in self._buckets:
+            self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+    
+    def remove(self, key: str):
+        count = self._counts.pop(key, None)
+        if count is not None:
+            self._unlink(key, count)
+    
+    def pop(self) -> Optional[str]:
+        if not self._counts:
+            return None
+        if self._min_count not in self._buckets:
+            self._min_count = min(self._buckets)  # only after remove() emptied the lowest bucket
+        key = next(iter(self._buckets[self._min_count]))
+        self.remove(key)
+        return key
+    
+    def _unlink(self, key: str, count: int):
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+
+class EnergyAwareEviction:
+    """
+    Evict the chunk that is cheapest to lose: Greedy-Dual-Size-Frequency
+    with the chunk's E=hf cost per hop as the refetch cost.
+    
+    priority = age + uses * energy_cost_per_hop / data_size
+    
+    `age` rises to each victim's priority, so chunks that were popular once
+    but stopped being requested are eventually evicted too.
+    """
+    
+    def __init__(self):
+        self._age = 0.0
+        self._entries: Dict[str, list] = {}  # key -> [priority, uses, energy per byte, sequence]
+        self._heap: List[Tuple[float, int, str]] = []  # stale entries skipped on pop
+        self._sequence = 0
+    
+    def insert(self, key: str, chunk: MediaChunk):
+        value = chunk.energy_cost_per_hop / chunk.data_size if chunk.data_size else 0.0
+        self._entries[key] = [0.0, 1, value, 0]
+        self._push(key)
+    
+    def touch(self, key: str):
+        if key in self._entries:
+            self._entries[key][1] += 1
+            self._push(key)
+    
+    def remove(self, key: str):
+        self._entries.pop(key, None)
+    
+    def pop(self) -> Optional[str]:
+        while self._heap:
+            priority, sequence, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[3] == sequence:
+                del self._entries[key]
+                self._age = priority
+                return key
+        return None
+    
+    def _push(self, key: str):
+        entry = self._entries[key]
+        self._sequence += 1
+        entry[0] = self._age + entry[1] * entry[2]
+        entry[3] = self._sequence
+        heapq.heappush(self._heap, (entry[0], self._sequence, key))
+        
+        # Drop superseded heap entries once they outnumber live ones
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(e[0], e[3], k) for k, e in self._entries.items()]
+            heapq.heapify(self._heap)
+
+
+# Eviction policy name -> factory (None: refuse new chunks when full)
+EVICTION_POLICIES = {
+    'lru': LRUEviction,
+    'lfu': LFUEviction,
+    'energy': EnergyAwareEviction,
+    'none': None
+}
+
+
 @dataclass
 class NodeCache:
-    """Cache inventory for a specific mesh node"""
+    """
+    Cache inventory for a specific mesh node
+    
+    Used bytes are kept as a running total. When a new chunk does not fit,
+    unpinned chunks are evicted by `eviction_policy` until it does; pinned
+    chunks (crisis/refugee content) are never evicted.
+    """
     node_id: str
     cache_capacity_mb: float
     chunks_cached: Dict[str, MediaChunk] = field(default_factory=dict)  # content_hash -> chunk
+    replica_index: Optional[NearestReplicaIndex] = field(default=None, repr=False)  # Told about adds/removals
+    eviction_policy: str = 'lru'
+    on_evict: Optional[Callable[[str, MediaChunk], None]] = field(default=None, repr=False)  # (node_id, chunk)
+    
+    # Hit-ratio metrics
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    
+    pinned: Set[str] = field(default_factory=set)  # content hashes exempt from eviction
+    _used_bytes: int = field(default=0, init=False, repr=False)
+    _pinned_bytes: int = field(default=0, init=False, repr=False)
+    _policy: object = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        if self.eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {self.eviction_policy}")
+        factory = EVICTION_POLICIES[self.eviction_policy]
+        self._policy = factory() if factory else None
+        
+        for key, chunk in self.chunks_cached.items():
+            self._used_bytes += chunk.data_size
+            if key in self.pinned:
+                self._pinned_bytes += chunk.data_size
+            elif self._policy:
+                self._policy.insert(key, chunk)
     
     @property
     def used_capacity_mb(self) -> float:
         """Calculate used cache capacity"""
-        return sum(chunk.data_size for chunk in self.chunks_cached.values()) / 1048576
+        return self._used_bytes / 1048576
     
     @property
     def available_capacity_mb(self) -> float:
         """Calculate available cache capacity"""
         return self.cache_capacity_mb - self.used_capacity_mb
     
+    @property
+    def pinned_capacity_mb(self) -> float:
+        """Capacity held by pinned chunks"""
+        return self._pinned_bytes / 1048576
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from this cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
     def can_store_chunk(self, chunk: MediaChunk) -> bool:
-        """Check if chunk can fit in cache"""
-        chunk_size_mb = chunk.data_size / 1048576
-        return chunk_size_mb <= self.available_capacity_mb
+        """Check if chunk can fit in cache (after evicting unpinned chunks, if the policy allows)"""
+        capacity = self.cache_capacity_mb * 1048576
+        reserved = self._pinned_bytes if self._policy else self._used_bytes
+        return reserved + chunk.data_size <= capacity
     
-    def add_chunk(self, chunk: MediaChunk) -> bool:
-        """Add chunk to cache (returns False if no space)"""
+    def add_chunk(self, chunk: MediaChunk, pinned: bool = False) -> bool:
+        """Add chunk to cache, evicting as needed (returns False if no space)"""
+        key = chunk.content_hash
+        if key in self.chunks_cached:
+            if pinned:
+                self._pin(key)
+            chunk.nodes_with_chunk.add(self.node_id)
+            return True
+        
         if not self.can_store_chunk(chunk):
             return False
+        capacity = self.cache_capacity_mb * 1048576
+        while self._used_bytes + chunk.data_size > capacity:
+            self._evict(self._policy.pop())
+        
+        self.chunks_cached[key] = chunk
+        self._used_bytes += chunk.data_size
+        if pinned:
+            self.pinned.add(key)
+            self._pinned_bytes += chunk.data_size
+        elif self._policy:
+            self._policy.insert(key, chunk)
         
-        self.chunks_cached[chunk.content_hash] = chunk
         chunk.nodes_with_chunk.add(self.node_id)
+        if self.replica_index is not None:
+            self.replica_index.add_holder(key, self.node_id)
         return True
     
+    def remove_chunk(self, content_hash: str) -> Optional[MediaChunk]:
+        """Drop a chunk from the cache, pinned or not (returns it, or None if absent)"""
+        chunk = self.chunks_cached.pop(content_hash, None)
+        if chunk is None:
+            return None
+        
+        self._used_bytes -= chunk.data_size
+        if content_hash in self.pinned:
+            self.pinned.discard(content_hash)
+            self._pinned_bytes -= chunk.data_size
+        elif self._policy:
+            self._policy.remove(content_hash)
+        
+        if self.replica_index is not None:
+            self.replica_index.remove_holder(content_hash, self.node_id)
+        return chunk
+    
     def has_chunk(self, content_hash: str) -> bool:
         """Check if chunk is in cache"""
         return content_hash in self.chunks_cached
+    
+    def lookup(self, content_hash: str) -> Optional[MediaChunk]:
+        """Serve a request from this cache: counts a hit or miss and marks the chunk used"""
+        chunk = self.chunks_cached.get(content_hash)
+        if chunk is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touch(content_hash)
+        return chunk
+    
+    def touch(self, content_hash: str):
+        """Mark a cached chunk as used (e.g. served to a neighbor)"""
+        if self._policy and content_hash not in self.pinned:
+            self._policy.touch(content_hash)
+    
+    def _pin(self, content_hash: str):
+        if content_hash in self.pinned:
+            return
+        self.pinned.add(content_hash)
+        self._pinned_bytes += self.chunks_cached[content_hash].data_size
+        if self._policy:
+            self._policy.remove(content_hash)
+    
+    def _evict(self, content_hash: str):
+        chunk = self.remove_chunk(content_hash)
+        chunk.nodes_with_chunk.discard(self.node_id)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(self.node_id, chunk)
 
 class WNSPMediaPropagationProduction:
     """
@@ -149,8 +389,12 @@ class WNSPMediaPropagationProduction:
     # 1 NXT / 1562 chunks / 5 hops = 0.000128 NXT per chunk per hop
     ENERGY_MULTIPLIER = 1.28e9  # Calibrated multiplier
     
-    def __init__(self, mesh_stack=None):
+    # Categories whose chunks are never evicted from node caches
+    PINNED_CATEGORIES = ('crisis', 'refugee')
+    
+    def __init__(self, mesh_stack=None, eviction_policy: str = 'lru'):
         self.mesh_stack = mesh_stack  # Reference to WNSPUnifiedMeshStack
+        self.eviction_policy = eviction_policy  # NodeCache policy: see EVICTION_POLICIES
         self.media_library: Dict[str, MediaFile] = {}
         self.node_caches: Dict[str, NodeCache] = {}  # node_id -> NodeCache
         self.content_index: Dict[str, List[MediaChunk]] = {}  # content_hash -> [chunks with same data]
@@ -167,12 +411,20 @@ class WNSPMediaPropagationProduction:
             'dedup_chunks_reused': 0
         }
         
+        # Nearest holder of each content hash, over the mesh topology
+        routing = mesh_stack.layer1_mesh_isp.routing if mesh_stack and mesh_stack.layer1_mesh_isp \
+            else MeshRoutingTable()
+        self.replica_index = NearestReplicaIndex(routing)
+        
         # Initialize node caches from mesh topology
         if mesh_stack and mesh_stack.layer1_mesh_isp:
             for node_id, node in mesh_stack.layer1_mesh_isp.nodes.items():
                 self.node_caches[node_id] = NodeCache(
                     node_id=node_id,
-                    cache_capacity_mb=node.cache_capacity_mb
+                    cache_capacity_mb=node.cache_capacity_mb,
+                    replica_index=self.replica_index,
+                    eviction_policy=eviction_policy,
+                    on_evict=self._on_chunk_evicted
                 )
         
         # Initialize sample content library
@@ -365,8 +617,9 @@ class WNSPMediaPropagationProduction:
         # Add chunks to source node's cache if specified
         if source_node_id and source_node_id in self.node_caches:
             source_cache = self.node_caches[source_node_id]
+            pinned = category in self.PINNED_CATEGORIES
             for chunk in media_file.chunks:
-                if source_cache.add_chunk(chunk):
+                if source_cache.add_chunk(chunk, pinned=pinned):
                     # Mark that this node has this chunk
                     chunk.nodes_with_chunk.add(source_node_id)
         self.propagation_stats['total_files'] += 1
@@ -405,9 +658,7 @@ class WNSPMediaPropagationProduction:
                 # Remove from node caches
                 for node_id in list(chunk.nodes_with_chunk):
                     if node_id in self.node_caches:
-                        cache = self.node_caches[node_id]
-                        if chunk.content_hash in cache.chunks_cached:
-                            del cache.chunks_cached[chunk.content_hash]
+                        self.node_caches[node_id].remove_chunk(chunk.content_hash)
                     chunk.nodes_with_chunk.discard(node_id)
             
             # Update stats
@@ -666,7 +917,7 @@ class WNSPMediaPropagationProduction:
         target_cache = self.node_caches[target_node_id]
         
         # Check for cache hit (deduplication)
-        if target_cache.has_chunk(chunk.content_hash):
+        if target_cache.lookup(chunk.content_hash) is not None:
             self.propagation_stats['cache_hits'] += 1
             return {
                 'success': True,
@@ -700,8 +951,10 @@ class WNSPMediaPropagationProduction:
         energy_cost = chunk.energy_cost_per_hop * hops
         
         # Try to add chunk to target cache
-        if not target_cache.add_chunk(chunk):
+        if not target_cache.add_chunk(chunk, pinned=self._is_pinned(chunk)):
             return {'success': False, 'error': 'Target cache full'}
+        if source_node_id in self.node_caches:
+            self.node_caches[source_node_id].touch(chunk.content_hash)
         
         # Update chunk propagation tracking
         chunk.propagation_paths.append(path)
@@ -721,53 +974,52 @@ class WNSPMediaPropagationProduction:
             'success': True,
             'cache_hit': False,
             'node_id': target_node_id,
+            'source_node_id': source_node_id,
             'hops': hops,
             'energy_cost': energy_cost,
             'path': path
         }
     
+    def _is_pinned(self, chunk: MediaChunk) -> bool:
+        """Whether the chunk's file is in a pinned category"""
+        media_file = self.media_library.get(chunk.file_id)
+        return media_file is not None and media_file.category in self.PINNED_CATEGORIES
+    
+    def _on_chunk_evicted(self, node_id: str, chunk: MediaChunk):
+        """Node no longer holds this content, under any file that shares it"""
+        for duplicate in self.content_index.get(chunk.content_hash, ()):
+            duplicate.nodes_with_chunk.discard(node_id)
+    
     def _find_closest_source_node(self, chunk: MediaChunk, target_node_id: str) -> Optional[str]:
-        """Find the closest node that has this chunk"""
+        """
+        Find the closest node that has this chunk's content (fewest hops),
+        from the replica locality index
+        """
+        nearest = self.replica_index.nearest(chunk.content_hash, target_node_id)
+        if nearest is not None:
+            return nearest
+        
+        # No holder can reach the target: any holder, so the caller reports the missing path
         if not chunk.nodes_with_chunk:
             return None
-        
-        # Simple: return first node that has it
-        # TODO: Could use BFS to find truly closest
         return next(iter(chunk.nodes_with_chunk))
     
     def _compute_propagation_path(self, source_id: str, target_id: str) -> List[str]:
-        """Compute propagation path using mesh topology (BFS)"""
+        """Compute propagation path using mesh topology (cached shortest-path trees)"""
         if not self.mesh_stack or not self.mesh_stack.layer1_mesh_isp:
             return []
         
-        topology = self.mesh_stack.layer1_mesh_isp.topology_graph
-        
-        if source_id not in topology or target_id not in topology:
-            return []
-        
-        # BFS pathfinding
-        visited = set()
-        queue = [(source_id, [source_id])]
-        
-        while queue:
-            current, path = queue.pop(0)
-            
-            if current == target_id:
-                return path
-            
-            if current in visited:
-                continue
-            visited.add(current)
-            
-            for neighbor in topology.get(current, []):
-                if neighbor not in visited:
-                    queue.append((neighbor, path + [neighbor]))
-        
-        return []
+        return self.mesh_stack.layer1_mesh_isp.routing.shortest_path(source_id, target_id)
     
     def propagate_file_to_node(self, file_id: str, target_node_id: str,
                                source_node_id: Optional[str] = None) -> Dict:
-        """Propagate entire file to target node (all chunks)"""
+        """
+        Propagate entire file to target node (all chunks).
+        
+        Without an explicit source, each chunk is fetched from its own
+        nearest holder, so a file is pulled from several holders at once;
+        'sources' in the result counts the chunks each one supplied.
+        """
         if file_id not in self.media_library:
             return {'success': False, 'error': 'File not found'}
         
@@ -776,6 +1028,7 @@ class WNSPMediaPropagationProduction:
         total_energy = 0
         total_hops = 0
         cache_hits = 0
+        sources = Counter()
         
         for chunk in media_file.chunks:
             result = self.propagate_chunk_to_node(chunk, target_node_id, source_node_id)
@@ -787,6 +1040,7 @@ class WNSPMediaPropagationProduction:
                 else:
                     total_energy += result['energy_cost']
                     total_hops += result['hops']
+                    sources[result['source_node_id']] += 1
         
         successful_chunks = sum(1 for r in results if r['success'])
         
@@ -799,7 +1053,8 @@ class WNSPMediaPropagationProduction:
             'cache_hits': cache_hits,
             'total_energy_cost': total_energy,
             'total_hops': total_hops,
-            'avg_hops_per_chunk': total_hops / successful_chunks if successful_chunks > 0 else 0
+            'avg_hops_per_chunk': total_hops / successful_chunks if successful_chunks > 0 else 0,
+            'sources': dict(sources)
         }
     
     def get_node_download_status(self, file_id: str, node_id: str) -> Dict:
@@ -927,5 +1182,11 @@ class WNSPMediaPropagationProduction:
             'available_capacity_mb': round(cache.available_capacity_mb, 2),
             'utilization_percent': round((cache.used_capacity_mb / cache.cache_capacity_mb * 100) 
                                         if cache.cache_capacity_mb > 0 else 0, 1),
-            'chunks_cached': len(cache.chunks_cached)
+            'chunks_cached': len(cache.chunks_cached),
+            'eviction_policy': cache.eviction_policy,
+            'pinned_capacity_mb': round(cache.pinned_capacity_mb, 2),
+            'cache_hits': cache.hits,
+            'cache_misses': cache.misses,
+            'hit_ratio': round(cache.hit_ratio, 3),
+            'evictions': cache.evictions
         }
@@ -5,11 +5,12 @@ GPL v3.0 License
 Serves the user-facing media player interface and integrates with WNSP backend
 """
 
-from flask import Flask, send_from_directory, jsonify, request, Response, send_file
+from flask import Flask, send_from_directory, jsonify, request, Response
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from werkzeug.utils import secure_filename
 import os
+import secrets
 import sys
 from datetime import datetime
 from threading import Thread
@@ -20,7 +21,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import production file manager
 try:
-    from wnsp_media_file_manager import media_manager
+    from wnsp_media_file_manager import media_manager, parse_byte_ranges
     FILE_MANAGER_AVAILABLE = True
 except ImportError:
     FILE_MANAGER_AVAILABLE = False
@@ -1276,11 +1277,50 @@ def health_check():
         'version': '1.0.0'
     })
 
+def _range_requested(source):
+    """False if an If-Range validator no longer matches (serve the whole file)"""
+    if_range = request.if_range
+    if if_range.etag is not None:
+        return if_range.etag == source.etag
+    if if_range.date is not None:
+        return if_range.date.timestamp() >= source.mtime_ns // 1_000_000_000
+    return True
+
+
+def _multipart_byteranges(source, ranges, mime_type, boundary):
+    """
+    multipart/byteranges body for several ranges.
+    
+    Returns:
+        (generator of body pieces, total length in bytes)
+    """
+    part_headers = [
+        (f"\r\n--{boundary}\r\nContent-Type: {mime_type}\r\n"
+         f"Content-Range: bytes {start}-{end}/{source.size}\r\n\r\n").encode()
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode()
+    length = sum(len(h) for h in part_headers) + sum(end - start + 1 for start, end in ranges) + len(closing)
+    
+    def body():
+        for header, (start, end) in zip(part_headers, ranges):
+            yield header
+            yield from source.iter_range(start, end)
+        yield closing
+    
+    return body(), length
+
+
 @app.route('/media/<file_id>/stream')
 def stream_media(file_id):
     """
     Stream media file with HTTP range request support
     Enables video/audio seeking and progressive download
+    
+    Bodies are streamed from a memory-mapped file in fixed-size slices, so
+    memory per viewer does not grow with the requested range. Supports
+    single and multi-range requests, If-Range, and conditional GET via
+    ETag / Last-Modified.
     """
     if not FILE_MANAGER_AVAILABLE:
         return jsonify({'error': 'File manager not available'}), 503
@@ -1291,56 +1331,58 @@ def stream_media(file_id):
     
     media_file = media_manager.media_library[file_id]
     
-    # Get file path
-    filepath = media_file.filepath
-    
-    if not os.path.exists(filepath):
+    if not os.path.exists(media_file.filepath):
         return jsonify({'error': 'File not found on disk'}), 404
     
-    # Get file size
-    file_size = os.path.getsize(filepath)
+    source = media_manager.get_media_source(file_id)
+    if source is None:
+        return jsonify({'error': 'Failed to read file'}), 500
+    
+    file_size = source.size
+    mime_type = media_file.mime_type
+    
+    # Conditional GET: unchanged since the client's copy
+    if request.if_none_match or request.if_modified_since:
+        if request.if_none_match:
+            not_modified = request.if_none_match.contains_weak(source.etag)
+        else:
+            not_modified = request.if_modified_since.timestamp() >= source.mtime_ns // 1_000_000_000
+        if not_modified:
+            response = Response(status=304)
+            response.set_etag(source.etag)
+            response.headers['Last-Modified'] = source.last_modified
+            return response
     
     # Handle range requests (for video/audio seeking)
-    range_header = request.headers.get('Range', None)
-    
-    if range_header:
-        # Parse range header (e.g., "bytes=0-1023")
-        byte_range = range_header.strip().split('=')[1]
-        start, end = byte_range.split('-')
-        start = int(start) if start else 0
-        end = int(end) if end else file_size - 1
-        
-        # Get file bytes in range
-        data = media_manager.get_file_bytes(file_id, start, end)
-        
-        if data is None:
-            return jsonify({'error': 'Failed to read file'}), 500
-        
-        # Build response with partial content
-        response = Response(
-            data,
-            206,  # Partial Content
-            mimetype=media_file.mime_type,
-            direct_passthrough=True
-        )
-        
-        response.headers.add('Content-Range', f'bytes {start}-{end}/{file_size}')
-        response.headers.add('Accept-Ranges', 'bytes')
-        response.headers.add('Content-Length', str(len(data)))
-        response.headers.add('Content-Type', media_file.mime_type)
-        
-        return response
+    ranges = None
+    if _range_requested(source):
+        ranges = parse_byte_ranges(request.headers.get('Range'), file_size)
+    
+    if ranges is None:
+        # No (usable) range request - send entire file
+        response = Response(source.iter_range(0, file_size - 1), 200,
+                            mimetype=mime_type, direct_passthrough=True)
+        response.headers['Content-Length'] = str(file_size)
+    elif not ranges:
+        response = Response(status=416)
+        response.headers['Content-Range'] = f'bytes */{file_size}'
+    elif len(ranges) == 1:
+        start, end = ranges[0]
+        response = Response(source.iter_range(start, end), 206,  # Partial Content
+                            mimetype=mime_type, direct_passthrough=True)
+        response.headers['Content-Range'] = f'bytes {start}-{end}/{file_size}'
+        response.headers['Content-Length'] = str(end - start + 1)
     else:
-        # No range request - send entire file
-        try:
-            return send_file(
-                filepath,
-                mimetype=media_file.mime_type,
-                as_attachment=False,
-                conditional=True
-            )
-        except Exception as e:
-            return jsonify({'error': f'Streaming failed: {str(e)}'}), 500
+        boundary = secrets.token_hex(16)
+        body, length = _multipart_byteranges(source, ranges, mime_type, boundary)
+        response = Response(body, 206, direct_passthrough=True,
+                            content_type=f'multipart/byteranges; boundary={boundary}')
+        response.headers['Content-Length'] = str(length)
+    
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.set_etag(source.etag)
+    response.headers['Last-Modified'] = source.last_modified
+    return response
 
 # ============================================================================
 # LIVESTREAMING API (Placeholder - Socket.IO backend to be added)
@@ -0,0 +1,382 @@
+"""
+WNSP Mesh Routing Table
+Shared route computation for the unified mesh stack and media propagation
+
+- quantum_hash -> node index, so wavelength addresses resolve in O(1)
+- Shortest-path trees built once per source (deque BFS by hop count, or
+  Dijkstra weighted by link quality) with parent pointers and a next-hop
+  table, cached in an LRU until a topology change affects them
+- Incremental invalidation: a new link only drops the trees it shortens,
+  a removed link or node only drops the trees that route through it
+- NearestReplicaIndex: per content key, hop distance from every node to
+  its nearest holder (multi-source BFS, extended incrementally as holders
+  are added)
+"""
+
+import heapq
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Floor on link quality when converting it to a hop cost (1 / quality)
+MIN_LINK_QUALITY = 1e-3
+
+# Shortest-path trees kept per routing table (each is O(nodes))
+MAX_CACHED_TREES = 1024
+
+# Replica label maps kept per NearestReplicaIndex (each is O(nodes))
+MAX_REPLICA_LABELS = 4096
+
+
+@dataclass
+class ShortestPathTree:
+    """Routes from one source to every reachable node"""
+    source: str
+    weighted: bool
+    parent: Dict[str, Optional[str]]  # node -> previous hop (None for the source)
+    distance: Dict[str, float]  # node -> hops, or summed link cost if weighted
+    first_hop: Dict[str, str]  # node -> next hop out of the source
+    interior: Set[str]  # nodes some other node routes through
+
+    def path_to(self, target: str) -> List[str]:
+        """Source-to-target node list, empty if unreachable"""
+        if target not in self.parent:
+            return []
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.parent[path[-1]])
+        path.reverse()
+        return path
+
+
+class MeshRoutingTable:
+    """
+    Wavelength-address index and cached shortest paths over a mesh topology.
+
+    Links are undirected. Parallel links between two nodes (e.g. BLE and
+    WiFi) count once, at the best quality.
+    """
+
+    def __init__(self, max_cached_trees: int = MAX_CACHED_TREES):
+        """
+        Args:
+            max_cached_trees: Shortest-path trees kept before least-recently-used eviction
+        """
+        self.max_cached_trees = max_cached_trees
+        self.adjacency: Dict[str, Dict[str, float]] = {}  # node -> neighbor -> hop cost
+        self._hash_of: Dict[str, Optional[str]] = {}
+        self._nodes_by_hash: Dict[str, Dict[str, None]] = {}
+        self._trees: "OrderedDict[Tuple[str, bool], ShortestPathTree]" = OrderedDict()
+        self._lock = threading.RLock()
+        # Bumped on every adjacency change, for caches built on top of this table
+        self.version = 0
+
+        self.stats = {
+            'tree_builds': 0,
+            'tree_hits': 0,
+            'trees_invalidated': 0
+        }
+
+    # ------------------------------------------------------------------
+    # Topology changes
+    # ------------------------------------------------------------------
+
+    def add_node(self, node_id: str, quantum_hash: Optional[str] = None):
+        """Register a node (re-adding one first drops its old links)"""
+        with self._lock:
+            if node_id in self.adjacency:
+                self.remove_node(node_id)
+            self.adjacency[node_id] = {}
+            self._hash_of[node_id] = quantum_hash
+            if quantum_hash is not None:
+                self._nodes_by_hash.setdefault(quantum_hash, {})[node_id] = None
+
+    def remove_node(self, node_id: str) -> bool:
+        """Drop a node and its links; only trees routing through it are rebuilt"""
+        with self._lock:
+            neighbors = self.adjacency.pop(node_id, None)
+            if neighbors is None:
+                return False
+            for neighbor in neighbors:
+                del self.adjacency[neighbor][node_id]
+            self.version += 1
+
+            quantum_hash = self._hash_of.pop(node_id)
+            if quantum_hash is not None:
+                nodes = self._nodes_by_hash[quantum_hash]
+                del nodes[node_id]
+                if not nodes:
+                    del self._nodes_by_hash[quantum_hash]
+
+            for key, tree in list(self._trees.items()):
+                if tree.source == node_id or node_id in tree.interior:
+                    self._invalidate(key)
+                elif node_id in tree.parent:
+                    # A leaf: no other route depends on it
+                    del tree.parent[node_id], tree.distance[node_id], tree.first_hop[node_id]
+            return True
+
+    def add_link(self, node_a: str, node_b: str, quality: float = 1.0):
+        """
+        Add (or improve) an undirected link.
+
+        Cached trees are kept when the link cannot shorten any of their
+        routes: both ends unreachable, hop counts within one of each other,
+        or (weighted) no strict cost improvement through the new link.
+        """
+        with self._lock:
+            cost = 1.0 / max(quality, MIN_LINK_QUALITY)
+            current = self.adjacency[node_a].get(node_b)
+            if current is not None and current <= cost:
+                return
+            self.adjacency[node_a][node_b] = cost
+            self.adjacency[node_b][node_a] = cost
+            self.version += 1
+
+            for key, tree in list(self._trees.items()):
+                dist_a, dist_b = tree.distance.get(node_a), tree.distance.get(node_b)
+                if dist_a is None and dist_b is None:
+                    continue
+                if dist_a is None or dist_b is None:
+                    stale = True
+                elif tree.weighted:
+                    stale = dist_a + cost < dist_b or dist_b + cost < dist_a
+                else:
+                    stale = current is None and abs(dist_a - dist_b) > 1
+                if stale:
+                    self._invalidate(key)
+
+    def remove_link(self, node_a: str, node_b: str) -> bool:
+        """Drop the link between two nodes; only trees using it are rebuilt"""
+        with self._lock:
+            if self.adjacency.get(node_a, {}).pop(node_b, None) is None:
+                return False
+            del self.adjacency[node_b][node_a]
+            self.version += 1
+
+            for key, tree in list(self._trees.items()):
+                if tree.parent.get(node_a) == node_b or tree.parent.get(node_b) == node_a:
+                    self._invalidate(key)
+            return True
+
+    def _invalidate(self, key: Tuple[str, bool]):
+        del self._trees[key]
+        self.stats['trees_invalidated'] += 1
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def resolve(self, quantum_hash: str) -> Optional[str]:
+        """Node registered under a wavelength address hash (latest wins)"""
+        nodes = self._nodes_by_hash.get(quantum_hash)
+        return next(reversed(nodes)) if nodes else None
+
+    def tree(self, source: str, weighted: bool = False) -> Optional[ShortestPathTree]:
+        """Cached shortest-path tree rooted at `source` (None for unknown nodes)"""
+        key = (source, weighted)
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.stats['tree_hits'] += 1
+                return tree
+            if source not in self.adjacency:
+                return None
+
+            tree = self._dijkstra(source) if weighted else self._bfs(source)
+            self.stats['tree_builds'] += 1
+            self._trees[key] = tree
+            while len(self._trees) > self.max_cached_trees:
+                self._trees.popitem(last=False)
+            return tree
+
+    def shortest_path(self, source: str, target: str, weighted: bool = False) -> List[str]:
+        """
+        Route from source to target as a node list ([source] when they are
+        equal, empty when either is unknown or unreachable).
+
+        Args:
+            weighted: Minimize summed 1/link_quality instead of hop count
+        """
+        tree = self.tree(source, weighted)
+        return tree.path_to(target) if tree is not None else []
+
+    def next_hop(self, source: str, target: str, weighted: bool = False) -> Optional[str]:
+        """First hop from source towards target, or None"""
+        tree = self.tree(source, weighted)
+        return tree.first_hop.get(target) if tree is not None else None
+
+    def distance(self, source: str, target: str, weighted: bool = False) -> Optional[float]:
+        """Hop count (or weighted cost) from source to target, or None"""
+        tree = self.tree(source, weighted)
+        return tree.distance.get(target) if tree is not None else None
+
+    # ------------------------------------------------------------------
+    # Tree construction
+    # ------------------------------------------------------------------
+
+    def _bfs(self, source: str) -> ShortestPathTree:
+        adjacency = self.adjacency
+        parent: Dict[str, Optional[str]] = {source: None}
+        distance: Dict[str, float] = {source: 0}
+        first_hop: Dict[str, str] = {}
+
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            hops = distance[current] + 1
+            for neighbor in adjacency[current]:
+                if neighbor not in parent:
+                    parent[neighbor] = current
+                    distance[neighbor] = hops
+                    first_hop[neighbor] = neighbor if current == source else first_hop[current]
+                    queue.append(neighbor)
+
+        return ShortestPathTree(source, False, parent, distance, first_hop, set(parent.values()))
+
+    def _dijkstra(self, source: str) -> ShortestPathTree:
+        adjacency = self.adjacency
+        parent: Dict[str, Optional[str]] = {}
+        distance: Dict[str, float] = {}
+        first_hop: Dict[str, str] = {}
+
+        # (cost, tie-break, node, previous hop)
+        heap = [(0.0, 0, source, None)]
+        pushed = 1
+        best = {source: 0.0}
+        while heap:
+            cost, _, current, previous = heapq.heappop(heap)
+            if current in distance:
+                continue
+            distance[current] = cost
+            parent[current] = previous
+            if previous is not None:
+                first_hop[current] = first_hop.get(previous, current)
+            for neighbor, link_cost in adjacency[current].items():
+                candidate = cost + link_cost
+                if neighbor not in distance and candidate < best.get(neighbor, float('inf')):
+                    best[neighbor] = candidate
+                    heapq.heappush(heap, (candidate, pushed, neighbor, current))
+                    pushed += 1
+
+        return ShortestPathTree(source, True, parent, distance, first_hop, set(parent.values()))
+
+
+@dataclass
+class ReplicaLabels:
+    """Nearest holder of one content key, for every node that can reach one"""
+    version: int  # MeshRoutingTable.version the labels were built against
+    distance: Dict[str, int]  # node -> hops to nearest holder
+    nearest: Dict[str, str]  # node -> nearest holder
+
+
+class NearestReplicaIndex:
+    """
+    Replica locality index: which holder of a piece of content is closest
+    to each node.
+
+    Holders are tracked for every key. Labels (distance and nearest holder
+    per node) are built lazily by a multi-source BFS from all holders, then
+    extended incrementally when a holder is added: a BFS from the new holder
+    only relabels nodes it is strictly closer to. Removing a holder or any
+    topology change drops the labels, which are rebuilt on the next lookup.
+    """
+
+    def __init__(self, routing: MeshRoutingTable, max_labels: int = MAX_REPLICA_LABELS):
+        """
+        Args:
+            routing: Mesh topology to measure hop distances on
+            max_labels: Content keys with materialized labels (LRU)
+        """
+        self.routing = routing
+        self.max_labels = max_labels
+        self.holders: Dict[str, Dict[str, None]] = {}  # key -> holder node_ids (insertion order)
+        self._labels: "OrderedDict[str, ReplicaLabels]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.stats = {
+            'label_builds': 0,
+            'incremental_updates': 0
+        }
+
+    def add_holder(self, key: str, node_id: str):
+        """Record that node_id now holds `key`"""
+        with self._lock:
+            holders = self.holders.setdefault(key, {})
+            if node_id in holders:
+                return
+            holders[node_id] = None
+
+            labels = self._labels.get(key)
+            if labels is None:
+                return
+            if labels.version != self.routing.version or node_id not in self.routing.adjacency:
+                del self._labels[key]
+                return
+            self._relabel_from(labels, [node_id])
+            self.stats['incremental_updates'] += 1
+
+    def remove_holder(self, key: str, node_id: str):
+        """Record that node_id no longer holds `key`"""
+        with self._lock:
+            holders = self.holders.get(key)
+            if holders is None or node_id not in holders:
+                return
+            del holders[node_id]
+            if not holders:
+                del self.holders[key]
+            self._labels.pop(key, None)
+
+    def nearest(self, key: str, node_id: str) -> Optional[str]:
+        """Closest holder of `key` to node_id, or None if none is reachable"""
+        labels = self._labels_for(key)
+        return labels.nearest.get(node_id) if labels is not None else None
+
+    def distance(self, key: str, node_id: str) -> Optional[int]:
+        """Hops from node_id to the closest holder of `key`, or None"""
+        labels = self._labels_for(key)
+        return labels.distance.get(node_id) if labels is not None else None
+
+    def _labels_for(self, key: str) -> Optional[ReplicaLabels]:
+        with self._lock:
+            labels = self._labels.get(key)
+            if labels is not None and labels.version == self.routing.version:
+                self._labels.move_to_end(key)
+                return labels
+            holders = self.holders.get(key)
+            if not holders:
+                self._labels.pop(key, None)
+                return None
+
+            labels = ReplicaLabels(self.routing.version, {}, {})
+            self._relabel_from(labels, [h for h in holders if h in self.routing.adjacency])
+            self.stats['label_builds'] += 1
+            self._labels[key] = labels
+            self._labels.move_to_end(key)
+            while len(self._labels) > self.max_labels:
+                self._labels.popitem(last=False)
+            return labels
+
+    def _relabel_from(self, labels: ReplicaLabels, sources: List[str]):
+        """BFS from `sources`, claiming every node they are strictly closer to"""
+        adjacency = self.routing.adjacency
+        distance, nearest = labels.distance, labels.nearest
+        queue = deque()
+        for source in sources:
+            if distance.get(source) != 0:
+                distance[source] = 0
+                nearest[source] = source
+                queue.append(source)
+
+        while queue:
+            current = queue.popleft()
+            hops = distance[current] + 1
+            owner = nearest[current]
+            for neighbor in adjacency[current]:
+                if hops < distance.get(neighbor, hops + 1):
+                    distance[neighbor] = hops
+                    nearest[neighbor] = owner
+                    queue.append(neighbor)
@@ -35,6 +35,7 @@ from typing import List, Dict, Tuple, Optional, Set
 from enum import Enum
 import hashlib
 import time
+from wnsp_mesh_routing import MeshRoutingTable
 
 class TransportProtocol(Enum):
     BLE = "Bluetooth Low Energy"
@@ -156,11 +157,28 @@ class Layer1_CommunityMeshISP:
         self.nodes: Dict[str, MeshNode] = {}
         self.links: List[MeshLink] = []
         self.topology_graph = {}
+        self.routing = MeshRoutingTable()  # Address index + cached shortest paths
         
     def add_node(self, node: MeshNode):
-        """Add node to mesh network"""
+        """Add node to mesh network (a rejoining node starts without links)"""
+        if node.node_id in self.nodes:
+            self.remove_node(node.node_id)
         self.nodes[node.node_id] = node
         self.topology_graph[node.node_id] = set()
+        self.routing.add_node(node.node_id, node.wavelength_addr.quantum_hash)
+        
+    def remove_node(self, node_id: str) -> bool:
+        """Remove node and all of its links (node churn)"""
+        node = self.nodes.pop(node_id, None)
+        if node is None:
+            return False
+        for neighbor in self.topology_graph.pop(node_id, set()):
+            self.topology_graph[neighbor].discard(node_id)
+            self.nodes[neighbor].neighbors.discard(node_id)
+        node.neighbors.clear()
+        self.links = [l for l in self.links if node_id not in (l.node_a, l.node_b)]
+        self.routing.remove_node(node_id)
+        return True
         
     def create_link(self, node_a_id: str, node_b_id: str, protocol: TransportProtocol,
                    signal_dbm: float, latency_ms: float, bandwidth_kbps: float):
@@ -176,6 +194,22 @@ class Layer1_CommunityMeshISP:
         self.nodes[node_a_id].neighbors.add(node_b_id)
         self.nodes[node_b_id].neighbors.add(node_a_id)
         
+        self.routing.add_link(node_a_id, node_b_id, link.link_quality)
+        
+    def remove_link(self, node_a_id: str, node_b_id: str) -> int:
+        """Remove every link between two nodes; returns the number removed"""
+        pair = {node_a_id, node_b_id}
+        kept = [l for l in self.links if {l.node_a, l.node_b} != pair]
+        removed = len(self.links) - len(kept)
+        if removed:
+            self.links = kept
+            self.topology_graph[node_a_id].discard(node_b_id)
+            self.topology_graph[node_b_id].discard(node_a_id)
+            self.nodes[node_a_id].neighbors.discard(node_b_id)
+            self.nodes[node_b_id].neighbors.discard(node_a_id)
+            self.routing.remove_link(node_a_id, node_b_id)
+        return removed
+        
     def get_network_coverage(self) -> Dict[str, any]:
         """Calculate mesh network coverage statistics"""
         total_nodes = len(self.nodes)
@@ -214,40 +248,25 @@ class Layer2_CensorshipResistantRouting:
         self.blocked_dns_urls = set()  # Simulates government censorship
         
     def compute_wavelength_route(self, source_addr: WavelengthAddress, 
-                                 dest_addr: WavelengthAddress) -> List[str]:
-        """Find route using wavelength signatures (not DNS/IP)"""
-        # Find source and destination nodes
-        source_node = None
-        dest_node = None
-        
-        for node in self.mesh.nodes.values():
-            if node.wavelength_addr.quantum_hash == source_addr.quantum_hash:
-                source_node = node.node_id
-            if node.wavelength_addr.quantum_hash == dest_addr.quantum_hash:
-                dest_node = node.node_id
+                                 dest_addr: WavelengthAddress, weighted: bool = False) -> List[str]:
+        """
+        Find route using wavelength signatures (not DNS/IP).
+        
+        Addresses resolve through the mesh's quantum_hash index and routes
+        come from cached shortest-path trees, rebuilt only when the topology
+        around them changes (self-healing).
+        
+        Args:
+            weighted: Prefer high-quality links (Dijkstra on 1/link_quality)
+                instead of the fewest hops
+        """
+        source_node = self.mesh.routing.resolve(source_addr.quantum_hash)
+        dest_node = self.mesh.routing.resolve(dest_addr.quantum_hash)
                 
         if not source_node or not dest_node:
             return []
             
-        # Self-healing BFS pathfinding
-        visited = set()
-        queue = [(source_node, [source_node])]
-        
-        while queue:
-            current, path = queue.pop(0)
-            
-            if current == dest_node:
-                return path
-                
-            if current in visited:
-                continue
-            visited.add(current)
-            
-            for neighbor in self.mesh.topology_graph.get(current, []):
-                if neighbor not in visited:
-                    queue.append((neighbor, path + [neighbor]))
-                    
-        return []  # No route found
+        return self.mesh.routing.shortest_path(source_node, dest_node, weighted)
         
     def evade_censorship(self, original_request: str) -> Dict[str, any]:
         """Show how wavelength routing evades DNS/URL blocking"""
@@ -326,6 +345,7 @@ class Layer4_OfflineKnowledge:
         self.mesh = mesh_layer
         self.knowledge_catalog: Dict[str, KnowledgeResource] = {}
         self.node_cache_map: Dict[str, Set[str]] = {}  # node_id -> cached resource_ids
+        self.resource_locations: Dict[str, Dict[str, None]] = {}  # resource_id -> caching node_ids (cache order)
         
     def add_resource(self, resource: KnowledgeResource):
         """Add knowledge resource to network"""
@@ -359,6 +379,7 @@ class Layer4_OfflineKnowledge:
             
         # Cache resource
         self.node_cache_map[node_id].add(resource_id)
+        self.resource_locations.setdefault(resource_id, {})[node_id] = None
         resource.access_count += 1
         
         return {
@@ -374,28 +395,18 @@ class Layer4_OfflineKnowledge:
         if resource_id not in self.knowledge_catalog:
             return None
             
-        # BFS to find nearest cached copy
-        visited = set()
-        queue = [(requester_node_id, 0)]
-        
-        while queue:
-            current_node, hops = queue.pop(0)
-            
-            if current_node in visited:
-                continue
-            visited.add(current_node)
+        locations = self.resource_locations.get(resource_id)
+        if not locations:
+            return None
+        if requester_node_id in locations:
+            return requester_node_id
             
-            # Check if this node has the resource
-            if current_node in self.node_cache_map:
-                if resource_id in self.node_cache_map[current_node]:
-                    return current_node
-                    
-            # Search neighbors
-            for neighbor in self.mesh.topology_graph.get(current_node, []):
-                if neighbor not in visited:
-                    queue.append((neighbor, hops + 1))
-                    
-        return None
+        # Fewest hops from the requester's cached shortest-path tree (ties: earliest cached)
+        tree = self.mesh.routing.tree(requester_node_id)
+        if tree is None:
+            return None
+        reachable = [node_id for node_id in locations if node_id in tree.distance]
+        return min(reachable, key=tree.distance.__getitem__) if reachable else None
         
     def get_network_knowledge_stats(self) -> Dict[str, any]:
         """Statistics about distributed knowledge network"""